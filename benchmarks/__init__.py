@@ -0,0 +1 @@
+"""Benchmarks and load tests (run as modules, e.g. ``python -m benchmarks.booking_api_load_test``)."""
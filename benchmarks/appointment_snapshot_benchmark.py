@@ -0,0 +1,127 @@
+"""Benchmark for the columnar appointments snapshot.
+
+Builds N synthetic appointments, writes them to a snapshot in a temporary
+directory, and computes revenue per day and bookings per weekday/hour
+three ways: looping over Appointment objects, over the snapshot's typed
+memoryviews, and with NumPy over the mapped arrays (skipped if NumPy is
+not installed). Every method must produce the same totals.
+
+Usage:
+    python -m benchmarks.appointment_snapshot_benchmark --appointments 1000000 --repeat 3
+"""
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.receipt_batch_benchmark import make_appointments
+from core.entities import Appointment
+from infrastructure.file_handlers import AppointmentSnapshot, AppointmentSnapshotWriter
+
+Totals = Tuple[Dict[int, float], Dict[Tuple[int, int], int]]
+
+
+def with_objects(appointments: List[Appointment]) -> Totals:
+    """Revenue per day and bookings per (weekday, hour) from entities."""
+    revenue: Counter = Counter()
+    bookings: Counter = Counter()
+    for appointment in appointments:
+        day = date.fromisoformat(appointment.date)
+        revenue[AppointmentSnapshot.to_day(appointment.date)] += appointment.service_price
+        bookings[day.weekday(), int(appointment.time[:2])] += 1
+    return dict(revenue), dict(bookings)
+
+
+def with_memoryviews(snapshot: AppointmentSnapshot) -> Totals:
+    """The same totals from the snapshot columns, without NumPy."""
+    revenue: Counter = Counter()
+    bookings: Counter = Counter()
+    days = snapshot.column("date")
+    for day, price in zip(days, snapshot.column("price")):
+        revenue[day] += price
+    # 1970-01-01 was a Thursday (weekday 3)
+    for day, minutes in zip(days, snapshot.column("time")):
+        bookings[(day + 3) % 7, minutes // 60] += 1
+    return dict(revenue), dict(bookings)
+
+
+def with_numpy(snapshot: AppointmentSnapshot) -> Totals:
+    """The same totals vectorized over the mapped arrays."""
+    import numpy
+
+    days = snapshot.array("date")
+    first = int(days.min()) if len(days) else 0
+    per_day = numpy.bincount(days - first, weights=snapshot.array("price"))
+    cells = ((days + 3) % 7) * 24 + snapshot.array("time") // 60
+    per_cell = numpy.bincount(cells, minlength=7 * 24)
+    revenue = {first + int(i): float(per_day[i]) for i in numpy.flatnonzero(per_day)}
+    bookings = {divmod(int(i), 24): int(per_cell[i]) for i in numpy.flatnonzero(per_cell)}
+    return revenue, bookings
+
+
+def same(expected: Totals, actual: Totals) -> bool:
+    """Compare totals, allowing for float summation order."""
+    revenue, bookings = actual
+    return bookings == expected[1] and revenue.keys() == expected[0].keys() and all(
+        abs(revenue[day] - total) < 1e-6 * max(1.0, abs(total))
+        for day, total in expected[0].items()
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark.
+
+    Returns:
+        Process exit code (1 if the methods disagree)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--appointments", type=int, default=1000000,
+                        help="Synthetic appointments to snapshot")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method (best is kept)")
+    args = parser.parse_args(argv)
+
+    appointments = make_appointments(args.appointments)
+    path = Path(tempfile.mkdtemp(prefix="salon-snapshot-")) / "appointments.snapshot"
+
+    start = time.perf_counter()
+    writer = AppointmentSnapshotWriter()
+    writer.add_all(appointments)
+    writer.write(path)
+    written = time.perf_counter() - start
+    print(f"Appointments: {args.appointments}  Snapshot: {path.stat().st_size / 1e6:.1f} MB"
+          f"  written in {written * 1000:.0f} ms")
+    print(f"{'method':<16}{'best ms':>10}")
+
+    def best(method, *method_args) -> Tuple[float, Totals]:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = method(*method_args)
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    elapsed, expected = best(with_objects, appointments)
+    print(f"{'objects':<16}{elapsed * 1000:>10.1f}")
+
+    failed = False
+    snapshot = AppointmentSnapshot(path)
+    methods = [("memoryview", with_memoryviews), ("numpy", with_numpy)]
+    for label, method in methods:
+        try:
+            elapsed, totals = best(method, snapshot)
+        except ImportError:
+            print(f"{label:<16}{'not installed':>10}")
+            continue
+        print(f"{label:<16}{elapsed * 1000:>10.1f}")
+        if not same(expected, totals):
+            print(f"FAIL: {label} totals differ from the object loop")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
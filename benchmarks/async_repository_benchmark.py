@@ -0,0 +1,145 @@
+"""Benchmark for the asyncio repository layer.
+
+Runs N concurrent coroutines on one event loop against a temporary
+database, each booking, listing and cancelling through the async use cases,
+while a ticker coroutine measures how late the event loop wakes up. Reports
+throughput, per-operation latency percentiles, event loop lag and any
+double-booked slot.
+
+Usage:
+    python -m benchmarks.async_repository_benchmark --tasks 200 --operations 20
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.booking_api_load_test import working_days
+from benchmarks.latency import summarize
+
+TICK_SECONDS = 0.005
+
+
+async def run_task(
+    task_id: int,
+    container,
+    operations: int,
+    days: List[str],
+    services: list,
+    rng: random.Random,
+    latencies: Dict[str, List[float]],
+) -> None:
+    """Replay a booking/availability/list/cancel mix for one client."""
+    own_bookings: List[int] = []
+    for _ in range(operations):
+        day = rng.choice(days)
+        roll = rng.random()
+        start = time.perf_counter()
+        if roll < 0.5:
+            operation = "availability"
+            await container.async_get_available_slots.execute(day)
+        elif roll < 0.65:
+            operation = "list"
+            await container.async_get_appointments.get_by_date(day)
+        elif roll < 0.75 and own_bookings:
+            operation = "cancel"
+            await container.async_cancel_appointment.execute(
+                own_bookings.pop(rng.randrange(len(own_bookings)))
+            )
+        else:
+            operation = "book"
+            slots = await container.async_get_available_slots.execute(day)
+            service = rng.choice(services)
+            result = await container.async_create_appointment.execute(
+                first_name=f"Async{task_id}",
+                last_name="Client",
+                phone_number=f"555{task_id:04d}",
+                date=day,
+                time=rng.choice(slots or ["08:00"]),
+                service_name=service.name,
+                service_price=service.price,
+            )
+            if result.success:
+                own_bookings.append(result.appointment.appointment_id)
+        latencies[operation].append((time.perf_counter() - start) * 1000)
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how much later than requested the event loop wakes a sleeper."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, (time.perf_counter() - start - TICK_SECONDS) * 1000))
+
+
+async def run(args: argparse.Namespace, container) -> int:
+    """Run the benchmark on the running event loop."""
+    services = await container.async_service_repository.get_all()
+    days = working_days(args.days)
+    rng = random.Random(args.seed)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    lags: List[float] = []
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_task(i, container, args.operations, days, services,
+                 random.Random(rng.random()), latencies)
+        for i in range(args.tasks)
+    ))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+
+    duplicates = []
+    for day in days:
+        times = [apt.time for apt in await container.async_get_appointments.get_by_date(day)]
+        duplicates.extend((day, t) for t in set(times) if times.count(t) > 1)
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"Tasks: {args.tasks}  Operations: {total}  Elapsed: {elapsed:.2f}s  "
+          f"Throughput: {total / elapsed:.1f} ops/s")
+    print(f"{'operation':<14}{'count':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for operation in ("availability", "book", "list", "cancel"):
+        summary = summarize(latencies.get(operation, []))
+        print(f"{operation:<14}{summary['count']:>8}{summary['mean_ms']:>9.2f}"
+              f"{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['max_ms']:>9.2f}")
+    lag = summarize(lags)
+    print(f"Event loop lag: p50 {lag['p50_ms']:.2f} ms  p99 {lag['p99_ms']:.2f} ms  "
+          f"max {lag['max_ms']:.2f} ms")
+    print(f"Double bookings: {len(duplicates)}")
+    return 1 if duplicates else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark.
+
+    Returns:
+        Process exit code (non-zero on double bookings)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200, help="Concurrent coroutines")
+    parser.add_argument("--operations", type=int, default=20, help="Operations per task")
+    parser.add_argument("--days", type=int, default=10, help="Distinct booking dates")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args(argv)
+
+    from di_container import DIContainer
+
+    database_path = Path(tempfile.mkdtemp(prefix="salon-async-")) / "salon.db"
+    container = DIContainer(database_path)
+    try:
+        return asyncio.run(run(args, container))
+    finally:
+        container.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Load test for the headless booking HTTP API.
+
+Starts the API on a temporary database (or targets ``--url``), runs N
+concurrent clients replaying a mix of availability lookups, bookings,
+listings and cancellations, then reports throughput, latency percentiles
+and any double-booked slot.
+
+Usage:
+    python -m benchmarks.booking_api_load_test --clients 16 --requests 200
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from benchmarks.latency import summarize
+
+# Operation mix (weights)
+OPERATIONS = (
+    ("availability", 50),
+    ("book", 25),
+    ("list", 15),
+    ("cancel", 10),
+)
+
+
+class ClientStats:
+    """Per-client counters and latencies."""
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[int, int] = defaultdict(int)
+        self.errors: List[str] = []
+        self.booked = 0
+        self.cancelled = 0
+
+
+class ApiClient:
+    """Minimal keep-alive JSON client."""
+
+    def __init__(self, base_url: str):
+        """Initialize client.
+
+        Args:
+            base_url: Base URL of the booking API
+        """
+        url = urlparse(base_url)
+        self._connection = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+
+    def request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, dict]:
+        """Send a request and decode the JSON response.
+
+        Returns:
+            (status code, decoded body)
+        """
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        self._connection.request(method, path, body=data, headers=headers)
+        response = self._connection.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
+
+
+def working_days(count: int) -> List[str]:
+    """Get the next ``count`` non-Sunday dates starting tomorrow."""
+    days = []
+    current = date.today()
+    while len(days) < count:
+        current += timedelta(days=1)
+        if current.weekday() != 6:
+            days.append(current.isoformat())
+    return days
+
+
+def run_client(
+    client_id: int,
+    base_url: str,
+    requests: int,
+    days: List[str],
+    services: List[str],
+    seed: int,
+    stats: ClientStats,
+) -> None:
+    """Replay the operation mix for one client."""
+    rng = random.Random(seed + client_id)
+    client = ApiClient(base_url)
+    names, weights = zip(*OPERATIONS)
+    own_bookings: List[int] = []
+
+    for _ in range(requests):
+        operation = rng.choices(names, weights)[0]
+        day = rng.choice(days)
+        start = time.perf_counter()
+        try:
+            if operation == "availability":
+                status, _ = client.request("GET", f"/availability?date={day}")
+            elif operation == "list":
+                status, _ = client.request("GET", f"/appointments?date={day}")
+            elif operation == "cancel" and own_bookings:
+                appointment_id = own_bookings.pop(rng.randrange(len(own_bookings)))
+                status, _ = client.request("DELETE", f"/appointments/{appointment_id}")
+                if status == 200:
+                    stats.cancelled += 1
+            else:
+                operation = "book"
+                _, free = client.request("GET", f"/availability?date={day}")
+                slots = free.get("available_slots") or ["08:00"]
+                status, body = client.request("POST", "/appointments", {
+                    "first_name": f"Load{client_id}",
+                    "last_name": "Client",
+                    "phone_number": f"555{client_id:04d}",
+                    "date": day,
+                    "time": rng.choice(slots),
+                    "service_name": rng.choice(services),
+                })
+                if status == 201:
+                    stats.booked += 1
+                    own_bookings.append(body["appointment"]["appointment_id"])
+        except Exception as e:  # connection failures count as errors
+            stats.errors.append(f"{operation}: {e}")
+            client.close()
+            client = ApiClient(base_url)
+            continue
+
+        stats.latencies[operation].append((time.perf_counter() - start) * 1000)
+        stats.statuses[status] += 1
+        if status >= 500:
+            stats.errors.append(f"{operation}: HTTP {status}")
+
+    client.close()
+
+
+def find_double_bookings(base_url: str, days: List[str]) -> List[Tuple[str, str, int]]:
+    """Find (date, time) slots holding more than one appointment."""
+    client = ApiClient(base_url)
+    duplicates = []
+    for day in days:
+        _, body = client.request("GET", f"/appointments?date={day}")
+        slots: Dict[str, int] = defaultdict(int)
+        for appointment in body["appointments"]:
+            slots[appointment["time"]] += 1
+        duplicates.extend((day, slot, n) for slot, n in slots.items() if n > 1)
+    client.close()
+    return duplicates
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the load test.
+
+    Returns:
+        Process exit code (non-zero on errors or double bookings)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--days", type=int, default=10, help="Distinct booking dates")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--url", help="Target an already running API instead of a temp one")
+    args = parser.parse_args(argv)
+
+    server = container = None
+    base_url = args.url
+    if base_url is None:
+        from di_container import DIContainer
+        from presentation.api import BookingService, BookingHTTPServer
+
+        database_path = Path(tempfile.mkdtemp(prefix="salon-load-")) / "salon.db"
+        container = DIContainer(database_path)
+        server = BookingHTTPServer(BookingService(container), port=0)
+        server.start_background()
+        base_url = server.url
+
+    try:
+        client = ApiClient(base_url)
+        _, catalog = client.request("GET", "/services")
+        client.close()
+        services = [service["name"] for service in catalog["services"]]
+        days = working_days(args.days)
+
+        all_stats = [ClientStats() for _ in range(args.clients)]
+        threads = [
+            threading.Thread(
+                target=run_client,
+                args=(i, base_url, args.requests, days, services, args.seed, all_stats[i]),
+            )
+            for i in range(args.clients)
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        duplicates = find_double_bookings(base_url, days)
+    finally:
+        if server is not None:
+            server.stop()
+            container.cleanup()
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[int, int] = defaultdict(int)
+    errors: List[str] = []
+    for stats in all_stats:
+        for operation, values in stats.latencies.items():
+            latencies[operation].extend(values)
+        for status, count in stats.statuses.items():
+            statuses[status] += count
+        errors.extend(stats.errors)
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"Clients: {args.clients}  Requests: {total}  Elapsed: {elapsed:.2f}s  "
+          f"Throughput: {total / elapsed:.1f} req/s")
+    print(f"{'operation':<14}{'count':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for operation, _ in OPERATIONS:
+        summary = summarize(latencies.get(operation, []))
+        print(f"{operation:<14}{summary['count']:>8}{summary['mean_ms']:>9.2f}"
+              f"{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['max_ms']:>9.2f}")
+    print(f"HTTP statuses: {dict(sorted(statuses.items()))}")
+    print(f"Booked: {sum(s.booked for s in all_stats)}  "
+          f"Cancelled: {sum(s.cancelled for s in all_stats)}")
+    print(f"Errors: {len(errors)}  Double bookings: {len(duplicates)}")
+    for message in errors[:10]:
+        print(f"  error: {message}")
+    for day, slot, count in duplicates[:10]:
+        print(f"  double booking: {day} {slot} x{count}")
+
+    return 1 if errors or duplicates else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Benchmark JsonHandler's JSON list format against JSON Lines.
+
+Writes N appointment-like records to a temporary ``.json`` file and a
+``.jsonl`` file, then times a full read, a streaming pass (JSON Lines
+only), appends and a single-record update, and reports the peak Python
+memory of each read. Finally one byte in the middle of each file is
+corrupted and the records that can still be read are counted.
+
+Usage:
+    python -m benchmarks.json_handler_benchmark --records 500000 --appends 5
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from infrastructure.file_handlers import JsonHandler
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    """Build records shaped like rows of the appointments table."""
+    start = date.today()
+    return [
+        {
+            "appointment_id": i + 1,
+            "first_name": f"Customer{i % 500}",
+            "last_name": "Bench",
+            "phone_number": f"555{i % 500:04d}",
+            "date": (start + timedelta(days=i // 200)).isoformat(),
+            "time": f"{8 + i % 10:02d}:00",
+            "service_name": "Massage",
+            "service_price": 30.0,
+        }
+        for i in range(count)
+    ]
+
+
+def timed(action: Callable[[], Any]) -> Tuple[float, Any]:
+    """Run an action, returning its wall time in seconds and its result."""
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def peak_memory(action: Callable[[], Any]) -> int:
+    """Peak Python allocation while running an action, in bytes."""
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def stream_count(path: Path) -> int:
+    """Count records without holding them all."""
+    return sum(1 for _ in JsonHandler.iter_records(path))
+
+
+def corrupt_middle(path: Path) -> None:
+    """Overwrite one byte in the middle of a file (never a line break)."""
+    with open(path, "r+b") as f:
+        f.seek(path.stat().st_size // 2)
+        if f.read(1) == b"\n":
+            f.seek(-2, 1)
+        else:
+            f.seek(-1, 1)
+        f.write(b"\xff")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark.
+
+    Returns:
+        Process exit code (1 if a format loses or invents records)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500000, help="Records to write")
+    parser.add_argument("--appends", type=int, default=5,
+                        help="Single-record appends to time per format")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the (slow) tracemalloc peak memory pass")
+    args = parser.parse_args(argv)
+
+    records = make_records(args.records)
+    root = Path(tempfile.mkdtemp(prefix="salon-json-"))
+    paths = {"json": root / "appointments.json", "jsonl": root / "appointments.jsonl"}
+    target = args.records // 2
+
+    print(f"Records: {args.records}  Appends: {args.appends}")
+    print(f"{'operation':<28}{'json ms':>12}{'jsonl ms':>12}")
+
+    def row(label: str, results: Dict[str, Optional[float]], unit: float = 1000) -> None:
+        cells = "".join(
+            f"{'-' if value is None else f'{value * unit:.1f}':>12}"
+            for value in (results.get("json"), results.get("jsonl"))
+        )
+        print(f"{label:<28}{cells}")
+
+    failed = False
+
+    row("write", {name: timed(lambda p=path: JsonHandler.write(p, records))[0]
+                  for name, path in paths.items()})
+    print(f"{'file size (MB)':<28}"
+          + "".join(f"{path.stat().st_size / 1e6:>12.1f}" for path in paths.values()))
+
+    reads = {}
+    for name, path in paths.items():
+        reads[name], loaded = timed(lambda p=path: JsonHandler.read(p))
+        if len(loaded) != args.records:
+            print(f"FAIL: {name} read {len(loaded)} of {args.records} records")
+            failed = True
+        del loaded
+    row("read (all)", reads)
+
+    elapsed, streamed = timed(lambda: stream_count(paths["jsonl"]))
+    row("iter_records (stream)", {"jsonl": elapsed})
+    if streamed != args.records:
+        print(f"FAIL: iter_records yielded {streamed} of {args.records} records")
+        failed = True
+
+    if not args.no_memory:
+        print(f"{'peak MB, read (all)':<28}"
+              + "".join(f"{peak_memory(lambda p=path: JsonHandler.read(p)) / 1e6:>12.1f}"
+                        for path in paths.values()))
+        print(f"{'peak MB, iter_records':<28}{'-':>12}"
+              f"{peak_memory(lambda: stream_count(paths['jsonl'])) / 1e6:>12.1f}")
+
+    appends = {}
+    for name, path in paths.items():
+        item = dict(records[0], appointment_id=0)
+        elapsed, _ = timed(lambda p=path: [JsonHandler.append(p, item) for _ in range(args.appends)])
+        appends[name] = elapsed / max(args.appends, 1)
+    row("append (per record)", appends)
+
+    updated = dict(records[target], time="19:00")
+    row("update_item", {
+        name: timed(lambda p=path: JsonHandler.update_item(
+            p, lambda item: item["appointment_id"] == target + 1, updated))[0]
+        for name, path in paths.items()
+    })
+
+    expected = args.records + args.appends
+    recovered = {}
+    for name, path in paths.items():
+        corrupt_middle(path)
+        recovered[name] = stream_count(path)
+        if recovered[name] > expected:
+            failed = True
+    print(f"{'records after 1 bad byte':<28}"
+          + "".join(f"{recovered[name]:>12}" for name in paths))
+    if recovered["jsonl"] < expected - 1:
+        print(f"FAIL: jsonl lost {expected - recovered['jsonl']} records to one bad byte")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Latency summary helpers shared by benchmarks."""
+import math
+from typing import Dict, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Get the nearest-rank percentile of a sequence.
+
+    Args:
+        values: Observed values (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value, or 0.0 for an empty sequence
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        latencies_ms: Observed latencies
+
+    Returns:
+        Dictionary with count, mean, p50, p95, p99 and max
+    """
+    count = len(latencies_ms)
+    return {
+        "count": count,
+        "mean_ms": sum(latencies_ms) / count if count else 0.0,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+        "max_ms": max(latencies_ms) if count else 0.0,
+    }
@@ -0,0 +1,97 @@
+"""Benchmark for batch receipt generation.
+
+Generates receipts for N synthetic appointments into a temporary directory,
+once with one ``generate`` call (and one file) per appointment and once with
+``generate_batch`` (one receipts log plus offset index) for each worker
+count, and reports wall time, throughput and output size. The index is
+re-read to check that every receipt made it in under a distinct name.
+
+Usage:
+    python -m benchmarks.receipt_batch_benchmark --receipts 10000 --workers 1 4 --format pdf
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from core.entities import Appointment
+from infrastructure.file_handlers import ReceiptGenerator
+
+
+def make_appointments(count: int) -> List[Appointment]:
+    """Build appointments with repeating customers and dates."""
+    start = date.today()
+    return [
+        Appointment(
+            appointment_id=i + 1,
+            first_name=f"Customer{i % 500}",
+            last_name="Batch",
+            phone_number=f"555{i % 500:04d}",
+            date=(start + timedelta(days=i // 200)).isoformat(),
+            time=f"{8 + i % 10:02d}:00",
+            service_name="Massage",
+            service_price=30.0,
+        )
+        for i in range(count)
+    ]
+
+
+def directory_size(path: Path) -> int:
+    """Total size of the files in a directory."""
+    return sum(entry.stat().st_size for entry in path.iterdir())
+
+
+def report(label: str, count: int, elapsed: float, size: int) -> None:
+    """Print one result row."""
+    print(f"{label:<22}{elapsed * 1000:>10.0f}{count / elapsed:>12.0f}{size / 1024:>10.0f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark.
+
+    Returns:
+        Process exit code (1 if the receipts log is missing receipts)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--receipts", type=int, default=10000, help="Receipts to generate")
+    parser.add_argument("--format", default="text", help="Receipt format (text, html, pdf)")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1, os.cpu_count() or 1], help="Worker counts to try")
+    args = parser.parse_args(argv)
+
+    appointments = make_appointments(args.receipts)
+    root = Path(tempfile.mkdtemp(prefix="salon-receipts-"))
+
+    print(f"Receipts: {args.receipts}  Format: {args.format}  CPUs: {os.cpu_count()}")
+    print(f"{'mode':<22}{'ms':>10}{'receipts/s':>12}{'KB':>10}")
+
+    files_dir = root / "files"
+    generator = ReceiptGenerator(files_dir, args.format)
+    start = time.perf_counter()
+    for appointment in appointments:
+        generator.generate(appointment)
+    report("generate (files)", args.receipts, time.perf_counter() - start,
+           directory_size(files_dir))
+
+    failed = False
+    for workers in dict.fromkeys(args.workers):
+        generator = ReceiptGenerator(root / f"batch-{workers}", args.format)
+        start = time.perf_counter()
+        log_path = generator.generate_batch(appointments, workers=workers)
+        elapsed = time.perf_counter() - start
+        report(f"generate_batch (w={workers})", args.receipts, elapsed,
+               log_path.stat().st_size)
+        indexed = len(generator.load_index())
+        if indexed != args.receipts:
+            print(f"FAIL: receipts log indexes {indexed} of {args.receipts} receipts")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Startup import-time benchmark with a budget.
+
+Imports ``main`` (which pulls in the DI container and the application
+module) in fresh interpreters under ``python -X importtime`` and reports the
+median total import time, the slowest modules and any module that should
+only be imported on first use. Exits non-zero when the median exceeds the
+budget or a deferred module was imported eagerly, so it can gate CI.
+
+Usage:
+    python -m benchmarks.startup_benchmark --runs 5 --budget-ms 150
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay off the startup path
+DEFERRED_MODULES = ("PIL", "tkcalendar", "asyncio")
+
+
+def measure(target: str) -> Dict[str, Tuple[int, int]]:
+    """Import a module in a fresh interpreter and parse ``-X importtime``.
+
+    Args:
+        target: Module to import
+
+    Returns:
+        Mapping of module name to (self, cumulative) microseconds
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark.
+
+    Returns:
+        Process exit code (1 if over budget or a deferred module was imported)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Median import budget")
+    parser.add_argument("--target", default="main", help="Module to import")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.target) for _ in range(args.runs)]
+    totals_ms = [run[args.target][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    # Slowest modules by self time, from the run closest to the median
+    typical = min(runs, key=lambda run: abs(run[args.target][1] / 1000 - median_ms))
+    slowest = sorted(typical.items(), key=lambda item: item[1][0], reverse=True)
+
+    print(f"import {args.target}: median {median_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(totals_ms):.1f}, max {max(totals_ms):.1f}), budget {args.budget_ms:.0f} ms")
+    print(f"\n{'self ms':>8} {'cum ms':>8}  module")
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"{self_us / 1000:8.1f} {cumulative_us / 1000:8.1f}  {name}")
+
+    eager = [
+        name for name in DEFERRED_MODULES
+        if any(module == name or module.startswith(name + ".") for module in typical)
+    ]
+
+    failed = False
+    if eager:
+        print(f"\nFAIL: imported at startup but should be deferred: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"\nFAIL: median {median_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""Repeatable benchmark suite over every use case and the SQLite repositories.
+
+Loads a seeded synthetic database (see benchmarks.synthetic_data), times
+each case a fixed number of times through a fresh DIContainer, writes the
+latency summaries as JSON and compares their medians with a stored
+baseline, flagging cases that got slower than the tolerance allows.
+
+Usage:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --save-baseline          # after an intended change
+"""
+import argparse
+import asyncio
+import io
+import json
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.latency import summarize
+from benchmarks.synthetic_data import PASSWORD, load_database
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+
+# Slowdowns smaller than this many milliseconds are noise, whatever the ratio
+NOISE_FLOOR_MS = 0.5
+
+# (name, timed function, untimed setup run before every repetition)
+Case = Tuple[str, Callable[[], Any], Optional[Callable[[], None]]]
+
+
+class NullWriter(io.TextIOBase):
+    """Text stream that discards everything, for timing exports without I/O."""
+
+    def write(self, text: str) -> int:
+        """Discard text."""
+        return len(text)
+
+
+def build_cases(
+    container, rng: random.Random, end_date: date, loop: asyncio.AbstractEventLoop
+) -> List[Case]:
+    """Create the benchmark cases against a loaded database.
+
+    Writes are paired so the data returns to its starting state: the
+    cancel case cancels what the booking case booked, and the remove case
+    removes the employees the add case added (registered users stay, the
+    same number every run). Report caches are cleared
+    before every repetition so the query itself is timed.
+    """
+    appointments = container.appointment_repository
+    today = end_date - timedelta(days=90)
+    month_start = (today - timedelta(days=30)).isoformat()
+    year_start = (today - timedelta(days=365)).isoformat()
+    day = today.isoformat()
+    users = container.user_repository.get_all()
+    customer = rng.choice(users)
+    sample = appointments.get_page(appointments.count() // 2, 1)[0]
+    services = container.get_services.get_all()
+
+    # Free future slots for the booking cases, cancelled again afterwards
+    free_slots = [
+        (slot_date, slot)
+        for slot_date, slots in container.get_available_slots.execute_range(
+            today.isoformat(), end_date.isoformat()
+        ).items()
+        for slot in slots
+    ]
+    rng.shuffle(free_slots)
+    booked: List[int] = []
+    async_booked: List[int] = []
+    counter = iter(range(10 ** 9))
+
+    def book(use_case, target: List[int]):
+        slot_date, slot = free_slots.pop()
+        service = rng.choice(services)
+        result = use_case.execute(
+            "Bench", "Client", "0990000000", slot_date, slot, service.name, service.price
+        )
+        target.append(result.appointment.appointment_id)
+        return result
+
+    added: List[int] = []
+
+    def add_employee():
+        result = container.add_employee.execute(
+            "Bench", "Employee", "Manicurist", "0980000000",
+            f"bench{next(counter)}", PASSWORD,
+        )
+        added.append(result.employee.employee_id)
+        return result
+
+    def run(coroutine):
+        return loop.run_until_complete(coroutine)
+
+    def async_book():
+        slot_date, slot = free_slots.pop()
+        service = rng.choice(services)
+        result = run(container.async_create_appointment.execute(
+            "Bench", "Async", "0990000001", slot_date, slot, service.name, service.price
+        ))
+        async_booked.append(result.appointment.appointment_id)
+        return result
+
+    def clear_reports():
+        container.get_revenue_report.invalidate()
+        container.get_occupancy_report.invalidate()
+
+    cases: List[Case] = [
+        # Use cases
+        ("login_user", lambda: container.login_user.execute(customer.username, PASSWORD), None),
+        ("register_user", lambda: container.register_user.execute(
+            "Bench", "User", "0970000000", f"benchuser{next(counter)}", PASSWORD, PASSWORD
+        ), None),
+        ("create_appointment", lambda: book(container.create_appointment, booked), None),
+        ("cancel_appointment", lambda: container.cancel_appointment.execute(booked.pop()), None),
+        ("get_appointments.get_page", lambda: container.get_appointments.get_page(0, 100), None),
+        ("get_appointments.get_count", container.get_appointments.get_count, None),
+        ("get_appointments.get_by_date", lambda: container.get_appointments.get_by_date(day), None),
+        ("get_appointments.get_by_customer", lambda: container.get_appointments.get_by_customer(
+            customer.first_name, customer.last_name, customer.phone_number
+        ), None),
+        ("get_available_slots", lambda: container.get_available_slots.execute(day), None),
+        ("get_available_slots.range", lambda: container.get_available_slots.execute_range(
+            month_start, day
+        ), None),
+        ("add_employee", add_employee, None),
+        ("remove_employee", lambda: container.remove_employee.execute(added.pop()), None),
+        ("get_employees", container.get_employees.get_all, None),
+        ("get_services", container.get_services.get_all, None),
+        ("get_revenue_report.month", lambda: container.get_revenue_report.execute(
+            year_start, day, "month"
+        ), clear_reports),
+        ("get_revenue_report.service", lambda: container.get_revenue_report.execute(
+            year_start, day, "service"
+        ), clear_reports),
+        ("get_occupancy_report", lambda: container.get_occupancy_report.execute(
+            year_start, day
+        ), clear_reports),
+        ("export_appointments", lambda: container.export_appointments.execute(
+            NullWriter(), year_start, day
+        ), None),
+        ("export_customers", lambda: container.export_customers.execute(
+            NullWriter(), year_start, day
+        ), None),
+        # Asyncio use cases
+        ("async_login_user", lambda: run(
+            container.async_login_user.execute(customer.username, PASSWORD)
+        ), None),
+        ("async_create_appointment", async_book, None),
+        ("async_cancel_appointment", lambda: run(
+            container.async_cancel_appointment.execute(async_booked.pop())
+        ), None),
+        ("async_get_appointments", lambda: run(
+            container.async_get_appointments.get_by_date(day)
+        ), None),
+        ("async_get_available_slots", lambda: run(
+            container.async_get_available_slots.execute(day)
+        ), None),
+        # SQLite repositories
+        ("appointments.get_by_id", lambda: appointments.get_by_id(sample.appointment_id), None),
+        ("appointments.get_by_date_range", lambda: appointments.get_by_date_range(
+            month_start, day
+        ), None),
+        ("appointments.get_page.deep", lambda: appointments.get_page(
+            appointments.count() - 100, 100
+        ), None),
+        ("appointments.get_page_after", lambda: appointments.get_page_after(
+            (sample.date, sample.time), 100
+        ), None),
+        ("appointments.count_by_customer", lambda: appointments.count_by_customer(
+            customer.first_name, customer.last_name, customer.phone_number
+        ), None),
+        ("appointments.is_time_slot_available", lambda: appointments.is_time_slot_available(
+            sample.date, sample.time
+        ), None),
+        ("users.get_by_username", lambda: container.user_repository.get_by_username(
+            customer.username
+        ), None),
+        ("users.get_all", container.user_repository.get_all, None),
+        ("employees.get_by_position", lambda: container.employee_repository.get_by_position(
+            "Manicurist"
+        ), None),
+        ("services.get_by_name", lambda: container.service_repository.get_by_name(
+            services[0].name
+        ), None),
+        ("reports.bookings_by_weekday_and_time",
+         lambda: container.report_repository.bookings_by_weekday_and_time(year_start, day), None),
+    ]
+    return cases
+
+
+def run_cases(cases: List[Case], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time every case ``repeat`` times after one warm-up run.
+
+    Raises:
+        RuntimeError: If a use case reports failure
+    """
+    results = {}
+    for name, function, setup in cases:
+        latencies = []
+        for iteration in range(repeat + 1):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = function()
+            if iteration:
+                latencies.append((time.perf_counter() - start) * 1000)
+            # A use case that failed did not do the work being timed
+            if getattr(result, "success", True) is False:
+                raise RuntimeError(f"{name} failed: {result.message}")
+        results[name] = summarize(latencies)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    """Print each case's median next to the baseline.
+
+    Returns:
+        Names of the cases slower than ``1 + tolerance`` times the baseline
+    """
+    regressions = []
+    print(f"{'case':<42}{'p50 ms':>10}{'baseline':>10}{'change':>9}")
+    for name, summary in results.items():
+        current = summary["p50_ms"]
+        previous = baseline.get(name, {}).get("p50_ms")
+        if previous is None:
+            print(f"{name:<42}{current:>10.3f}{'-':>10}{'new':>9}")
+            continue
+        change = current / previous - 1 if previous else 0.0
+        flag = ""
+        if change > tolerance and current - previous > NOISE_FLOOR_MS:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<42}{current:>10.3f}{previous:>10.3f}{change:>+9.0%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite.
+
+    Returns:
+        Process exit code (non-zero on regressions)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--years", type=float, default=3, help="Years of appointments")
+    parser.add_argument("--customers", type=int, default=2000, help="Registered customers")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per case")
+    parser.add_argument(
+        "--end-date", type=date.fromisoformat, default=date(2026, 12, 31),
+        help="Last appointment date; fixed so runs on different days match",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_FILE, help="Results to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store these results as the baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="Allowed median slowdown (0.5 = 50%%)"
+    )
+    args = parser.parse_args(argv)
+
+    from di_container import DIContainer
+
+    database_path = Path(tempfile.mkdtemp(prefix="salon-suite-")) / "salon.db"
+    start = time.perf_counter()
+    counts = load_database(
+        database_path, args.seed, args.years, args.customers, end_date=args.end_date
+    )
+    print(f"Loaded {counts['appointments']} appointments, {counts['users']} users "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    container = DIContainer(database_path)
+    loop = asyncio.new_event_loop()
+    try:
+        cases = build_cases(container, random.Random(args.seed), args.end_date, loop)
+        results = run_cases(cases, args.repeat)
+    finally:
+        loop.close()
+        container.cleanup()
+
+    report = {
+        "parameters": {
+            "seed": args.seed, "years": args.years, "customers": args.customers,
+            "repeat": args.repeat, "end_date": args.end_date.isoformat(),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+        },
+        "counts": counts,
+        "cases": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        stored = json.loads(args.baseline.read_text())
+        if stored.get("parameters") != report["parameters"]:
+            print("Baseline was recorded with other parameters; not comparing")
+        else:
+            baseline = stored["cases"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
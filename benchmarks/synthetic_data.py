@@ -0,0 +1,220 @@
+"""Seeded synthetic salon data, bulk-loaded into a SQLite database.
+
+Customers, employees and years of appointments are generated from one
+random seed, so every run of a benchmark sees the same data. Bookings
+follow a weekday and hour profile (busy Friday/Saturday and after-work
+hours, quiet Monday mornings) and a few regular customers account for a
+large share of the visits.
+
+Usage:
+    python -m benchmarks.synthetic_data /tmp/salon.db --years 3 --customers 2000
+"""
+import argparse
+import itertools
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config.constants import EmployeePosition
+from infrastructure.database import DatabaseMigrations, SQLiteConnection
+from infrastructure.database.database_migrations import DEFAULT_SERVICES
+from infrastructure.scheduling import WorkingHoursService
+from infrastructure.security import PasswordHasher
+
+# Password of every generated user and employee
+PASSWORD = "Benchmark1!"
+
+# Relative demand per weekday (Monday first; Sunday is closed anyway)
+WEEKDAY_DEMAND = [0.55, 0.6, 0.65, 0.75, 0.95, 1.0, 0.0]
+
+# Relative demand per opening hour
+HOUR_DEMAND = {
+    8: 0.35, 9: 0.5, 10: 0.7, 11: 0.75, 12: 0.6, 13: 0.45, 14: 0.45,
+    15: 0.55, 16: 0.7, 17: 0.9, 18: 1.0, 19: 0.85, 20: 0.5,
+}
+
+# Relative popularity of the default services
+SERVICE_DEMAND = {
+    "Eyelashes": 0.8, "Manicure": 1.0, "Physiotherapy": 0.4, "Massage": 0.7,
+    "Facial Care": 0.6, "Body Care": 0.4, "Depilation": 0.6, "Laser Depilation": 0.3,
+}
+
+INSERT_BATCH = 10000
+
+FIRST_NAMES = [
+    "Ana", "Ivana", "Marija", "Petra", "Lucija", "Maja", "Sara", "Ema", "Nina", "Iva",
+    "Marko", "Luka", "Ivan", "Josip", "Tomislav", "Karlo", "Filip", "Mia", "Lana", "Tea",
+]
+LAST_NAMES = [
+    "Horvat", "Kovacevic", "Babic", "Maric", "Juric", "Novak", "Kovacic", "Knezevic",
+    "Vukovic", "Markovic", "Petrovic", "Matic", "Tomic", "Pavlovic", "Bozic", "Blazevic",
+]
+
+Person = Tuple[str, str, str]  # first name, last name, phone number
+
+
+def people(rng: random.Random, count: int, prefix: str) -> List[Person]:
+    """Generate people with unique phone numbers."""
+    return [
+        (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), f"{prefix}{index:07d}")
+        for index in range(count)
+    ]
+
+
+def appointments(
+    rng: random.Random,
+    customers: List[Person],
+    start_date: date,
+    end_date: date,
+    peak_occupancy: float,
+) -> Iterator[tuple]:
+    """Generate appointment rows for every open slot between two dates.
+
+    Each slot is booked with probability ``peak_occupancy`` times its
+    weekday and hour demand. Customers are picked with Pareto weights, so
+    a few regulars visit often.
+
+    Yields:
+        (first_name, last_name, phone_number, date, time, service_name,
+        service_price) in date and time order
+    """
+    working_hours = WorkingHoursService()
+    services = [(name, price) for name, price in DEFAULT_SERVICES]
+    service_weights = list(
+        itertools.accumulate(SERVICE_DEMAND.get(name, 0.5) for name, _ in services)
+    )
+    customer_weights = list(itertools.accumulate(rng.paretovariate(1.5) for _ in customers))
+
+    day = start_date
+    while day <= end_date:
+        day_text = day.isoformat()
+        day_demand = WEEKDAY_DEMAND[day.weekday()] * peak_occupancy
+        for slot in working_hours.get_available_hours(day_text):
+            if rng.random() >= day_demand * HOUR_DEMAND.get(int(slot[:2]), 0.5):
+                continue
+            first_name, last_name, phone_number = rng.choices(
+                customers, cum_weights=customer_weights
+            )[0]
+            service_name, service_price = rng.choices(services, cum_weights=service_weights)[0]
+            yield (first_name, last_name, phone_number, day_text, slot, service_name, service_price)
+        day += timedelta(days=1)
+
+
+def load_database(
+    database_path: Path,
+    seed: int = 42,
+    years: float = 3,
+    customers: int = 2000,
+    employees: int = 12,
+    peak_occupancy: float = 0.9,
+    end_date: Optional[date] = None,
+) -> Dict[str, int]:
+    """Create a salon database filled with synthetic data.
+
+    The schema comes from DatabaseMigrations (so the daily_summary
+    triggers fire); rows are inserted with executemany in one transaction.
+
+    Args:
+        database_path: Database file to create (must not exist yet)
+        seed: Random seed; the same arguments and end date give the same data
+        years: Span of the appointment history
+        customers: Registered customers, who also make the bookings
+        employees: Employees, spread over the positions
+        peak_occupancy: Booking probability of the busiest slot
+        end_date: Last appointment date (default: 90 days from today)
+
+    Returns:
+        Row counts per table
+    """
+    if database_path.exists():
+        raise FileExistsError(f"{database_path} already exists")
+    rng = random.Random(seed)
+    end_date = end_date or date.today() + timedelta(days=90)
+    start_date = end_date - timedelta(days=round(365 * years))
+
+    connection = SQLiteConnection(database_path)
+    DatabaseMigrations(connection).migrate()
+    connection.close()
+
+    password_hash = PasswordHasher.hash_password(PASSWORD)
+    customer_people = people(rng, customers, "091")
+    employee_people = people(rng, employees, "092")
+    positions = [position.value for position in EmployeePosition]
+
+    conn = sqlite3.connect(database_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO users (first_name, last_name, phone_number, username, password_hash)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    (first, last, phone, f"customer{index:05d}", password_hash)
+                    for index, (first, last, phone) in enumerate(customer_people)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO employees"
+                " (first_name, last_name, position, phone_number, username, password_hash)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (first, last, positions[index % len(positions)], phone,
+                     f"employee{index:03d}", password_hash)
+                    for index, (first, last, phone) in enumerate(employee_people)
+                ),
+            )
+            rows = appointments(rng, customer_people, start_date, end_date, peak_occupancy)
+            while True:
+                batch = list(itertools.islice(rows, INSERT_BATCH))
+                if not batch:
+                    break
+                conn.executemany(
+                    "INSERT INTO appointments (first_name, last_name, phone_number, date, time,"
+                    " service_name, service_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+        conn.execute("ANALYZE")
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("users", "employees", "services", "appointments")
+        }
+    finally:
+        conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Generate a database.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", type=Path, help="Database file to create")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--years", type=float, default=3, help="Years of appointments")
+    parser.add_argument("--customers", type=int, default=2000, help="Registered customers")
+    parser.add_argument("--employees", type=int, default=12, help="Employees")
+    parser.add_argument(
+        "--peak-occupancy", type=float, default=0.9, help="Booking probability of the busiest slot"
+    )
+    parser.add_argument(
+        "--end-date", type=date.fromisoformat, help="Last appointment date (default: today + 90)"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    counts = load_database(
+        args.database, args.seed, args.years, args.customers, args.employees,
+        args.peak_occupancy, args.end_date,
+    )
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{count} {table}" for table, count in counts.items()))
+    print(f"Loaded {args.database} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Load simulator for many front-desk terminals sharing one salon.db.
+
+Each terminal is a thread or a process with its own DIContainer (and so
+its own SQLite connection) on the same database file, replaying a mix of
+logins, availability lookups, bookings and cancellations. Reports
+throughput, latency percentiles, SQLITE_BUSY errors ("database is
+locked"), slot conflicts, and integrity violations: slots held by more
+than one live booking, bookings reported as made but missing, and a
+daily_summary that no longer matches the appointments.
+
+Usage:
+    python -m benchmarks.terminal_load_simulator --terminals 8 --mode process
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.booking_api_load_test import working_days
+from benchmarks.latency import summarize
+from benchmarks.synthetic_data import PASSWORD, load_database
+
+# Operation mix (weights)
+OPERATIONS = (
+    ("availability", 45),
+    ("book", 20),
+    ("login", 15),
+    ("list", 10),
+    ("cancel", 10),
+)
+
+# Error text of SQLITE_BUSY / SQLITE_LOCKED as raised by the sqlite3 module
+BUSY_MESSAGES = ("database is locked", "database is busy", "database table is locked")
+
+# Seconds given to the workers to start before the clock starts
+START_DELAY = 1.0
+
+
+def is_busy(message: str) -> bool:
+    """Check whether an error message reports SQLITE_BUSY."""
+    return any(busy in message for busy in BUSY_MESSAGES)
+
+
+def run_terminal(
+    terminal_id: int,
+    database_path: str,
+    operations: int,
+    days: List[str],
+    usernames: List[str],
+    seed: int,
+    start_at: float,
+) -> Dict[str, Any]:
+    """Replay the operation mix as one terminal.
+
+    Runs in a worker thread or process, so it takes and returns plain data.
+
+    Returns:
+        Latencies per operation, error counters, bookings made and
+        cancelled, and the time the terminal finished
+    """
+    from di_container import DIContainer
+
+    rng = random.Random(seed * 1000 + terminal_id)
+    names, weights = zip(*OPERATIONS)
+    stats: Dict[str, Any] = {
+        "latencies": defaultdict(list),
+        "busy": 0,
+        "conflicts": 0,
+        "errors": [],
+        "booked": [],
+        "cancelled": [],
+    }
+
+    def failed(operation: str, message: str) -> None:
+        if is_busy(message):
+            stats["busy"] += 1
+        elif "already booked" in message:
+            stats["conflicts"] += 1
+        else:
+            stats["errors"].append(f"{operation}: {message}")
+
+    container = DIContainer(Path(database_path))
+    services = container.get_services.get_all()
+    own_bookings: List[int] = []
+    time.sleep(max(0.0, start_at - time.time()))
+
+    try:
+        for _ in range(operations):
+            operation = rng.choices(names, weights)[0]
+            day = rng.choice(days)
+            start = time.perf_counter()
+            try:
+                if operation == "availability":
+                    container.get_available_slots.execute(day)
+                elif operation == "list":
+                    container.get_appointments.get_by_date(day)
+                elif operation == "login":
+                    result = container.login_user.execute(rng.choice(usernames), PASSWORD)
+                    if not result.success:
+                        failed(operation, result.message)
+                elif operation == "cancel" and own_bookings:
+                    appointment_id = own_bookings.pop(rng.randrange(len(own_bookings)))
+                    result = container.cancel_appointment.execute(appointment_id)
+                    if result.success:
+                        stats["cancelled"].append(appointment_id)
+                    else:
+                        own_bookings.append(appointment_id)
+                        failed(operation, result.message)
+                else:
+                    operation = "book"
+                    slots = container.get_available_slots.execute(day) or ["08:00"]
+                    service = rng.choice(services)
+                    result = container.create_appointment.execute(
+                        f"Terminal{terminal_id}", "Client", f"0950{terminal_id:06d}",
+                        day, rng.choice(slots), service.name, service.price,
+                    )
+                    if result.success:
+                        appointment = result.appointment
+                        own_bookings.append(appointment.appointment_id)
+                        stats["booked"].append(
+                            (appointment.appointment_id, appointment.date, appointment.time)
+                        )
+                    else:
+                        failed(operation, result.message)
+            except sqlite3.Error as e:
+                failed(operation, str(e))
+                continue
+            stats["latencies"][operation].append((time.perf_counter() - start) * 1000)
+    finally:
+        container.cleanup()
+
+    stats["latencies"] = dict(stats["latencies"])
+    stats["finished_at"] = time.time()
+    return stats
+
+
+def check_integrity(database_path: Path, all_stats: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Compare what the terminals were told with what the database holds."""
+    from infrastructure.database import DailySummary, SQLiteConnection
+
+    live: Dict[tuple, List[int]] = defaultdict(list)
+    for stats in all_stats:
+        cancelled = set(stats["cancelled"])
+        for appointment_id, day, slot in stats["booked"]:
+            if appointment_id not in cancelled:
+                live[day, slot].append(appointment_id)
+
+    conn = sqlite3.connect(database_path)
+    try:
+        stored = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT appointment_id, date, time FROM appointments")
+        }
+        duplicate_rows = conn.execute(
+            "SELECT date, time, COUNT(*) FROM appointments GROUP BY date, time HAVING COUNT(*) > 1"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    connection = SQLiteConnection(database_path)
+    try:
+        summary_mismatches = DailySummary(connection).check()
+    finally:
+        connection.close()
+
+    return {
+        "double_bookings": sorted(
+            (day, slot, ids) for (day, slot), ids in live.items() if len(ids) > 1
+        ) + [(day, slot, count) for day, slot, count in duplicate_rows],
+        "lost_bookings": sorted(
+            appointment_id
+            for (day, slot), ids in live.items()
+            for appointment_id in ids
+            if stored.get(appointment_id) != (day, slot)
+        ),
+        "summary_mismatches": summary_mismatches,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the simulation.
+
+    Returns:
+        Process exit code (non-zero on integrity violations)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terminals", type=int, default=8, help="Concurrent terminals")
+    parser.add_argument(
+        "--mode", choices=["thread", "process"], default="process",
+        help="Run terminals as threads or processes",
+    )
+    parser.add_argument("--operations", type=int, default=200, help="Operations per terminal")
+    parser.add_argument("--days", type=int, default=20, help="Distinct booking dates")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--database", type=Path,
+        help="Existing salon.db to load (default: a temporary synthetic one)",
+    )
+    args = parser.parse_args(argv)
+
+    database_path = args.database
+    if database_path is None:
+        database_path = Path(tempfile.mkdtemp(prefix="salon-terminals-")) / "salon.db"
+        load_database(
+            database_path, args.seed, years=1, customers=500,
+            end_date=date.today() - timedelta(days=1),
+        )
+    conn = sqlite3.connect(database_path)
+    try:
+        usernames = [row[0] for row in conn.execute("SELECT username FROM users")]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
+    if not usernames:
+        parser.error(f"{database_path} has no users to log in as")
+    days = working_days(args.days)
+
+    executor_class = ProcessPoolExecutor if args.mode == "process" else ThreadPoolExecutor
+    start_at = time.time() + START_DELAY
+    with executor_class(max_workers=args.terminals) as executor:
+        futures = [
+            executor.submit(
+                run_terminal, i, str(database_path), args.operations, days, usernames,
+                args.seed, start_at,
+            )
+            for i in range(args.terminals)
+        ]
+        all_stats = [future.result() for future in futures]
+    elapsed = max(stats["finished_at"] for stats in all_stats) - start_at
+
+    violations = check_integrity(database_path, all_stats)
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: List[str] = []
+    for stats in all_stats:
+        for operation, values in stats["latencies"].items():
+            latencies[operation].extend(values)
+        errors.extend(stats["errors"])
+    busy = sum(stats["busy"] for stats in all_stats)
+    conflicts = sum(stats["conflicts"] for stats in all_stats)
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"Terminals: {args.terminals} ({args.mode} mode)  Journal mode: {journal_mode}")
+    print(f"Operations: {total}  Elapsed: {elapsed:.2f}s  Throughput: {total / elapsed:.1f} ops/s")
+    print(f"{'operation':<14}{'count':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for operation, _ in OPERATIONS:
+        summary = summarize(latencies.get(operation, []))
+        print(f"{operation:<14}{summary['count']:>8}{summary['mean_ms']:>9.2f}"
+              f"{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['max_ms']:>9.2f}")
+    print(f"Booked: {sum(len(stats['booked']) for stats in all_stats)}  "
+          f"Cancelled: {sum(len(stats['cancelled']) for stats in all_stats)}  "
+          f"Slot conflicts: {conflicts}")
+    print(f"SQLITE_BUSY errors: {busy}  Other errors: {len(errors)}")
+    print(f"Double bookings: {len(violations['double_bookings'])}  "
+          f"Lost bookings: {len(violations['lost_bookings'])}  "
+          f"Summary mismatches: {len(violations['summary_mismatches'])}")
+    for message in errors[:10]:
+        print(f"  error: {message}")
+    for day, slot, holders in violations["double_bookings"][:10]:
+        print(f"  double booking: {day} {slot} {holders}")
+
+    return 1 if any(violations.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,17 +12,43 @@ class Settings:
     # Data sources
     DATA_DIR = BASE_DIR / "data" / "sources"
     RECEIPTS_DIR = BASE_DIR / "receipts"
+    LOGS_DIR = BASE_DIR / "logs"
     ASSETS_DIR = BASE_DIR / "assets"
+    CACHE_DIR = BASE_DIR / ".cache"  # derived files, safe to delete
 
     # Database
     DATABASE_PATH = DATA_DIR / "salon.db"
-    USE_SQLITE = True  # Set to False to use JSON instead
+    # Storage backend: SALON_STORAGE=json uses the JSON files below instead
+    USE_SQLITE = os.environ.get("SALON_STORAGE", "sqlite") != "json"
 
-    # JSON files
+    # Query profiling (opt-in: SALON_QUERY_PROFILING=1)
+    QUERY_PROFILING = os.environ.get("SALON_QUERY_PROFILING") == "1"
+    SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SALON_SLOW_QUERY_MS", "50"))
+    QUERY_PROFILE_REPORT = LOGS_DIR / "query_profile.txt"
+
+    # Use case metrics (disable with SALON_METRICS=0)
+    METRICS_ENABLED = os.environ.get("SALON_METRICS", "1") != "0"
+    # Prometheus file export (opt-in: SALON_METRICS_FILE=logs/metrics-{pid}.prom);
+    # "{pid}" gives every process its own file
+    METRICS_FILE = os.environ.get("SALON_METRICS_FILE") or None
+    METRICS_EXPORT_INTERVAL = 15.0  # seconds
+
+    # Detect writes by other processes (0 disables the data_version watcher)
+    DATA_VERSION_POLL_INTERVAL = float(os.environ.get("SALON_DATA_VERSION_POLL", "2.0"))
+
+    # Receipt output format: text, html or pdf
+    RECEIPT_FORMAT = os.environ.get("SALON_RECEIPT_FORMAT", "text")
+
+    # JSON files (each with a ``.log`` operation log next to it)
     USERS_JSON = DATA_DIR / "users.json"
     EMPLOYEES_JSON = DATA_DIR / "employees.json"
     APPOINTMENTS_JSON = DATA_DIR / "appointments.json"
     SERVICES_JSON = DATA_DIR / "services.json"
+    JSON_COMPACT_THRESHOLD = 1000  # log entries before a snapshot is rewritten
+    JSON_LOCK_FILE = DATA_DIR / "json.lock"  # held by the process writing the JSON files
+
+    # Columnar, memory-mappable copy of the appointments for reporting
+    APPOINTMENT_SNAPSHOT = CACHE_DIR / "appointments.snapshot"
 
     # UI Settings
     WINDOW_TITLE = "Beauty Salon"
@@ -40,7 +66,6 @@ class Settings:
     def ensure_directories(cls):
         """Create necessary directories if they don't exist."""
         cls.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        cls.RECEIPTS_DIR.mkdir(parents=True, exist_ok=True)
         (cls.ASSETS_DIR / "images").mkdir(parents=True, exist_ok=True)
 
 
@@ -3,10 +3,23 @@ from .user_repository import UserRepository
 from .employee_repository import EmployeeRepository
 from .appointment_repository import AppointmentRepository
 from .service_repository import ServiceRepository
+from .report_repository import ReportRepository
+from .unit_of_work import UnitOfWork, NullUnitOfWork
+from .async_user_repository import AsyncUserRepository
+from .async_employee_repository import AsyncEmployeeRepository
+from .async_appointment_repository import AsyncAppointmentRepository
+from .async_service_repository import AsyncServiceRepository
 
 __all__ = [
     "UserRepository",
     "EmployeeRepository",
     "AppointmentRepository",
     "ServiceRepository",
+    "ReportRepository",
+    "UnitOfWork",
+    "NullUnitOfWork",
+    "AsyncUserRepository",
+    "AsyncEmployeeRepository",
+    "AsyncAppointmentRepository",
+    "AsyncServiceRepository",
 ]
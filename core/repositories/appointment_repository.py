@@ -1,6 +1,6 @@
 """Appointment repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from core.entities import Appointment
 
 
@@ -56,6 +56,87 @@ class AppointmentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_page(self, offset: int, limit: int) -> List[Appointment]:
+        """Get one page of all appointments ordered by date and time.
+
+        Args:
+            offset: Number of appointments to skip
+            limit: Maximum number of appointments to return
+
+        Returns:
+            List of at most limit appointments
+        """
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Count all appointments.
+
+        Returns:
+            Number of appointments
+        """
+        pass
+
+    @abstractmethod
+    def get_page_after(
+        self,
+        after: Optional[Tuple[str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Appointment]:
+        """Get the next page of matching appointments ordered by date and time.
+
+        Pages are keyed on the last (date, time) returned rather than an
+        offset, so walking a large table costs the same for every page.
+
+        Args:
+            after: (date, time) of the last appointment of the previous
+                page, None for the first page
+            limit: Maximum number of appointments to return
+            start_date: First date (YYYY-MM-DD), None for no lower bound
+            end_date: Last date (YYYY-MM-DD), None for no upper bound
+            service_names: Only these services, None for all
+
+        Returns:
+            List of at most limit appointments; shorter only on the last page
+        """
+        pass
+
+    @abstractmethod
+    def get_page_by_customer(
+        self, first_name: str, last_name: str, phone_number: str, offset: int, limit: int
+    ) -> List[Appointment]:
+        """Get one page of a customer's appointments ordered by date and time.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+            offset: Number of appointments to skip
+            limit: Maximum number of appointments to return
+
+        Returns:
+            List of at most limit appointments
+        """
+        pass
+
+    @abstractmethod
+    def count_by_customer(self, first_name: str, last_name: str, phone_number: str) -> int:
+        """Count a customer's appointments.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+
+        Returns:
+            Number of appointments
+        """
+        pass
+
     @abstractmethod
     def get_by_date(self, date: str) -> List[Appointment]:
         """Get appointments by date.
@@ -68,6 +149,19 @@ class AppointmentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_date_range(self, start_date: str, end_date: str) -> List[Appointment]:
+        """Get appointments between two dates (inclusive).
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format
+
+        Returns:
+            List of appointments ordered by date and time
+        """
+        pass
+
     @abstractmethod
     def get_by_date_and_time(self, date: str, time: str) -> Optional[Appointment]:
         """Get appointment by date and time.
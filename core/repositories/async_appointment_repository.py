@@ -0,0 +1,59 @@
+"""Async appointment repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from core.entities import Appointment
+
+
+class AsyncAppointmentRepository(ABC):
+    """Asyncio counterpart of AppointmentRepository.
+
+    Methods have the same semantics as in AppointmentRepository but must not
+    block the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, appointment: Appointment) -> Appointment:
+        """Create a new appointment. See AppointmentRepository.create."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        """Get appointment by ID. See AppointmentRepository.get_by_id."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[Appointment]:
+        """Get all appointments. See AppointmentRepository.get_all."""
+        pass
+
+    @abstractmethod
+    async def get_by_customer(
+        self, first_name: str, last_name: str, phone_number: str
+    ) -> List[Appointment]:
+        """Get appointments by customer details. See AppointmentRepository.get_by_customer."""
+        pass
+
+    @abstractmethod
+    async def get_by_date(self, date: str) -> List[Appointment]:
+        """Get appointments by date. See AppointmentRepository.get_by_date."""
+        pass
+
+    @abstractmethod
+    async def get_by_date_and_time(self, date: str, time: str) -> Optional[Appointment]:
+        """Get appointment by date and time. See AppointmentRepository.get_by_date_and_time."""
+        pass
+
+    @abstractmethod
+    async def update(self, appointment: Appointment) -> Appointment:
+        """Update appointment. See AppointmentRepository.update."""
+        pass
+
+    @abstractmethod
+    async def delete(self, appointment_id: int) -> bool:
+        """Delete appointment. See AppointmentRepository.delete."""
+        pass
+
+    @abstractmethod
+    async def is_time_slot_available(self, date: str, time: str) -> bool:
+        """Check if time slot is available. See AppointmentRepository.is_time_slot_available."""
+        pass
@@ -0,0 +1,52 @@
+"""Async employee repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from core.entities import Employee
+
+
+class AsyncEmployeeRepository(ABC):
+    """Asyncio counterpart of EmployeeRepository.
+
+    Methods have the same semantics as in EmployeeRepository but must not
+    block the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, employee: Employee) -> Employee:
+        """Create a new employee. See EmployeeRepository.create."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        """Get employee by ID. See EmployeeRepository.get_by_id."""
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[Employee]:
+        """Get employee by username. See EmployeeRepository.get_by_username."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[Employee]:
+        """Get all employees. See EmployeeRepository.get_all."""
+        pass
+
+    @abstractmethod
+    async def update(self, employee: Employee) -> Employee:
+        """Update employee. See EmployeeRepository.update."""
+        pass
+
+    @abstractmethod
+    async def delete(self, employee_id: int) -> bool:
+        """Delete employee. See EmployeeRepository.delete."""
+        pass
+
+    @abstractmethod
+    async def username_exists(self, username: str) -> bool:
+        """Check if username exists. See EmployeeRepository.username_exists."""
+        pass
+
+    @abstractmethod
+    async def get_by_position(self, position: str) -> List[Employee]:
+        """Get employees by position. See EmployeeRepository.get_by_position."""
+        pass
@@ -0,0 +1,42 @@
+"""Async service repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from core.entities import Service
+
+
+class AsyncServiceRepository(ABC):
+    """Asyncio counterpart of ServiceRepository.
+
+    Methods have the same semantics as in ServiceRepository but must not
+    block the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, service: Service) -> Service:
+        """Create a new service. See ServiceRepository.create."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, service_id: int) -> Optional[Service]:
+        """Get service by ID. See ServiceRepository.get_by_id."""
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Optional[Service]:
+        """Get service by name. See ServiceRepository.get_by_name."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[Service]:
+        """Get all services. See ServiceRepository.get_all."""
+        pass
+
+    @abstractmethod
+    async def update(self, service: Service) -> Service:
+        """Update service. See ServiceRepository.update."""
+        pass
+
+    @abstractmethod
+    async def delete(self, service_id: int) -> bool:
+        """Delete service. See ServiceRepository.delete."""
+        pass
@@ -0,0 +1,47 @@
+"""Async user repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from core.entities import User
+
+
+class AsyncUserRepository(ABC):
+    """Asyncio counterpart of UserRepository.
+
+    Methods have the same semantics as in UserRepository but must not
+    block the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, user: User) -> User:
+        """Create a new user. See UserRepository.create."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID. See UserRepository.get_by_id."""
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username. See UserRepository.get_by_username."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[User]:
+        """Get all users. See UserRepository.get_all."""
+        pass
+
+    @abstractmethod
+    async def update(self, user: User) -> User:
+        """Update user. See UserRepository.update."""
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> bool:
+        """Delete user. See UserRepository.delete."""
+        pass
+
+    @abstractmethod
+    async def username_exists(self, username: str) -> bool:
+        """Check if username exists. See UserRepository.username_exists."""
+        pass
@@ -0,0 +1,88 @@
+"""Report repository interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+
+# Accepted values of ``period`` in ``revenue_by_period``
+REPORT_PERIODS = ("day", "week", "month")
+
+
+class ReportRepository(ABC):
+    """Abstract base class for aggregates over appointments.
+
+    Implementations aggregate in the storage backend (``GROUP BY`` for
+    SQLite) rather than building an Appointment per row. Date bounds are
+    inclusive YYYY-MM-DD strings; weekdays count from 0 (Monday).
+    """
+
+    @abstractmethod
+    def revenue_by_period(
+        self, start_date: str, end_date: str, period: str
+    ) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per day, week or month.
+
+        Args:
+            start_date: First date
+            end_date: Last date
+            period: "day", "week" or "month"
+
+        Returns:
+            (key, bookings, revenue) in key order; the key is the date, the
+            Monday starting the week, or the month as YYYY-MM
+        """
+        pass
+
+    @abstractmethod
+    def revenue_by_service(self, start_date: str, end_date: str) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per service.
+
+        Args:
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            (service name, bookings, revenue), highest revenue first
+        """
+        pass
+
+    @abstractmethod
+    def bookings_by_weekday_and_time(
+        self, start_date: str, end_date: str
+    ) -> List[Tuple[int, str, int]]:
+        """Count bookings per weekday and time slot.
+
+        Args:
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            (weekday, time, bookings) for every slot with a booking
+        """
+        pass
+
+    @abstractmethod
+    def customer_totals(
+        self,
+        after: Optional[Tuple[str, str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, str, str, int, float, str, str]]:
+        """Get the next page of per-customer totals.
+
+        Customers are identified by name and phone number, as on their
+        appointments, and ordered by phone number, last name, first name.
+
+        Args:
+            after: (first name, last name, phone number) of the last customer
+                of the previous page, None for the first page
+            limit: Maximum number of customers to return
+            start_date: First date, None for no lower bound
+            end_date: Last date, None for no upper bound
+            service_names: Only these services, None for all
+
+        Returns:
+            (first name, last name, phone number, bookings, revenue, first
+            date, last date) for at most limit customers
+        """
+        pass
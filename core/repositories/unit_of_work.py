@@ -0,0 +1,60 @@
+"""Unit of work interface."""
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """Abstract transaction scope spanning multiple repository calls.
+
+    Example:
+        with unit_of_work:
+            if repository.is_time_slot_available(date, time):
+                repository.create(appointment)
+    """
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Begin the transaction scope."""
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit all work done since begin()."""
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all work done since begin()."""
+        pass
+
+    def __enter__(self) -> "UnitOfWork":
+        """Enter the transaction scope."""
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """Commit on success, roll back on error."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+class NullUnitOfWork(UnitOfWork):
+    """Unit of work that does nothing.
+
+    Used when no transactional backend is wired in; every repository call
+    then commits on its own, as before.
+    """
+
+    def begin(self) -> None:
+        """Begin (no-op)."""
+        pass
+
+    def commit(self) -> None:
+        """Commit (no-op)."""
+        pass
+
+    def rollback(self) -> None:
+        """Roll back (no-op)."""
+        pass
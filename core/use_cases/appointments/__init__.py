@@ -3,10 +3,18 @@ from .create_appointment import CreateAppointment
 from .cancel_appointment import CancelAppointment
 from .get_appointments import GetAppointments
 from .get_available_slots import GetAvailableSlots
+from .async_create_appointment import AsyncCreateAppointment
+from .async_cancel_appointment import AsyncCancelAppointment
+from .async_get_appointments import AsyncGetAppointments
+from .async_get_available_slots import AsyncGetAvailableSlots
 
 __all__ = [
     "CreateAppointment",
     "CancelAppointment",
     "GetAppointments",
     "GetAvailableSlots",
+    "AsyncCreateAppointment",
+    "AsyncCancelAppointment",
+    "AsyncGetAppointments",
+    "AsyncGetAvailableSlots",
 ]
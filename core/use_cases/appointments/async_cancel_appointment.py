@@ -0,0 +1,40 @@
+"""Cancel appointment use case (asyncio)."""
+from core.repositories import AsyncAppointmentRepository
+from .cancel_appointment import CancelAppointmentResult
+
+
+class AsyncCancelAppointment:
+    """Asyncio use case for cancelling appointments."""
+
+    def __init__(self, appointment_repository: AsyncAppointmentRepository):
+        """Initialize use case.
+
+        Args:
+            appointment_repository: Async appointment repository
+        """
+        self.appointment_repository = appointment_repository
+
+    async def execute(self, appointment_id: int) -> CancelAppointmentResult:
+        """Execute appointment cancellation.
+
+        Args:
+            appointment_id: ID of appointment to cancel
+
+        Returns:
+            CancelAppointmentResult with cancellation status
+        """
+        try:
+            deleted = await self.appointment_repository.delete(appointment_id)
+
+            if deleted:
+                return CancelAppointmentResult(
+                    success=True, message="Appointment cancelled successfully"
+                )
+            else:
+                return CancelAppointmentResult(
+                    success=False, message="Appointment not found"
+                )
+        except Exception as e:
+            return CancelAppointmentResult(
+                success=False, message=f"Failed to cancel appointment: {str(e)}"
+            )
@@ -0,0 +1,120 @@
+"""Create appointment use case (asyncio)."""
+from core.entities import Appointment
+from core.repositories import AsyncAppointmentRepository
+from infrastructure.scheduling import WorkingHoursService
+from .create_appointment import (
+    INVALID_REQUEST,
+    SLOT_TAKEN,
+    STORAGE_ERROR,
+    CreateAppointmentResult,
+)
+
+
+class AsyncCreateAppointment:
+    """Asyncio use case for creating appointments."""
+
+    def __init__(
+        self,
+        appointment_repository: AsyncAppointmentRepository,
+        working_hours_service: WorkingHoursService,
+    ):
+        """Initialize use case.
+
+        Args:
+            appointment_repository: Async appointment repository
+            working_hours_service: Working hours service
+        """
+        self.appointment_repository = appointment_repository
+        self.working_hours_service = working_hours_service
+
+    async def execute(
+        self,
+        first_name: str,
+        last_name: str,
+        phone_number: str,
+        date: str,
+        time: str,
+        service_name: str,
+        service_price: float,
+    ) -> CreateAppointmentResult:
+        """Execute appointment creation.
+
+        The repository checks the slot and inserts in one write, so no unit of
+        work is needed to keep concurrent bookings apart.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+            date: Appointment date (YYYY-MM-DD)
+            time: Appointment time (HH:MM)
+            service_name: Service name
+            service_price: Service price
+
+        Returns:
+            CreateAppointmentResult with appointment details
+        """
+        # Validate required fields
+        if not all([first_name, last_name, phone_number, date, time, service_name]):
+            return CreateAppointmentResult(
+                success=False,
+                message="All fields are required",
+                error=INVALID_REQUEST,
+            )
+
+        # Check if date is a working day
+        if not self.working_hours_service.is_working_day(date):
+            return CreateAppointmentResult(
+                success=False,
+                message="Salon is closed on selected date",
+                error=INVALID_REQUEST,
+            )
+
+        # Check if time is within working hours
+        available_hours = self.working_hours_service.get_available_hours(date)
+        if time not in available_hours:
+            return CreateAppointmentResult(
+                success=False,
+                message="Selected time is outside working hours",
+                error=INVALID_REQUEST,
+            )
+
+        # Cheap read first so most conflicts never reach the writer
+        if not await self.appointment_repository.is_time_slot_available(date, time):
+            return CreateAppointmentResult(
+                success=False,
+                message="Time slot is already booked",
+                error=SLOT_TAKEN,
+            )
+
+        appointment = Appointment(
+            first_name=first_name,
+            last_name=last_name,
+            phone_number=phone_number,
+            date=date,
+            time=time,
+            service_name=service_name,
+            service_price=service_price,
+        )
+
+        try:
+            created_appointment = await self.appointment_repository.create(appointment)
+        except ValueError:
+            # Slot was taken between the read and the write
+            return CreateAppointmentResult(
+                success=False,
+                message="Time slot is already booked",
+                error=SLOT_TAKEN,
+            )
+        except Exception as e:
+            return CreateAppointmentResult(
+                success=False,
+                message=f"Failed to create appointment: {str(e)}",
+                error=STORAGE_ERROR,
+            )
+
+        return CreateAppointmentResult(
+            success=True,
+            appointment=created_appointment,
+            message="Appointment created successfully",
+        )
@@ -0,0 +1,76 @@
+"""Get appointments use case (asyncio)."""
+from typing import List, Optional
+
+from core.entities import Appointment, User, Employee
+from core.repositories import AsyncAppointmentRepository
+from config.constants import UserRole
+
+
+class AsyncGetAppointments:
+    """Asyncio use case for retrieving appointments."""
+
+    def __init__(self, appointment_repository: AsyncAppointmentRepository):
+        """Initialize use case.
+
+        Args:
+            appointment_repository: Async appointment repository
+        """
+        self.appointment_repository = appointment_repository
+
+    async def get_all(self) -> List[Appointment]:
+        """Get all appointments.
+
+        Returns:
+            List of all appointments
+        """
+        return await self.appointment_repository.get_all()
+
+    async def get_by_customer(
+        self, first_name: str, last_name: str, phone_number: str
+    ) -> List[Appointment]:
+        """Get appointments for specific customer.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+
+        Returns:
+            List of customer's appointments
+        """
+        return await self.appointment_repository.get_by_customer(
+            first_name, last_name, phone_number
+        )
+
+    async def get_by_date(self, date: str) -> List[Appointment]:
+        """Get appointments for specific date.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            List of appointments on specified date
+        """
+        return await self.appointment_repository.get_by_date(date)
+
+    async def get_for_user(
+        self, role: UserRole, user: Optional[User] = None, employee: Optional[Employee] = None
+    ) -> List[Appointment]:
+        """Get appointments based on user role.
+
+        Args:
+            role: User role
+            user: User entity (for customers)
+            employee: Employee entity (for employees)
+
+        Returns:
+            List of appointments visible to the user
+        """
+        if role == UserRole.ADMIN or role == UserRole.EMPLOYEE:
+            return await self.get_all()
+        elif role == UserRole.CUSTOMER and user:
+            return await self.get_by_customer(
+                user.first_name, user.last_name, user.phone_number
+            )
+        else:
+            return []
@@ -0,0 +1,41 @@
+"""Get available time slots use case (asyncio)."""
+from typing import List
+
+from core.repositories import AsyncAppointmentRepository
+from infrastructure.scheduling import WorkingHoursService
+
+
+class AsyncGetAvailableSlots:
+    """Asyncio use case for getting available time slots."""
+
+    def __init__(
+        self,
+        appointment_repository: AsyncAppointmentRepository,
+        working_hours_service: WorkingHoursService,
+    ):
+        """Initialize use case.
+
+        Args:
+            appointment_repository: Async appointment repository
+            working_hours_service: Working hours service
+        """
+        self.appointment_repository = appointment_repository
+        self.working_hours_service = working_hours_service
+
+    async def execute(self, date: str) -> List[str]:
+        """Get available time slots for a specific date.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            List of available time slots (e.g., ["08:00", "09:00", ...])
+        """
+        all_hours = self.working_hours_service.get_available_hours(date)
+        if not all_hours:
+            return []
+
+        booked_appointments = await self.appointment_repository.get_by_date(date)
+        booked_times = {appointment.time for appointment in booked_appointments}
+
+        return [hour for hour in all_hours if hour not in booked_times]
@@ -1,7 +1,8 @@
 """Cancel appointment use case."""
 from dataclasses import dataclass
+from typing import Optional
 
-from core.repositories import AppointmentRepository
+from core.repositories import AppointmentRepository, UnitOfWork, NullUnitOfWork
 
 
 @dataclass
@@ -15,13 +16,19 @@ class CancelAppointmentResult:
 class CancelAppointment:
     """Use case for cancelling appointments."""
 
-    def __init__(self, appointment_repository: AppointmentRepository):
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
         """Initialize use case.
 
         Args:
             appointment_repository: Appointment repository
+            unit_of_work: Transaction scope for the delete
         """
         self.appointment_repository = appointment_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     def execute(self, appointment_id: int) -> CancelAppointmentResult:
         """Execute appointment cancellation.
@@ -33,7 +40,8 @@ class CancelAppointment:
             CancelAppointmentResult with cancellation status
         """
         try:
-            deleted = self.appointment_repository.delete(appointment_id)
+            with self.unit_of_work:
+                deleted = self.appointment_repository.delete(appointment_id)
 
             if deleted:
                 return CancelAppointmentResult(
@@ -3,9 +3,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 from core.entities import Appointment
-from core.repositories import AppointmentRepository
+from core.repositories import AppointmentRepository, UnitOfWork, NullUnitOfWork
 from infrastructure.scheduling import WorkingHoursService
 
+# Kinds of failure reported in CreateAppointmentResult.error
+INVALID_REQUEST = "invalid_request"  # missing field, closed day or time outside hours
+SLOT_TAKEN = "slot_taken"
+STORAGE_ERROR = "storage_error"
+
 
 @dataclass
 class CreateAppointmentResult:
@@ -14,6 +19,7 @@ class CreateAppointmentResult:
     success: bool
     appointment: Optional[Appointment] = None
     message: str = ""
+    error: Optional[str] = None  # INVALID_REQUEST, SLOT_TAKEN or STORAGE_ERROR on failure
 
 
 class CreateAppointment:
@@ -23,15 +29,18 @@ class CreateAppointment:
         self,
         appointment_repository: AppointmentRepository,
         working_hours_service: WorkingHoursService,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
         """Initialize use case.
 
         Args:
             appointment_repository: Appointment repository
             working_hours_service: Working hours service
+            unit_of_work: Transaction scope for the availability check and insert
         """
         self.appointment_repository = appointment_repository
         self.working_hours_service = working_hours_service
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     def execute(
         self,
@@ -60,26 +69,26 @@ class CreateAppointment:
         # Validate required fields
         if not all([first_name, last_name, phone_number, date, time, service_name]):
             return CreateAppointmentResult(
-                success=False, message="All fields are required"
+                success=False,
+                message="All fields are required",
+                error=INVALID_REQUEST,
             )
 
         # Check if date is a working day
         if not self.working_hours_service.is_working_day(date):
             return CreateAppointmentResult(
-                success=False, message="Salon is closed on selected date"
+                success=False,
+                message="Salon is closed on selected date",
+                error=INVALID_REQUEST,
             )
 
         # Check if time is within working hours
         available_hours = self.working_hours_service.get_available_hours(date)
         if time not in available_hours:
             return CreateAppointmentResult(
-                success=False, message="Selected time is outside working hours"
-            )
-
-        # Check if time slot is available
-        if not self.appointment_repository.is_time_slot_available(date, time):
-            return CreateAppointmentResult(
-                success=False, message="Time slot is already booked"
+                success=False,
+                message="Selected time is outside working hours",
+                error=INVALID_REQUEST,
             )
 
         # Create appointment
@@ -94,13 +103,25 @@ class CreateAppointment:
         )
 
         try:
-            created_appointment = self.appointment_repository.create(appointment)
-            return CreateAppointmentResult(
-                success=True,
-                appointment=created_appointment,
-                message="Appointment created successfully",
-            )
+            with self.unit_of_work:
+                # Check if time slot is available
+                if not self.appointment_repository.is_time_slot_available(date, time):
+                    return CreateAppointmentResult(
+                        success=False,
+                        message="Time slot is already booked",
+                        error=SLOT_TAKEN,
+                    )
+
+                created_appointment = self.appointment_repository.create(appointment)
         except Exception as e:
             return CreateAppointmentResult(
-                success=False, message=f"Failed to create appointment: {str(e)}"
+                success=False,
+                message=f"Failed to create appointment: {str(e)}",
+                error=STORAGE_ERROR,
             )
+
+        return CreateAppointmentResult(
+            success=True,
+            appointment=created_appointment,
+            message="Appointment created successfully",
+        )
@@ -42,6 +42,60 @@ class GetAppointments:
             first_name, last_name, phone_number
         )
 
+    def get_page(self, offset: int, limit: int) -> List[Appointment]:
+        """Get one page of all appointments.
+
+        Args:
+            offset: Number of appointments to skip
+            limit: Maximum number of appointments to return
+
+        Returns:
+            List of appointments ordered by date and time
+        """
+        return self.appointment_repository.get_page(offset, limit)
+
+    def get_count(self) -> int:
+        """Get the number of appointments.
+
+        Returns:
+            Number of appointments
+        """
+        return self.appointment_repository.count()
+
+    def get_page_by_customer(
+        self, first_name: str, last_name: str, phone_number: str, offset: int, limit: int
+    ) -> List[Appointment]:
+        """Get one page of a customer's appointments.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+            offset: Number of appointments to skip
+            limit: Maximum number of appointments to return
+
+        Returns:
+            List of appointments ordered by date and time
+        """
+        return self.appointment_repository.get_page_by_customer(
+            first_name, last_name, phone_number, offset, limit
+        )
+
+    def get_count_by_customer(self, first_name: str, last_name: str, phone_number: str) -> int:
+        """Get the number of a customer's appointments.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+
+        Returns:
+            Number of appointments
+        """
+        return self.appointment_repository.count_by_customer(
+            first_name, last_name, phone_number
+        )
+
     def get_by_date(self, date: str) -> List[Appointment]:
         """Get appointments for specific date.
 
@@ -1,5 +1,6 @@
 """Get available time slots use case."""
-from typing import List
+from datetime import date as Date, timedelta
+from typing import Dict, List, Set
 
 from core.repositories import AppointmentRepository
 from infrastructure.scheduling import WorkingHoursService
@@ -42,3 +43,32 @@ class GetAvailableSlots:
         available_slots = [hour for hour in all_hours if hour not in booked_times]
 
         return available_slots
+
+    def execute_range(self, start_date: str, end_date: str) -> Dict[str, List[str]]:
+        """Get available time slots for every date in a range with one query.
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            Mapping of date (YYYY-MM-DD) to its available time slots
+        """
+        booked: Dict[str, Set[str]] = {}
+        for appointment in self.appointment_repository.get_by_date_range(start_date, end_date):
+            booked.setdefault(appointment.date, set()).add(appointment.time)
+
+        slots: Dict[str, List[str]] = {}
+        current = Date.fromisoformat(start_date)
+        last = Date.fromisoformat(end_date)
+        while current <= last:
+            day = current.isoformat()
+            booked_times = booked.get(day, set())
+            slots[day] = [
+                hour
+                for hour in self.working_hours_service.get_available_hours(day)
+                if hour not in booked_times
+            ]
+            current += timedelta(days=1)
+
+        return slots
@@ -2,4 +2,12 @@
 from .login_user import LoginUser
 from .register_user import RegisterUser
 
-__all__ = ["LoginUser", "RegisterUser"]
+__all__ = ["LoginUser", "RegisterUser", "AsyncLoginUser"]
+
+
+def __getattr__(name):
+    """Import AsyncLoginUser on first use; it pulls in asyncio."""
+    if name == "AsyncLoginUser":
+        from .async_login_user import AsyncLoginUser
+        return AsyncLoginUser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
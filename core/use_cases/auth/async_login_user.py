@@ -0,0 +1,76 @@
+"""Login user use case (asyncio)."""
+import asyncio
+
+from core.repositories import AsyncUserRepository, AsyncEmployeeRepository
+from infrastructure.security import PasswordHasher
+from config.constants import UserRole
+from config.settings import settings
+from .login_user import LoginResult
+
+
+class AsyncLoginUser:
+    """Asyncio use case for user authentication."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepository,
+        employee_repository: AsyncEmployeeRepository,
+        password_hasher: PasswordHasher,
+    ):
+        """Initialize use case.
+
+        Args:
+            user_repository: Async user repository
+            employee_repository: Async employee repository
+            password_hasher: Password hashing service
+        """
+        self.user_repository = user_repository
+        self.employee_repository = employee_repository
+        self.password_hasher = password_hasher
+
+    async def execute(self, username: str, password: str) -> LoginResult:
+        """Execute login.
+
+        The customer and employee lookups run concurrently.
+
+        Args:
+            username: Username
+            password: Plain text password
+
+        Returns:
+            LoginResult with authentication details
+        """
+        if username == settings.ADMIN_USERNAME and password == settings.ADMIN_PASSWORD:
+            return LoginResult(
+                success=True,
+                role=UserRole.ADMIN,
+                message="Admin login successful",
+            )
+
+        user, employee = await asyncio.gather(
+            self.user_repository.get_by_username(username),
+            self.employee_repository.get_by_username(username),
+        )
+
+        if user and self.password_hasher.verify_password(password, user.password_hash):
+            return LoginResult(
+                success=True,
+                role=UserRole.CUSTOMER,
+                user=user,
+                message="Customer login successful",
+            )
+
+        if employee and self.password_hasher.verify_password(
+            password, employee.password_hash
+        ):
+            return LoginResult(
+                success=True,
+                role=UserRole.EMPLOYEE,
+                employee=employee,
+                message="Employee login successful",
+            )
+
+        return LoginResult(
+            success=False, message="Invalid username or password"
+        )
+
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from core.entities import User
-from core.repositories import UserRepository, EmployeeRepository
+from core.repositories import UserRepository, EmployeeRepository, UnitOfWork, NullUnitOfWork
 from infrastructure.security import PasswordHasher, PasswordValidator
 
 
@@ -25,6 +25,7 @@ class RegisterUser:
         employee_repository: EmployeeRepository,
         password_hasher: PasswordHasher,
         password_validator: PasswordValidator,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
         """Initialize use case.
 
@@ -33,11 +34,13 @@ class RegisterUser:
             employee_repository: Employee repository
             password_hasher: Password hashing service
             password_validator: Password validation service
+            unit_of_work: Transaction scope for the username checks and insert
         """
         self.user_repository = user_repository
         self.employee_repository = employee_repository
         self.password_hasher = password_hasher
         self.password_validator = password_validator
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     def execute(
         self,
@@ -80,13 +83,8 @@ class RegisterUser:
                 message=self.password_validator.get_validation_message(),
             )
 
-        # Check if username already exists (in both users and employees)
-        if self.user_repository.username_exists(username):
-            return RegistrationResult(
-                success=False, message=f"Username '{username}' already exists"
-            )
-
-        if self.employee_repository.username_exists(username):
+        # Check if username already exists before paying for the hash
+        if self._username_taken(username):
             return RegistrationResult(
                 success=False, message=f"Username '{username}' already exists"
             )
@@ -104,13 +102,28 @@ class RegisterUser:
         )
 
         try:
-            created_user = self.user_repository.create(user)
-            return RegistrationResult(
-                success=True,
-                user=created_user,
-                message="Registration successful",
-            )
+            with self.unit_of_work:
+                # Re-check under the lock in case another writer took the name
+                if self._username_taken(username):
+                    return RegistrationResult(
+                        success=False, message=f"Username '{username}' already exists"
+                    )
+
+                created_user = self.user_repository.create(user)
         except Exception as e:
             return RegistrationResult(
                 success=False, message=f"Registration failed: {str(e)}"
             )
+
+        return RegistrationResult(
+            success=True,
+            user=created_user,
+            message="Registration successful",
+        )
+
+    def _username_taken(self, username: str) -> bool:
+        """Check whether a user or an employee already has the username."""
+        return (
+            self.user_repository.username_exists(username)
+            or self.employee_repository.username_exists(username)
+        )
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from core.entities import Employee
-from core.repositories import EmployeeRepository, UserRepository
+from core.repositories import EmployeeRepository, UserRepository, UnitOfWork, NullUnitOfWork
 from infrastructure.security import PasswordHasher, PasswordValidator
 
 
@@ -25,6 +25,7 @@ class AddEmployee:
         user_repository: UserRepository,
         password_hasher: PasswordHasher,
         password_validator: PasswordValidator,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
         """Initialize use case.
 
@@ -33,11 +34,13 @@ class AddEmployee:
             user_repository: User repository
             password_hasher: Password hashing service
             password_validator: Password validation service
+            unit_of_work: Transaction scope for the username checks and insert
         """
         self.employee_repository = employee_repository
         self.user_repository = user_repository
         self.password_hasher = password_hasher
         self.password_validator = password_validator
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     def execute(
         self,
@@ -74,13 +77,8 @@ class AddEmployee:
                 message=self.password_validator.get_validation_message(),
             )
 
-        # Check if username already exists (in both users and employees)
-        if self.employee_repository.username_exists(username):
-            return AddEmployeeResult(
-                success=False, message=f"Username '{username}' already exists"
-            )
-
-        if self.user_repository.username_exists(username):
+        # Check if username already exists before paying for the hash
+        if self._username_taken(username):
             return AddEmployeeResult(
                 success=False, message=f"Username '{username}' already exists"
             )
@@ -99,13 +97,28 @@ class AddEmployee:
         )
 
         try:
-            created_employee = self.employee_repository.create(employee)
-            return AddEmployeeResult(
-                success=True,
-                employee=created_employee,
-                message="Employee added successfully",
-            )
+            with self.unit_of_work:
+                # Re-check under the lock in case another writer took the name
+                if self._username_taken(username):
+                    return AddEmployeeResult(
+                        success=False, message=f"Username '{username}' already exists"
+                    )
+
+                created_employee = self.employee_repository.create(employee)
         except Exception as e:
             return AddEmployeeResult(
                 success=False, message=f"Failed to add employee: {str(e)}"
             )
+
+        return AddEmployeeResult(
+            success=True,
+            employee=created_employee,
+            message="Employee added successfully",
+        )
+
+    def _username_taken(self, username: str) -> bool:
+        """Check whether a user or an employee already has the username."""
+        return (
+            self.employee_repository.username_exists(username)
+            or self.user_repository.username_exists(username)
+        )
@@ -1,7 +1,8 @@
 """Remove employee use case."""
 from dataclasses import dataclass
+from typing import Optional
 
-from core.repositories import EmployeeRepository
+from core.repositories import EmployeeRepository, UnitOfWork, NullUnitOfWork
 
 
 @dataclass
@@ -15,13 +16,19 @@ class RemoveEmployeeResult:
 class RemoveEmployee:
     """Use case for removing employees."""
 
-    def __init__(self, employee_repository: EmployeeRepository):
+    def __init__(
+        self,
+        employee_repository: EmployeeRepository,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
         """Initialize use case.
 
         Args:
             employee_repository: Employee repository
+            unit_of_work: Transaction scope for the delete
         """
         self.employee_repository = employee_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
 
     def execute(self, employee_id: int) -> RemoveEmployeeResult:
         """Execute remove employee.
@@ -33,7 +40,8 @@ class RemoveEmployee:
             RemoveEmployeeResult with removal status
         """
         try:
-            deleted = self.employee_repository.delete(employee_id)
+            with self.unit_of_work:
+                deleted = self.employee_repository.delete(employee_id)
 
             if deleted:
                 return RemoveEmployeeResult(
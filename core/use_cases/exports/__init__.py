@@ -0,0 +1,5 @@
+"""Export use cases."""
+from .export_appointments import ExportAppointments, ExportResult
+from .export_customers import ExportCustomers
+
+__all__ = ["ExportAppointments", "ExportCustomers", "ExportResult"]
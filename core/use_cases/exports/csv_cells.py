@@ -0,0 +1,22 @@
+"""Cell formatting shared by the CSV exports."""
+import re
+
+# Spreadsheets evaluate cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Phone numbers and signed amounts are data, not formulas
+NUMBER_PATTERN = re.compile(r"[+-]?[\d .()/-]+")
+
+
+def safe_cell(value: str) -> str:
+    """Quote a text cell so Excel shows it instead of evaluating it.
+
+    Args:
+        value: Cell text taken from user input
+
+    Returns:
+        The value, prefixed with an apostrophe if it would start a formula
+    """
+    if value.startswith(FORMULA_PREFIXES) and not NUMBER_PATTERN.fullmatch(value):
+        return "'" + value
+    return value
@@ -0,0 +1,101 @@
+"""Export appointments use case."""
+import csv
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, TextIO
+
+from core.repositories import AppointmentRepository
+from core.use_cases.exports.csv_cells import safe_cell
+
+# Appointments fetched per query; memory use is bounded by one batch
+EXPORT_BATCH_SIZE = 5000
+
+APPOINTMENT_HEADER = [
+    "appointment_id", "date", "time", "first_name", "last_name",
+    "phone_number", "service_name", "service_price",
+]
+
+
+@dataclass
+class ExportResult:
+    """Result of an export operation."""
+
+    success: bool
+    rows: int = 0
+    seconds: float = 0.0
+    message: str = ""
+
+    @property
+    def rows_per_second(self) -> float:
+        """Export throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class ExportAppointments:
+    """Use case for writing appointments to CSV for accounting.
+
+    Appointments are streamed in (date, time) order one keyset page at a
+    time, with the date and service filters applied by the repository, so
+    memory stays flat however many rows are exported.
+    """
+
+    def __init__(self, appointment_repository: AppointmentRepository):
+        """Initialize use case.
+
+        Args:
+            appointment_repository: Appointment repository
+        """
+        self.appointment_repository = appointment_repository
+
+    def execute(
+        self,
+        output: TextIO,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> ExportResult:
+        """Write matching appointments as CSV.
+
+        Args:
+            output: Text stream opened with ``newline=""``
+            start_date: First date (YYYY-MM-DD), None for no lower bound
+            end_date: Last date (YYYY-MM-DD), None for no upper bound
+            service_names: Only these services, None for all
+            batch_size: Appointments fetched per query
+
+        Returns:
+            ExportResult with the number of rows written
+        """
+        started = time.perf_counter()
+        rows = 0
+        try:
+            writer = csv.writer(output)
+            writer.writerow(APPOINTMENT_HEADER)
+            after = None
+            while True:
+                page = self.appointment_repository.get_page_after(
+                    after, batch_size, start_date, end_date, service_names
+                )
+                writer.writerows(
+                    (
+                        apt.appointment_id, apt.date, apt.time, safe_cell(apt.first_name),
+                        safe_cell(apt.last_name), safe_cell(apt.phone_number),
+                        safe_cell(apt.service_name), f"{apt.service_price:.2f}",
+                    )
+                    for apt in page
+                )
+                rows += len(page)
+                if len(page) < batch_size:
+                    break
+                after = (page[-1].date, page[-1].time)
+        except Exception as e:
+            return ExportResult(
+                success=False, rows=rows, seconds=time.perf_counter() - started,
+                message=f"Failed to export appointments: {str(e)}",
+            )
+
+        return ExportResult(
+            success=True, rows=rows, seconds=time.perf_counter() - started,
+            message=f"Exported {rows} appointments",
+        )
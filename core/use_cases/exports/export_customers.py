@@ -0,0 +1,83 @@
+"""Export customers use case."""
+import csv
+import time
+from typing import Optional, Sequence, TextIO
+
+from core.repositories import ReportRepository
+from core.use_cases.exports.csv_cells import safe_cell
+from core.use_cases.exports.export_appointments import EXPORT_BATCH_SIZE, ExportResult
+
+CUSTOMER_HEADER = [
+    "first_name", "last_name", "phone_number", "bookings", "revenue",
+    "first_date", "last_date",
+]
+
+
+class ExportCustomers:
+    """Use case for writing per-customer booking totals to CSV.
+
+    Customers are identified by name and phone number as on their
+    appointments and streamed a page at a time, aggregated by the
+    repository with the same filters as the appointment export.
+    """
+
+    def __init__(self, report_repository: ReportRepository):
+        """Initialize use case.
+
+        Args:
+            report_repository: Report repository
+        """
+        self.report_repository = report_repository
+
+    def execute(
+        self,
+        output: TextIO,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> ExportResult:
+        """Write matching customers as CSV.
+
+        Args:
+            output: Text stream opened with ``newline=""``
+            start_date: First date (YYYY-MM-DD), None for no lower bound
+            end_date: Last date (YYYY-MM-DD), None for no upper bound
+            service_names: Only bookings of these services, None for all
+            batch_size: Customers fetched per query
+
+        Returns:
+            ExportResult with the number of rows written
+        """
+        started = time.perf_counter()
+        rows = 0
+        try:
+            writer = csv.writer(output)
+            writer.writerow(CUSTOMER_HEADER)
+            after = None
+            while True:
+                page = self.report_repository.customer_totals(
+                    after, batch_size, start_date, end_date, service_names
+                )
+                writer.writerows(
+                    (
+                        safe_cell(first_name), safe_cell(last_name), safe_cell(phone_number),
+                        bookings, f"{revenue:.2f}", first_date, last_date,
+                    )
+                    for first_name, last_name, phone_number, bookings, revenue, first_date, last_date
+                    in page
+                )
+                rows += len(page)
+                if len(page) < batch_size:
+                    break
+                after = page[-1][:3]
+        except Exception as e:
+            return ExportResult(
+                success=False, rows=rows, seconds=time.perf_counter() - started,
+                message=f"Failed to export customers: {str(e)}",
+            )
+
+        return ExportResult(
+            success=True, rows=rows, seconds=time.perf_counter() - started,
+            message=f"Exported {rows} customers",
+        )
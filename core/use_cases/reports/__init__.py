@@ -0,0 +1,12 @@
+"""Report use cases."""
+from .report_cache import ReportCache
+from .get_revenue_report import GetRevenueReport, RevenueReport
+from .get_occupancy_report import GetOccupancyReport, OccupancyReport
+
+__all__ = [
+    "ReportCache",
+    "GetRevenueReport",
+    "RevenueReport",
+    "GetOccupancyReport",
+    "OccupancyReport",
+]
@@ -0,0 +1,123 @@
+"""Get occupancy report use case."""
+from dataclasses import dataclass, replace
+from datetime import date as Date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from core.repositories import ReportRepository
+from core.use_cases.reports.report_cache import ReportCache
+from infrastructure.scheduling import WorkingHoursService
+
+
+@dataclass
+class OccupancyReport:
+    """Booked share of the working slots per weekday and time.
+
+    ``rows`` holds (weekday, time, bookings, capacity) tuples ordered by
+    weekday (0 = Monday) and time, where capacity is the number of dates
+    in the range on which that slot was open. Slots booked outside the
+    working hours appear with a capacity of 0.
+    """
+
+    start_date: str
+    end_date: str
+    rows: List[Tuple[int, str, int, int]]
+
+    @property
+    def bookings(self) -> int:
+        """Total bookings in the range."""
+        return sum(row[2] for row in self.rows)
+
+    @property
+    def capacity(self) -> int:
+        """Total open slots in the range."""
+        return sum(row[3] for row in self.rows)
+
+    @property
+    def rate(self) -> float:
+        """Booked share of all open slots (0.0 when nothing was open)."""
+        capacity = self.capacity
+        return self.bookings / capacity if capacity else 0.0
+
+    def rate_for(self, weekday: int, time: str) -> float:
+        """Booked share of one weekday/time slot.
+
+        Args:
+            weekday: 0 (Monday) to 6 (Sunday)
+            time: Slot time (HH:MM)
+
+        Returns:
+            Occupancy rate, 0.0 if the slot was never open
+        """
+        for row_weekday, row_time, bookings, capacity in self.rows:
+            if row_weekday == weekday and row_time == time:
+                return bookings / capacity if capacity else 0.0
+        return 0.0
+
+
+class GetOccupancyReport:
+    """Use case for occupancy per weekday and hour against the working hours.
+
+    Bookings come from one aggregate query; capacity is derived from
+    WorkingHoursService for each date in the range. Reports are cached
+    per date range; call ``invalidate`` with the date of every booking
+    change.
+    """
+
+    def __init__(
+        self,
+        report_repository: ReportRepository,
+        working_hours_service: WorkingHoursService,
+        cache: Optional[ReportCache] = None,
+    ):
+        """Initialize use case.
+
+        Args:
+            report_repository: Report repository
+            working_hours_service: Working hours service
+            cache: Report cache (a private one by default)
+        """
+        self.report_repository = report_repository
+        self.working_hours_service = working_hours_service
+        self.cache = cache or ReportCache()
+
+    def execute(self, start_date: str, end_date: str) -> OccupancyReport:
+        """Get the occupancy report for a date range.
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            OccupancyReport for the range
+        """
+        report = self.cache.get(("occupancy", start_date, end_date),
+                                start_date, end_date,
+                                lambda: self._compute(start_date, end_date))
+        return replace(report, rows=list(report.rows))
+
+    def invalidate(self, date: Optional[str] = None) -> None:
+        """Drop cached reports covering a date (all reports if None)."""
+        self.cache.invalidate(date)
+
+    def _compute(self, start_date: str, end_date: str) -> OccupancyReport:
+        """Combine the booking counts with the open slots of the range."""
+        capacity: Dict[Tuple[int, str], int] = {}
+        day = Date.fromisoformat(start_date)
+        last = Date.fromisoformat(end_date)
+        while day <= last:
+            for time in self.working_hours_service.get_available_hours(day.isoformat()):
+                slot = (day.weekday(), time)
+                capacity[slot] = capacity.get(slot, 0) + 1
+            day += timedelta(days=1)
+
+        bookings = {
+            (weekday, time): count
+            for weekday, time, count in self.report_repository.bookings_by_weekday_and_time(
+                start_date, end_date
+            )
+        }
+        rows = [
+            (weekday, time, bookings.get((weekday, time), 0), capacity.get((weekday, time), 0))
+            for weekday, time in sorted(capacity.keys() | bookings.keys())
+        ]
+        return OccupancyReport(start_date, end_date, rows)
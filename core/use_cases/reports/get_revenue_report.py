@@ -0,0 +1,78 @@
+"""Get revenue report use case."""
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+from core.repositories import ReportRepository
+from core.use_cases.reports.report_cache import ReportCache
+
+
+@dataclass
+class RevenueReport:
+    """Revenue over a date range, grouped by period or service.
+
+    ``rows`` holds (key, bookings, revenue) tuples; see
+    ``ReportRepository`` for the keys of each grouping.
+    """
+
+    start_date: str
+    end_date: str
+    group_by: str  # "day", "week", "month" or "service"
+    rows: List[Tuple[str, int, float]]
+
+    @property
+    def bookings(self) -> int:
+        """Total bookings in the range."""
+        return sum(row[1] for row in self.rows)
+
+    @property
+    def revenue(self) -> float:
+        """Total revenue in the range."""
+        return sum(row[2] for row in self.rows)
+
+
+class GetRevenueReport:
+    """Use case for revenue per day, week, month or service.
+
+    Reports are cached per date range; call ``invalidate`` with the date
+    of every booking change.
+    """
+
+    def __init__(self, report_repository: ReportRepository, cache: Optional[ReportCache] = None):
+        """Initialize use case.
+
+        Args:
+            report_repository: Report repository
+            cache: Report cache (a private one by default)
+        """
+        self.report_repository = report_repository
+        self.cache = cache or ReportCache()
+
+    def execute(self, start_date: str, end_date: str, group_by: str = "day") -> RevenueReport:
+        """Get the revenue report for a date range.
+
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format (inclusive)
+            group_by: "day", "week", "month" or "service"
+
+        Returns:
+            RevenueReport for the range
+
+        Raises:
+            ValueError: If group_by is not supported
+        """
+        def compute() -> RevenueReport:
+            if group_by == "service":
+                rows = self.report_repository.revenue_by_service(start_date, end_date)
+            else:
+                rows = self.report_repository.revenue_by_period(start_date, end_date, group_by)
+            return RevenueReport(start_date, end_date, group_by, rows)
+
+        report = self.cache.get(("revenue", group_by, start_date, end_date),
+                                start_date, end_date, compute)
+        # Callers get their own row list; the cached report stays intact
+        return replace(report, rows=list(report.rows))
+
+    def invalidate(self, date: Optional[str] = None) -> None:
+        """Drop cached reports covering a date (all reports if None)."""
+        self.cache.invalidate(date)
@@ -0,0 +1,69 @@
+"""Cache of computed reports keyed by their date range."""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class ReportCache:
+    """Keeps recently computed reports until a write touches their period.
+
+    Entries remember the date range they cover, so a booking on one date
+    only drops the reports whose range contains it. Like GetServices, a
+    report computed while an invalidation ran is returned but not stored.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize cache.
+
+        Args:
+            max_entries: Reports kept; the least recently used go first
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[str, str, Any]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, start_date: str, end_date: str, compute: Callable[[], Any]
+    ) -> Any:
+        """Get a cached report or compute and store it.
+
+        Args:
+            key: Identifies the report, including its date range
+            start_date: First date the report covers
+            end_date: Last date the report covers
+            compute: Builds the report on a miss
+
+        Returns:
+            The report
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[2]
+            generation = self._generation
+        value = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (start_date, end_date, value)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, date: Optional[str] = None) -> None:
+        """Drop the reports covering a date, or every report.
+
+        Args:
+            date: Date (YYYY-MM-DD) that was written, None for all
+        """
+        with self._lock:
+            self._generation += 1
+            if date is None:
+                self._entries.clear()
+                return
+            stale = [
+                key for key, (start, end, _) in self._entries.items() if start <= date <= end
+            ]
+            for key in stale:
+                del self._entries[key]
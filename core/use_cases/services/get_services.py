@@ -1,12 +1,18 @@
 """Get services use case."""
-from typing import List
+import threading
+from typing import List, Optional
 
 from core.entities import Service
 from core.repositories import ServiceRepository
 
 
 class GetServices:
-    """Use case for retrieving services."""
+    """Use case for retrieving services.
+
+    The catalog is small and rarely changes, so it is kept in memory after
+    the first load; call ``invalidate`` when services are added, changed or
+    removed.
+    """
 
     def __init__(self, service_repository: ServiceRepository):
         """Initialize use case.
@@ -15,6 +21,9 @@ class GetServices:
             service_repository: Service repository
         """
         self.service_repository = service_repository
+        self._services: Optional[List[Service]] = None
+        self._generation = 0
+        self._lock = threading.Lock()
 
     def get_all(self) -> List[Service]:
         """Get all services.
@@ -22,7 +31,16 @@ class GetServices:
         Returns:
             List of all services
         """
-        return self.service_repository.get_all()
+        with self._lock:
+            services = self._services
+            generation = self._generation
+        if services is None:
+            services = self.service_repository.get_all()
+            with self._lock:
+                # Don't cache a load that raced with an invalidation
+                if generation == self._generation:
+                    self._services = services
+        return list(services)
 
     def get_display_names(self) -> List[str]:
         """Get service display names (name -> price).
@@ -32,3 +50,9 @@ class GetServices:
         """
         services = self.get_all()
         return [service.display_name for service in services]
+
+    def invalidate(self) -> None:
+        """Drop the cached catalog so the next call reloads it."""
+        with self._lock:
+            self._services = None
+            self._generation += 1
@@ -0,0 +1,198 @@
+"""JSON implementation of AppointmentRepository."""
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from core.entities import Appointment
+from core.repositories import AppointmentRepository
+from infrastructure.file_handlers import JsonStore
+from infrastructure.events import AppointmentChanged, ChangeType, EventBus
+
+
+class JsonAppointmentRepository(AppointmentRepository):
+    """JSON implementation of appointment repository.
+
+    Appointments are kept in (date, time) order with hash indexes on the
+    slot, the date and the customer, mirroring the SQLite table's UNIQUE
+    constraint and indexes.
+    """
+
+    def __init__(self, store: JsonStore, path: Path, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            store: JSON store
+            path: Appointments snapshot file
+            event_bus: Bus receiving AppointmentChanged after every committed write
+        """
+        self.store = store
+        self.event_bus = event_bus
+        self.collection = store.collection(
+            path,
+            "appointment_id",
+            unique={"slot": ("date", "time")},
+            indexes={
+                "date": ("date",),
+                "customer": ("first_name", "last_name", "phone_number"),
+            },
+            order_by=("date", "time"),
+        )
+
+    def create(self, appointment: Appointment) -> Appointment:
+        """Create a new appointment."""
+        with self.store.transaction():
+            # Check if time slot is available
+            if not self.is_time_slot_available(appointment.date, appointment.time):
+                raise ValueError(
+                    f"Time slot {appointment.date} at {appointment.time} is already booked"
+                )
+            record = self.collection.insert(self._to_record(appointment))
+            appointment.appointment_id = record["appointment_id"]
+            self._publish(ChangeType.CREATED, appointment.appointment_id, appointment=appointment)
+        return appointment
+
+    def get_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        """Get appointment by ID."""
+        record = self.collection.get(appointment_id)
+        return self._to_entity(record) if record else None
+
+    def get_all(self) -> List[Appointment]:
+        """Get all appointments."""
+        return [self._to_entity(record) for record in self.collection.all()]
+
+    def get_by_customer(
+        self, first_name: str, last_name: str, phone_number: str
+    ) -> List[Appointment]:
+        """Get appointments by customer details."""
+        records = self.collection.find("customer", first_name, last_name, phone_number)
+        return [self._to_entity(record) for record in records]
+
+    def get_page(self, offset: int, limit: int) -> List[Appointment]:
+        """Get one page of all appointments ordered by date and time."""
+        return [self._to_entity(record) for record in self.collection.page(offset, limit)]
+
+    def count(self) -> int:
+        """Count all appointments."""
+        return self.collection.count()
+
+    def get_page_after(
+        self,
+        after: Optional[Tuple[str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Appointment]:
+        """Get the next page of matching appointments ordered by date and time."""
+        where = None
+        if service_names is not None:
+            services = set(service_names)
+
+            def in_services(record: Dict[str, Any]) -> bool:
+                return record["service_name"] in services
+
+            where = in_services
+
+        records = self.collection.page_after(after, limit, start_date, end_date, where)
+        return [self._to_entity(record) for record in records]
+
+    def get_page_by_customer(
+        self, first_name: str, last_name: str, phone_number: str, offset: int, limit: int
+    ) -> List[Appointment]:
+        """Get one page of a customer's appointments ordered by date and time."""
+        records = self.collection.find("customer", first_name, last_name, phone_number)
+        return [self._to_entity(record) for record in records[offset:offset + limit]]
+
+    def count_by_customer(self, first_name: str, last_name: str, phone_number: str) -> int:
+        """Count a customer's appointments."""
+        return self.collection.count("customer", first_name, last_name, phone_number)
+
+    def get_by_date(self, date: str) -> List[Appointment]:
+        """Get appointments by date."""
+        return [self._to_entity(record) for record in self.collection.find("date", date)]
+
+    def get_by_date_range(self, start_date: str, end_date: str) -> List[Appointment]:
+        """Get appointments between two dates (inclusive)."""
+        records = self.collection.between(start_date, end_date)
+        return [self._to_entity(record) for record in records]
+
+    def get_by_date_and_time(self, date: str, time: str) -> Optional[Appointment]:
+        """Get appointment by date and time."""
+        record = self.collection.find_one("slot", date, time)
+        return self._to_entity(record) if record else None
+
+    def update(self, appointment: Appointment) -> Appointment:
+        """Update appointment."""
+        if not appointment.appointment_id:
+            raise ValueError("Appointment ID is required for update")
+
+        with self.store.transaction():
+            previous = self.collection.replace(self._to_record(appointment))
+            if previous is None:
+                raise ValueError(
+                    f"Appointment with ID {appointment.appointment_id} not found"
+                )
+            self._publish(
+                ChangeType.UPDATED, appointment.appointment_id,
+                appointment=appointment, previous=self._to_entity(previous),
+            )
+        return appointment
+
+    def delete(self, appointment_id: int) -> bool:
+        """Delete appointment."""
+        with self.store.transaction():
+            previous = self.collection.delete(appointment_id)
+            if previous is not None:
+                self._publish(
+                    ChangeType.DELETED, appointment_id, previous=self._to_entity(previous)
+                )
+        return previous is not None
+
+    def is_time_slot_available(self, date: str, time: str) -> bool:
+        """Check if time slot is available."""
+        return self.collection.find_one("slot", date, time) is None
+
+    @staticmethod
+    def _to_record(appointment: Appointment) -> Dict[str, Any]:
+        """Convert an appointment to a stored record."""
+        return {
+            "appointment_id": appointment.appointment_id,
+            "first_name": appointment.first_name,
+            "last_name": appointment.last_name,
+            "phone_number": appointment.phone_number,
+            "date": appointment.date,
+            "time": appointment.time,
+            "service_name": appointment.service_name,
+            "service_price": appointment.service_price,
+        }
+
+    @staticmethod
+    def _to_entity(record: Dict[str, Any]) -> Appointment:
+        """Convert a stored record to an appointment."""
+        return Appointment(
+            appointment_id=record["appointment_id"],
+            first_name=record["first_name"],
+            last_name=record["last_name"],
+            phone_number=record["phone_number"],
+            date=record["date"],
+            time=record["time"],
+            service_name=record["service_name"],
+            service_price=record["service_price"],
+        )
+
+    def _publish(
+        self,
+        change: ChangeType,
+        appointment_id: int,
+        appointment: Optional[Appointment] = None,
+        previous: Optional[Appointment] = None,
+    ) -> None:
+        """Publish an AppointmentChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = AppointmentChanged(
+            change=change,
+            appointment_id=appointment_id,
+            appointment=replace(appointment) if appointment else None,
+            previous=previous,
+        )
+        self.store.after_commit(lambda: self.event_bus.publish(event))
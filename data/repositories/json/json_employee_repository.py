@@ -0,0 +1,119 @@
+"""JSON implementation of EmployeeRepository."""
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from core.entities import Employee
+from core.repositories import EmployeeRepository
+from infrastructure.file_handlers import JsonStore
+from infrastructure.events import ChangeType, EmployeeChanged, EventBus
+
+
+class JsonEmployeeRepository(EmployeeRepository):
+    """JSON implementation of employee repository."""
+
+    def __init__(self, store: JsonStore, path: Path, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            store: JSON store
+            path: Employees snapshot file
+            event_bus: Bus receiving EmployeeChanged after every committed write
+        """
+        self.store = store
+        self.event_bus = event_bus
+        self.collection = store.collection(
+            path,
+            "employee_id",
+            unique={"username": ("username",)},
+            indexes={"position": ("position",)},
+        )
+
+    def create(self, employee: Employee) -> Employee:
+        """Create a new employee."""
+        with self.store.transaction():
+            if self.username_exists(employee.username):
+                raise ValueError(f"Username '{employee.username}' already exists")
+            record = self.collection.insert(self._to_record(employee))
+            employee.employee_id = record["employee_id"]
+            self._publish(ChangeType.CREATED, employee.employee_id, employee)
+        return employee
+
+    def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        """Get employee by ID."""
+        record = self.collection.get(employee_id)
+        return self._to_entity(record) if record else None
+
+    def get_by_username(self, username: str) -> Optional[Employee]:
+        """Get employee by username."""
+        record = self.collection.find_one("username", username)
+        return self._to_entity(record) if record else None
+
+    def get_all(self) -> List[Employee]:
+        """Get all employees."""
+        return [self._to_entity(record) for record in self.collection.all()]
+
+    def update(self, employee: Employee) -> Employee:
+        """Update employee."""
+        if not employee.employee_id:
+            raise ValueError("Employee ID is required for update")
+
+        with self.store.transaction():
+            if self.collection.replace(self._to_record(employee)) is None:
+                raise ValueError(f"Employee with ID {employee.employee_id} not found")
+            self._publish(ChangeType.UPDATED, employee.employee_id, employee)
+        return employee
+
+    def delete(self, employee_id: int) -> bool:
+        """Delete employee."""
+        with self.store.transaction():
+            deleted = self.collection.delete(employee_id) is not None
+            if deleted:
+                self._publish(ChangeType.DELETED, employee_id)
+        return deleted
+
+    def username_exists(self, username: str) -> bool:
+        """Check if username exists."""
+        return self.collection.find_one("username", username) is not None
+
+    def get_by_position(self, position: str) -> List[Employee]:
+        """Get employees by position."""
+        return [self._to_entity(record) for record in self.collection.find("position", position)]
+
+    @staticmethod
+    def _to_record(employee: Employee) -> Dict[str, Any]:
+        """Convert an employee to a stored record."""
+        return {
+            "employee_id": employee.employee_id,
+            "first_name": employee.first_name,
+            "last_name": employee.last_name,
+            "position": employee.position,
+            "phone_number": employee.phone_number,
+            "username": employee.username,
+            "password_hash": employee.password_hash,
+        }
+
+    @staticmethod
+    def _to_entity(record: Dict[str, Any]) -> Employee:
+        """Convert a stored record to an employee."""
+        return Employee(
+            employee_id=record["employee_id"],
+            first_name=record["first_name"],
+            last_name=record["last_name"],
+            position=record["position"],
+            phone_number=record["phone_number"],
+            username=record["username"],
+            password_hash=record["password_hash"],
+        )
+
+    def _publish(
+        self, change: ChangeType, employee_id: int, employee: Optional[Employee] = None
+    ) -> None:
+        """Publish an EmployeeChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = EmployeeChanged(
+            change=change,
+            employee_id=employee_id,
+            employee=replace(employee) if employee else None,
+        )
+        self.store.after_commit(lambda: self.event_bus.publish(event))
@@ -0,0 +1,125 @@
+"""JSON implementation of ReportRepository."""
+from collections import Counter
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from core.repositories import ReportRepository
+from core.repositories.report_repository import REPORT_PERIODS
+from data.repositories.json.json_appointment_repository import JsonAppointmentRepository
+
+
+class JsonReportRepository(ReportRepository):
+    """JSON implementation of report repository.
+
+    Aggregates the in-memory appointment records of the date range (found
+    by binary search on the collection's date order) without turning them
+    into Appointment objects.
+    """
+
+    def __init__(self, appointment_repository: JsonAppointmentRepository):
+        """Initialize repository.
+
+        Args:
+            appointment_repository: Repository whose collection is aggregated
+        """
+        self.collection = appointment_repository.collection
+
+    def revenue_by_period(
+        self, start_date: str, end_date: str, period: str
+    ) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per day, week or month."""
+        if period not in REPORT_PERIODS:
+            raise ValueError(f"Unknown report period {period!r}")
+        key = self._period_key(period)
+        rows = self._totals(start_date, end_date, lambda record: key(record["date"]))
+        return sorted(rows)
+
+    def revenue_by_service(self, start_date: str, end_date: str) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per service."""
+        rows = self._totals(start_date, end_date, lambda record: record["service_name"])
+        return sorted(rows, key=lambda row: (-row[2], row[0]))
+
+    def bookings_by_weekday_and_time(
+        self, start_date: str, end_date: str
+    ) -> List[Tuple[int, str, int]]:
+        """Count bookings per weekday and time slot."""
+        weekdays: Dict[str, int] = {}
+        bookings: Counter = Counter()
+        for record in self.collection.between(start_date, end_date):
+            weekday = weekdays.get(record["date"])
+            if weekday is None:
+                weekday = weekdays[record["date"]] = date.fromisoformat(record["date"]).weekday()
+            bookings[weekday, record["time"]] += 1
+        return sorted((weekday, time, count) for (weekday, time), count in bookings.items())
+
+    def customer_totals(
+        self,
+        after: Optional[Tuple[str, str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, str, str, int, float, str, str]]:
+        """Get the next page of per-customer totals.
+
+        The JSON backend has no ordered customer index, so each page
+        aggregates the whole date range; it is meant for small data sets.
+        """
+        if start_date is None and end_date is None:
+            records = self.collection.all()
+        else:
+            records = self.collection.between(start_date or "", end_date or "\uffff")
+        services = None if service_names is None else set(service_names)
+        start = None
+        if after is not None:
+            first_name, last_name, phone_number = after
+            start = (phone_number, last_name, first_name)
+
+        totals: Dict[Tuple[str, str, str], list] = {}
+        for record in records:
+            if services is not None and record["service_name"] not in services:
+                continue
+            key = (record["phone_number"], record["last_name"], record["first_name"])
+            if start is not None and key <= start:
+                continue
+            total = totals.get(key)
+            if total is None:
+                totals[key] = [1, record["service_price"], record["date"], record["date"]]
+            else:
+                total[0] += 1
+                total[1] += record["service_price"]
+                total[2] = min(total[2], record["date"])
+                total[3] = max(total[3], record["date"])
+        return [
+            (first_name, last_name, phone_number, *totals[phone_number, last_name, first_name])
+            for phone_number, last_name, first_name in sorted(totals)[:limit]
+        ]
+
+    def _totals(
+        self, start_date: str, end_date: str, key: Callable[[dict], str]
+    ) -> List[Tuple[str, int, float]]:
+        """Bookings and revenue per key over the date range."""
+        bookings: Counter = Counter()
+        revenue: Counter = Counter()
+        for record in self.collection.between(start_date, end_date):
+            group = key(record)
+            bookings[group] += 1
+            revenue[group] += record["service_price"]
+        return [(group, count, revenue[group]) for group, count in bookings.items()]
+
+    @staticmethod
+    def _period_key(period: str) -> Callable[[str], str]:
+        """Map a YYYY-MM-DD date to its period key."""
+        if period == "day":
+            return lambda value: value
+        if period == "month":
+            return lambda value: value[:7]
+        weeks: Dict[str, str] = {}
+
+        def week(value: str) -> str:
+            monday = weeks.get(value)
+            if monday is None:
+                day = date.fromisoformat(value)
+                monday = weeks[value] = (day - timedelta(days=day.weekday())).isoformat()
+            return monday
+
+        return week
@@ -0,0 +1,109 @@
+"""JSON implementation of ServiceRepository."""
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from core.entities import Service
+from core.repositories import ServiceRepository
+from infrastructure.file_handlers import JsonStore
+from infrastructure.events import ChangeType, ServiceChanged, EventBus
+
+
+class JsonServiceRepository(ServiceRepository):
+    """JSON implementation of service repository."""
+
+    def __init__(self, store: JsonStore, path: Path, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            store: JSON store
+            path: Services snapshot file
+            event_bus: Bus receiving ServiceChanged after every committed write
+        """
+        self.store = store
+        self.event_bus = event_bus
+        self.collection = store.collection(
+            path, "service_id", unique={"name": ("name",)}, order_by=("name",)
+        )
+
+    def seed(self, services: Iterable[Tuple[str, float]]) -> None:
+        """Create the initial catalog if the services file has never been written.
+
+        Args:
+            services: (name, price) pairs
+        """
+        with self.store.transaction():
+            if self.collection.is_new:
+                for name, price in services:
+                    self.create(Service(name=name, price=price))
+
+    def create(self, service: Service) -> Service:
+        """Create a new service."""
+        with self.store.transaction():
+            record = self.collection.insert(self._to_record(service))
+            service.service_id = record["service_id"]
+            self._publish(ChangeType.CREATED, service.service_id, service)
+        return service
+
+    def get_by_id(self, service_id: int) -> Optional[Service]:
+        """Get service by ID."""
+        record = self.collection.get(service_id)
+        return self._to_entity(record) if record else None
+
+    def get_by_name(self, name: str) -> Optional[Service]:
+        """Get service by name."""
+        record = self.collection.find_one("name", name)
+        return self._to_entity(record) if record else None
+
+    def get_all(self) -> List[Service]:
+        """Get all services."""
+        return [self._to_entity(record) for record in self.collection.all()]
+
+    def update(self, service: Service) -> Service:
+        """Update service."""
+        if not service.service_id:
+            raise ValueError("Service ID is required for update")
+
+        with self.store.transaction():
+            if self.collection.replace(self._to_record(service)) is None:
+                raise ValueError(f"Service with ID {service.service_id} not found")
+            self._publish(ChangeType.UPDATED, service.service_id, service)
+        return service
+
+    def delete(self, service_id: int) -> bool:
+        """Delete service."""
+        with self.store.transaction():
+            deleted = self.collection.delete(service_id) is not None
+            if deleted:
+                self._publish(ChangeType.DELETED, service_id)
+        return deleted
+
+    @staticmethod
+    def _to_record(service: Service) -> Dict[str, Any]:
+        """Convert a service to a stored record."""
+        return {
+            "service_id": service.service_id,
+            "name": service.name,
+            "price": service.price,
+        }
+
+    @staticmethod
+    def _to_entity(record: Dict[str, Any]) -> Service:
+        """Convert a stored record to a service."""
+        return Service(
+            service_id=record["service_id"],
+            name=record["name"],
+            price=record["price"],
+        )
+
+    def _publish(
+        self, change: ChangeType, service_id: int, service: Optional[Service] = None
+    ) -> None:
+        """Publish a ServiceChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = ServiceChanged(
+            change=change,
+            service_id=service_id,
+            service=replace(service) if service else None,
+        )
+        self.store.after_commit(lambda: self.event_bus.publish(event))
@@ -0,0 +1,31 @@
+"""JSON implementation of UnitOfWork."""
+from core.repositories import UnitOfWork
+from infrastructure.file_handlers import JsonStore
+
+
+class JsonUnitOfWork(UnitOfWork):
+    """Runs repository calls in one JsonStore transaction.
+
+    Repositories sharing the store see the active transaction; their log
+    entries are written together on commit and undone on rollback.
+    """
+
+    def __init__(self, store: JsonStore):
+        """Initialize unit of work.
+
+        Args:
+            store: JSON store
+        """
+        self.store = store
+
+    def begin(self) -> None:
+        """Begin transaction (savepoint if already inside one)."""
+        self.store.begin()
+
+    def commit(self) -> None:
+        """Commit transaction."""
+        self.store.commit()
+
+    def rollback(self) -> None:
+        """Roll back transaction."""
+        self.store.rollback()
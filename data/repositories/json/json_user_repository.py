@@ -0,0 +1,110 @@
+"""JSON implementation of UserRepository."""
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from core.entities import User
+from core.repositories import UserRepository
+from infrastructure.file_handlers import JsonStore
+from infrastructure.events import ChangeType, UserChanged, EventBus
+
+
+class JsonUserRepository(UserRepository):
+    """JSON implementation of user repository."""
+
+    def __init__(self, store: JsonStore, path: Path, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            store: JSON store
+            path: Users snapshot file
+            event_bus: Bus receiving UserChanged after every committed write
+        """
+        self.store = store
+        self.event_bus = event_bus
+        self.collection = store.collection(
+            path, "user_id", unique={"username": ("username",)}
+        )
+
+    def create(self, user: User) -> User:
+        """Create a new user."""
+        with self.store.transaction():
+            if self.username_exists(user.username):
+                raise ValueError(f"Username '{user.username}' already exists")
+            record = self.collection.insert(self._to_record(user))
+            user.user_id = record["user_id"]
+            self._publish(ChangeType.CREATED, user.user_id, user)
+        return user
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        record = self.collection.get(user_id)
+        return self._to_entity(record) if record else None
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username."""
+        record = self.collection.find_one("username", username)
+        return self._to_entity(record) if record else None
+
+    def get_all(self) -> List[User]:
+        """Get all users."""
+        return [self._to_entity(record) for record in self.collection.all()]
+
+    def update(self, user: User) -> User:
+        """Update user."""
+        if not user.user_id:
+            raise ValueError("User ID is required for update")
+
+        with self.store.transaction():
+            if self.collection.replace(self._to_record(user)) is None:
+                raise ValueError(f"User with ID {user.user_id} not found")
+            self._publish(ChangeType.UPDATED, user.user_id, user)
+        return user
+
+    def delete(self, user_id: int) -> bool:
+        """Delete user."""
+        with self.store.transaction():
+            deleted = self.collection.delete(user_id) is not None
+            if deleted:
+                self._publish(ChangeType.DELETED, user_id)
+        return deleted
+
+    def username_exists(self, username: str) -> bool:
+        """Check if username exists."""
+        return self.collection.find_one("username", username) is not None
+
+    @staticmethod
+    def _to_record(user: User) -> Dict[str, Any]:
+        """Convert a user to a stored record."""
+        return {
+            "user_id": user.user_id,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "phone_number": user.phone_number,
+            "username": user.username,
+            "password_hash": user.password_hash,
+        }
+
+    @staticmethod
+    def _to_entity(record: Dict[str, Any]) -> User:
+        """Convert a stored record to a user."""
+        return User(
+            user_id=record["user_id"],
+            first_name=record["first_name"],
+            last_name=record["last_name"],
+            phone_number=record["phone_number"],
+            username=record["username"],
+            password_hash=record["password_hash"],
+        )
+
+    def _publish(
+        self, change: ChangeType, user_id: int, user: Optional[User] = None
+    ) -> None:
+        """Publish a UserChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = UserChanged(
+            change=change,
+            user_id=user_id,
+            user=replace(user) if user else None,
+        )
+        self.store.after_commit(lambda: self.event_bus.publish(event))
@@ -0,0 +1,32 @@
+"""WHERE conditions shared by the appointment queries that accept filters."""
+from typing import List, Optional, Sequence, Tuple
+
+
+def appointment_filters(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    service_names: Optional[Sequence[str]] = None,
+) -> Tuple[List[str], List]:
+    """Build conditions restricting appointments to a date range and services.
+
+    Args:
+        start_date: First date (YYYY-MM-DD), None for no lower bound
+        end_date: Last date (YYYY-MM-DD), None for no upper bound
+        service_names: Only these services, None for all
+
+    Returns:
+        (conditions, params) to be joined with AND
+    """
+    conditions = []
+    params: List = []
+    if start_date is not None:
+        conditions.append("date >= ?")
+        params.append(start_date)
+    if end_date is not None:
+        conditions.append("date <= ?")
+        params.append(end_date)
+    if service_names is not None:
+        service_names = list(service_names)
+        conditions.append(f"service_name IN ({', '.join('?' * len(service_names))})")
+        params.extend(service_names)
+    return conditions, params
@@ -0,0 +1,193 @@
+"""Asyncio SQLite implementation of AsyncAppointmentRepository."""
+import sqlite3
+from dataclasses import replace
+from typing import List, Optional, Tuple
+from core.entities import Appointment
+from core.repositories import AsyncAppointmentRepository
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.events import AppointmentChanged, ChangeType, EventBus
+
+
+def _to_appointment(row: sqlite3.Row) -> Appointment:
+    """Map a database row to an Appointment."""
+    return Appointment(
+        appointment_id=row["appointment_id"],
+        first_name=row["first_name"],
+        last_name=row["last_name"],
+        phone_number=row["phone_number"],
+        date=row["date"],
+        time=row["time"],
+        service_name=row["service_name"],
+        service_price=row["service_price"],
+    )
+
+
+class AsyncSQLiteAppointmentRepository(AsyncAppointmentRepository):
+    """Asyncio SQLite implementation of appointment repository."""
+
+    def __init__(self, executor: DatabaseExecutor, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            executor: Database executor running queries off the event loop
+            event_bus: Bus receiving AppointmentChanged after every committed write
+        """
+        self.executor = executor
+        self.event_bus = event_bus
+
+    async def create(self, appointment: Appointment) -> Appointment:
+        """Create a new appointment.
+
+        The availability check and the insert run in the same write, so two
+        concurrent bookings of one slot cannot both succeed.
+        """
+        def create(conn: sqlite3.Connection) -> Appointment:
+            existing = conn.execute(
+                "SELECT 1 FROM appointments WHERE date = ? AND time = ?",
+                (appointment.date, appointment.time),
+            ).fetchone()
+            if existing:
+                raise ValueError(
+                    f"Time slot {appointment.date} at {appointment.time} is already booked"
+                )
+            cursor = conn.execute(
+                """
+                INSERT INTO appointments
+                (first_name, last_name, phone_number, date, time, service_name, service_price)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    appointment.first_name,
+                    appointment.last_name,
+                    appointment.phone_number,
+                    appointment.date,
+                    appointment.time,
+                    appointment.service_name,
+                    appointment.service_price,
+                ),
+            )
+            appointment.appointment_id = cursor.lastrowid
+            return appointment
+
+        created = await self.executor.write(create)
+        self._publish(ChangeType.CREATED, created.appointment_id, appointment=created)
+        return created
+
+    async def get_by_id(self, appointment_id: int) -> Optional[Appointment]:
+        """Get appointment by ID."""
+        row = await self.executor.fetch_one(
+            "SELECT * FROM appointments WHERE appointment_id = ?", (appointment_id,)
+        )
+        return _to_appointment(row) if row else None
+
+    async def get_all(self) -> List[Appointment]:
+        """Get all appointments."""
+        rows = await self.executor.fetch_all("SELECT * FROM appointments ORDER BY date, time")
+        return [_to_appointment(row) for row in rows]
+
+    async def get_by_customer(
+        self, first_name: str, last_name: str, phone_number: str
+    ) -> List[Appointment]:
+        """Get appointments by customer details."""
+        query = """
+        SELECT * FROM appointments
+        WHERE first_name = ? AND last_name = ? AND phone_number = ?
+        ORDER BY date, time
+        """
+        rows = await self.executor.fetch_all(query, (first_name, last_name, phone_number))
+        return [_to_appointment(row) for row in rows]
+
+    async def get_by_date(self, date: str) -> List[Appointment]:
+        """Get appointments by date."""
+        rows = await self.executor.fetch_all(
+            "SELECT * FROM appointments WHERE date = ? ORDER BY time", (date,)
+        )
+        return [_to_appointment(row) for row in rows]
+
+    async def get_by_date_and_time(self, date: str, time: str) -> Optional[Appointment]:
+        """Get appointment by date and time."""
+        row = await self.executor.fetch_one(
+            "SELECT * FROM appointments WHERE date = ? AND time = ?", (date, time)
+        )
+        return _to_appointment(row) if row else None
+
+    async def update(self, appointment: Appointment) -> Appointment:
+        """Update appointment."""
+        if not appointment.appointment_id:
+            raise ValueError("Appointment ID is required for update")
+
+        def update(conn: sqlite3.Connection) -> Tuple[Appointment, Optional[Appointment]]:
+            row = conn.execute(
+                "SELECT * FROM appointments WHERE appointment_id = ?",
+                (appointment.appointment_id,),
+            ).fetchone()
+            cursor = conn.execute(
+                """
+                UPDATE appointments
+                SET first_name = ?, last_name = ?, phone_number = ?,
+                    date = ?, time = ?, service_name = ?, service_price = ?
+                WHERE appointment_id = ?
+                """,
+                (
+                    appointment.first_name,
+                    appointment.last_name,
+                    appointment.phone_number,
+                    appointment.date,
+                    appointment.time,
+                    appointment.service_name,
+                    appointment.service_price,
+                    appointment.appointment_id,
+                ),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(
+                    f"Appointment with ID {appointment.appointment_id} not found"
+                )
+            return appointment, _to_appointment(row) if row else None
+
+        updated, previous = await self.executor.write(update)
+        self._publish(
+            ChangeType.UPDATED, updated.appointment_id,
+            appointment=updated, previous=previous,
+        )
+        return updated
+
+    async def delete(self, appointment_id: int) -> bool:
+        """Delete appointment."""
+        def delete(conn: sqlite3.Connection) -> Optional[Appointment]:
+            row = conn.execute(
+                "SELECT * FROM appointments WHERE appointment_id = ?", (appointment_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM appointments WHERE appointment_id = ?", (appointment_id,))
+            return _to_appointment(row)
+
+        previous = await self.executor.write(delete)
+        if previous is None:
+            return False
+        self._publish(ChangeType.DELETED, appointment_id, previous=previous)
+        return True
+
+    async def is_time_slot_available(self, date: str, time: str) -> bool:
+        """Check if time slot is available."""
+        row = await self.executor.fetch_one(
+            "SELECT 1 FROM appointments WHERE date = ? AND time = ?", (date, time)
+        )
+        return row is None
+
+    def _publish(
+        self,
+        change: ChangeType,
+        appointment_id: int,
+        appointment: Optional[Appointment] = None,
+        previous: Optional[Appointment] = None,
+    ) -> None:
+        """Publish an AppointmentChanged event (writes resolve only after commit)."""
+        if self.event_bus is not None:
+            self.event_bus.publish(AppointmentChanged(
+                change=change,
+                appointment_id=appointment_id,
+                appointment=replace(appointment) if appointment else None,
+                previous=previous,
+            ))
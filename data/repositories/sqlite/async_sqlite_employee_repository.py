@@ -0,0 +1,147 @@
+"""Asyncio SQLite implementation of AsyncEmployeeRepository."""
+import sqlite3
+from dataclasses import replace
+from typing import List, Optional
+from core.entities import Employee
+from core.repositories import AsyncEmployeeRepository
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.events import ChangeType, EmployeeChanged, EventBus
+
+
+def _to_employee(row: sqlite3.Row) -> Employee:
+    """Map a database row to an Employee."""
+    return Employee(
+        employee_id=row["employee_id"],
+        first_name=row["first_name"],
+        last_name=row["last_name"],
+        position=row["position"],
+        phone_number=row["phone_number"],
+        username=row["username"],
+        password_hash=row["password_hash"],
+    )
+
+
+class AsyncSQLiteEmployeeRepository(AsyncEmployeeRepository):
+    """Asyncio SQLite implementation of employee repository."""
+
+    def __init__(self, executor: DatabaseExecutor, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            executor: Database executor running queries off the event loop
+            event_bus: Bus receiving EmployeeChanged after every committed write
+        """
+        self.executor = executor
+        self.event_bus = event_bus
+
+    async def create(self, employee: Employee) -> Employee:
+        """Create a new employee."""
+        def create(conn: sqlite3.Connection) -> Employee:
+            existing = conn.execute(
+                "SELECT 1 FROM employees WHERE username = ?", (employee.username,)
+            ).fetchone()
+            if existing:
+                raise ValueError(f"Username '{employee.username}' already exists")
+            cursor = conn.execute(
+                """
+                INSERT INTO employees
+                (first_name, last_name, position, phone_number, username, password_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    employee.first_name,
+                    employee.last_name,
+                    employee.position,
+                    employee.phone_number,
+                    employee.username,
+                    employee.password_hash,
+                ),
+            )
+            employee.employee_id = cursor.lastrowid
+            return employee
+
+        created = await self.executor.write(create)
+        self._publish(ChangeType.CREATED, created.employee_id, created)
+        return created
+
+    async def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        """Get employee by ID."""
+        row = await self.executor.fetch_one(
+            "SELECT * FROM employees WHERE employee_id = ?", (employee_id,)
+        )
+        return _to_employee(row) if row else None
+
+    async def get_by_username(self, username: str) -> Optional[Employee]:
+        """Get employee by username."""
+        row = await self.executor.fetch_one(
+            "SELECT * FROM employees WHERE username = ?", (username,)
+        )
+        return _to_employee(row) if row else None
+
+    async def get_all(self) -> List[Employee]:
+        """Get all employees."""
+        rows = await self.executor.fetch_all("SELECT * FROM employees ORDER BY employee_id")
+        return [_to_employee(row) for row in rows]
+
+    async def update(self, employee: Employee) -> Employee:
+        """Update employee."""
+        if not employee.employee_id:
+            raise ValueError("Employee ID is required for update")
+
+        query = """
+        UPDATE employees
+        SET first_name = ?, last_name = ?, position = ?, phone_number = ?,
+            username = ?, password_hash = ?
+        WHERE employee_id = ?
+        """
+        updated = await self.executor.execute(
+            query,
+            (
+                employee.first_name,
+                employee.last_name,
+                employee.position,
+                employee.phone_number,
+                employee.username,
+                employee.password_hash,
+                employee.employee_id,
+            ),
+        )
+        if updated == 0:
+            raise ValueError(f"Employee with ID {employee.employee_id} not found")
+        self._publish(ChangeType.UPDATED, employee.employee_id, employee)
+        return employee
+
+    async def delete(self, employee_id: int) -> bool:
+        """Delete employee."""
+        deleted = await self.executor.execute(
+            "DELETE FROM employees WHERE employee_id = ?", (employee_id,)
+        )
+        if deleted == 0:
+            return False
+        self._publish(ChangeType.DELETED, employee_id)
+        return True
+
+    async def username_exists(self, username: str) -> bool:
+        """Check if username exists."""
+        row = await self.executor.fetch_one(
+            "SELECT 1 FROM employees WHERE username = ?", (username,)
+        )
+        return row is not None
+
+    async def get_by_position(self, position: str) -> List[Employee]:
+        """Get employees by position."""
+        rows = await self.executor.fetch_all(
+            "SELECT * FROM employees WHERE position = ? ORDER BY employee_id", (position,)
+        )
+        return [_to_employee(row) for row in rows]
+
+    def _publish(
+        self, change: ChangeType, employee_id: int, employee: Optional[Employee] = None
+    ) -> None:
+        """Publish a EmployeeChanged event (writes resolve only after commit)."""
+        if self.event_bus is not None:
+            self.event_bus.publish(EmployeeChanged(
+                change=change,
+                employee_id=employee_id,
+                employee=replace(employee) if employee else None,
+            ))
@@ -0,0 +1,97 @@
+"""Asyncio SQLite implementation of AsyncServiceRepository."""
+import sqlite3
+from dataclasses import replace
+from typing import List, Optional
+from core.entities import Service
+from core.repositories import AsyncServiceRepository
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.events import ChangeType, ServiceChanged, EventBus
+
+
+def _to_service(row: sqlite3.Row) -> Service:
+    """Map a database row to a Service."""
+    return Service(
+        service_id=row["service_id"],
+        name=row["name"],
+        price=row["price"],
+    )
+
+
+class AsyncSQLiteServiceRepository(AsyncServiceRepository):
+    """Asyncio SQLite implementation of service repository."""
+
+    def __init__(self, executor: DatabaseExecutor, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            executor: Database executor running queries off the event loop
+            event_bus: Bus receiving ServiceChanged after every committed write
+        """
+        self.executor = executor
+        self.event_bus = event_bus
+
+    async def create(self, service: Service) -> Service:
+        """Create a new service."""
+        def create(conn: sqlite3.Connection) -> Service:
+            cursor = conn.execute(
+                "INSERT INTO services (name, price) VALUES (?, ?)",
+                (service.name, service.price),
+            )
+            service.service_id = cursor.lastrowid
+            return service
+
+        created = await self.executor.write(create)
+        self._publish(ChangeType.CREATED, created.service_id, created)
+        return created
+
+    async def get_by_id(self, service_id: int) -> Optional[Service]:
+        """Get service by ID."""
+        row = await self.executor.fetch_one(
+            "SELECT * FROM services WHERE service_id = ?", (service_id,)
+        )
+        return _to_service(row) if row else None
+
+    async def get_by_name(self, name: str) -> Optional[Service]:
+        """Get service by name."""
+        row = await self.executor.fetch_one("SELECT * FROM services WHERE name = ?", (name,))
+        return _to_service(row) if row else None
+
+    async def get_all(self) -> List[Service]:
+        """Get all services."""
+        rows = await self.executor.fetch_all("SELECT * FROM services ORDER BY name")
+        return [_to_service(row) for row in rows]
+
+    async def update(self, service: Service) -> Service:
+        """Update service."""
+        if not service.service_id:
+            raise ValueError("Service ID is required for update")
+
+        updated = await self.executor.execute(
+            "UPDATE services SET name = ?, price = ? WHERE service_id = ?",
+            (service.name, service.price, service.service_id),
+        )
+        if updated == 0:
+            raise ValueError(f"Service with ID {service.service_id} not found")
+        self._publish(ChangeType.UPDATED, service.service_id, service)
+        return service
+
+    async def delete(self, service_id: int) -> bool:
+        """Delete service."""
+        deleted = await self.executor.execute(
+            "DELETE FROM services WHERE service_id = ?", (service_id,)
+        )
+        if deleted == 0:
+            return False
+        self._publish(ChangeType.DELETED, service_id)
+        return True
+
+    def _publish(
+        self, change: ChangeType, service_id: int, service: Optional[Service] = None
+    ) -> None:
+        """Publish a ServiceChanged event (writes resolve only after commit)."""
+        if self.event_bus is not None:
+            self.event_bus.publish(ServiceChanged(
+                change=change,
+                service_id=service_id,
+                service=replace(service) if service else None,
+            ))
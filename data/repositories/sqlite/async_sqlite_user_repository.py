@@ -0,0 +1,127 @@
+"""Asyncio SQLite implementation of AsyncUserRepository."""
+import sqlite3
+from dataclasses import replace
+from typing import List, Optional
+from core.entities import User
+from core.repositories import AsyncUserRepository
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.events import ChangeType, UserChanged, EventBus
+
+
+def _to_user(row: sqlite3.Row) -> User:
+    """Map a database row to a User."""
+    return User(
+        user_id=row["user_id"],
+        first_name=row["first_name"],
+        last_name=row["last_name"],
+        phone_number=row["phone_number"],
+        username=row["username"],
+        password_hash=row["password_hash"],
+    )
+
+
+class AsyncSQLiteUserRepository(AsyncUserRepository):
+    """Asyncio SQLite implementation of user repository."""
+
+    def __init__(self, executor: DatabaseExecutor, event_bus: Optional[EventBus] = None):
+        """Initialize repository.
+
+        Args:
+            executor: Database executor running queries off the event loop
+            event_bus: Bus receiving UserChanged after every committed write
+        """
+        self.executor = executor
+        self.event_bus = event_bus
+
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        def create(conn: sqlite3.Connection) -> User:
+            existing = conn.execute(
+                "SELECT 1 FROM users WHERE username = ?", (user.username,)
+            ).fetchone()
+            if existing:
+                raise ValueError(f"Username '{user.username}' already exists")
+            cursor = conn.execute(
+                """
+                INSERT INTO users (first_name, last_name, phone_number, username, password_hash)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    user.first_name,
+                    user.last_name,
+                    user.phone_number,
+                    user.username,
+                    user.password_hash,
+                ),
+            )
+            user.user_id = cursor.lastrowid
+            return user
+
+        created = await self.executor.write(create)
+        self._publish(ChangeType.CREATED, created.user_id, created)
+        return created
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        row = await self.executor.fetch_one("SELECT * FROM users WHERE user_id = ?", (user_id,))
+        return _to_user(row) if row else None
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username."""
+        row = await self.executor.fetch_one("SELECT * FROM users WHERE username = ?", (username,))
+        return _to_user(row) if row else None
+
+    async def get_all(self) -> List[User]:
+        """Get all users."""
+        rows = await self.executor.fetch_all("SELECT * FROM users ORDER BY user_id")
+        return [_to_user(row) for row in rows]
+
+    async def update(self, user: User) -> User:
+        """Update user."""
+        if not user.user_id:
+            raise ValueError("User ID is required for update")
+
+        query = """
+        UPDATE users
+        SET first_name = ?, last_name = ?, phone_number = ?, username = ?, password_hash = ?
+        WHERE user_id = ?
+        """
+        updated = await self.executor.execute(
+            query,
+            (
+                user.first_name,
+                user.last_name,
+                user.phone_number,
+                user.username,
+                user.password_hash,
+                user.user_id,
+            ),
+        )
+        if updated == 0:
+            raise ValueError(f"User with ID {user.user_id} not found")
+        self._publish(ChangeType.UPDATED, user.user_id, user)
+        return user
+
+    async def delete(self, user_id: int) -> bool:
+        """Delete user."""
+        deleted = await self.executor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+        if deleted == 0:
+            return False
+        self._publish(ChangeType.DELETED, user_id)
+        return True
+
+    async def username_exists(self, username: str) -> bool:
+        """Check if username exists."""
+        row = await self.executor.fetch_one("SELECT 1 FROM users WHERE username = ?", (username,))
+        return row is not None
+
+    def _publish(
+        self, change: ChangeType, user_id: int, user: Optional[User] = None
+    ) -> None:
+        """Publish a UserChanged event (writes resolve only after commit)."""
+        if self.event_bus is not None:
+            self.event_bus.publish(UserChanged(
+                change=change,
+                user_id=user_id,
+                user=replace(user) if user else None,
+            ))
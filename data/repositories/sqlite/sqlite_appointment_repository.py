@@ -1,20 +1,25 @@
 """SQLite implementation of AppointmentRepository."""
-from typing import List, Optional
+from dataclasses import replace
+from typing import List, Optional, Sequence, Tuple
 from core.entities import Appointment
 from core.repositories import AppointmentRepository
 from infrastructure.database import SQLiteConnection
+from data.repositories.sqlite.appointment_filters import appointment_filters
+from infrastructure.events import AppointmentChanged, ChangeType, EventBus
 
 
 class SQLiteAppointmentRepository(AppointmentRepository):
     """SQLite implementation of appointment repository."""
 
-    def __init__(self, connection: SQLiteConnection):
+    def __init__(self, connection: SQLiteConnection, event_bus: Optional[EventBus] = None):
         """Initialize repository.
 
         Args:
             connection: SQLite connection manager
+            event_bus: Bus receiving AppointmentChanged after every committed write
         """
         self.connection = connection
+        self.event_bus = event_bus
 
     def create(self, appointment: Appointment) -> Appointment:
         """Create a new appointment."""
@@ -43,6 +48,8 @@ class SQLiteAppointmentRepository(AppointmentRepository):
                 ),
             )
             appointment.appointment_id = cursor.lastrowid
+
+        self._publish(ChangeType.CREATED, appointment.appointment_id, appointment=appointment)
         return appointment
 
     def get_by_id(self, appointment_id: int) -> Optional[Appointment]:
@@ -107,6 +114,102 @@ class SQLiteAppointmentRepository(AppointmentRepository):
             for row in rows
         ]
 
+    def get_page(self, offset: int, limit: int) -> List[Appointment]:
+        """Get one page of all appointments ordered by date and time."""
+        query = "SELECT * FROM appointments ORDER BY date, time LIMIT ? OFFSET ?"
+        rows = self.connection.fetch_all(query, (limit, offset))
+
+        return [
+            Appointment(
+                appointment_id=row["appointment_id"],
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                phone_number=row["phone_number"],
+                date=row["date"],
+                time=row["time"],
+                service_name=row["service_name"],
+                service_price=row["service_price"],
+            )
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """Count all appointments from the daily totals (O(days), not O(rows))."""
+        row = self.connection.fetch_one("SELECT COALESCE(SUM(bookings), 0) FROM daily_summary")
+        return row[0]
+
+    def get_page_after(
+        self,
+        after: Optional[Tuple[str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Appointment]:
+        """Get the next page of matching appointments ordered by date and time.
+
+        The (date, time) > (?, ?) bound is a range seek on the UNIQUE(date,
+        time) index, so every page costs O(limit).
+        """
+        conditions, params = appointment_filters(start_date, end_date, service_names)
+        if after is not None:
+            conditions.insert(0, "(date, time) > (?, ?)")
+            params[:0] = after
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT * FROM appointments {where} ORDER BY date, time LIMIT ?"
+        rows = self.connection.fetch_all(query, (*params, limit))
+
+        return [
+            Appointment(
+                appointment_id=row["appointment_id"],
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                phone_number=row["phone_number"],
+                date=row["date"],
+                time=row["time"],
+                service_name=row["service_name"],
+                service_price=row["service_price"],
+            )
+            for row in rows
+        ]
+
+    def get_page_by_customer(
+        self, first_name: str, last_name: str, phone_number: str, offset: int, limit: int
+    ) -> List[Appointment]:
+        """Get one page of a customer's appointments ordered by date and time."""
+        query = """
+        SELECT * FROM appointments
+        WHERE first_name = ? AND last_name = ? AND phone_number = ?
+        ORDER BY date, time
+        LIMIT ? OFFSET ?
+        """
+        rows = self.connection.fetch_all(
+            query, (first_name, last_name, phone_number, limit, offset)
+        )
+
+        return [
+            Appointment(
+                appointment_id=row["appointment_id"],
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                phone_number=row["phone_number"],
+                date=row["date"],
+                time=row["time"],
+                service_name=row["service_name"],
+                service_price=row["service_price"],
+            )
+            for row in rows
+        ]
+
+    def count_by_customer(self, first_name: str, last_name: str, phone_number: str) -> int:
+        """Count a customer's appointments."""
+        query = """
+        SELECT COUNT(*) FROM appointments
+        WHERE first_name = ? AND last_name = ? AND phone_number = ?
+        """
+        row = self.connection.fetch_one(query, (first_name, last_name, phone_number))
+        return row[0]
+
     def get_by_date(self, date: str) -> List[Appointment]:
         """Get appointments by date."""
         query = "SELECT * FROM appointments WHERE date = ? ORDER BY time"
@@ -126,6 +229,29 @@ class SQLiteAppointmentRepository(AppointmentRepository):
             for row in rows
         ]
 
+    def get_by_date_range(self, start_date: str, end_date: str) -> List[Appointment]:
+        """Get appointments between two dates (inclusive)."""
+        query = """
+        SELECT * FROM appointments
+        WHERE date BETWEEN ? AND ?
+        ORDER BY date, time
+        """
+        rows = self.connection.fetch_all(query, (start_date, end_date))
+
+        return [
+            Appointment(
+                appointment_id=row["appointment_id"],
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                phone_number=row["phone_number"],
+                date=row["date"],
+                time=row["time"],
+                service_name=row["service_name"],
+                service_price=row["service_price"],
+            )
+            for row in rows
+        ]
+
     def get_by_date_and_time(self, date: str, time: str) -> Optional[Appointment]:
         """Get appointment by date and time."""
         query = "SELECT * FROM appointments WHERE date = ? AND time = ?"
@@ -155,7 +281,8 @@ class SQLiteAppointmentRepository(AppointmentRepository):
             date = ?, time = ?, service_name = ?, service_price = ?
         WHERE appointment_id = ?
         """
-        with self.connection.get_cursor() as cursor:
+        with self.connection.transaction(), self.connection.get_cursor() as cursor:
+            previous = self.get_by_id(appointment.appointment_id) if self.event_bus else None
             cursor.execute(
                 query,
                 (
@@ -174,16 +301,43 @@ class SQLiteAppointmentRepository(AppointmentRepository):
                     f"Appointment with ID {appointment.appointment_id} not found"
                 )
 
+        self._publish(
+            ChangeType.UPDATED, appointment.appointment_id,
+            appointment=appointment, previous=previous,
+        )
         return appointment
 
     def delete(self, appointment_id: int) -> bool:
         """Delete appointment."""
         query = "DELETE FROM appointments WHERE appointment_id = ?"
-        with self.connection.get_cursor() as cursor:
+        with self.connection.transaction(), self.connection.get_cursor() as cursor:
+            previous = self.get_by_id(appointment_id) if self.event_bus else None
             cursor.execute(query, (appointment_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._publish(ChangeType.DELETED, appointment_id, previous=previous)
+        return deleted
 
     def is_time_slot_available(self, date: str, time: str) -> bool:
         """Check if time slot is available."""
         existing = self.get_by_date_and_time(date, time)
         return existing is None
+
+    def _publish(
+        self,
+        change: ChangeType,
+        appointment_id: int,
+        appointment: Optional[Appointment] = None,
+        previous: Optional[Appointment] = None,
+    ) -> None:
+        """Publish an AppointmentChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = AppointmentChanged(
+            change=change,
+            appointment_id=appointment_id,
+            appointment=replace(appointment) if appointment else None,
+            previous=previous,
+        )
+        self.connection.after_commit(lambda: self.event_bus.publish(event))
@@ -1,20 +1,24 @@
 """SQLite implementation of EmployeeRepository."""
+from dataclasses import replace
 from typing import List, Optional
 from core.entities import Employee
 from core.repositories import EmployeeRepository
 from infrastructure.database import SQLiteConnection
+from infrastructure.events import ChangeType, EmployeeChanged, EventBus
 
 
 class SQLiteEmployeeRepository(EmployeeRepository):
     """SQLite implementation of employee repository."""
 
-    def __init__(self, connection: SQLiteConnection):
+    def __init__(self, connection: SQLiteConnection, event_bus: Optional[EventBus] = None):
         """Initialize repository.
 
         Args:
             connection: SQLite connection manager
+            event_bus: Bus receiving EmployeeChanged after every committed write
         """
         self.connection = connection
+        self.event_bus = event_bus
 
     def create(self, employee: Employee) -> Employee:
         """Create a new employee."""
@@ -38,6 +42,8 @@ class SQLiteEmployeeRepository(EmployeeRepository):
                 ),
             )
             employee.employee_id = cursor.lastrowid
+
+        self._publish(ChangeType.CREATED, employee.employee_id, employee)
         return employee
 
     def get_by_id(self, employee_id: int) -> Optional[Employee]:
@@ -118,6 +124,7 @@ class SQLiteEmployeeRepository(EmployeeRepository):
             if cursor.rowcount == 0:
                 raise ValueError(f"Employee with ID {employee.employee_id} not found")
 
+        self._publish(ChangeType.UPDATED, employee.employee_id, employee)
         return employee
 
     def delete(self, employee_id: int) -> bool:
@@ -125,7 +132,11 @@ class SQLiteEmployeeRepository(EmployeeRepository):
         query = "DELETE FROM employees WHERE employee_id = ?"
         with self.connection.get_cursor() as cursor:
             cursor.execute(query, (employee_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._publish(ChangeType.DELETED, employee_id)
+        return deleted
 
     def username_exists(self, username: str) -> bool:
         """Check if username exists."""
@@ -150,3 +161,16 @@ class SQLiteEmployeeRepository(EmployeeRepository):
             )
             for row in rows
         ]
+
+    def _publish(
+        self, change: ChangeType, employee_id: int, employee: Optional[Employee] = None
+    ) -> None:
+        """Publish a EmployeeChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = EmployeeChanged(
+            change=change,
+            employee_id=employee_id,
+            employee=replace(employee) if employee else None,
+        )
+        self.connection.after_commit(lambda: self.event_bus.publish(event))
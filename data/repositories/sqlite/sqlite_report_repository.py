@@ -0,0 +1,113 @@
+"""SQLite implementation of ReportRepository."""
+from typing import List, Optional, Sequence, Tuple
+from core.repositories import ReportRepository
+from core.repositories.report_repository import REPORT_PERIODS
+from infrastructure.database import SQLiteConnection
+from data.repositories.sqlite.appointment_filters import appointment_filters
+
+# Monday = 0, matching datetime.weekday(); strftime('%w') starts on Sunday
+WEEKDAY = "(CAST(strftime('%w', date) AS INTEGER) + 6) % 7"
+
+PERIOD_KEYS = {
+    "day": "date",
+    "week": f"date(date, '-' || ({WEEKDAY}) || ' days')",
+    "month": "substr(date, 1, 7)",
+}
+
+
+class SQLiteReportRepository(ReportRepository):
+    """SQLite implementation of report repository.
+
+    Revenue reports aggregate the ``daily_summary`` table, so they cost
+    O(days x services) rather than O(appointments). Occupancy needs the
+    time of day and groups the appointments themselves, served by the
+    UNIQUE(date, time) index.
+    """
+
+    def __init__(self, connection: SQLiteConnection):
+        """Initialize repository.
+
+        Args:
+            connection: SQLite connection manager
+        """
+        self.connection = connection
+
+    def revenue_by_period(
+        self, start_date: str, end_date: str, period: str
+    ) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per day, week or month."""
+        if period not in REPORT_PERIODS:
+            raise ValueError(f"Unknown report period {period!r}")
+        query = f"""
+        SELECT {PERIOD_KEYS[period]} AS period, SUM(bookings) AS bookings,
+               SUM(revenue) AS revenue
+        FROM daily_summary
+        WHERE date BETWEEN ? AND ?
+        GROUP BY period
+        ORDER BY period
+        """
+        rows = self.connection.fetch_all(query, (start_date, end_date))
+        return [(row["period"], row["bookings"], row["revenue"]) for row in rows]
+
+    def revenue_by_service(self, start_date: str, end_date: str) -> List[Tuple[str, int, float]]:
+        """Get bookings and revenue per service."""
+        query = """
+        SELECT service_name, SUM(bookings) AS bookings, SUM(revenue) AS revenue
+        FROM daily_summary
+        WHERE date BETWEEN ? AND ?
+        GROUP BY service_name
+        ORDER BY revenue DESC, service_name
+        """
+        rows = self.connection.fetch_all(query, (start_date, end_date))
+        return [(row["service_name"], row["bookings"], row["revenue"]) for row in rows]
+
+    def bookings_by_weekday_and_time(
+        self, start_date: str, end_date: str
+    ) -> List[Tuple[int, str, int]]:
+        """Count bookings per weekday and time slot."""
+        query = f"""
+        SELECT {WEEKDAY} AS weekday, time, COUNT(*) AS bookings
+        FROM appointments
+        WHERE date BETWEEN ? AND ?
+        GROUP BY weekday, time
+        ORDER BY weekday, time
+        """
+        rows = self.connection.fetch_all(query, (start_date, end_date))
+        return [(row["weekday"], row["time"], row["bookings"]) for row in rows]
+
+    def customer_totals(
+        self,
+        after: Optional[Tuple[str, str, str]],
+        limit: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        service_names: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, str, str, int, float, str, str]]:
+        """Get the next page of per-customer totals.
+
+        Walks the customer index from ``after``, so the grouping needs no
+        temporary sort and every page costs O(its customers' appointments).
+        """
+        conditions, params = appointment_filters(start_date, end_date, service_names)
+        if after is not None:
+            first_name, last_name, phone_number = after
+            conditions.insert(0, "(phone_number, last_name, first_name) > (?, ?, ?)")
+            params[:0] = (phone_number, last_name, first_name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+        SELECT first_name, last_name, phone_number, COUNT(*) AS bookings,
+               SUM(service_price) AS revenue, MIN(date) AS first_date, MAX(date) AS last_date
+        FROM appointments
+        {where}
+        GROUP BY phone_number, last_name, first_name
+        ORDER BY phone_number, last_name, first_name
+        LIMIT ?
+        """
+        rows = self.connection.fetch_all(query, (*params, limit))
+        return [
+            (
+                row["first_name"], row["last_name"], row["phone_number"], row["bookings"],
+                row["revenue"], row["first_date"], row["last_date"],
+            )
+            for row in rows
+        ]
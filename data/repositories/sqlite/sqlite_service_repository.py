@@ -1,20 +1,24 @@
 """SQLite implementation of ServiceRepository."""
+from dataclasses import replace
 from typing import List, Optional
 from core.entities import Service
 from core.repositories import ServiceRepository
 from infrastructure.database import SQLiteConnection
+from infrastructure.events import ChangeType, ServiceChanged, EventBus
 
 
 class SQLiteServiceRepository(ServiceRepository):
     """SQLite implementation of service repository."""
 
-    def __init__(self, connection: SQLiteConnection):
+    def __init__(self, connection: SQLiteConnection, event_bus: Optional[EventBus] = None):
         """Initialize repository.
 
         Args:
             connection: SQLite connection manager
+            event_bus: Bus receiving ServiceChanged after every committed write
         """
         self.connection = connection
+        self.event_bus = event_bus
 
     def create(self, service: Service) -> Service:
         """Create a new service."""
@@ -22,6 +26,8 @@ class SQLiteServiceRepository(ServiceRepository):
         with self.connection.get_cursor() as cursor:
             cursor.execute(query, (service.name, service.price))
             service.service_id = cursor.lastrowid
+
+        self._publish(ChangeType.CREATED, service.service_id, service)
         return service
 
     def get_by_id(self, service_id: int) -> Optional[Service]:
@@ -77,6 +83,7 @@ class SQLiteServiceRepository(ServiceRepository):
             if cursor.rowcount == 0:
                 raise ValueError(f"Service with ID {service.service_id} not found")
 
+        self._publish(ChangeType.UPDATED, service.service_id, service)
         return service
 
     def delete(self, service_id: int) -> bool:
@@ -84,4 +91,21 @@ class SQLiteServiceRepository(ServiceRepository):
         query = "DELETE FROM services WHERE service_id = ?"
         with self.connection.get_cursor() as cursor:
             cursor.execute(query, (service_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._publish(ChangeType.DELETED, service_id)
+        return deleted
+
+    def _publish(
+        self, change: ChangeType, service_id: int, service: Optional[Service] = None
+    ) -> None:
+        """Publish a ServiceChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = ServiceChanged(
+            change=change,
+            service_id=service_id,
+            service=replace(service) if service else None,
+        )
+        self.connection.after_commit(lambda: self.event_bus.publish(event))
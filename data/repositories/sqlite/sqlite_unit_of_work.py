@@ -0,0 +1,31 @@
+"""SQLite implementation of UnitOfWork."""
+from core.repositories import UnitOfWork
+from infrastructure.database import SQLiteConnection
+
+
+class SQLiteUnitOfWork(UnitOfWork):
+    """Runs repository calls in one ``BEGIN IMMEDIATE ... COMMIT``.
+
+    Repositories sharing the same connection see the active transaction and
+    skip their per-statement commit.
+    """
+
+    def __init__(self, connection: SQLiteConnection):
+        """Initialize unit of work.
+
+        Args:
+            connection: SQLite connection manager
+        """
+        self.connection = connection
+
+    def begin(self) -> None:
+        """Begin transaction (savepoint if already inside one)."""
+        self.connection.begin()
+
+    def commit(self) -> None:
+        """Commit transaction."""
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        """Roll back transaction."""
+        self.connection.rollback()
@@ -1,20 +1,24 @@
 """SQLite implementation of UserRepository."""
+from dataclasses import replace
 from typing import List, Optional
 from core.entities import User
 from core.repositories import UserRepository
 from infrastructure.database import SQLiteConnection
+from infrastructure.events import ChangeType, UserChanged, EventBus
 
 
 class SQLiteUserRepository(UserRepository):
     """SQLite implementation of user repository."""
 
-    def __init__(self, connection: SQLiteConnection):
+    def __init__(self, connection: SQLiteConnection, event_bus: Optional[EventBus] = None):
         """Initialize repository.
 
         Args:
             connection: SQLite connection manager
+            event_bus: Bus receiving UserChanged after every committed write
         """
         self.connection = connection
+        self.event_bus = event_bus
 
     def create(self, user: User) -> User:
         """Create a new user."""
@@ -37,6 +41,8 @@ class SQLiteUserRepository(UserRepository):
                 ),
             )
             user.user_id = cursor.lastrowid
+
+        self._publish(ChangeType.CREATED, user.user_id, user)
         return user
 
     def get_by_id(self, user_id: int) -> Optional[User]:
@@ -113,6 +119,7 @@ class SQLiteUserRepository(UserRepository):
             if cursor.rowcount == 0:
                 raise ValueError(f"User with ID {user.user_id} not found")
 
+        self._publish(ChangeType.UPDATED, user.user_id, user)
         return user
 
     def delete(self, user_id: int) -> bool:
@@ -120,10 +127,27 @@ class SQLiteUserRepository(UserRepository):
         query = "DELETE FROM users WHERE user_id = ?"
         with self.connection.get_cursor() as cursor:
             cursor.execute(query, (user_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._publish(ChangeType.DELETED, user_id)
+        return deleted
 
     def username_exists(self, username: str) -> bool:
         """Check if username exists."""
         query = "SELECT COUNT(*) FROM users WHERE username = ?"
         row = self.connection.fetch_one(query, (username,))
         return row[0] > 0 if row else False
+
+    def _publish(
+        self, change: ChangeType, user_id: int, user: Optional[User] = None
+    ) -> None:
+        """Publish a UserChanged event once the write is committed."""
+        if self.event_bus is None:
+            return
+        event = UserChanged(
+            change=change,
+            user_id=user_id,
+            user=replace(user) if user else None,
+        )
+        self.connection.after_commit(lambda: self.event_bus.publish(event))
@@ -1,16 +1,39 @@
 """Dependency Injection Container - wires all dependencies together."""
+import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from config.settings import settings
-from infrastructure.database import SQLiteConnection, DatabaseMigrations
+from infrastructure.database import (
+    SQLiteConnection,
+    DatabaseMigrations,
+    DailySummary,
+)
+from infrastructure.database.database_migrations import DEFAULT_SERVICES
 from infrastructure.security import PasswordHasher, PasswordValidator
-from infrastructure.file_handlers import ReceiptGenerator
 from infrastructure.scheduling import WorkingHoursService
+from infrastructure.events import (
+    AppointmentChanged,
+    DataVersionWatcher,
+    EventBus,
+    ExternalDataChanged,
+    ServiceChanged,
+)
+from infrastructure.monitoring import (
+    MetricsRegistry,
+    PrometheusFileExporter,
+    instrument_use_case,
+)
 
 from data.repositories.sqlite.sqlite_user_repository import SQLiteUserRepository
 from data.repositories.sqlite.sqlite_employee_repository import SQLiteEmployeeRepository
 from data.repositories.sqlite.sqlite_appointment_repository import SQLiteAppointmentRepository
 from data.repositories.sqlite.sqlite_service_repository import SQLiteServiceRepository
+from data.repositories.sqlite.sqlite_report_repository import SQLiteReportRepository
+from data.repositories.sqlite.sqlite_unit_of_work import SQLiteUnitOfWork
+
+from core.repositories import UnitOfWork
 
 from core.use_cases.auth import LoginUser, RegisterUser
 from core.use_cases.appointments import (
@@ -18,9 +41,35 @@ from core.use_cases.appointments import (
     CancelAppointment,
     GetAppointments,
     GetAvailableSlots,
+    AsyncCreateAppointment,
+    AsyncCancelAppointment,
+    AsyncGetAppointments,
+    AsyncGetAvailableSlots,
 )
 from core.use_cases.employees import AddEmployee, RemoveEmployee, GetEmployees
 from core.use_cases.services import GetServices
+from core.use_cases.reports import GetOccupancyReport, GetRevenueReport
+from core.use_cases.exports import ExportAppointments, ExportCustomers
+
+# The asyncio stack (executor, async repositories, async login) always uses
+# SQLite and is only used by the HTTP API and benchmarks; it is imported on
+# first use so the desktop app does not pay for importing asyncio at startup.
+# The same goes for the receipt generator and its formats, and for the JSON
+# backend, which is only imported when settings.USE_SQLITE is off.
+if TYPE_CHECKING:
+    from infrastructure.database import DatabaseExecutor
+    from data.repositories.sqlite.async_sqlite_user_repository import AsyncSQLiteUserRepository
+    from data.repositories.sqlite.async_sqlite_employee_repository import (
+        AsyncSQLiteEmployeeRepository,
+    )
+    from data.repositories.sqlite.async_sqlite_appointment_repository import (
+        AsyncSQLiteAppointmentRepository,
+    )
+    from data.repositories.sqlite.async_sqlite_service_repository import (
+        AsyncSQLiteServiceRepository,
+    )
+    from core.use_cases.auth import AsyncLoginUser
+    from infrastructure.file_handlers import JsonStore, ReceiptGenerator
 
 
 class DIContainer:
@@ -29,23 +78,53 @@ class DIContainer:
     Centralized location for creating and managing all application dependencies.
     """
 
-    def __init__(self):
-        """Initialize container and all dependencies."""
+    def __init__(self, database_path: Optional[Path] = None):
+        """Initialize container and all dependencies.
+
+        Args:
+            database_path: SQLite database file (defaults to settings.DATABASE_PATH)
+        """
         # Ensure directories exist
         settings.ensure_directories()
+        self._database_path = database_path or settings.DATABASE_PATH
+
+        # Guards lazy creation of the database singletons, which the startup
+        # warm-up thread and the UI may request at the same time
+        self._init_lock = threading.RLock()
 
         # Infrastructure
         self._db_connection = None
+        self._db_executor = None
+        self._json_store = None
         self._password_hasher = PasswordHasher()
         self._password_validator = PasswordValidator()
-        self._receipt_generator = ReceiptGenerator(settings.RECEIPTS_DIR)
+        self._receipt_generator = None
         self._working_hours_service = WorkingHoursService()
+        self._event_bus = EventBus()
+        self._data_version_watcher = None
+
+        # Monitoring
+        self._metrics_registry = MetricsRegistry()
+        self._metrics_exporter = None
+        if settings.METRICS_ENABLED and settings.METRICS_FILE:
+            self._metrics_exporter = PrometheusFileExporter(
+                self._metrics_registry,
+                settings.BASE_DIR / str(settings.METRICS_FILE).format(pid=os.getpid()),
+                settings.METRICS_EXPORT_INTERVAL,
+            )
+            self._metrics_exporter.start()
 
         # Repositories
         self._user_repository = None
         self._employee_repository = None
         self._appointment_repository = None
         self._service_repository = None
+        self._report_repository = None
+        self._unit_of_work = None
+        self._async_user_repository = None
+        self._async_employee_repository = None
+        self._async_appointment_repository = None
+        self._async_service_repository = None
 
         # Use cases
         self._login_user = None
@@ -58,6 +137,15 @@ class DIContainer:
         self._remove_employee = None
         self._get_employees = None
         self._get_services = None
+        self._get_revenue_report = None
+        self._get_occupancy_report = None
+        self._export_appointments = None
+        self._export_customers = None
+        self._async_login_user = None
+        self._async_create_appointment = None
+        self._async_cancel_appointment = None
+        self._async_get_appointments = None
+        self._async_get_available_slots = None
 
     # Infrastructure Properties
 
@@ -65,13 +153,50 @@ class DIContainer:
     def db_connection(self) -> SQLiteConnection:
         """Get database connection (singleton)."""
         if self._db_connection is None:
-            self._db_connection = SQLiteConnection(settings.DATABASE_PATH)
-            # Run migrations
-            migrations = DatabaseMigrations(self._db_connection)
-            migrations.create_tables()
-            migrations.seed_services()
+            with self._init_lock:
+                if self._db_connection is None:
+                    profiler = None
+                    if settings.QUERY_PROFILING:
+                        from infrastructure.database import QueryProfiler
+
+                        profiler = QueryProfiler(settings.SLOW_QUERY_THRESHOLD_MS)
+                    connection = SQLiteConnection(self._database_path, profiler)
+                    # Run migrations (a single pragma read when up to date)
+                    DatabaseMigrations(connection).migrate()
+                    self._db_connection = connection
         return self._db_connection
 
+    @property
+    def db_executor(self) -> "DatabaseExecutor":
+        """Get database executor for the asyncio repositories (singleton)."""
+        if self._db_executor is None:
+            from infrastructure.database import DatabaseExecutor
+
+            with self._init_lock:
+                if self._db_executor is None:
+                    # Open the shared connection first so migrations have run
+                    self.db_connection
+                    self._db_executor = DatabaseExecutor(self._database_path)
+        return self._db_executor
+
+    @property
+    def daily_summary(self) -> DailySummary:
+        """Get maintenance of the daily_summary table (SQLite backend)."""
+        return DailySummary(self.db_connection)
+
+    @property
+    def json_store(self) -> "JsonStore":
+        """Get JSON store used when settings.USE_SQLITE is off (singleton)."""
+        if self._json_store is None:
+            from infrastructure.file_handlers import JsonStore
+
+            with self._init_lock:
+                if self._json_store is None:
+                    self._json_store = JsonStore(
+                        settings.JSON_LOCK_FILE, settings.JSON_COMPACT_THRESHOLD
+                    )
+        return self._json_store
+
     @property
     def password_hasher(self) -> PasswordHasher:
         """Get password hasher."""
@@ -83,8 +208,16 @@ class DIContainer:
         return self._password_validator
 
     @property
-    def receipt_generator(self) -> ReceiptGenerator:
-        """Get receipt generator."""
+    def receipt_generator(self) -> "ReceiptGenerator":
+        """Get receipt generator (singleton, imported on first use)."""
+        if self._receipt_generator is None:
+            from infrastructure.file_handlers import ReceiptGenerator
+
+            with self._init_lock:
+                if self._receipt_generator is None:
+                    self._receipt_generator = ReceiptGenerator(
+                        settings.RECEIPTS_DIR, settings.RECEIPT_FORMAT
+                    )
         return self._receipt_generator
 
     @property
@@ -92,46 +225,186 @@ class DIContainer:
         """Get working hours service."""
         return self._working_hours_service
 
+    @property
+    def event_bus(self) -> EventBus:
+        """Get event bus carrying repository change events."""
+        return self._event_bus
+
+    @property
+    def data_version_watcher(self) -> DataVersionWatcher:
+        """Get watcher publishing ExternalDataChanged (started by the caller)."""
+        if self._data_version_watcher is None:
+            with self._init_lock:
+                if self._data_version_watcher is None:
+                    self._data_version_watcher = DataVersionWatcher(
+                        self.db_connection, self.event_bus,
+                        settings.DATA_VERSION_POLL_INTERVAL,
+                    )
+        return self._data_version_watcher
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry:
+        """Get metrics registry."""
+        return self._metrics_registry
+
     # Repository Properties
 
     @property
     def user_repository(self):
         """Get user repository."""
         if self._user_repository is None:
-            self._user_repository = SQLiteUserRepository(self.db_connection)
+            if settings.USE_SQLITE:
+                self._user_repository = SQLiteUserRepository(
+                    self.db_connection, self.event_bus
+                )
+            else:
+                from data.repositories.json.json_user_repository import JsonUserRepository
+
+                self._user_repository = JsonUserRepository(
+                    self.json_store, settings.USERS_JSON, self.event_bus
+                )
         return self._user_repository
 
     @property
     def employee_repository(self):
         """Get employee repository."""
         if self._employee_repository is None:
-            self._employee_repository = SQLiteEmployeeRepository(self.db_connection)
+            if settings.USE_SQLITE:
+                self._employee_repository = SQLiteEmployeeRepository(
+                    self.db_connection, self.event_bus
+                )
+            else:
+                from data.repositories.json.json_employee_repository import JsonEmployeeRepository
+
+                self._employee_repository = JsonEmployeeRepository(
+                    self.json_store, settings.EMPLOYEES_JSON, self.event_bus
+                )
         return self._employee_repository
 
     @property
     def appointment_repository(self):
         """Get appointment repository."""
         if self._appointment_repository is None:
-            self._appointment_repository = SQLiteAppointmentRepository(self.db_connection)
+            if settings.USE_SQLITE:
+                self._appointment_repository = SQLiteAppointmentRepository(
+                    self.db_connection, self.event_bus
+                )
+            else:
+                from data.repositories.json.json_appointment_repository import JsonAppointmentRepository
+
+                self._appointment_repository = JsonAppointmentRepository(
+                    self.json_store, settings.APPOINTMENTS_JSON, self.event_bus
+                )
         return self._appointment_repository
 
     @property
     def service_repository(self):
         """Get service repository."""
         if self._service_repository is None:
-            self._service_repository = SQLiteServiceRepository(self.db_connection)
+            if settings.USE_SQLITE:
+                self._service_repository = SQLiteServiceRepository(
+                    self.db_connection, self.event_bus
+                )
+            else:
+                from data.repositories.json.json_service_repository import JsonServiceRepository
+
+                repository = JsonServiceRepository(
+                    self.json_store, settings.SERVICES_JSON, self.event_bus
+                )
+                # The SQLite backend seeds these in its migrations
+                repository.seed(DEFAULT_SERVICES)
+                self._service_repository = repository
         return self._service_repository
 
+    @property
+    def report_repository(self):
+        """Get report repository."""
+        if self._report_repository is None:
+            if settings.USE_SQLITE:
+                self._report_repository = SQLiteReportRepository(self.db_connection)
+            else:
+                from data.repositories.json.json_report_repository import JsonReportRepository
+
+                self._report_repository = JsonReportRepository(self.appointment_repository)
+        return self._report_repository
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """Get unit of work spanning all repositories of the configured backend."""
+        if self._unit_of_work is None:
+            if settings.USE_SQLITE:
+                self._unit_of_work = SQLiteUnitOfWork(self.db_connection)
+            else:
+                from data.repositories.json.json_unit_of_work import JsonUnitOfWork
+
+                self._unit_of_work = JsonUnitOfWork(self.json_store)
+        return self._unit_of_work
+
+    @property
+    def async_user_repository(self) -> "AsyncSQLiteUserRepository":
+        """Get asyncio user repository."""
+        if self._async_user_repository is None:
+            from data.repositories.sqlite.async_sqlite_user_repository import (
+                AsyncSQLiteUserRepository,
+            )
+
+            self._async_user_repository = AsyncSQLiteUserRepository(
+                self.db_executor, self.event_bus
+            )
+        return self._async_user_repository
+
+    @property
+    def async_employee_repository(self) -> "AsyncSQLiteEmployeeRepository":
+        """Get asyncio employee repository."""
+        if self._async_employee_repository is None:
+            from data.repositories.sqlite.async_sqlite_employee_repository import (
+                AsyncSQLiteEmployeeRepository,
+            )
+
+            self._async_employee_repository = AsyncSQLiteEmployeeRepository(
+                self.db_executor, self.event_bus
+            )
+        return self._async_employee_repository
+
+    @property
+    def async_appointment_repository(self) -> "AsyncSQLiteAppointmentRepository":
+        """Get asyncio appointment repository."""
+        if self._async_appointment_repository is None:
+            from data.repositories.sqlite.async_sqlite_appointment_repository import (
+                AsyncSQLiteAppointmentRepository,
+            )
+
+            self._async_appointment_repository = AsyncSQLiteAppointmentRepository(
+                self.db_executor, self.event_bus
+            )
+        return self._async_appointment_repository
+
+    @property
+    def async_service_repository(self) -> "AsyncSQLiteServiceRepository":
+        """Get asyncio service repository."""
+        if self._async_service_repository is None:
+            from data.repositories.sqlite.async_sqlite_service_repository import (
+                AsyncSQLiteServiceRepository,
+            )
+
+            self._async_service_repository = AsyncSQLiteServiceRepository(
+                self.db_executor, self.event_bus
+            )
+        return self._async_service_repository
+
     # Use Case Properties
 
     @property
     def login_user(self) -> LoginUser:
         """Get login user use case."""
         if self._login_user is None:
-            self._login_user = LoginUser(
-                self.user_repository,
-                self.employee_repository,
-                self.password_hasher,
+            self._login_user = self._instrument(
+                LoginUser(
+                    self.user_repository,
+                    self.employee_repository,
+                    self.password_hasher,
+                ),
+                "login_user",
             )
         return self._login_user
 
@@ -139,11 +412,15 @@ class DIContainer:
     def register_user(self) -> RegisterUser:
         """Get register user use case."""
         if self._register_user is None:
-            self._register_user = RegisterUser(
-                self.user_repository,
-                self.employee_repository,
-                self.password_hasher,
-                self.password_validator,
+            self._register_user = self._instrument(
+                RegisterUser(
+                    self.user_repository,
+                    self.employee_repository,
+                    self.password_hasher,
+                    self.password_validator,
+                    self.unit_of_work,
+                ),
+                "register_user",
             )
         return self._register_user
 
@@ -151,9 +428,13 @@ class DIContainer:
     def create_appointment(self) -> CreateAppointment:
         """Get create appointment use case."""
         if self._create_appointment is None:
-            self._create_appointment = CreateAppointment(
-                self.appointment_repository,
-                self.working_hours_service,
+            self._create_appointment = self._instrument(
+                CreateAppointment(
+                    self.appointment_repository,
+                    self.working_hours_service,
+                    self.unit_of_work,
+                ),
+                "create_appointment",
             )
         return self._create_appointment
 
@@ -161,23 +442,34 @@ class DIContainer:
     def cancel_appointment(self) -> CancelAppointment:
         """Get cancel appointment use case."""
         if self._cancel_appointment is None:
-            self._cancel_appointment = CancelAppointment(self.appointment_repository)
+            self._cancel_appointment = self._instrument(
+                CancelAppointment(
+                    self.appointment_repository,
+                    self.unit_of_work,
+                ),
+                "cancel_appointment",
+            )
         return self._cancel_appointment
 
     @property
     def get_appointments(self) -> GetAppointments:
         """Get appointments use case."""
         if self._get_appointments is None:
-            self._get_appointments = GetAppointments(self.appointment_repository)
+            self._get_appointments = self._instrument(
+                GetAppointments(self.appointment_repository), "get_appointments"
+            )
         return self._get_appointments
 
     @property
     def get_available_slots(self) -> GetAvailableSlots:
         """Get available slots use case."""
         if self._get_available_slots is None:
-            self._get_available_slots = GetAvailableSlots(
-                self.appointment_repository,
-                self.working_hours_service,
+            self._get_available_slots = self._instrument(
+                GetAvailableSlots(
+                    self.appointment_repository,
+                    self.working_hours_service,
+                ),
+                "get_available_slots",
             )
         return self._get_available_slots
 
@@ -185,11 +477,15 @@ class DIContainer:
     def add_employee(self) -> AddEmployee:
         """Get add employee use case."""
         if self._add_employee is None:
-            self._add_employee = AddEmployee(
-                self.employee_repository,
-                self.user_repository,
-                self.password_hasher,
-                self.password_validator,
+            self._add_employee = self._instrument(
+                AddEmployee(
+                    self.employee_repository,
+                    self.user_repository,
+                    self.password_hasher,
+                    self.password_validator,
+                    self.unit_of_work,
+                ),
+                "add_employee",
             )
         return self._add_employee
 
@@ -197,24 +493,207 @@ class DIContainer:
     def remove_employee(self) -> RemoveEmployee:
         """Get remove employee use case."""
         if self._remove_employee is None:
-            self._remove_employee = RemoveEmployee(self.employee_repository)
+            self._remove_employee = self._instrument(
+                RemoveEmployee(
+                    self.employee_repository,
+                    self.unit_of_work,
+                ),
+                "remove_employee",
+            )
         return self._remove_employee
 
     @property
     def get_employees(self) -> GetEmployees:
         """Get employees use case."""
         if self._get_employees is None:
-            self._get_employees = GetEmployees(self.employee_repository)
+            self._get_employees = self._instrument(
+                GetEmployees(self.employee_repository), "get_employees"
+            )
         return self._get_employees
 
     @property
     def get_services(self) -> GetServices:
         """Get services use case."""
         if self._get_services is None:
-            self._get_services = GetServices(self.service_repository)
+            with self._init_lock:
+                if self._get_services is None:
+                    get_services = GetServices(self.service_repository)
+                    # Keep the cached catalog in step with writes from any process
+                    self.event_bus.subscribe(ServiceChanged, lambda e: get_services.invalidate())
+                    self.event_bus.subscribe(
+                        ExternalDataChanged, lambda e: get_services.invalidate()
+                    )
+                    self._get_services = self._instrument(get_services, "get_services")
         return self._get_services
 
+    @property
+    def get_revenue_report(self) -> GetRevenueReport:
+        """Get revenue report use case."""
+        if self._get_revenue_report is None:
+            with self._init_lock:
+                if self._get_revenue_report is None:
+                    get_revenue_report = GetRevenueReport(self.report_repository)
+                    self._subscribe_report(get_revenue_report)
+                    self._get_revenue_report = self._instrument(
+                        get_revenue_report, "get_revenue_report"
+                    )
+        return self._get_revenue_report
+
+    @property
+    def get_occupancy_report(self) -> GetOccupancyReport:
+        """Get occupancy report use case."""
+        if self._get_occupancy_report is None:
+            with self._init_lock:
+                if self._get_occupancy_report is None:
+                    get_occupancy_report = GetOccupancyReport(
+                        self.report_repository, self.working_hours_service
+                    )
+                    self._subscribe_report(get_occupancy_report)
+                    self._get_occupancy_report = self._instrument(
+                        get_occupancy_report, "get_occupancy_report"
+                    )
+        return self._get_occupancy_report
+
+    @property
+    def export_appointments(self) -> ExportAppointments:
+        """Get export appointments use case."""
+        if self._export_appointments is None:
+            self._export_appointments = self._instrument(
+                ExportAppointments(self.appointment_repository), "export_appointments"
+            )
+        return self._export_appointments
+
+    @property
+    def export_customers(self) -> ExportCustomers:
+        """Get export customers use case."""
+        if self._export_customers is None:
+            self._export_customers = self._instrument(
+                ExportCustomers(self.report_repository), "export_customers"
+            )
+        return self._export_customers
+
+    def _subscribe_report(self, report) -> None:
+        """Drop a report use case's cached reports when bookings change."""
+
+        def on_appointment_changed(event: AppointmentChanged) -> None:
+            for date in event.dates:
+                report.invalidate(date)
+
+        self.event_bus.subscribe(AppointmentChanged, on_appointment_changed)
+        self.event_bus.subscribe(ExternalDataChanged, lambda e: report.invalidate())
+
+    # Asyncio Use Case Properties
+
+    @property
+    def async_login_user(self) -> "AsyncLoginUser":
+        """Get asyncio login user use case."""
+        if self._async_login_user is None:
+            from core.use_cases.auth import AsyncLoginUser
+
+            self._async_login_user = self._instrument(
+                AsyncLoginUser(
+                    self.async_user_repository,
+                    self.async_employee_repository,
+                    self.password_hasher,
+                ),
+                "async_login_user",
+            )
+        return self._async_login_user
+
+    @property
+    def async_create_appointment(self) -> AsyncCreateAppointment:
+        """Get asyncio create appointment use case."""
+        if self._async_create_appointment is None:
+            self._async_create_appointment = self._instrument(
+                AsyncCreateAppointment(
+                    self.async_appointment_repository,
+                    self.working_hours_service,
+                ),
+                "async_create_appointment",
+            )
+        return self._async_create_appointment
+
+    @property
+    def async_cancel_appointment(self) -> AsyncCancelAppointment:
+        """Get asyncio cancel appointment use case."""
+        if self._async_cancel_appointment is None:
+            self._async_cancel_appointment = self._instrument(
+                AsyncCancelAppointment(self.async_appointment_repository),
+                "async_cancel_appointment",
+            )
+        return self._async_cancel_appointment
+
+    @property
+    def async_get_appointments(self) -> AsyncGetAppointments:
+        """Get asyncio appointments use case."""
+        if self._async_get_appointments is None:
+            self._async_get_appointments = self._instrument(
+                AsyncGetAppointments(self.async_appointment_repository),
+                "async_get_appointments",
+            )
+        return self._async_get_appointments
+
+    @property
+    def async_get_available_slots(self) -> AsyncGetAvailableSlots:
+        """Get asyncio available slots use case."""
+        if self._async_get_available_slots is None:
+            self._async_get_available_slots = self._instrument(
+                AsyncGetAvailableSlots(
+                    self.async_appointment_repository,
+                    self.working_hours_service,
+                ),
+                "async_get_available_slots",
+            )
+        return self._async_get_available_slots
+
+    def warm_up(self) -> None:
+        """Open the database and load what the first screens need.
+
+        Meant to run on a background thread during startup, so the first
+        login does not pay for connecting, migrating (or loading the JSON
+        files) and loading the service catalog.
+        """
+        if settings.USE_SQLITE:
+            self.db_connection
+        else:
+            self.appointment_repository
+        self.login_user
+        self.get_services.get_all()
+
+    def export_appointment_snapshot(self) -> Path:
+        """Write all appointments to the columnar reporting snapshot.
+
+        Open the result with ``AppointmentSnapshot``. Pages are read
+        outside a transaction so bookings are not blocked meanwhile; a
+        booking made during the export may be missed.
+
+        Returns:
+            Path of the snapshot
+        """
+        from infrastructure.file_handlers import AppointmentSnapshotWriter
+
+        AppointmentSnapshotWriter.export(self.appointment_repository, settings.APPOINTMENT_SNAPSHOT)
+        return settings.APPOINTMENT_SNAPSHOT
+
+    def _instrument(self, use_case, name: str):
+        """Apply latency/outcome metrics to a use case if metrics are enabled."""
+        if settings.METRICS_ENABLED:
+            instrument_use_case(use_case, name, self._metrics_registry)
+        return use_case
+
     def cleanup(self):
         """Cleanup resources."""
+        if self._receipt_generator:
+            self._receipt_generator.close()
+        if self._metrics_exporter:
+            self._metrics_exporter.stop()
+        if self._data_version_watcher:
+            self._data_version_watcher.stop()
+        if self._db_executor:
+            self._db_executor.close()
+        if self._json_store:
+            self._json_store.close()
         if self._db_connection:
+            if self._db_connection.profiler is not None:
+                self._db_connection.profiler.dump(settings.QUERY_PROFILE_REPORT)
             self._db_connection.close()
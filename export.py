@@ -0,0 +1,75 @@
+"""
+Beauty Salon Export - Command Line Entry Point
+
+Streams appointments or per-customer totals to a CSV file for accounting.
+"""
+import argparse
+import gzip
+import os
+import sys
+from pathlib import Path
+
+from di_container import DIContainer
+from core.use_cases.exports.export_appointments import EXPORT_BATCH_SIZE
+
+
+def open_output(path: Path, compress: bool):
+    """Open a CSV text stream Excel reads as UTF-8 (gzip-compressed if asked)."""
+    if compress:
+        # Level 6 is about three times faster than the default 9 for ~2% larger files
+        return gzip.open(path, "wt", compresslevel=6, encoding="utf-8-sig", newline="")
+    return open(path, "w", encoding="utf-8-sig", newline="")
+
+
+def main(argv=None) -> int:
+    """Main entry point - exports one table and reports the throughput."""
+    parser = argparse.ArgumentParser(description="Export appointments or customers to CSV")
+    parser.add_argument("table", choices=["appointments", "customers"], help="What to export")
+    parser.add_argument("output", help="CSV file to write ('-' for stdout); .gz compresses")
+    parser.add_argument("--start", help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--service", action="append", dest="services", metavar="NAME",
+        help="Only this service (repeatable)",
+    )
+    parser.add_argument("--gzip", action="store_true", help="Compress even without .gz")
+    parser.add_argument(
+        "--batch-size", type=int, default=EXPORT_BATCH_SIZE, help="Rows per query"
+    )
+    args = parser.parse_args(argv)
+
+    container = DIContainer()
+    try:
+        use_case = getattr(container, f"export_{args.table}")
+
+        def export(output):
+            return use_case.execute(
+                output, args.start, args.end, args.services, batch_size=args.batch_size
+            )
+
+        if args.output == "-":
+            result = export(sys.stdout)
+        else:
+            # Written next to the target and renamed, so a failed export
+            # never leaves a truncated file behind
+            path = Path(args.output)
+            temp_path = path.with_name(path.name + ".tmp")
+            with open_output(temp_path, args.gzip or path.suffix == ".gz") as output:
+                result = export(output)
+            if result.success:
+                os.replace(temp_path, path)
+            else:
+                temp_path.unlink()
+
+        print(
+            f"{result.message} in {result.seconds:.2f} s "
+            f"({result.rows_per_second:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+        return 0 if result.success else 1
+    finally:
+        container.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
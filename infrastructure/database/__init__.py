@@ -1,5 +1,23 @@
 """Database infrastructure package."""
 from .sqlite_connection import SQLiteConnection
 from .database_migrations import DatabaseMigrations
+from .daily_summary import DailySummary
 
-__all__ = ["SQLiteConnection", "DatabaseMigrations"]
+__all__ = [
+    "SQLiteConnection",
+    "DatabaseMigrations",
+    "DailySummary",
+    "QueryProfiler",
+    "DatabaseExecutor",
+]
+
+
+def __getattr__(name):
+    """Import DatabaseExecutor (pulls in asyncio) and QueryProfiler on first use."""
+    if name == "DatabaseExecutor":
+        from .database_executor import DatabaseExecutor
+        return DatabaseExecutor
+    if name == "QueryProfiler":
+        from .query_profiler import QueryProfiler
+        return QueryProfiler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
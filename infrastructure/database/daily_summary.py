@@ -0,0 +1,108 @@
+"""Maintenance of the daily_summary table."""
+from typing import Dict, List, Optional, Tuple
+from infrastructure.database.sqlite_connection import SQLiteConnection
+
+# Revenue is summed incrementally by the triggers, so allow float rounding
+REVENUE_TOLERANCE = 1e-6
+
+
+class DailySummary:
+    """Rebuilds and verifies the per-day, per-service booking totals.
+
+    ``daily_summary`` holds one row per (date, service_name) with its
+    bookings and revenue. Triggers on ``appointments`` keep it current on
+    every insert, update and delete, whichever repository or process
+    writes; this class backfills it and checks it against the
+    appointments it summarizes.
+    """
+
+    def __init__(self, connection: SQLiteConnection):
+        """Initialize summary maintenance.
+
+        Args:
+            connection: SQLite connection manager
+        """
+        self.connection = connection
+
+    def rebuild(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> int:
+        """Recompute the summary from the appointments.
+
+        Args:
+            start_date: First date to rebuild (YYYY-MM-DD), None for no lower bound
+            end_date: Last date to rebuild (YYYY-MM-DD), None for no upper bound
+
+        Returns:
+            Number of summary rows written
+        """
+        where, params = self._range(start_date, end_date)
+        with self.connection.transaction():
+            with self.connection.get_cursor() as cursor:
+                cursor.execute(f"DELETE FROM daily_summary {where}", params)
+                cursor.execute(
+                    f"""
+                    INSERT INTO daily_summary (date, service_name, bookings, revenue)
+                    SELECT date, service_name, COUNT(*), SUM(service_price)
+                    FROM appointments
+                    {where}
+                    GROUP BY date, service_name
+                    """,
+                    params,
+                )
+                return cursor.rowcount
+
+    def check(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[Tuple[str, str, Tuple[int, float], Tuple[int, float]]]:
+        """Compare the summary with the appointments it summarizes.
+
+        Args:
+            start_date: First date to check (YYYY-MM-DD), None for no lower bound
+            end_date: Last date to check (YYYY-MM-DD), None for no upper bound
+
+        Returns:
+            (date, service_name, expected, actual) for every row that is
+            wrong, where expected and actual are (bookings, revenue) and a
+            missing row counts as (0, 0.0); empty if the summary is consistent
+        """
+        where, params = self._range(start_date, end_date)
+        expected = self._totals(
+            f"""
+            SELECT date, service_name, COUNT(*) AS bookings, SUM(service_price) AS revenue
+            FROM appointments
+            {where}
+            GROUP BY date, service_name
+            """,
+            params,
+        )
+        actual = self._totals(
+            f"SELECT date, service_name, bookings, revenue FROM daily_summary {where}", params
+        )
+
+        mismatches = []
+        for key in sorted(expected.keys() | actual.keys()):
+            want = expected.get(key, (0, 0.0))
+            have = actual.get(key, (0, 0.0))
+            if want[0] != have[0] or abs(want[1] - have[1]) > REVENUE_TOLERANCE:
+                mismatches.append((key[0], key[1], want, have))
+        return mismatches
+
+    def _totals(self, query: str, params: tuple) -> Dict[Tuple[str, str], Tuple[int, float]]:
+        """Run a (date, service_name, bookings, revenue) query into a dict."""
+        return {
+            (row["date"], row["service_name"]): (row["bookings"], row["revenue"])
+            for row in self.connection.fetch_all(query, params)
+        }
+
+    @staticmethod
+    def _range(start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, tuple]:
+        """Build the WHERE clause restricting a query to a date range."""
+        conditions = []
+        params = []
+        if start_date is not None:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            conditions.append("date <= ?")
+            params.append(end_date)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, tuple(params)
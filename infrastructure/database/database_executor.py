@@ -0,0 +1,283 @@
+"""Dedicated thread pool for running SQLite work from asyncio code."""
+import asyncio
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+# Callable receiving a worker's connection plus the caller's arguments
+DatabaseFunction = Callable[..., Any]
+
+_STOP = object()
+
+
+class DatabaseExecutor:
+    """Runs SQLite work off the event loop.
+
+    Reads go to a pool of worker threads, each holding its own connection, so
+    concurrent lookups do not queue behind one another. Writes go to a single
+    writer thread that drains the write queue and commits everything it
+    collected within ``batch_window`` seconds in one transaction. Each write
+    runs in its own savepoint, so one failing write does not undo the others,
+    and its future resolves only after the batch has been committed.
+    """
+
+    def __init__(
+        self,
+        database_path: Path,
+        max_readers: int = 4,
+        batch_window: float = 0.002,
+        max_batch: int = 64,
+        busy_timeout_ms: int = 5000,
+        wal: bool = True,
+    ):
+        """Initialize executor.
+
+        Args:
+            database_path: Path to SQLite database file
+            max_readers: Number of reader threads (one connection each)
+            batch_window: Seconds the writer waits for more writes to batch
+            max_batch: Maximum writes committed in one transaction
+            busy_timeout_ms: SQLite busy timeout for every connection
+            wal: Switch the database to WAL mode so readers never block the writer
+        """
+        self.database_path = database_path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.busy_timeout_ms = busy_timeout_ms
+        self.wal = wal
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self._readers = ThreadPoolExecutor(
+            max_workers=max_readers, thread_name_prefix="db-reader"
+        )
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="db-writer", daemon=True
+        )
+        self._writer.start()
+        self._closed = False
+
+    async def read(self, fn: DatabaseFunction, *args: Any) -> Any:
+        """Run a read-only function on a reader thread.
+
+        Args:
+            fn: Function called as fn(connection, *args)
+            *args: Extra arguments
+
+        Returns:
+            Return value of fn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, self._run_read, fn, args)
+
+    async def write(self, fn: DatabaseFunction, *args: Any) -> Any:
+        """Queue a write function for the writer thread.
+
+        Args:
+            fn: Function called as fn(connection, *args) inside a transaction
+            *args: Extra arguments
+
+        Returns:
+            Return value of fn, available once its batch has been committed
+        """
+        return await asyncio.wrap_future(self.submit_write(fn, *args))
+
+    async def fetch_one(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        """Execute query on a reader thread and fetch one result.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+
+        Returns:
+            Single row or None
+        """
+        return await self.read(_fetch_one, query, params)
+
+    async def fetch_all(self, query: str, params: tuple = ()) -> list:
+        """Execute query on a reader thread and fetch all results.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+
+        Returns:
+            List of rows
+        """
+        return await self.read(_fetch_all, query, params)
+
+    async def execute(self, query: str, params: tuple = ()) -> int:
+        """Execute a write statement through the writer thread.
+
+        Args:
+            query: SQL statement to execute
+            params: Statement parameters
+
+        Returns:
+            Number of affected rows
+        """
+        return await self.write(_execute, query, params)
+
+    def submit_write(self, fn: DatabaseFunction, *args: Any) -> Future:
+        """Queue a write function and return a concurrent future.
+
+        Args:
+            fn: Function called as fn(connection, *args) inside a transaction
+            *args: Extra arguments
+
+        Returns:
+            Future resolved after the batch containing the write commits
+        """
+        if self._closed:
+            raise RuntimeError("DatabaseExecutor is closed")
+        future: Future = Future()
+        self._writes.put((fn, args, future))
+        return future
+
+    def close(self) -> None:
+        """Finish queued writes, stop all threads and close connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._writes.put(_STOP)
+        self._writer.join()
+        self._readers.shutdown(wait=True)
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling worker thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.database_path,
+                isolation_level=None,  # transactions are managed explicitly
+                check_same_thread=False,  # closed from close() on another thread
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            if self.wal:
+                connection.execute("PRAGMA journal_mode = WAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _run_read(self, fn: DatabaseFunction, args: tuple) -> Any:
+        """Execute a read on the current reader thread."""
+        return fn(self._connection(), *args)
+
+    def _write_loop(self) -> None:
+        """Writer thread: collect writes into batches and commit them."""
+        while True:
+            item = self._writes.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._writes.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: List[Tuple[DatabaseFunction, tuple, Future]]) -> None:
+        """Run a batch of writes in one transaction.
+
+        Never raises, so the writer thread survives a bad batch: if the
+        transaction itself fails (BEGIN, a savepoint, COMMIT or the rollback),
+        it is rolled back and every future not resolved yet gets the error.
+        """
+        connection = None
+        try:
+            connection = self._connection()
+            outcomes = self._run_batch(connection, batch)
+        except Exception as e:
+            if connection is not None and connection.in_transaction:
+                try:
+                    connection.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            for _, _, future in batch:
+                self._fail(future, e)
+            return
+
+        for future, ok, value in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    @staticmethod
+    def _run_batch(
+        connection: sqlite3.Connection, batch: List[Tuple[DatabaseFunction, tuple, Future]]
+    ) -> List[Tuple[Future, bool, Any]]:
+        """Execute and commit a batch, one savepoint per write.
+
+        Returns:
+            (future, succeeded, result or exception) for every write that ran
+        """
+        outcomes: List[Tuple[Future, bool, Any]] = []
+        connection.execute("BEGIN IMMEDIATE")
+        for fn, args, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            connection.execute("SAVEPOINT batch_item")
+            try:
+                result = fn(connection, *args)
+            except Exception as e:
+                connection.execute("ROLLBACK TO SAVEPOINT batch_item")
+                connection.execute("RELEASE SAVEPOINT batch_item")
+                outcomes.append((future, False, e))
+            else:
+                connection.execute("RELEASE SAVEPOINT batch_item")
+                outcomes.append((future, True, result))
+        connection.execute("COMMIT")
+        return outcomes
+
+    @staticmethod
+    def _fail(future: Future, error: Exception) -> None:
+        """Fail a future unless it is already resolved or was cancelled."""
+        if future.done():
+            return
+        if future.running() or future.set_running_or_notify_cancel():
+            future.set_exception(error)
+
+    @property
+    def closed(self) -> bool:
+        """Check if the executor has been closed."""
+        return self._closed
+
+
+def _fetch_one(conn: sqlite3.Connection, query: str, params: tuple) -> Optional[sqlite3.Row]:
+    """Execute query and fetch one row."""
+    return conn.execute(query, params).fetchone()
+
+
+def _fetch_all(conn: sqlite3.Connection, query: str, params: tuple) -> list:
+    """Execute query and fetch all rows."""
+    return conn.execute(query, params).fetchall()
+
+
+def _execute(conn: sqlite3.Connection, query: str, params: tuple) -> int:
+    """Execute statement and return affected row count."""
+    return conn.execute(query, params).rowcount
@@ -1,6 +1,25 @@
 """Database schema migrations."""
+from infrastructure.database.daily_summary import DailySummary
 from infrastructure.database.sqlite_connection import SQLiteConnection
 
+# Bump whenever create_tables() or seed_services() changes
+SCHEMA_VERSION = 2
+
+# First schema version with the daily_summary table; older databases are backfilled
+DAILY_SUMMARY_VERSION = 2
+
+# Initial service catalog (name, price), also seeded by the JSON backend
+DEFAULT_SERVICES = [
+    ("Eyelashes", 25.0),
+    ("Manicure", 20.0),
+    ("Physiotherapy", 35.0),
+    ("Massage", 30.0),
+    ("Facial Care", 28.0),
+    ("Body Care", 32.0),
+    ("Depilation", 15.0),
+    ("Laser Depilation", 50.0),
+]
+
 
 class DatabaseMigrations:
     """Handles database schema creation and migrations."""
@@ -13,12 +32,46 @@ class DatabaseMigrations:
         """
         self.connection = connection
 
+    def migrate(self) -> bool:
+        """Bring the database up to SCHEMA_VERSION.
+
+        The schema version is stored in ``PRAGMA user_version``, so on an
+        up-to-date database this costs a single pragma read instead of
+        running every CREATE statement and the seed check.
+
+        Returns:
+            True if migrations ran, False if the schema was already current
+
+        Raises:
+            RuntimeError: If a newer version of the application wrote the database
+        """
+        row = self.connection.fetch_one("PRAGMA user_version")
+        if row[0] > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"Database schema version {row[0]} is newer than this application "
+                f"supports ({SCHEMA_VERSION}); upgrade the application"
+            )
+        if row[0] == SCHEMA_VERSION:
+            return False
+
+        with self.connection.transaction():
+            self.create_tables()
+            self.seed_services()
+            if row[0] < DAILY_SUMMARY_VERSION:
+                DailySummary(self.connection).rebuild()
+            with self.connection.get_cursor() as cursor:
+                cursor.execute(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
+        return True
+
     def create_tables(self) -> None:
         """Create all database tables if they don't exist."""
         self._create_users_table()
         self._create_employees_table()
         self._create_appointments_table()
         self._create_services_table()
+        self._create_daily_summary_table()
+        self._create_indexes()
+        self._create_daily_summary_triggers()
 
     def _create_users_table(self) -> None:
         """Create users table."""
@@ -84,19 +137,77 @@ class DatabaseMigrations:
         with self.connection.get_cursor() as cursor:
             cursor.execute(query)
 
-    def seed_services(self) -> None:
-        """Seed initial services data."""
-        services = [
-            ("Eyelashes", 25.0),
-            ("Manicure", 20.0),
-            ("Physiotherapy", 35.0),
-            ("Massage", 30.0),
-            ("Facial Care", 28.0),
-            ("Body Care", 32.0),
-            ("Depilation", 15.0),
-            ("Laser Depilation", 50.0),
+    def _create_daily_summary_table(self) -> None:
+        """Create daily_summary table (bookings and revenue per date and service)."""
+        query = """
+        CREATE TABLE IF NOT EXISTS daily_summary (
+            date TEXT NOT NULL,
+            service_name TEXT NOT NULL,
+            bookings INTEGER NOT NULL,
+            revenue REAL NOT NULL,
+            PRIMARY KEY (date, service_name)
+        ) WITHOUT ROWID
+        """
+        with self.connection.get_cursor() as cursor:
+            cursor.execute(query)
+
+    def _create_daily_summary_triggers(self) -> None:
+        """Create the triggers keeping daily_summary in step with appointments.
+
+        They run inside the writing statement, so the summary is updated
+        atomically with the appointment no matter which repository or
+        process writes. Rows whose bookings drop to zero are deleted.
+        """
+        add = """
+            INSERT INTO daily_summary (date, service_name, bookings, revenue)
+            VALUES (NEW.date, NEW.service_name, 1, NEW.service_price)
+            ON CONFLICT (date, service_name) DO UPDATE SET
+                bookings = bookings + 1,
+                revenue = revenue + excluded.revenue;
+        """
+        remove = """
+            UPDATE daily_summary
+            SET bookings = bookings - 1, revenue = revenue - OLD.service_price
+            WHERE date = OLD.date AND service_name = OLD.service_name;
+            DELETE FROM daily_summary
+            WHERE date = OLD.date AND service_name = OLD.service_name AND bookings <= 0;
+        """
+        triggers = [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_daily_summary_insert
+            AFTER INSERT ON appointments
+            BEGIN {add} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_daily_summary_delete
+            AFTER DELETE ON appointments
+            BEGIN {remove} END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_daily_summary_update
+            AFTER UPDATE OF date, service_name, service_price ON appointments
+            BEGIN {remove} {add} END
+            """,
         ]
+        with self.connection.get_cursor() as cursor:
+            for query in triggers:
+                cursor.execute(query)
+
+    def _create_indexes(self) -> None:
+        """Create secondary indexes.
 
+        (date, time) is already covered by the UNIQUE constraint; customer
+        lookups page through their appointments in date order.
+        """
+        query = """
+        CREATE INDEX IF NOT EXISTS idx_appointments_customer
+        ON appointments (phone_number, last_name, first_name, date, time)
+        """
+        with self.connection.get_cursor() as cursor:
+            cursor.execute(query)
+
+    def seed_services(self) -> None:
+        """Seed initial services data."""
         # Check if services already exist
         with self.connection.get_cursor() as cursor:
             cursor.execute("SELECT COUNT(*) FROM services")
@@ -105,11 +216,12 @@ class DatabaseMigrations:
             if count == 0:
                 # Insert services
                 query = "INSERT INTO services (name, price) VALUES (?, ?)"
-                cursor.executemany(query, services)
+                cursor.executemany(query, DEFAULT_SERVICES)
 
     def drop_all_tables(self) -> None:
         """Drop all tables (use with caution!)."""
-        tables = ["users", "employees", "appointments", "services"]
+        tables = ["users", "employees", "appointments", "services", "daily_summary"]
         with self.connection.get_cursor() as cursor:
             for table in tables:
                 cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute("PRAGMA user_version = 0")
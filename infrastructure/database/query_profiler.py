@@ -0,0 +1,281 @@
+"""SQL query profiler and slow-query log."""
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+
+@dataclass
+class QueryStats:
+    """Aggregated statistics for one SQL statement."""
+
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        """Get average latency in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class SlowQuery:
+    """A single execution that exceeded the slow-query threshold."""
+
+    statement: str
+    params: tuple
+    elapsed_ms: float
+    plan: List[str] = field(default_factory=list)
+
+
+class QueryProfiler:
+    """Collects per-statement latency and row counts.
+
+    Statements are keyed by their SQL text with whitespace collapsed, so the
+    same parameterized query is aggregated regardless of its parameters.
+    """
+
+    def __init__(self, slow_threshold_ms: float = 50.0, max_slow_queries: int = 100):
+        """Initialize profiler.
+
+        Args:
+            slow_threshold_ms: Executions slower than this are logged with their plan
+            max_slow_queries: Maximum number of slow executions kept for the report
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.max_slow_queries = max_slow_queries
+        self._stats: Dict[str, QueryStats] = {}
+        self._slow_queries: List[SlowQuery] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        sql: str,
+        params: tuple,
+        elapsed_ms: float,
+        rows: int,
+        connection: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        """Record one finished execution.
+
+        Args:
+            sql: SQL text as executed
+            params: Query parameters
+            elapsed_ms: Time spent executing and fetching, in milliseconds
+            rows: Number of rows fetched
+            connection: Connection used to run EXPLAIN QUERY PLAN for slow queries
+        """
+        statement = _WHITESPACE.sub(" ", sql).strip()
+
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is None:
+                stats = self._stats[statement] = QueryStats(statement)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.rows += rows
+            if elapsed_ms > stats.max_ms:
+                stats.max_ms = elapsed_ms
+
+        if elapsed_ms >= self.slow_threshold_ms:
+            plan = self._explain(connection, sql, params) if connection else []
+            logger.warning(
+                "Slow query (%.1f ms): %s | plan: %s",
+                elapsed_ms, statement, "; ".join(plan) or "n/a",
+            )
+            with self._lock:
+                if len(self._slow_queries) < self.max_slow_queries:
+                    self._slow_queries.append(
+                        SlowQuery(statement, tuple(params), elapsed_ms, plan)
+                    )
+
+    def get_stats(self) -> List[QueryStats]:
+        """Get statistics sorted by total time, slowest first.
+
+        Returns:
+            List of per-statement statistics
+        """
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+    def get_slow_queries(self) -> List[SlowQuery]:
+        """Get recorded slow executions.
+
+        Returns:
+            List of slow executions in the order they happened
+        """
+        with self._lock:
+            return list(self._slow_queries)
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._slow_queries.clear()
+
+    def report(self) -> str:
+        """Format collected statistics as a plain-text report.
+
+        Returns:
+            Report text
+        """
+        lines = [
+            f"{'count':>8} {'total ms':>10} {'avg ms':>8} {'max ms':>8} {'rows':>8}  statement",
+        ]
+        for stats in self.get_stats():
+            lines.append(
+                f"{stats.count:>8} {stats.total_ms:>10.2f} {stats.avg_ms:>8.3f} "
+                f"{stats.max_ms:>8.3f} {stats.rows:>8}  {stats.statement}"
+            )
+
+        slow_queries = self.get_slow_queries()
+        if slow_queries:
+            lines.append("")
+            lines.append(f"Slow queries (>= {self.slow_threshold_ms} ms):")
+            for slow in slow_queries:
+                lines.append(f"  {slow.elapsed_ms:.1f} ms  {slow.statement}  {slow.params}")
+                for step in slow.plan:
+                    lines.append(f"      {step}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, file_path: Path) -> Path:
+        """Write the report to a file.
+
+        Args:
+            file_path: Destination path
+
+        Returns:
+            Path to written report
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(self.report())
+        return file_path
+
+    @staticmethod
+    def _explain(connection: sqlite3.Connection, sql: str, params: tuple) -> List[str]:
+        """Run EXPLAIN QUERY PLAN for a statement.
+
+        Args:
+            connection: Connection to run the plan on
+            sql: SQL text
+            params: Query parameters
+
+        Returns:
+            Plan steps, or an empty list if the statement cannot be explained
+        """
+        if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return []
+        try:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except sqlite3.Error:
+            return []
+        return [str(row[-1]) for row in rows]
+
+
+class ProfiledCursor:
+    """Cursor wrapper that reports executions to a QueryProfiler.
+
+    An execution is measured from ``execute`` through all fetches and is
+    recorded when the next statement starts or the cursor is closed.
+    """
+
+    def __init__(
+        self,
+        cursor: sqlite3.Cursor,
+        profiler: QueryProfiler,
+        connection: sqlite3.Connection,
+    ):
+        """Initialize wrapper.
+
+        Args:
+            cursor: Underlying SQLite cursor
+            profiler: Profiler to report to
+            connection: Connection the cursor belongs to
+        """
+        self._cursor = cursor
+        self._profiler = profiler
+        self._connection = connection
+        self._pending: Optional[list] = None  # [sql, params, elapsed_ms, rows]
+
+    def execute(self, sql: str, params: tuple = ()) -> "ProfiledCursor":
+        """Execute a statement."""
+        self._finish()
+        start = time.perf_counter()
+        self._cursor.execute(sql, params)
+        self._pending = [sql, params, (time.perf_counter() - start) * 1000, 0]
+        return self
+
+    def executemany(self, sql: str, params_list) -> "ProfiledCursor":
+        """Execute a statement for each parameter tuple."""
+        self._finish()
+        params_list = list(params_list)
+        start = time.perf_counter()
+        self._cursor.executemany(sql, params_list)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._profiler.record(sql, (), elapsed_ms, 0)
+        return self
+
+    def fetchone(self):
+        """Fetch next row."""
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._track(start, 1 if row is not None else 0)
+        return row
+
+    def fetchmany(self, size: int = 1) -> list:
+        """Fetch next batch of rows."""
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._track(start, len(rows))
+        return rows
+
+    def fetchall(self) -> list:
+        """Fetch all remaining rows."""
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._track(start, len(rows))
+        return rows
+
+    def close(self) -> None:
+        """Record pending execution and close cursor."""
+        self._finish()
+        self._cursor.close()
+
+    def __iter__(self):
+        """Iterate over remaining rows."""
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def __getattr__(self, name: str):
+        """Delegate everything else (lastrowid, rowcount, ...) to the cursor."""
+        return getattr(self._cursor, name)
+
+    def _track(self, start: float, rows: int) -> None:
+        """Add fetch time and rows to the pending execution."""
+        if self._pending is not None:
+            self._pending[2] += (time.perf_counter() - start) * 1000
+            self._pending[3] += rows
+
+    def _finish(self) -> None:
+        """Record the pending execution, if any."""
+        if self._pending is not None:
+            sql, params, elapsed_ms, rows = self._pending
+            self._pending = None
+            self._profiler.record(sql, params, elapsed_ms, rows, self._connection)
@@ -1,46 +1,162 @@
 """SQLite database connection manager."""
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 from contextlib import contextmanager
 
+if TYPE_CHECKING:
+    from infrastructure.database.query_profiler import QueryProfiler
+
 
 class SQLiteConnection:
     """SQLite database connection manager with connection pooling."""
 
-    def __init__(self, database_path: Path):
+    def __init__(self, database_path: Path, profiler: Optional["QueryProfiler"] = None):
         """Initialize connection manager.
 
         Args:
             database_path: Path to SQLite database file
+            profiler: Optional query profiler; when None, cursors are not wrapped
         """
         self.database_path = database_path
+        self.profiler = profiler
         self._connection: Optional[sqlite3.Connection] = None
 
+        # Explicit transaction state (see begin/commit/rollback). The lock is
+        # held for the whole transaction so statements issued from other
+        # threads cannot interleave with an open unit of work.
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+
+        # Callbacks deferred until the outermost commit, one list per level
+        self._after_commit: List[List[Callable[[], None]]] = []
+
     def connect(self) -> sqlite3.Connection:
         """Get or create database connection.
 
         Returns:
             SQLite connection
         """
-        if self._connection is None:
-            self._connection = sqlite3.connect(
-                self.database_path,
-                check_same_thread=False
-            )
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        with self._lock:
+            if self._connection is None:
+                self._connection = sqlite3.connect(
+                    self.database_path,
+                    check_same_thread=False
+                )
+                self._connection.row_factory = sqlite3.Row
+            return self._connection
 
     def close(self) -> None:
         """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    @property
+    def in_transaction(self) -> bool:
+        """Check if an explicit transaction is active on this connection."""
+        return self._transaction_depth > 0
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the current transaction has been committed.
+
+        Outside an explicit transaction every statement commits immediately,
+        so the callback runs right away. Inside one it runs after the
+        outermost commit, outside the connection lock, and is dropped if the
+        enclosing transaction or savepoint is rolled back.
+
+        Args:
+            callback: Function to run after commit
+        """
+        with self._lock:
+            if self.in_transaction:
+                self._after_commit[-1].append(callback)
+                return
+        callback()
+
+    def begin(self) -> None:
+        """Begin an explicit transaction.
+
+        The outermost call issues ``BEGIN IMMEDIATE`` so the write lock is
+        taken up front; nested calls open a savepoint instead.
+        """
+        self._lock.acquire()
+        try:
+            conn = self.connect()
+            if self._transaction_depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            else:
+                conn.execute(f"SAVEPOINT uow_{self._transaction_depth}")
+        except Exception:
+            self._lock.release()
+            raise
+        self._transaction_depth += 1
+        self._after_commit.append([])
+
+    def commit(self) -> None:
+        """Commit the innermost explicit transaction."""
+        self._transaction_depth -= 1
+        callbacks = self._after_commit.pop()
+        try:
+            conn = self.connect()
+            if self._transaction_depth == 0:
+                try:
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            else:
+                conn.execute(f"RELEASE SAVEPOINT uow_{self._transaction_depth}")
+                # Released savepoints only become durable with the outer commit
+                self._after_commit[-1].extend(callbacks)
+                callbacks = []
+        finally:
+            self._lock.release()
+
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        """Roll back the innermost explicit transaction."""
+        self._transaction_depth -= 1
+        self._after_commit.pop()  # discard callbacks of the rolled back work
+        try:
+            conn = self.connect()
+            if self._transaction_depth == 0:
+                conn.rollback()
+            else:
+                savepoint = f"uow_{self._transaction_depth}"
+                conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+        finally:
+            self._lock.release()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager for an explicit transaction.
+
+        Example:
+            with connection.transaction():
+                repository.create(...)
+                repository.update(...)
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
 
     @contextmanager
     def get_cursor(self):
         """Context manager for database cursor.
 
+        Commits on success unless an explicit transaction is active, in
+        which case the transaction owner decides when to commit.
+
         Yields:
             SQLite cursor
 
@@ -48,16 +164,24 @@ class SQLiteConnection:
             with connection.get_cursor() as cursor:
                 cursor.execute("SELECT * FROM users")
         """
-        conn = self.connect()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+        with self._lock:
+            conn = self.connect()
+            cursor = conn.cursor()
+            if self.profiler is not None:
+                # Only imported when profiling is on (SALON_QUERY_PROFILING=1)
+                from infrastructure.database.query_profiler import ProfiledCursor
+
+                cursor = ProfiledCursor(cursor, self.profiler, conn)
+            try:
+                yield cursor
+                if not self.in_transaction:
+                    conn.commit()
+            except Exception as e:
+                if not self.in_transaction:
+                    conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a query and return cursor.
@@ -0,0 +1,20 @@
+"""Events infrastructure package."""
+from .change_type import ChangeType
+from .appointment_changed import AppointmentChanged
+from .user_changed import UserChanged
+from .employee_changed import EmployeeChanged
+from .service_changed import ServiceChanged
+from .external_data_changed import ExternalDataChanged
+from .event_bus import EventBus
+from .data_version_watcher import DataVersionWatcher
+
+__all__ = [
+    "ChangeType",
+    "AppointmentChanged",
+    "UserChanged",
+    "EmployeeChanged",
+    "ServiceChanged",
+    "ExternalDataChanged",
+    "EventBus",
+    "DataVersionWatcher",
+]
@@ -0,0 +1,30 @@
+"""Appointment change event."""
+from dataclasses import dataclass
+from typing import List, Optional
+
+from core.entities import Appointment
+from infrastructure.events.change_type import ChangeType
+
+
+@dataclass(frozen=True)
+class AppointmentChanged:
+    """Published after an appointment was created, updated or deleted.
+
+    ``appointment`` is the row as it is now (None after a delete) and
+    ``previous`` the row as it was before (None after a create), so
+    subscribers can both remove the old row and place the new one.
+    """
+
+    change: ChangeType
+    appointment_id: int
+    appointment: Optional[Appointment] = None
+    previous: Optional[Appointment] = None
+
+    @property
+    def dates(self) -> List[str]:
+        """Get the dates (YYYY-MM-DD) whose availability this change affects."""
+        dates = []
+        for appointment in (self.previous, self.appointment):
+            if appointment is not None and appointment.date not in dates:
+                dates.append(appointment.date)
+        return dates
@@ -0,0 +1,9 @@
+"""Kinds of data change carried by repository events."""
+from enum import Enum
+
+
+class ChangeType(Enum):
+    """Change type enumeration."""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
@@ -0,0 +1,82 @@
+"""Detects database writes made by other connections and processes."""
+import logging
+import sqlite3
+import threading
+from typing import Optional
+
+from infrastructure.database import SQLiteConnection
+from infrastructure.events.event_bus import EventBus
+from infrastructure.events.external_data_changed import ExternalDataChanged
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersionWatcher:
+    """Polls ``PRAGMA data_version`` and publishes ExternalDataChanged.
+
+    SQLite bumps ``data_version`` on a connection whenever *another*
+    connection commits, so polling the application's own connection catches
+    a second app instance (or a script) writing the same ``salon.db``
+    without reporting the writes that already published typed events.
+    """
+
+    def __init__(self, connection: SQLiteConnection, event_bus: EventBus, interval: float = 2.0):
+        """Initialize watcher.
+
+        Args:
+            connection: Connection whose view of the database is watched
+            event_bus: Bus receiving ExternalDataChanged
+            interval: Seconds between polls
+        """
+        self.connection = connection
+        self.event_bus = event_bus
+        self.interval = interval
+        self._version: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background polling thread."""
+        if self._thread is not None:
+            return
+        self._version = self._read_version()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="data-version-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """Poll once and publish if another connection has committed.
+
+        Returns:
+            True if a change was detected
+        """
+        version = self._read_version()
+        if self._version is None or version == self._version:
+            self._version = version
+            return False
+        self._version = version
+        self.event_bus.publish(ExternalDataChanged(data_version=version))
+        return True
+
+    def _read_version(self) -> int:
+        """Read the connection's current data version."""
+        row = self.connection.fetch_one("PRAGMA data_version")
+        return row[0]
+
+    def _run(self) -> None:
+        """Polling loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except sqlite3.Error:
+                # Database busy or closing; try again on the next tick
+                logger.debug("data_version poll failed", exc_info=True)
@@ -0,0 +1,18 @@
+"""Employee change event."""
+from dataclasses import dataclass
+from typing import Optional
+
+from core.entities import Employee
+from infrastructure.events.change_type import ChangeType
+
+
+@dataclass(frozen=True)
+class EmployeeChanged:
+    """Published after a employee was created, updated or deleted.
+
+    ``employee`` is the row as it is now (None after a delete).
+    """
+
+    change: ChangeType
+    employee_id: int
+    employee: Optional[Employee] = None
@@ -0,0 +1,69 @@
+"""In-process publish/subscribe event bus."""
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any], None]
+
+
+class EventBus:
+    """Synchronous, thread-safe event bus.
+
+    Handlers run on the publishing thread, in subscription order. A handler
+    that raises is logged and skipped so a broken subscriber can never undo
+    or fail the write that published the event. Subscribers that touch Tk
+    widgets must hop to the Tk thread themselves (see
+    ``BackgroundTaskRunner.call_soon``).
+    """
+
+    def __init__(self):
+        """Initialize bus with no subscribers."""
+        self._handlers: Dict[Type, List[EventHandler]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: Type, handler: EventHandler) -> Callable[[], None]:
+        """Subscribe a handler to an event type (and its subclasses).
+
+        Args:
+            event_type: Event class to listen for
+            handler: Called with each published event
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._handlers[event_type].append(handler)
+        return lambda: self.unsubscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: Type, handler: EventHandler) -> None:
+        """Remove a subscription if present.
+
+        Args:
+            event_type: Event class
+            handler: Previously subscribed handler
+        """
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event: Any) -> None:
+        """Deliver an event to every matching subscriber.
+
+        Args:
+            event: Event instance
+        """
+        with self._lock:
+            handlers = [
+                handler
+                for event_type in type(event).__mro__
+                for handler in self._handlers.get(event_type, ())
+            ]
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Event handler %r failed for %r", handler, event)
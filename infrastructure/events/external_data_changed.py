@@ -0,0 +1,13 @@
+"""Event for writes made outside this connection."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ExternalDataChanged:
+    """Published when another connection or process committed to the database.
+
+    Such writes carry no details, so subscribers should reload whatever
+    they display rather than patch it.
+    """
+
+    data_version: int
@@ -0,0 +1,18 @@
+"""Service change event."""
+from dataclasses import dataclass
+from typing import Optional
+
+from core.entities import Service
+from infrastructure.events.change_type import ChangeType
+
+
+@dataclass(frozen=True)
+class ServiceChanged:
+    """Published after a service was created, updated or deleted.
+
+    ``service`` is the row as it is now (None after a delete).
+    """
+
+    change: ChangeType
+    service_id: int
+    service: Optional[Service] = None
@@ -0,0 +1,18 @@
+"""User change event."""
+from dataclasses import dataclass
+from typing import Optional
+
+from core.entities import User
+from infrastructure.events.change_type import ChangeType
+
+
+@dataclass(frozen=True)
+class UserChanged:
+    """Published after a user was created, updated or deleted.
+
+    ``user`` is the row as it is now (None after a delete).
+    """
+
+    change: ChangeType
+    user_id: int
+    user: Optional[User] = None
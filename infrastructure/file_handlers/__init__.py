@@ -1,5 +1,50 @@
 """File handlers infrastructure package."""
-from .json_handler import JsonHandler
-from .receipt_generator import ReceiptGenerator
+from importlib import import_module
 
-__all__ = ["JsonHandler", "ReceiptGenerator"]
+# Imported on first use: the JSON backend is only needed with
+# SALON_STORAGE=json, the appointment snapshot only on export, and receipt
+# generation pulls in the template compiler, every registered format and the
+# background writer
+_LAZY_EXPORTS = {
+    "AppointmentSnapshot": ".appointment_snapshot",
+    "AppointmentSnapshotWriter": ".appointment_snapshot_writer",
+    "FileLock": ".file_lock",
+    "JsonHandler": ".json_handler",
+    "JsonCollection": ".json_collection",
+    "JsonStore": ".json_store",
+    "ReceiptTemplate": ".receipt_template",
+    "ReceiptFormat": ".receipt_format",
+    "TemplateReceiptFormat": ".template_receipt_format",
+    "PdfReceiptFormat": ".pdf_receipt_format",
+    "get_receipt_format": ".receipt_formats",
+    "receipt_format_names": ".receipt_formats",
+    "register_receipt_format": ".receipt_formats",
+    "ReceiptWriter": ".receipt_writer",
+    "ReceiptGenerator": ".receipt_generator",
+}
+
+__all__ = [
+    "FileLock",
+    "JsonHandler",
+    "JsonCollection",
+    "JsonStore",
+    "AppointmentSnapshot",
+    "AppointmentSnapshotWriter",
+    "ReceiptTemplate",
+    "ReceiptFormat",
+    "TemplateReceiptFormat",
+    "PdfReceiptFormat",
+    "get_receipt_format",
+    "receipt_format_names",
+    "register_receipt_format",
+    "ReceiptWriter",
+    "ReceiptGenerator",
+]
+
+
+def __getattr__(name):
+    """Import the JSON, snapshot and receipt classes and functions on first use."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -0,0 +1,159 @@
+"""Read-only, memory-mapped columnar snapshot of the appointments book."""
+import json
+import mmap
+import struct
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+MAGIC = b"SALONAPT"
+VERSION = 1
+# magic, version, reserved, rows, dictionary offset, dictionary length
+HEADER = struct.Struct("<8sHHQQQ")
+# name, array/memoryview type code, little-endian NumPy dtype
+COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("appointment_id", "i", "<i4"),
+    ("date", "i", "<i4"),      # days since 1970-01-01 (NumPy datetime64[D])
+    ("time", "h", "<i2"),      # minutes since midnight
+    ("price", "d", "<f8"),
+    ("service", "h", "<i2"),   # index into ``services``
+)
+ALIGNMENT = 8
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def column_offsets(rows: int) -> Tuple[Dict[str, int], int]:
+    """Lay out the columns of a snapshot with ``rows`` rows.
+
+    Each column starts on an 8-byte boundary after the header.
+
+    Args:
+        rows: Row count
+
+    Returns:
+        (column name -> byte offset, offset of the end of the last column)
+    """
+    offsets = {}
+    position = HEADER.size
+    for name, code, _ in COLUMNS:
+        position += -position % ALIGNMENT
+        offsets[name] = position
+        position += rows * struct.calcsize(code)
+    return offsets, position
+
+
+class AppointmentSnapshot:
+    """Memory-mapped view of a file written by AppointmentSnapshotWriter.
+
+    Each column is a fixed-width little-endian array, so ``column`` and
+    ``array`` hand out views of the mapped file without copying or
+    creating a Python object per row. Release every view before calling
+    ``close``.
+    """
+
+    def __init__(self, path: Path):
+        """Open and map a snapshot.
+
+        Args:
+            path: Snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _parse(self) -> None:
+        """Read the header and the service dictionary."""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{self.path} is too short to be an appointment snapshot")
+        magic, version, _, rows, dictionary_offset, dictionary_length = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not an appointment snapshot")
+        if version != VERSION:
+            raise ValueError(f"Unsupported appointment snapshot version {version}")
+        self._offsets, end = column_offsets(rows)
+        if end > dictionary_offset or dictionary_offset + dictionary_length > len(self._mmap):
+            raise ValueError(f"{self.path} is truncated")
+        self.row_count: int = rows
+        dictionary = self._mmap[dictionary_offset:dictionary_offset + dictionary_length]
+        self.services: List[str] = json.loads(dictionary.decode("utf-8"))
+
+    def column(self, name: str) -> memoryview:
+        """Get a column as a typed memoryview (zero-copy, no NumPy needed).
+
+        Args:
+            name: Column name
+
+        Returns:
+            View of ``row_count`` values
+
+        Raises:
+            KeyError: If there is no such column
+            ValueError: On big-endian hosts, where only ``array`` works
+        """
+        code, _ = self._types(name)
+        if sys.byteorder != "little":
+            raise ValueError("Snapshot columns are little-endian; use array() with NumPy")
+        start = self._offsets[name]
+        size = self.row_count * struct.calcsize(code)
+        return memoryview(self._mmap)[start:start + size].cast(code)
+
+    def array(self, name: str) -> Any:
+        """Get a column as a read-only NumPy array (zero-copy).
+
+        Args:
+            name: Column name
+
+        Returns:
+            numpy.ndarray backed by the mapped file
+
+        Raises:
+            KeyError: If there is no such column
+            ImportError: If NumPy is not installed
+        """
+        import numpy
+
+        _, dtype = self._types(name)
+        return numpy.frombuffer(
+            self._mmap, dtype=dtype, count=self.row_count, offset=self._offsets[name]
+        )
+
+    def arrays(self) -> Dict[str, Any]:
+        """Get every column as a NumPy array, keyed by column name."""
+        return {name: self.array(name) for name, _, _ in COLUMNS}
+
+    @staticmethod
+    def to_day(value: str) -> int:
+        """Convert an ISO date to the value stored in the date column."""
+        return date.fromisoformat(value).toordinal() - EPOCH_ORDINAL
+
+    @staticmethod
+    def from_day(value: int) -> str:
+        """Convert a date column value back to an ISO date."""
+        return date.fromordinal(int(value) + EPOCH_ORDINAL).isoformat()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> "AppointmentSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _types(name: str) -> Tuple[str, str]:
+        """Type code and dtype of a column."""
+        for column, code, dtype in COLUMNS:
+            if column == name:
+                return code, dtype
+        raise KeyError(f"Unknown snapshot column {name!r}")
@@ -0,0 +1,144 @@
+"""Writer for the columnar appointments snapshot."""
+import json
+import os
+import sys
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable
+
+from core.entities import Appointment
+from core.repositories import AppointmentRepository
+from infrastructure.file_handlers.appointment_snapshot import (
+    ALIGNMENT,
+    COLUMNS,
+    EPOCH_ORDINAL,
+    HEADER,
+    MAGIC,
+    VERSION,
+    column_offsets,
+)
+
+EXPORT_BATCH_SIZE = 10000
+MAX_SERVICES = 2 ** 15
+
+
+class AppointmentSnapshotWriter:
+    """Collects appointments into columns and writes them as a snapshot.
+
+    Columns are accumulated in compact ``array`` buffers (about 20 bytes
+    per appointment), and ``write`` lays them out as described in
+    ``appointment_snapshot`` and renames the result into place, so a
+    reader never maps a half-written file.
+    """
+
+    def __init__(self):
+        """Initialize an empty writer."""
+        self._columns: Dict[str, array] = {name: array(code) for name, code, _ in COLUMNS}
+        self._services: Dict[str, int] = {}
+        # Appointments share few distinct dates, so converting each once pays
+        self._days: Dict[str, int] = {}
+
+    @property
+    def row_count(self) -> int:
+        """Number of appointments added so far."""
+        return len(self._columns["appointment_id"])
+
+    def add(self, appointment: Appointment) -> None:
+        """Add one appointment.
+
+        Args:
+            appointment: Appointment to add
+
+        Raises:
+            ValueError: If a date or time is malformed, or there are more
+                services than the int16 service column can hold
+        """
+        day = self._days.get(appointment.date)
+        if day is None:
+            day = self._days[appointment.date] = (
+                date.fromisoformat(appointment.date).toordinal() - EPOCH_ORDINAL
+            )
+        hours, minutes = appointment.time.split(":")
+        service = self._services.get(appointment.service_name)
+        if service is None:
+            if len(self._services) == MAX_SERVICES:
+                raise ValueError(f"More than {MAX_SERVICES} services")
+            service = self._services[appointment.service_name] = len(self._services)
+
+        columns = self._columns
+        columns["appointment_id"].append(appointment.appointment_id or 0)
+        columns["date"].append(day)
+        columns["time"].append(int(hours) * 60 + int(minutes))
+        columns["price"].append(appointment.service_price)
+        columns["service"].append(service)
+
+    def add_all(self, appointments: Iterable[Appointment]) -> None:
+        """Add several appointments."""
+        for appointment in appointments:
+            self.add(appointment)
+
+    def write(self, path: Path) -> Path:
+        """Write the snapshot atomically.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            The path written
+        """
+        rows = self.row_count
+        offsets, end = column_offsets(rows)
+        dictionary = json.dumps(list(self._services), ensure_ascii=False).encode("utf-8")
+        dictionary_offset = end + (-end % ALIGNMENT)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 0, rows, dictionary_offset, len(dictionary)))
+                for name, _, _ in COLUMNS:
+                    f.write(b"\0" * (offsets[name] - f.tell()))
+                    column = self._columns[name]
+                    if sys.byteorder != "little":
+                        column = array(column.typecode, column)
+                        column.byteswap()
+                    column.tofile(f)
+                f.write(b"\0" * (dictionary_offset - f.tell()))
+                f.write(dictionary)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return path
+
+    @classmethod
+    def export(
+        cls,
+        repository: AppointmentRepository,
+        path: Path,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> int:
+        """Write every appointment in a repository to a snapshot.
+
+        Appointments are read a keyset page at a time in (date, time)
+        order, so only one page of entities exists at once and every page
+        costs the same however deep into the table it is.
+
+        Args:
+            repository: Appointment repository
+            path: Snapshot file
+            batch_size: Appointments per page
+
+        Returns:
+            Number of appointments written
+        """
+        writer = cls()
+        after = None
+        while True:
+            page = repository.get_page_after(after, batch_size)
+            writer.add_all(page)
+            if len(page) < batch_size:
+                break
+            after = (page[-1].date, page[-1].time)
+        writer.write(path)
+        return writer.row_count
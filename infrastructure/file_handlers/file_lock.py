@@ -0,0 +1,109 @@
+"""Advisory lock shared by threads and processes working on the same file."""
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads of this process are still serialized
+    fcntl = None
+
+
+class FileLock:
+    """Re-entrant lock on a ``.lock`` file.
+
+    Threads of one process exclude each other through a re-entrant lock;
+    other processes are excluded with ``fcntl.flock`` on the lock file,
+    which is separate from the data file because the data file is
+    replaced by rename. Shared holders only exclude other processes'
+    exclusive holders. Use ``for_path`` so that every caller in the
+    process shares one instance per file.
+    """
+
+    _instances: Dict[Path, "FileLock"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path):
+        """Initialize lock.
+
+        Args:
+            path: Lock file, created on first acquire
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._shared = False
+        self._file = None
+
+    @classmethod
+    def for_path(cls, path: Path) -> "FileLock":
+        """Get the process-wide lock for a lock file.
+
+        Args:
+            path: Lock file
+
+        Returns:
+            The same instance for every caller using that path
+        """
+        key = path.absolute()
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls(path)
+            return instance
+
+    def acquire(self, shared: bool = False) -> None:
+        """Acquire the lock, blocking until it is available.
+
+        Args:
+            shared: Take a shared (read) lock instead of an exclusive one
+
+        Raises:
+            RuntimeError: If an exclusive lock is requested while this
+                thread holds a shared one
+        """
+        self._lock.acquire()
+        if self._depth:
+            if self._shared and not shared:
+                self._lock.release()
+                raise RuntimeError(f"Cannot upgrade shared lock on {self.path}")
+            self._depth += 1
+            return
+        try:
+            if fcntl is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a+b")
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        except BaseException:
+            self._close()
+            self._lock.release()
+            raise
+        self._shared = shared
+        self._depth = 1
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if not self._depth:
+            self._close()
+        self._lock.release()
+
+    @contextmanager
+    def hold(self, shared: bool = False):
+        """Context manager holding the lock.
+
+        Args:
+            shared: Take a shared (read) lock instead of an exclusive one
+        """
+        self.acquire(shared)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def _close(self) -> None:
+        """Close the lock file, which drops the flock."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,405 @@
+"""In-memory indexed collection persisted as a JSON snapshot plus an operation log."""
+import bisect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from infrastructure.file_handlers.json_handler import JsonHandler
+
+if TYPE_CHECKING:
+    from infrastructure.file_handlers.json_store import JsonStore
+
+logger = logging.getLogger(__name__)
+
+Record = Dict[str, Any]
+
+
+class JsonCollection:
+    """One entity type held in memory with hash indexes.
+
+    The collection is loaded once from ``<name>.json`` (a JSON list, the
+    JsonHandler format) and the operations in ``<name>.json.log`` are
+    replayed on top of it. Each later write appends one JSON line to the
+    log instead of rewriting the file. Operations store whole records, so
+    replaying the log again over a newer snapshot ends in the same state;
+    compaction can therefore write the snapshot first and replace the log
+    afterwards.
+
+    Other processes may append to the same log. Before a read outside a
+    transaction the log is checked for growth and new entries are
+    replayed; a log replaced by compaction carries a higher generation in
+    its first line and makes the collection reload.
+
+    Records returned by the lookup methods are the stored dictionaries and
+    must not be modified.
+    """
+
+    def __init__(
+        self,
+        store: "JsonStore",
+        path: Path,
+        id_field: str,
+        unique: Optional[Dict[str, Tuple[str, ...]]] = None,
+        indexes: Optional[Dict[str, Tuple[str, ...]]] = None,
+        order_by: Tuple[str, ...] = (),
+    ):
+        """Initialize collection and load it from disk.
+
+        Args:
+            store: Store providing the lock and transactions
+            path: Snapshot file; the log lives next to it
+            id_field: Integer primary key field, assigned on insert
+            unique: Unique indexes, name -> fields
+            indexes: Non-unique indexes, name -> fields
+            order_by: Fields that ``all``, ``page`` and ``find`` sort by
+                (ties broken by id); the default is id order
+        """
+        self.store = store
+        self.path = path
+        self.log_path = path.with_name(path.name + ".log")
+        self.id_field = id_field
+        self.unique_fields = dict(unique or {})
+        self.index_fields = dict(indexes or {})
+        self.order_by = order_by
+
+        self._records: Dict[int, Record] = {}
+        self._unique: Dict[str, Dict[Tuple, int]] = {name: {} for name in self.unique_fields}
+        self._indexes: Dict[str, Dict[Tuple, Set[int]]] = {name: {} for name in self.index_fields}
+        self._order: List[Tuple] = []
+        self._next_id = 1
+        self.log_entries = 0
+        self.generation = 0
+        self.is_new = False
+        self.damaged = False
+        self._log_offset = 0
+        self._log_state: Optional[Tuple[int, int, int]] = None
+        self._load()
+
+    # Reads
+
+    def get(self, record_id: int) -> Optional[Record]:
+        """Get a record by id."""
+        with self.store.lock:
+            self._sync()
+            return self._records.get(record_id)
+
+    def find_one(self, index: str, *values: Any) -> Optional[Record]:
+        """Get the record matching a unique index."""
+        with self.store.lock:
+            self._sync()
+            record_id = self._unique[index].get(values)
+            return None if record_id is None else self._records[record_id]
+
+    def find(self, index: str, *values: Any) -> List[Record]:
+        """Get the records matching a non-unique index, in collection order."""
+        with self.store.lock:
+            self._sync()
+            ids = self._indexes[index].get(values, ())
+            return sorted((self._records[record_id] for record_id in ids), key=self._sort_key)
+
+    def count(self, index: Optional[str] = None, *values: Any) -> int:
+        """Count all records, or those matching a non-unique index."""
+        with self.store.lock:
+            self._sync()
+            if index is None:
+                return len(self._records)
+            return len(self._indexes[index].get(values, ()))
+
+    def all(self) -> List[Record]:
+        """Get every record in collection order."""
+        return self.page(0, None)
+
+    def page(self, offset: int, limit: Optional[int]) -> List[Record]:
+        """Get a slice of the records in collection order."""
+        with self.store.lock:
+            self._sync()
+            stop = None if limit is None else offset + limit
+            return [self._records[key[-1]] for key in self._order[offset:stop]]
+
+    def between(self, low: Any, high: Any) -> List[Record]:
+        """Get records whose first ``order_by`` field lies in [low, high]."""
+        with self.store.lock:
+            self._sync()
+            start = bisect.bisect_left(self._order, (low,))
+            # First key whose leading field is past ``high``
+            stop, end = start, len(self._order)
+            while stop < end:
+                middle = (stop + end) // 2
+                if self._order[middle][0] <= high:
+                    stop = middle + 1
+                else:
+                    end = middle
+            return [self._records[key[-1]] for key in self._order[start:stop]]
+
+    def page_after(
+        self,
+        after: Optional[Tuple],
+        limit: int,
+        low: Any = None,
+        high: Any = None,
+        where: Optional[Callable[[Record], bool]] = None,
+    ) -> List[Record]:
+        """Get the records following a position in collection order.
+
+        Args:
+            after: ``order_by`` values of the last record already seen
+                (exclusive), None to start at the beginning
+            limit: Maximum number of records to return
+            low: Skip records whose first ``order_by`` field is below this
+            high: Stop at the first record whose first field is above this
+            where: Only records for which this returns True
+
+        Returns:
+            At most limit records in collection order
+        """
+        with self.store.lock:
+            self._sync()
+            start = 0
+            if after is not None:
+                # Keys end with the id, so this sorts after every key for ``after``
+                start = bisect.bisect_right(self._order, tuple(after) + (float("inf"),))
+            if low is not None:
+                start = max(start, bisect.bisect_left(self._order, (low,)))
+            records = []
+            for position in range(start, len(self._order)):
+                key = self._order[position]
+                if len(records) == limit or (high is not None and key[0] > high):
+                    break
+                record = self._records[key[-1]]
+                if where is None or where(record):
+                    records.append(record)
+            return records
+
+    # Writes
+
+    def insert(self, record: Record) -> Record:
+        """Insert a record, assigning its id.
+
+        Args:
+            record: Record without an id
+
+        Returns:
+            Stored record
+
+        Raises:
+            ValueError: If a unique index already holds the record's key
+        """
+        with self.store.transaction():
+            self._check_unique(record, None)
+            stored = dict(record)
+            stored[self.id_field] = self._next_id
+            self._put(stored)
+            self.store.record(
+                self, {"op": "put", "record": stored}, lambda: self._delete(stored[self.id_field])
+            )
+            return stored
+
+    def replace(self, record: Record) -> Optional[Record]:
+        """Replace an existing record.
+
+        Args:
+            record: Record including its id
+
+        Returns:
+            The previous version, or None if no record has that id
+
+        Raises:
+            ValueError: If a unique index already holds the record's key
+        """
+        with self.store.transaction():
+            record_id = record[self.id_field]
+            previous = self._records.get(record_id)
+            if previous is None:
+                return None
+            self._check_unique(record, record_id)
+            stored = dict(record)
+            self._delete(record_id)
+            self._put(stored)
+            self.store.record(self, {"op": "put", "record": stored}, lambda: self._restore(previous))
+            return previous
+
+    def delete(self, record_id: int) -> Optional[Record]:
+        """Delete a record.
+
+        Args:
+            record_id: Record id
+
+        Returns:
+            The deleted record, or None if it did not exist
+        """
+        with self.store.transaction():
+            previous = self._records.get(record_id)
+            if previous is None:
+                return None
+            self._delete(record_id)
+            self.store.record(self, {"op": "delete", "id": record_id}, lambda: self._put(previous))
+            return previous
+
+    # Persistence (called by the store with its file lock held, which also
+    # keeps other writers away from the snapshot and log; no per-file locks)
+
+    def refresh(self) -> None:
+        """Replay log entries appended by other processes since the last look."""
+        if self._log_state == self._stat_log():
+            return
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            self._reload()
+            return
+        with f:
+            replaced = self._header_generation(f.readline()) != self.generation
+            if replaced or os.fstat(f.fileno()).st_size < self._log_offset:
+                f.close()
+                self._reload()
+                return
+            f.seek(self._log_offset)
+            self._replay(f)
+        self.is_new = False
+
+    def append_log(self, operations: List[Dict[str, Any]]) -> None:
+        """Append operations to the log with a single write."""
+        JsonHandler.append_lines(self.log_path, operations, use_lock=False)
+        self.log_entries += len(operations)
+        self.is_new = False
+        # The store's lock kept other writers out, so the log ends with ours
+        self._log_state = self._stat_log()
+        self._log_offset = self._log_state[1]
+
+    def needs_compaction(self, threshold: int) -> bool:
+        """Check if the log has outgrown the snapshot."""
+        return self.log_entries > max(threshold, len(self._records))
+
+    def compact(self) -> None:
+        """Write a fresh snapshot and truncate the log."""
+        snapshot = [self._records[record_id] for record_id in sorted(self._records)]
+        JsonHandler.write(self.path, snapshot, use_lock=False)
+        # Ids are never reused, even for records deleted before the snapshot;
+        # the new generation tells other processes to reload
+        self.generation += 1
+        header = {"op": "next_id", "value": self._next_id, "generation": self.generation}
+        JsonHandler.write_lines(self.log_path, [header], use_lock=False)
+        self.log_entries = 0
+        self._log_state = self._stat_log()
+        self._log_offset = self._log_state[1]
+
+    # Internals
+
+    def _load(self) -> None:
+        """Load the snapshot and replay the log."""
+        self.is_new = not self.path.exists() and not self.log_path.exists()
+        for record in JsonHandler.read(self.path, use_lock=False):
+            self._put(record)
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            self._replay(f)
+
+    def _reload(self) -> None:
+        """Drop everything in memory and load again."""
+        self._records.clear()
+        for index in (*self._unique.values(), *self._indexes.values()):
+            index.clear()
+        self._order.clear()
+        self._next_id = 1
+        self.log_entries = 0
+        self.generation = 0
+        self._log_offset = 0
+        self._log_state = None
+        self._load()
+
+    def _replay(self, f) -> None:
+        """Apply the log entries from the file's position to its end."""
+        offset = f.tell()
+        for line in f:
+            try:
+                op = json.loads(line)
+                if op["op"] == "put":
+                    record_id = op["record"][self.id_field]
+                    if record_id in self._records:
+                        self._delete(record_id)
+                    self._put(op["record"])
+                elif op["op"] == "delete":
+                    if op["id"] in self._records:
+                        self._delete(op["id"])
+                elif op["op"] == "next_id":
+                    self._next_id = max(self._next_id, op["value"])
+                    self.generation = op.get("generation", self.generation)
+            except (ValueError, KeyError, TypeError):
+                # A torn line from an interrupted append
+                logger.warning("Skipping unreadable entry at byte %d of %s", offset, self.log_path)
+                self.damaged = True
+            else:
+                self.log_entries += 1
+            offset += len(line)
+        self._log_offset = offset
+        self._log_state = self._stat_log()
+
+    def _sync(self) -> None:
+        """Catch up with other processes before a read outside a transaction."""
+        if not self.store.in_transaction and self._log_state != self._stat_log():
+            with self.store.file_lock.hold(shared=True):
+                self.refresh()
+
+    def _stat_log(self) -> Optional[Tuple[int, int, int]]:
+        """Identity and size of the log file, None if it does not exist."""
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _header_generation(line: bytes) -> int:
+        """Generation recorded in the first line of a compacted log."""
+        try:
+            op = json.loads(line)
+            return op.get("generation", 0) if op.get("op") == "next_id" else 0
+        except (ValueError, AttributeError):
+            return 0
+
+    def _check_unique(self, record: Record, record_id: Optional[int]) -> None:
+        """Raise if another record holds one of the record's unique keys."""
+        for name, fields in self.unique_fields.items():
+            holder = self._unique[name].get(tuple(record[field] for field in fields))
+            if holder is not None and holder != record_id:
+                raise ValueError(f"Duplicate {name} {tuple(record[field] for field in fields)}")
+
+    def _sort_key(self, record: Record) -> Tuple:
+        """Collection order key: the order_by fields, then the id."""
+        return tuple(record[field] for field in self.order_by) + (record[self.id_field],)
+
+    def _put(self, record: Record) -> None:
+        """Add a record to the maps and indexes."""
+        record_id = record[self.id_field]
+        self._records[record_id] = record
+        for name, fields in self.unique_fields.items():
+            self._unique[name][tuple(record[field] for field in fields)] = record_id
+        for name, fields in self.index_fields.items():
+            self._indexes[name].setdefault(tuple(record[field] for field in fields), set()).add(record_id)
+        bisect.insort(self._order, self._sort_key(record))
+        self._next_id = max(self._next_id, record_id + 1)
+
+    def _delete(self, record_id: int) -> None:
+        """Remove a record from the maps and indexes."""
+        record = self._records.pop(record_id)
+        for name, fields in self.unique_fields.items():
+            del self._unique[name][tuple(record[field] for field in fields)]
+        for name, fields in self.index_fields.items():
+            key = tuple(record[field] for field in fields)
+            bucket = self._indexes[name][key]
+            bucket.discard(record_id)
+            if not bucket:
+                del self._indexes[name][key]
+        key = self._sort_key(record)
+        del self._order[bisect.bisect_left(self._order, key)]
+
+    def _restore(self, previous: Record) -> None:
+        """Undo a replace."""
+        self._delete(previous[self.id_field])
+        self._put(previous)
+
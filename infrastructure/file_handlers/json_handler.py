@@ -1,57 +1,222 @@
 """JSON file handler for reading and writing JSON data."""
 import json
+import logging
+import os
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from infrastructure.file_handlers.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+JSONL_SUFFIX = ".jsonl"
+JSONL_CHUNK_LINES = 1000
+# Bytes read from the end of a JSON list file to find its closing bracket
+TAIL_BYTES = 4096
+
+# json.dumps builds a new encoder on every call when given options
+_line_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_item_encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
 
 
 class JsonHandler:
-    """Handles JSON file operations."""
+    """Handles JSON file operations.
+
+    Files ending in ``.jsonl`` are handled as JSON Lines: one object per
+    line, read as a stream, appended to without rereading the file, and
+    rewritten through a temporary file renamed over the original. A
+    corrupt line only loses that line. Any other file holds a single JSON
+    list.
+
+    Every write holds an exclusive ``FileLock`` on ``<name>.lock`` and
+    whole-file reads hold a shared one, so several processes can share
+    the files. Rewrites go through ``<name>.tmp`` and ``os.replace``; a
+    crash leaves either the old or the new file. Appends to a JSON list
+    file patch its closing bracket in place: the patch is first written
+    to ``<name>.journal`` and fsynced, and a journal left behind by a
+    crash is replayed by the next reader or writer.
+
+    ``read``, ``write``, ``write_lines`` and ``append_lines`` take
+    ``use_lock=False`` from callers that already hold a lock keeping other
+    writers out (such as ``JsonStore``), so no per-file lock is taken.
+    """
 
     @staticmethod
-    def read(file_path: Path) -> List[Dict[str, Any]]:
+    def is_jsonl(file_path: Path) -> bool:
+        """Check if a file uses the JSON Lines format."""
+        return file_path.suffix == JSONL_SUFFIX
+
+    @staticmethod
+    def lock(file_path: Path) -> FileLock:
+        """Get the lock guarding a file.
+
+        Hold it (``with JsonHandler.lock(path).hold():``) to make several
+        calls on the file atomic with respect to other processes.
+
+        Args:
+            file_path: Path to JSON file
+
+        Returns:
+            The process-wide lock on ``<name>.lock``
+        """
+        return FileLock.for_path(file_path.with_name(file_path.name + ".lock"))
+
+    @staticmethod
+    def read(file_path: Path, use_lock: bool = True) -> List[Dict[str, Any]]:
         """Read data from JSON file.
 
         Args:
             file_path: Path to JSON file
+            use_lock: Take the file's lock; False if the caller holds a covering lock
 
         Returns:
             List of dictionaries from JSON file
         """
-        if not file_path.exists():
-            return []
+        if JsonHandler.is_jsonl(file_path):
+            with JsonHandler._hold(file_path, use_lock, shared=True):
+                return list(JsonHandler.iter_records(file_path))
+
+        if JsonHandler._journal_path(file_path).exists():
+            with JsonHandler._hold(file_path, use_lock):
+                JsonHandler._recover(file_path)
+        with JsonHandler._hold(file_path, use_lock, shared=True):
+            return JsonHandler._read_list(file_path)
+
+    @staticmethod
+    def iter_records(file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield the records of a file one at a time.
+
+        JSON Lines files are streamed, so memory stays flat whatever the
+        file size, and without a lock: rewrites replace the file, so the
+        stream keeps reading the version it opened. Lines that are not a
+        JSON object (a torn append, a bad byte) are logged and skipped.
+
+        Args:
+            file_path: Path to JSON or JSON Lines file
+
+        Yields:
+            Dictionaries from the file
+        """
+        if not JsonHandler.is_jsonl(file_path):
+            yield from JsonHandler.read(file_path)
+            return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
-        except (json.JSONDecodeError, IOError):
-            return []
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            number = 0
+            while True:
+                lines = list(islice(f, JSONL_CHUNK_LINES))
+                if not lines:
+                    return
+                # One json.loads per chunk is several times faster than one
+                # per line; the chunk is trusted only if every line turned
+                # into exactly one object
+                try:
+                    items = json.loads(b"[" + b",".join(lines) + b"]")
+                except ValueError:
+                    items = None
+                if (
+                    items is not None
+                    and len(items) == len(lines)
+                    and all(isinstance(item, dict) for item in items)
+                ):
+                    yield from items
+                else:
+                    yield from JsonHandler._parse_lines(file_path, lines, number)
+                number += len(lines)
 
     @staticmethod
-    def write(file_path: Path, data: List[Dict[str, Any]]) -> None:
+    def write(
+        file_path: Path, data: Iterable[Dict[str, Any]], use_lock: bool = True
+    ) -> None:
         """Write data to JSON file.
 
         Args:
             file_path: Path to JSON file
-            data: List of dictionaries to write
+            data: Dictionaries to write (a JSON Lines file accepts any
+                iterable and consumes it lazily)
+            use_lock: Take the file's lock; False if the caller holds a covering lock
         """
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if JsonHandler.is_jsonl(file_path):
+            JsonHandler.write_lines(file_path, data, use_lock)
+            return
+
+        with JsonHandler._hold(file_path, use_lock):
+            JsonHandler._recover(file_path)
+            JsonHandler._replace(
+                file_path, lambda f: json.dump(data, f, indent=2, ensure_ascii=False)
+            )
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    @staticmethod
+    def write_lines(
+        file_path: Path, items: Iterable[Dict[str, Any]], use_lock: bool = True
+    ) -> None:
+        """Atomically replace a file with JSON Lines, whatever its suffix.
+
+        Args:
+            file_path: Path to file
+            items: Dictionaries to write
+            use_lock: Take the file's lock; False if the caller holds a covering lock
+        """
+        with JsonHandler._hold(file_path, use_lock):
+            JsonHandler._replace(file_path, lambda f: JsonHandler._write_items(f, items))
 
     @staticmethod
     def append(file_path: Path, item: Dict[str, Any]) -> None:
         """Append item to JSON file.
 
+        A JSON Lines file gets one line added at its end; a JSON list file
+        has its closing bracket patched in place. Neither is reread.
+
         Args:
             file_path: Path to JSON file
             item: Dictionary to append
         """
-        data = JsonHandler.read(file_path)
-        data.append(item)
-        JsonHandler.write(file_path, data)
+        if JsonHandler.is_jsonl(file_path):
+            JsonHandler.append_lines(file_path, [item])
+            return
+
+        with JsonHandler.lock(file_path).hold():
+            JsonHandler._recover(file_path)
+            patch = JsonHandler._append_patch(file_path, item)
+            if patch is None:
+                # Missing or not ending in a list: rewrite it whole
+                data = JsonHandler._read_list(file_path)
+                data.append(item)
+                JsonHandler.write(file_path, data)
+                return
+            JsonHandler._apply_patch(file_path, *patch)
+
+    @staticmethod
+    def append_lines(
+        file_path: Path, items: Iterable[Dict[str, Any]], use_lock: bool = True
+    ) -> None:
+        """Append items to a file as JSON Lines with a single write.
+
+        If the file ends in a torn line, a newline is written first so the
+        new records do not run into it.
+
+        Args:
+            file_path: Path to file
+            items: Dictionaries to append
+            use_lock: Take the file's lock; False if the caller holds a covering lock
+        """
+        data = "".join(JsonHandler._encode_line(item) for item in items).encode("utf-8")
+        if not data:
+            return
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with JsonHandler._hold(file_path, use_lock), open(file_path, "a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
 
     @staticmethod
     def update_item(
@@ -69,13 +234,30 @@ class JsonHandler:
         Returns:
             True if item was found and updated, False otherwise
         """
-        data = JsonHandler.read(file_path)
-        for i, item in enumerate(data):
-            if predicate(item):
-                data[i] = updated_item
-                JsonHandler.write(file_path, data)
-                return True
-        return False
+        with JsonHandler.lock(file_path).hold():
+            if JsonHandler.is_jsonl(file_path):
+                matched = []
+
+                def updated() -> Iterator[Dict[str, Any]]:
+                    for item in JsonHandler.iter_records(file_path):
+                        if not matched and predicate(item):
+                            matched.append(item)
+                            yield updated_item
+                        else:
+                            yield item
+
+                return JsonHandler._replace(
+                    file_path, lambda f: JsonHandler._write_items(f, updated()) and bool(matched)
+                )
+
+            JsonHandler._recover(file_path)
+            data = JsonHandler._read_list(file_path)
+            for i, item in enumerate(data):
+                if predicate(item):
+                    data[i] = updated_item
+                    JsonHandler.write(file_path, data)
+                    return True
+            return False
 
     @staticmethod
     def delete_item(file_path: Path, predicate: callable) -> bool:
@@ -88,11 +270,190 @@ class JsonHandler:
         Returns:
             True if item was found and deleted, False otherwise
         """
-        data = JsonHandler.read(file_path)
-        original_length = len(data)
-        data = [item for item in data if not predicate(item)]
+        with JsonHandler.lock(file_path).hold():
+            if JsonHandler.is_jsonl(file_path):
+                deleted = []
 
-        if len(data) < original_length:
-            JsonHandler.write(file_path, data)
+                def kept() -> Iterator[Dict[str, Any]]:
+                    for item in JsonHandler.iter_records(file_path):
+                        if predicate(item):
+                            deleted.append(item)
+                        else:
+                            yield item
+
+                return JsonHandler._replace(
+                    file_path, lambda f: JsonHandler._write_items(f, kept()) and bool(deleted)
+                )
+
+            JsonHandler._recover(file_path)
+            data = JsonHandler._read_list(file_path)
+            original_length = len(data)
+            data = [item for item in data if not predicate(item)]
+
+            if len(data) < original_length:
+                JsonHandler.write(file_path, data)
+                return True
+            return False
+
+    @staticmethod
+    def _hold(file_path: Path, use_lock: bool, shared: bool = False):
+        """Hold the file's lock, or nothing when the caller holds a covering lock."""
+        if not use_lock:
+            return nullcontext()
+        return JsonHandler.lock(file_path).hold(shared=shared)
+
+    @staticmethod
+    def _read_list(file_path: Path) -> List[Dict[str, Any]]:
+        """Read a JSON list file (the caller holds the lock)."""
+        if not file_path.exists():
+            return []
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data if isinstance(data, list) else []
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError):
+            return []
+
+    @staticmethod
+    def _parse_lines(
+        file_path: Path, lines: List[bytes], first_number: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse lines one at a time, skipping those that are not an object."""
+        for number, line in enumerate(lines, start=first_number + 1):
+            try:
+                item = json.loads(line)
+            except ValueError:
+                # Also catches UnicodeDecodeError from invalid UTF-8
+                if line.strip():
+                    logger.warning("Skipping unreadable line %d of %s", number, file_path)
+                continue
+            if isinstance(item, dict):
+                yield item
+            else:
+                logger.warning("Skipping non-object line %d of %s", number, file_path)
+
+    @staticmethod
+    def _encode_line(item: Dict[str, Any]) -> str:
+        """Encode one record as a JSON Lines line."""
+        return _line_encoder.encode(item) + "\n"
+
+    @staticmethod
+    def _write_items(f: TextIO, items: Iterable[Dict[str, Any]]) -> bool:
+        """Write records as JSON Lines."""
+        f.writelines(JsonHandler._encode_line(item) for item in items)
+        return True
+
+    @staticmethod
+    def _replace(file_path: Path, write: Callable[[TextIO], Optional[bool]]) -> bool:
+        """Atomically replace a file (the caller holds the lock).
+
+        The content is written to ``<name>.tmp`` next to the file, which is
+        fsynced and renamed over it, so readers and crashes see either the
+        old file or the new one in full.
+
+        Args:
+            file_path: File to replace
+            write: Writes the new content; if it returns False the
+                temporary file is discarded and the file left alone
+
+        Returns:
+            True if the file was replaced
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                if write(f) is False:
+                    return False
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
             return True
-        return False
+        finally:
+            # Already gone after a successful replace
+            temp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _journal_path(file_path: Path) -> Path:
+        """Journal of an append to a JSON list file that is in progress."""
+        return file_path.with_name(file_path.name + ".journal")
+
+    @staticmethod
+    def _append_patch(file_path: Path, item: Dict[str, Any]) -> Optional[Tuple[int, bytes]]:
+        """Work out the bytes that append an item to a JSON list file.
+
+        The item is formatted the way ``write`` would have written it, so
+        the patched file is the one a full rewrite would produce.
+
+        Returns:
+            (offset, data) to write before cutting the file after it, or
+            None if the file does not end in a list
+        """
+        try:
+            size = file_path.stat().st_size
+        except FileNotFoundError:
+            return None
+        start = max(0, size - TAIL_BYTES)
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            tail = f.read()
+
+        body = tail.rstrip()
+        if not body.endswith(b"]"):
+            return None
+        before = body[:-1].rstrip()
+        if not before:
+            return None
+        text = _item_encoder.encode(item).replace("\n", "\n  ")
+        # The closing bracket belongs to the opening one only in "[]"
+        separator = "\n  " if before.endswith(b"[") else ",\n  "
+        return start + len(before), (separator + text + "\n]").encode("utf-8")
+
+    @staticmethod
+    def _apply_patch(file_path: Path, offset: int, data: bytes) -> None:
+        """Write a patch through the journal (the caller holds the lock)."""
+        journal_path = JsonHandler._journal_path(file_path)
+        entry = json.dumps({"offset": offset, "data": data.decode("utf-8")}, ensure_ascii=False)
+        with open(journal_path, "w", encoding="utf-8") as f:
+            f.write(entry + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        JsonHandler._patch(file_path, offset, data)
+        journal_path.unlink()
+
+    @staticmethod
+    def _patch(file_path: Path, offset: int, data: bytes) -> None:
+        """Write data at an offset and cut the file after it."""
+        with open(file_path, "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _recover(file_path: Path) -> None:
+        """Finish an append interrupted by a crash (the caller holds the lock).
+
+        A journal that was fully written is applied again, which is
+        harmless if the patch had already reached the file; a torn one
+        means the file was never touched.
+        """
+        journal_path = JsonHandler._journal_path(file_path)
+        try:
+            with open(journal_path, "r", encoding="utf-8") as f:
+                entry = f.read()
+        except FileNotFoundError:
+            return
+        try:
+            if not entry.endswith("\n"):
+                raise ValueError("torn journal")
+            patch = json.loads(entry)
+            offset, data = patch["offset"], patch["data"].encode("utf-8")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Discarding incomplete journal %s", journal_path)
+        else:
+            logger.warning("Replaying journal %s", journal_path)
+            JsonHandler._patch(file_path, offset, data)
+        journal_path.unlink()
@@ -0,0 +1,205 @@
+"""Transactional store of JSON collections."""
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from infrastructure.file_handlers.file_lock import FileLock
+from infrastructure.file_handlers.json_collection import JsonCollection
+
+
+class JsonStore:
+    """Owns the JSON collections and their transactions.
+
+    Mirrors SQLiteConnection: one re-entrant lock serializes access,
+    ``begin``/``commit``/``rollback`` nest, and ``after_commit`` callbacks
+    run once the outermost transaction commits. Writes are applied to
+    memory immediately so the transaction reads its own writes. Their log
+    lines are buffered and appended when the outermost transaction
+    commits. A rollback undoes the in-memory changes and drops the lines.
+
+    Several processes can share the files: the outermost transaction holds
+    an exclusive ``FileLock``, much like SQLite's single writer, and first
+    replays whatever the other processes have logged since.
+    """
+
+    def __init__(self, lock_path: Path, compact_threshold: int = 1000):
+        """Initialize store.
+
+        Args:
+            lock_path: Lock file shared by every process using the files
+            compact_threshold: Log entries a collection may accumulate (or
+                its record count, if larger) before it is compacted
+        """
+        self.compact_threshold = compact_threshold
+        self.lock = threading.RLock()
+        self.file_lock = FileLock.for_path(lock_path)
+        self._collections: Dict[Path, JsonCollection] = {}
+        self._transaction_depth = 0
+        self._undo: List[List[Callable[[], None]]] = []
+        self._after_commit: List[List[Callable[[], None]]] = []
+        # Buffered (collection, log entry) pairs and where each level starts
+        self._pending: List[Tuple[JsonCollection, Dict[str, Any]]] = []
+        self._pending_marks: List[int] = []
+
+    def collection(
+        self,
+        path: Path,
+        id_field: str,
+        unique: Optional[Dict[str, Tuple[str, ...]]] = None,
+        indexes: Optional[Dict[str, Tuple[str, ...]]] = None,
+        order_by: Tuple[str, ...] = (),
+    ) -> JsonCollection:
+        """Open a collection, loading it on first use.
+
+        Args:
+            path: Snapshot file
+            id_field: Integer primary key field
+            unique: Unique indexes, name -> fields
+            indexes: Non-unique indexes, name -> fields
+            order_by: Fields defining the collection order
+
+        Returns:
+            The collection (the same instance for the same path)
+        """
+        with self.lock, self.file_lock.hold():
+            collection = self._collections.get(path)
+            if collection is None:
+                collection = JsonCollection(self, path, id_field, unique, indexes, order_by)
+                if collection.damaged:
+                    # Rewrite so later appends don't follow a torn line
+                    collection.compact()
+                self._collections[path] = collection
+            return collection
+
+    @property
+    def in_transaction(self) -> bool:
+        """Check if an explicit transaction is active."""
+        return self._transaction_depth > 0
+
+    def begin(self) -> None:
+        """Begin an explicit transaction (nested calls act as savepoints)."""
+        self.lock.acquire()
+        if not self._transaction_depth:
+            try:
+                self._lock_files()
+            except BaseException:
+                self.lock.release()
+                raise
+        self._transaction_depth += 1
+        self._undo.append([])
+        self._after_commit.append([])
+        self._pending_marks.append(len(self._pending))
+
+    def commit(self) -> None:
+        """Commit the innermost explicit transaction."""
+        self._transaction_depth -= 1
+        undo = self._undo.pop()
+        callbacks = self._after_commit.pop()
+        self._pending_marks.pop()
+        try:
+            if self._transaction_depth > 0:
+                # Released savepoints only become durable with the outer commit
+                self._undo[-1].extend(undo)
+                self._after_commit[-1].extend(callbacks)
+                callbacks = []
+            else:
+                grouped: Dict[JsonCollection, List[Dict[str, Any]]] = {}
+                for collection, operation in self._pending:
+                    grouped.setdefault(collection, []).append(operation)
+                self._pending = []
+                try:
+                    for collection, operations in grouped.items():
+                        collection.append_log(operations)
+                except Exception:
+                    # Keep memory in step with what reached the disk
+                    for action in reversed(undo):
+                        action()
+                    raise
+                self._compact_if_needed()
+        finally:
+            if not self._transaction_depth:
+                self.file_lock.release()
+            self.lock.release()
+
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        """Roll back the innermost explicit transaction."""
+        self._transaction_depth -= 1
+        undo = self._undo.pop()
+        self._after_commit.pop()  # discard callbacks of the rolled back work
+        del self._pending[self._pending_marks.pop():]
+        try:
+            for action in reversed(undo):
+                action()
+        finally:
+            if not self._transaction_depth:
+                self.file_lock.release()
+            self.lock.release()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager for an explicit transaction."""
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the current transaction has been committed.
+
+        Args:
+            callback: Function to run after commit
+        """
+        with self.lock:
+            if self.in_transaction:
+                self._after_commit[-1].append(callback)
+                return
+        callback()
+
+    def record(
+        self, collection: JsonCollection, operation: Dict[str, Any], undo: Callable[[], None]
+    ) -> None:
+        """Log a write made by a collection inside a transaction.
+
+        Args:
+            collection: Collection that was written
+            operation: Log entry
+            undo: Reverts the in-memory change
+        """
+        self._undo[-1].append(undo)
+        self._pending.append((collection, operation))
+
+    def compact(self) -> None:
+        """Compact every collection that has log entries."""
+        with self.lock, self.file_lock.hold():
+            for collection in self._collections.values():
+                # Include what other processes logged since our last look
+                collection.refresh()
+                if collection.log_entries:
+                    collection.compact()
+
+    def close(self) -> None:
+        """Compact on shutdown so the next start loads snapshots only."""
+        self.compact()
+
+    def _lock_files(self) -> None:
+        """Take the file lock and catch up with other processes."""
+        self.file_lock.acquire()
+        try:
+            for collection in self._collections.values():
+                collection.refresh()
+        except BaseException:
+            self.file_lock.release()
+            raise
+
+    def _compact_if_needed(self) -> None:
+        """Compact collections whose log has outgrown the threshold."""
+        for collection in self._collections.values():
+            if collection.needs_compaction(self.compact_threshold):
+                collection.compact()
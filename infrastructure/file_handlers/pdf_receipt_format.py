@@ -0,0 +1,152 @@
+"""Minimal single-page PDF receipt format."""
+import unicodedata
+from typing import Any, Mapping
+
+from infrastructure.file_handlers.receipt_format import ReceiptFormat
+from infrastructure.file_handlers.receipt_template import ReceiptTemplate, Write
+
+# Glyphs missing from WinAnsiEncoding (cp1252), placed on codes it leaves
+# unused; together with cp1252's Š, š, Ž and ž this covers Croatian
+PDF_EXTRA_GLYPHS = (
+    ("đ", 0o177, "dcroat"),
+    ("Ć", 0o201, "Cacute"),
+    ("Č", 0o215, "Ccaron"),
+    ("Đ", 0o217, "Dcroat"),
+    ("ć", 0o220, "cacute"),
+    ("č", 0o235, "ccaron"),
+)
+_GLYPH_ESCAPES = {char: "\\%03o" % code for char, code, _ in PDF_EXTRA_GLYPHS}
+_DIFFERENCES = b" ".join(b"%d /%s" % (code, glyph.encode()) for _, code, glyph in PDF_EXTRA_GLYPHS)
+
+# Objects 1-4 never change: catalog, page tree, page and the built-in
+# Helvetica font (WinAnsiEncoding is cp1252, which covers the euro sign,
+# extended with the glyphs above)
+_HEADER_OBJECTS = (
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+    b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding "
+    b"<< /Type /Encoding /BaseEncoding /WinAnsiEncoding /Differences [%s] >> >>" % _DIFFERENCES,
+)
+
+
+def _build_header():
+    """Serialize the fixed objects once and record their offsets."""
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    offsets = []
+    for number, body in enumerate(_HEADER_OBJECTS, start=1):
+        offsets.append(len(header))
+        header += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    return header, offsets
+
+
+_HEADER, _HEADER_OFFSETS = _build_header()
+# The content stream's length isn't known until it has been written, so it
+# refers to object 6, which is written after the stream
+_STREAM_START = b"5 0 obj\n<< /Length 6 0 R >>\nstream\n"
+_STREAM_END = b"\nendstream\nendobj\n"
+
+
+def escape_pdf_text(value: str) -> str:
+    """Escape a value for use inside a PDF literal string.
+
+    Args:
+        value: Field value
+
+    Returns:
+        Value with backslashes and parentheses escaped, line breaks removed,
+        and characters outside cp1252 written as octal escapes of the extra
+        glyphs or transliterated to ASCII
+    """
+    value = (
+        value.replace("\\", "\\\\")
+        .replace("(", "\\(")
+        .replace(")", "\\)")
+        .replace("\r", " ")
+        .replace("\n", " ")
+    )
+    try:
+        value.encode("cp1252")
+    except UnicodeEncodeError:
+        value = "".join(_pdf_char(char) for char in value)
+    return value
+
+
+def _pdf_char(char: str) -> str:
+    """Map one character to text the font encoding can show."""
+    if char in _GLYPH_ESCAPES:
+        return _GLYPH_ESCAPES[char]
+    try:
+        char.encode("cp1252")
+        return char
+    except UnicodeEncodeError:
+        pass
+    # Drop accents the font has no glyph for (e.g. ő -> o) rather than print '?'
+    stripped = "".join(
+        part for part in unicodedata.normalize("NFKD", char) if not unicodedata.combining(part)
+    )
+    try:
+        stripped.encode("cp1252")
+        return stripped
+    except UnicodeEncodeError:
+        return "?"
+
+
+class PdfReceiptFormat(ReceiptFormat):
+    """Writes each receipt as a one-page PDF.
+
+    The page content stream comes from a compiled template, so only the
+    cross-reference table and stream length are computed per receipt; the
+    rest of the file structure is serialized once at import.
+    """
+
+    name = "pdf"
+    extension = "pdf"
+
+    def __init__(self, template_name: str = "receipt_pdf.txt"):
+        """Initialize format.
+
+        Args:
+            template_name: Content stream template in the templates directory
+        """
+        self.template_name = template_name
+
+    @property
+    def template(self) -> ReceiptTemplate:
+        """Get the compiled content stream template."""
+        return ReceiptTemplate.load(self.template_name, escape_pdf_text, "cp1252")
+
+    def write(self, values: Mapping[str, Any], write: Write) -> None:
+        """Render one receipt.
+
+        Args:
+            values: Receipt field values by name
+            write: Receives the encoded output
+        """
+        stream_length = 0
+
+        def write_counted(piece: bytes) -> None:
+            nonlocal stream_length
+            stream_length += len(piece)
+            write(piece)
+
+        write(_HEADER)
+        write(_STREAM_START)
+        self.template.render_to(write_counted, values)
+        write(_STREAM_END)
+
+        stream_offset = len(_HEADER)
+        length_offset = stream_offset + len(_STREAM_START) + stream_length + len(_STREAM_END)
+        length_object = b"6 0 obj\n%d\nendobj\n" % stream_length
+        xref_offset = length_offset + len(length_object)
+
+        offsets = _HEADER_OFFSETS + [stream_offset, length_offset]
+        xref = [b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1)]
+        xref.extend(b"%010d 00000 n \n" % offset for offset in offsets)
+        write(length_object)
+        write(b"".join(xref))
+        write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(offsets) + 1, xref_offset)
+        )
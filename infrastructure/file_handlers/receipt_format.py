@@ -0,0 +1,29 @@
+"""Receipt output format interface."""
+from abc import ABC, abstractmethod
+from typing import Any, Mapping
+
+from infrastructure.file_handlers.receipt_template import Write
+
+
+class ReceiptFormat(ABC):
+    """Abstract receipt output format.
+
+    Formats stream encoded bytes to a ``write`` callable, so the same format
+    can render into a file, a buffer or the batch receipts log. Instances are
+    pickled into batch worker processes and should only hold plain data.
+    """
+
+    #: Registry key, e.g. "text"
+    name: str = ""
+    #: Filename extension without the dot
+    extension: str = ""
+
+    @abstractmethod
+    def write(self, values: Mapping[str, Any], write: Write) -> None:
+        """Render one receipt.
+
+        Args:
+            values: Receipt field values by name
+            write: Receives the encoded output
+        """
+        pass
@@ -0,0 +1,48 @@
+"""Registry of receipt output formats."""
+import html
+from typing import Dict, List
+
+from infrastructure.file_handlers.pdf_receipt_format import PdfReceiptFormat
+from infrastructure.file_handlers.receipt_format import ReceiptFormat
+from infrastructure.file_handlers.template_receipt_format import TemplateReceiptFormat
+
+_FORMATS: Dict[str, ReceiptFormat] = {}
+
+
+def register_receipt_format(receipt_format: ReceiptFormat) -> None:
+    """Register (or replace) a receipt format under its name.
+
+    Args:
+        receipt_format: Format to register
+    """
+    _FORMATS[receipt_format.name] = receipt_format
+
+
+def get_receipt_format(name: str) -> ReceiptFormat:
+    """Look up a registered receipt format.
+
+    Args:
+        name: Format name, e.g. "text", "html" or "pdf"
+
+    Returns:
+        Registered format
+
+    Raises:
+        ValueError: If no format is registered under that name
+    """
+    try:
+        return _FORMATS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown receipt format {name!r} (available: {', '.join(receipt_format_names())})"
+        ) from None
+
+
+def receipt_format_names() -> List[str]:
+    """Get the names of all registered formats."""
+    return sorted(_FORMATS)
+
+
+register_receipt_format(TemplateReceiptFormat("text", "txt", "receipt.txt"))
+register_receipt_format(TemplateReceiptFormat("html", "html", "receipt.html", escape=html.escape))
+register_receipt_format(PdfReceiptFormat())
@@ -1,72 +1,315 @@
 """Receipt generation service."""
-from pathlib import Path
+import io
+import os
+import re
+import threading
+from concurrent.futures import Future
 from datetime import datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
 from core.entities import Appointment
+from infrastructure.file_handlers.receipt_format import ReceiptFormat
+from infrastructure.file_handlers.receipt_formats import get_receipt_format
+from infrastructure.file_handlers.receipt_writer import ReceiptWriter
+
+# Receipts rendered per worker task; large enough to amortize pickling
+BATCH_CHUNK_SIZE = 1000
+
+RECEIPTS_LOG = "receipts.log"
+RECEIPTS_INDEX = "receipts.idx"
+
+# Anything that is not safe inside a filename on every platform
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]+")
 
 
 class ReceiptGenerator:
     """Generates receipt files for appointments."""
 
-    def __init__(self, receipts_dir: Path):
+    def __init__(self, receipts_dir: Path, receipt_format: str = "text"):
         """Initialize receipt generator.
 
         Args:
             receipts_dir: Directory to save receipts
+            receipt_format: Default output format ("text", "html", "pdf")
+
+        Raises:
+            ValueError: If the format is not registered
         """
         self.receipts_dir = receipts_dir
-        self.receipts_dir.mkdir(parents=True, exist_ok=True)
+        self.receipt_format = get_receipt_format(receipt_format)
+        self.log_path = receipts_dir / RECEIPTS_LOG
+        self.index_path = receipts_dir / RECEIPTS_INDEX
+        self._log_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[ReceiptWriter] = None
+        self._directory_ready = False
 
-    def generate(self, appointment: Appointment) -> Path:
+    def ensure_directory(self) -> None:
+        """Create the receipts directory on first write.
+
+        Deferred from construction so a slow receipts location (e.g. a
+        network share) never delays startup.
+        """
+        if not self._directory_ready:
+            self.receipts_dir.mkdir(parents=True, exist_ok=True)
+            self._directory_ready = True
+
+    def generate(self, appointment: Appointment, receipt_format: Optional[str] = None) -> Path:
         """Generate receipt file for appointment.
 
         Args:
             appointment: Appointment to generate receipt for
+            receipt_format: Output format (defaults to the generator's)
 
         Returns:
             Path to generated receipt file
-        """
-        # Format filename: receipt_FirstName_LastName_Date.txt
-        filename = f"receipt_{appointment.first_name}_{appointment.last_name}_{appointment.date}.txt"
-        file_path = self.receipts_dir / filename
 
-        # Generate receipt content
-        content = self._format_receipt(appointment)
+        Raises:
+            ValueError: If the format is not registered
+        """
+        output = get_receipt_format(receipt_format) if receipt_format else self.receipt_format
+        file_path = self.receipts_dir / self.filename(appointment, output.extension)
+        self.ensure_directory()
 
-        # Write to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Stream the rendered receipt straight into the file
+        with open(file_path, "wb") as f:
+            output.write(self._values(appointment), f.write)
 
         return file_path
 
-    def _format_receipt(self, appointment: Appointment) -> str:
-        """Format receipt content.
+    def generate_async(self, appointment: Appointment, receipt_format: Optional[str] = None) -> Future:
+        """Queue a receipt on the background writer and return immediately.
 
         Args:
-            appointment: Appointment details
+            appointment: Appointment to generate receipt for
+            receipt_format: Output format (defaults to the generator's)
 
         Returns:
-            Formatted receipt text
+            Future resolving to the receipt path once it is durably on disk;
+            done callbacks run on the writer thread
+
+        Raises:
+            RuntimeError: If the generator has been closed
         """
-        return f"""
-╔════════════════════════════════════════╗
-║        BEAUTY SALON RECEIPT            ║
-╚════════════════════════════════════════╝
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = ReceiptWriter(self)
+            writer = self._writer
+        return writer.submit(appointment, receipt_format)
 
-Customer Information:
-  Name: {appointment.full_name}
-  Phone: {appointment.phone_number}
+    def render(self, appointment: Appointment, receipt_format: Optional[str] = None) -> Tuple[Path, bytes]:
+        """Render a receipt in memory.
 
-Appointment Details:
-  Date: {appointment.date}
-  Time: {appointment.time}
-  Service: {appointment.service_name}
+        Args:
+            appointment: Appointment to render a receipt for
+            receipt_format: Output format (defaults to the generator's)
 
-Payment Information:
-  Service Price: {appointment.service_price}€
+        Returns:
+            Path the receipt belongs at and its encoded content
 
-═══════════════════════════════════════════
+        Raises:
+            ValueError: If the format is not registered
+        """
+        output = get_receipt_format(receipt_format) if receipt_format else self.receipt_format
+        buffer = io.BytesIO()
+        output.write(self._values(appointment), buffer.write)
+        return self.receipts_dir / self.filename(appointment, output.extension), buffer.getvalue()
+
+    def close(self) -> None:
+        """Finish queued receipts and stop the background writer."""
+        with self._writer_lock:
+            writer = self._writer
+        if writer is not None:
+            writer.close()
+
+    def generate_batch(
+        self, appointments: Sequence[Appointment], workers: Optional[int] = None
+    ) -> Path:
+        """Append receipts for many appointments to the receipts log.
+
+        Receipts are rendered in a process pool (formatting is pure Python,
+        so threads would serialize on the GIL) and appended to a single
+        ``receipts.log`` with one write, instead of creating one small file
+        per appointment. Each receipt gets a line in ``receipts.idx`` with
+        its name, byte offset and length; the index is only appended after
+        the log data is synced, so it never points at bytes that were lost.
+        Regenerating a receipt appends a new copy and the newest entry wins.
+
+        Args:
+            appointments: Appointments to generate receipts for
+            workers: Worker processes; defaults to the CPU count, and 1 renders
+                in the calling process
+
+        Returns:
+            Path to the receipts log
+        """
+        extension = self.receipt_format.extension
+        names = [self.filename(appointment, extension) for appointment in appointments]
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        data, lengths = self._render_all(appointments, generated_at, workers)
+
+        self.ensure_directory()
+        with self._log_lock:
+            with open(self.log_path, "ab") as log_file:
+                offset = log_file.seek(0, os.SEEK_END)
+                log_file.write(data)
+                log_file.flush()
+                os.fsync(log_file.fileno())
+
+            entries = []
+            for name, length in zip(names, lengths):
+                entries.append(f"{name}\t{offset}\t{length}\n")
+                offset += length
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                index_file.write("".join(entries))
+
+        return self.log_path
 
-Thank you for choosing our Beauty Salon!
+    def read_receipt(self, name: str) -> Optional[bytes]:
+        """Read a receipt back from the receipts log.
 
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-"""
+        Args:
+            name: Receipt filename as returned by ``filename``
+
+        Returns:
+            Encoded receipt, or None if it is not in the log
+        """
+        entry = self.load_index().get(name)
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self.log_path, "rb") as log_file:
+            log_file.seek(offset)
+            return log_file.read(length)
+
+    def load_index(self) -> Dict[str, Tuple[int, int]]:
+        """Load the receipts log index.
+
+        Returns:
+            Mapping of receipt name to (offset, length) of its newest copy
+        """
+        index: Dict[str, Tuple[int, int]] = {}
+        if not self.index_path.exists():
+            return index
+        log_size = self.log_path.stat().st_size
+        with open(self.index_path, "r", encoding="utf-8") as index_file:
+            for line in index_file:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) != 3:
+                    # Torn final line from an interrupted append
+                    continue
+                name, offset, length = fields[0], int(fields[1]), int(fields[2])
+                if offset + length <= log_size:
+                    index[name] = (offset, length)
+        return index
+
+    @staticmethod
+    def filename(appointment: Appointment, extension: str = "txt") -> str:
+        """Build a collision-free receipt filename.
+
+        Format: ``receipt_<id>_FirstName_LastName_Date_HHMM.<extension>``. The
+        appointment id keys the name; the slot time keeps it unique for
+        appointments that have not been saved yet, since a slot can only be
+        booked once.
+
+        Args:
+            appointment: Appointment the receipt is for
+            extension: Filename extension without the dot
+
+        Returns:
+            Receipt filename
+        """
+        parts = [
+            appointment.first_name,
+            appointment.last_name,
+            appointment.date,
+            appointment.time.replace(":", ""),
+        ]
+        if appointment.appointment_id is not None:
+            parts.insert(0, str(appointment.appointment_id))
+        safe = [_UNSAFE_FILENAME_CHARS.sub("-", part).strip("-") for part in parts]
+        return f"receipt_{'_'.join(safe)}.{extension}"
+
+    def _render_all(
+        self, appointments: Sequence[Appointment], generated_at: str, workers: Optional[int]
+    ) -> Tuple[bytes, List[int]]:
+        """Render receipts, in parallel when the batch is big enough.
+
+        Args:
+            appointments: Appointments to render
+            generated_at: Timestamp printed on every receipt in the batch
+            workers: Worker processes (None for the CPU count)
+
+        Returns:
+            Concatenated receipts in the order of ``appointments`` and the
+            byte length of each
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(appointments) <= BATCH_CHUNK_SIZE:
+            return ReceiptGenerator._render_chunk(self.receipt_format, appointments, generated_at)
+
+        # multiprocessing is slow to import and only needed for big batches
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [
+            appointments[start:start + BATCH_CHUNK_SIZE]
+            for start in range(0, len(appointments), BATCH_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            rendered = list(pool.map(
+                ReceiptGenerator._render_chunk, repeat(self.receipt_format), chunks, repeat(generated_at)
+            ))
+        return (
+            b"".join(data for data, _ in rendered),
+            [length for _, lengths in rendered for length in lengths],
+        )
+
+    @staticmethod
+    def _render_chunk(
+        receipt_format: ReceiptFormat, appointments: Sequence[Appointment], generated_at: str
+    ) -> Tuple[bytes, List[int]]:
+        """Render a chunk of receipts into one buffer (runs in a worker process).
+
+        Args:
+            receipt_format: Output format
+            appointments: Appointments to render
+            generated_at: Timestamp printed on every receipt
+
+        Returns:
+            Concatenated receipts and the byte length of each
+        """
+        buffer = io.BytesIO()
+        lengths = []
+        for appointment in appointments:
+            start = buffer.tell()
+            receipt_format.write(ReceiptGenerator._values(appointment, generated_at), buffer.write)
+            lengths.append(buffer.tell() - start)
+        return buffer.getvalue(), lengths
+
+    @staticmethod
+    def _values(appointment: Appointment, generated_at: Optional[str] = None) -> Dict[str, Any]:
+        """Collect the template fields for an appointment.
+
+        Args:
+            appointment: Appointment details
+            generated_at: Timestamp to print (defaults to now)
+
+        Returns:
+            Field values by name
+        """
+        if generated_at is None:
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return {
+            "appointment_id": appointment.appointment_id,
+            "first_name": appointment.first_name,
+            "last_name": appointment.last_name,
+            "full_name": appointment.full_name,
+            "phone_number": appointment.phone_number,
+            "date": appointment.date,
+            "time": appointment.time,
+            "service_name": appointment.service_name,
+            "service_price": appointment.service_price,
+            "generated_at": generated_at,
+        }
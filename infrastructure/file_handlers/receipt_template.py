@@ -0,0 +1,124 @@
+"""Compiled receipt templates."""
+import string
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Receives already-encoded output
+Write = Callable[[bytes], Any]
+Escape = Callable[[str], str]
+RenderFunction = Callable[[Write, Mapping[str, Any]], None]
+
+
+class ReceiptTemplate:
+    """A template parsed once into a render function that streams bytes.
+
+    Templates use ``str.format`` syntax: ``{field}`` or ``{field:spec}``
+    placeholders, with ``{{`` and ``}}`` for literal braces. Compiling turns
+    the template into a Python function whose literal text is already
+    encoded, so rendering a receipt only formats and encodes the field
+    values and hands the output to ``write`` in one call, without building
+    the receipt as an intermediate ``str``. Compiled functions are cached per
+    (source, escape, encoding), so every instance built from the same
+    template shares one function.
+    """
+
+    def __init__(self, source: str, escape: Optional[Escape] = None, encoding: str = "utf-8"):
+        """Initialize and compile template.
+
+        Args:
+            source: Template text
+            escape: Applied to every formatted field value (e.g. html.escape)
+            encoding: Output encoding
+
+        Raises:
+            ValueError: If the template is malformed or uses unsupported syntax
+        """
+        self.source = source
+        self.escape = escape
+        self.encoding = encoding
+        self._render = _compile(source, escape, encoding)
+
+    @classmethod
+    def load(cls, name: str, escape: Optional[Escape] = None, encoding: str = "utf-8") -> "ReceiptTemplate":
+        """Load a template from the templates directory (cached).
+
+        Args:
+            name: Template filename inside ``TEMPLATES_DIR``
+            escape: Applied to every formatted field value
+            encoding: Output encoding
+
+        Returns:
+            Compiled template
+        """
+        return _load(cls, name, escape, encoding)
+
+    def render_to(self, write: Write, values: Mapping[str, Any]) -> None:
+        """Stream the rendered template to ``write``.
+
+        Args:
+            write: Receives the encoded output, e.g. ``stream.write``
+            values: Field values by name
+
+        Raises:
+            KeyError: If a field is missing from ``values``
+        """
+        self._render(write, values)
+
+    def render(self, values: Mapping[str, Any]) -> bytes:
+        """Render the template to bytes.
+
+        Args:
+            values: Field values by name
+
+        Returns:
+            Encoded output
+        """
+        parts = []
+        self._render(parts.append, values)
+        return b"".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _load(cls: type, name: str, escape: Optional[Escape], encoding: str) -> ReceiptTemplate:
+    """Read and compile a template file once."""
+    source = (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+    return cls(source, escape, encoding)
+
+
+@lru_cache(maxsize=None)
+def _compile(source: str, escape: Optional[Escape], encoding: str) -> RenderFunction:
+    """Compile template source into a render function.
+
+    Args:
+        source: Template text
+        escape: Applied to every formatted field value
+        encoding: Output encoding
+
+    Returns:
+        Function taking (write, values)
+
+    Raises:
+        ValueError: If the template is malformed or uses unsupported syntax
+    """
+    pieces = []
+    namespace: Dict[str, Any] = {"escape": escape}
+    errors = "" if encoding.lower().replace("-", "") == "utf8" else ", 'replace'"
+    for literal, field, spec, conversion in string.Formatter().parse(source):
+        if literal:
+            pieces.append(repr(literal.encode(encoding)))
+        if field is None:
+            continue
+        if not field.isidentifier() or conversion is not None:
+            raise ValueError(f"Unsupported template field: {{{field}}}")
+        value = f"format(values[{field!r}], {spec!r})" if spec else f"str(values[{field!r}])"
+        if escape is not None:
+            value = f"escape({value})"
+        pieces.append(f"{value}.encode({encoding!r}{errors})")
+
+    # One write of the joined bytes beats a write call per piece
+    code = f"def render(write, values):\n    write(b''.join(({''.join(p + ', ' for p in pieces)})))\n"
+    exec(compile(code, f"<template {source[:20]!r}>", "exec"), namespace)
+    return namespace["render"]
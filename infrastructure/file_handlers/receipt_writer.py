@@ -0,0 +1,221 @@
+"""Background receipt writer."""
+import logging
+import os
+import queue
+import threading
+from concurrent import futures
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Tuple
+
+from core.entities import Appointment
+
+if TYPE_CHECKING:
+    from infrastructure.file_handlers.receipt_generator import ReceiptGenerator
+
+logger = logging.getLogger(__name__)
+
+# Queue item: (appointment or None for a flush barrier, format, future)
+_Request = Tuple[Optional[Appointment], Optional[str], Future]
+
+
+class ReceiptWriter:
+    """Renders and writes receipts on a single background thread.
+
+    Callers get a Future and never touch the filesystem, so a slow disk or
+    network share only delays the completion callback. The thread takes
+    everything queued at once and handles it as a batch. A receipt that was
+    requested several times is written once. All files are written to
+    temporary names before any is fsynced, then renamed into place, and the
+    directory is fsynced once per batch.
+    """
+
+    def __init__(self, generator: "ReceiptGenerator", max_batch: int = 64, durable: bool = True):
+        """Initialize writer.
+
+        Args:
+            generator: Renders receipts and owns the receipts directory
+            max_batch: Most requests handled per batch
+            durable: fsync files and the directory before reporting success
+        """
+        self.generator = generator
+        self.max_batch = max_batch
+        self.durable = durable
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, appointment: Appointment, receipt_format: Optional[str] = None) -> Future:
+        """Queue a receipt.
+
+        Args:
+            appointment: Appointment to write a receipt for
+            receipt_format: Output format (defaults to the generator's)
+
+        Returns:
+            Future resolving to the receipt path once it is on disk. Its done
+            callbacks run on the writer thread, so UI code should hand them
+            to the Tk thread (e.g. BackgroundTaskRunner.call_soon).
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        future: Future = Future()
+        self._put((appointment, receipt_format, future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every receipt submitted so far has been handled.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            True if the queue drained in time
+        """
+        barrier: Future = Future()
+        try:
+            self._put((None, None, barrier))
+        except RuntimeError:
+            return True
+        try:
+            barrier.result(timeout)
+            return True
+        except futures.TimeoutError:
+            return False
+
+    def close(self) -> None:
+        """Write everything still queued, then stop the thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _put(self, request: _Request) -> None:
+        """Queue a request, starting the thread on first use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ReceiptWriter is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="receipt-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(request)
+
+    def _run(self) -> None:
+        """Writer loop."""
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not None and len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            requests = [request for request in batch if request is not None]
+            try:
+                self._write_batch(requests)
+            except Exception as e:
+                # Never leave a caller waiting on a future
+                logger.exception("Receipt batch failed")
+                for appointment, _, future in requests:
+                    if future.done():
+                        continue
+                    if appointment is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(e)
+            if stop:
+                return
+
+    def _write_batch(self, requests: List[_Request]) -> None:
+        """Render, write and sync one batch of requests.
+
+        Args:
+            requests: Requests taken off the queue, oldest first
+        """
+        rendered: Dict[Path, bytes] = {}
+        waiting: Dict[Path, List[Future]] = {}
+        barriers: List[Future] = []
+        for appointment, receipt_format, future in requests:
+            if appointment is None:
+                barriers.append(future)
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                path, data = self.generator.render(appointment, receipt_format)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            # A later request for the same receipt replaces the earlier one
+            rendered[path] = data
+            waiting.setdefault(path, []).append(future)
+
+        if rendered:
+            self.generator.ensure_directory()
+
+        # Write every file before syncing any, so the OS can flush them together
+        opened: List[Tuple[Path, Path, BinaryIO]] = []
+        for path, data in rendered.items():
+            temp_path = path.with_name(path.name + ".tmp")
+            try:
+                f = open(temp_path, "wb")
+                try:
+                    f.write(data)
+                    f.flush()
+                except OSError:
+                    f.close()
+                    raise
+                opened.append((path, temp_path, f))
+            except OSError as e:
+                self._fail(waiting.pop(path), temp_path, e)
+
+        written: List[Path] = []
+        for path, temp_path, f in opened:
+            try:
+                with f:
+                    if self.durable:
+                        os.fsync(f.fileno())
+                os.replace(temp_path, path)
+                written.append(path)
+            except OSError as e:
+                self._fail(waiting.pop(path), temp_path, e)
+
+        if written and self.durable:
+            self._sync_directory(self.generator.receipts_dir)
+
+        for path in written:
+            for future in waiting[path]:
+                future.set_result(path)
+        for barrier in barriers:
+            barrier.set_result(None)
+
+    @staticmethod
+    def _fail(pending: List[Future], temp_path: Path, error: OSError) -> None:
+        """Fail the requests for one receipt and remove its temporary file."""
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        for future in pending:
+            future.set_exception(error)
+
+    @staticmethod
+    def _sync_directory(directory: Path) -> None:
+        """fsync a directory so renames in it are durable (POSIX only)."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # Directories can't be opened on Windows; NTFS renames are journaled
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,46 @@
+"""Receipt format rendered straight from a template."""
+from typing import Any, Mapping, Optional
+
+from infrastructure.file_handlers.receipt_format import ReceiptFormat
+from infrastructure.file_handlers.receipt_template import Escape, ReceiptTemplate, Write
+
+
+class TemplateReceiptFormat(ReceiptFormat):
+    """Receipt format whose output is a single template (text, HTML)."""
+
+    def __init__(
+        self,
+        name: str,
+        extension: str,
+        template_name: str,
+        escape: Optional[Escape] = None,
+        encoding: str = "utf-8",
+    ):
+        """Initialize format.
+
+        Args:
+            name: Registry key
+            extension: Filename extension without the dot
+            template_name: Template filename in the templates directory
+            escape: Applied to every field value (e.g. html.escape)
+            encoding: Output encoding
+        """
+        self.name = name
+        self.extension = extension
+        self.template_name = template_name
+        self.escape = escape
+        self.encoding = encoding
+
+    @property
+    def template(self) -> ReceiptTemplate:
+        """Get the compiled template (loaded once per process)."""
+        return ReceiptTemplate.load(self.template_name, self.escape, self.encoding)
+
+    def write(self, values: Mapping[str, Any], write: Write) -> None:
+        """Render one receipt.
+
+        Args:
+            values: Receipt field values by name
+            write: Receives the encoded output
+        """
+        self.template.render_to(write, values)
@@ -0,0 +1,12 @@
+"""Monitoring infrastructure package."""
+from .metrics_registry import Counter, Histogram, MetricsRegistry
+from .use_case_instrumentation import instrument_use_case
+from .metrics_exporter import PrometheusFileExporter
+
+__all__ = [
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "instrument_use_case",
+    "PrometheusFileExporter",
+]
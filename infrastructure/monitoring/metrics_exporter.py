@@ -0,0 +1,85 @@
+"""Periodic Prometheus text-format file exporter."""
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from infrastructure.monitoring.metrics_registry import MetricsRegistry
+
+
+class PrometheusFileExporter:
+    """Writes a registry to a ``.prom`` file on a fixed interval.
+
+    The file is replaced atomically, so a node_exporter textfile collector
+    (or anyone tailing it) never sees a half-written file. Each write goes
+    through its own temporary file, so exporters sharing a directory never
+    move away each other's half-written output.
+    """
+
+    def __init__(self, registry: MetricsRegistry, file_path: Path, interval: float = 15.0):
+        """Initialize exporter.
+
+        Args:
+            registry: Registry to export
+            file_path: Destination .prom file
+            interval: Seconds between writes
+        """
+        self.registry = registry
+        self.file_path = file_path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background export thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the export thread and write a final snapshot."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        try:
+            self.export()
+        except OSError:
+            # Shutdown must not fail because the last snapshot could not be written
+            pass
+
+    def export(self) -> Path:
+        """Write the current metrics to the file.
+
+        Returns:
+            Path to written file
+        """
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=self.file_path.name + ".", suffix=".tmp", dir=self.file_path.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.registry.render_prometheus())
+            os.replace(tmp_name, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return self.file_path
+
+    def _run(self) -> None:
+        """Export loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.export()
+            except OSError:
+                # Keep exporting on transient filesystem errors
+                continue
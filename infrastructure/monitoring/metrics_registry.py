@@ -0,0 +1,227 @@
+"""In-process metrics registry with Prometheus text rendering."""
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Latency buckets in seconds, tuned for interactive use cases (1 ms .. 2.5 s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self):
+        """Initialize counter at zero."""
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase counter.
+
+        Args:
+            amount: Amount to add (must be non-negative)
+        """
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Get current value."""
+        return self._value
+
+
+class Histogram:
+    """Histogram with fixed upper-bound buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize histogram.
+
+        Args:
+            buckets: Bucket upper bounds (an implicit +Inf bucket is added)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Get number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Get sum of observations."""
+        return self._sum
+
+    def cumulative_counts(self) -> List[int]:
+        """Get cumulative count per bucket, ending with the +Inf bucket.
+
+        Returns:
+            List of cumulative counts
+        """
+        with self._lock:
+            counts = list(self._counts)
+        total = 0
+        cumulative = []
+        for count in counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class MetricFamily:
+    """A named metric with one child per label combination."""
+
+    def __init__(self, name: str, help_text: str, kind: str, buckets: Sequence[float] = ()):
+        """Initialize metric family.
+
+        Args:
+            name: Metric name
+            help_text: HELP line text
+            kind: "counter" or "histogram"
+            buckets: Histogram buckets (histograms only)
+        """
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.buckets = tuple(buckets)
+        self._children: Dict[LabelKey, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: str):
+        """Get (or create) the child metric for a label combination.
+
+        Returns:
+            Counter or Histogram
+        """
+        key = tuple(sorted(labels.items()))
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = Counter() if self.kind == "counter" else Histogram(self.buckets)
+                    self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[LabelKey, object]]:
+        """Get all children sorted by labels.
+
+        Returns:
+            List of (label key, metric) pairs
+        """
+        with self._lock:
+            return sorted(self._children.items())
+
+
+class MetricsRegistry:
+    """Registry of counters and histograms."""
+
+    def __init__(self, namespace: str = "salon"):
+        """Initialize registry.
+
+        Args:
+            namespace: Prefix added to every metric name
+        """
+        self.namespace = namespace
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> MetricFamily:
+        """Get or create a counter family.
+
+        Args:
+            name: Metric name (without namespace)
+            help_text: Description
+
+        Returns:
+            Counter family
+        """
+        return self._family(name, help_text, "counter", ())
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> MetricFamily:
+        """Get or create a histogram family.
+
+        Args:
+            name: Metric name (without namespace)
+            help_text: Description
+            buckets: Bucket upper bounds
+
+        Returns:
+            Histogram family
+        """
+        return self._family(name, help_text, "histogram", buckets)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda f: f.name)
+
+        lines = []
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.help_text}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for key, metric in family.children():
+                if family.kind == "counter":
+                    lines.append(f"{family.name}{_format_labels(key)} {_format_value(metric.value)}")
+                    continue
+
+                cumulative = metric.cumulative_counts()
+                bounds = [_format_value(b) for b in metric.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, cumulative):
+                    labels = _format_labels(key + (("le", bound),))
+                    lines.append(f"{family.name}_bucket{labels} {count}")
+                lines.append(f"{family.name}_sum{_format_labels(key)} {_format_value(metric.sum)}")
+                lines.append(f"{family.name}_count{_format_labels(key)} {cumulative[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+    def _family(
+        self, name: str, help_text: str, kind: str, buckets: Sequence[float]
+    ) -> MetricFamily:
+        """Get or create a metric family."""
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            family = self._families.get(full_name)
+            if family is None:
+                family = MetricFamily(full_name, help_text, kind, buckets)
+                self._families[full_name] = family
+            elif family.kind != kind:
+                raise ValueError(f"Metric '{full_name}' already registered as {family.kind}")
+            return family
+
+
+def _format_labels(key: LabelKey) -> str:
+    """Format a label key as {a="1",b="2"}."""
+    if not key:
+        return ""
+    parts = []
+    for name, value in key:
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -0,0 +1,94 @@
+"""Latency and outcome instrumentation for use cases."""
+import functools
+import inspect
+import time
+from typing import Any, Callable, TypeVar
+
+from infrastructure.monitoring.metrics_registry import MetricsRegistry
+
+T = TypeVar("T")
+
+
+def instrument_use_case(use_case: T, name: str, registry: MetricsRegistry) -> T:
+    """Wrap a use case's public ``execute*``/``get_*`` methods with metrics.
+
+    Every call records its latency in ``salon_use_case_duration_seconds`` and
+    its outcome in ``salon_use_case_calls_total``. The outcome is taken from
+    the ``success`` field of ``*Result`` objects; calls returning anything else
+    count as success, and calls that raise count as ``error``.
+
+    Methods are replaced on the instance, so the use case keeps its type.
+    Coroutine methods get an async wrapper that times the awaited call.
+
+    Args:
+        use_case: Use case instance
+        name: Label value identifying the use case (e.g. "create_appointment")
+        registry: Registry to record into
+
+    Returns:
+        The same use case instance
+    """
+    durations = registry.histogram(
+        "use_case_duration_seconds", "Use case latency in seconds."
+    )
+    calls = registry.counter(
+        "use_case_calls_total", "Use case calls by outcome."
+    )
+
+    for attribute in dir(type(use_case)):
+        if not attribute.startswith(("execute", "get_")):
+            continue
+        method = getattr(use_case, attribute)
+        if callable(method):
+            setattr(
+                use_case,
+                attribute,
+                _wrap(method, durations.labels(use_case=name, method=attribute),
+                      calls, name, attribute),
+            )
+
+    return use_case
+
+
+def _wrap(method: Callable, histogram, calls, name: str, attribute: str) -> Callable:
+    """Build the timing wrapper for one bound method."""
+    outcomes = {
+        outcome: calls.labels(use_case=name, method=attribute, outcome=outcome)
+        for outcome in ("success", "failure", "error")
+    }
+
+    def record(start: float, result: Any) -> None:
+        histogram.observe(time.perf_counter() - start)
+        success = getattr(result, "success", True)
+        outcomes["success" if success else "failure"].inc()
+
+    def record_error(start: float) -> None:
+        histogram.observe(time.perf_counter() - start)
+        outcomes["error"].inc()
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(*args: Any, **kwargs: Any):
+            start = time.perf_counter()
+            try:
+                result = await method(*args, **kwargs)
+            except Exception:
+                record_error(start)
+                raise
+            record(start, result)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any):
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            record_error(start)
+            raise
+        record(start, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,49 @@
+"""
+Beauty Salon Maintenance - Command Line Entry Point
+
+Rebuilds and checks the daily_summary table that reports read their totals from.
+"""
+import argparse
+import sys
+
+from di_container import DIContainer
+
+
+def main(argv=None) -> int:
+    """Main entry point - runs one maintenance command against the database."""
+    parser = argparse.ArgumentParser(description="Beauty Salon database maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (
+        ("rebuild-summary", "Recompute daily_summary from the appointments (backfill)"),
+        ("check-summary", "Report daily_summary rows that disagree with the appointments"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--start", help="First date (YYYY-MM-DD), default: earliest")
+        command.add_argument("--end", help="Last date (YYYY-MM-DD), default: latest")
+    args = parser.parse_args(argv)
+
+    container = DIContainer()
+    try:
+        summary = container.daily_summary
+        if args.command == "rebuild-summary":
+            rows = summary.rebuild(args.start, args.end)
+            print(f"Rebuilt daily_summary: {rows} rows")
+            return 0
+
+        mismatches = summary.check(args.start, args.end)
+        for date, service_name, expected, actual in mismatches:
+            print(
+                f"{date} {service_name}: expected {expected[0]} bookings / {expected[1]:.2f}, "
+                f"found {actual[0]} / {actual[1]:.2f}"
+            )
+        if mismatches:
+            print(f"{len(mismatches)} inconsistent rows; run 'rebuild-summary' to repair")
+            return 1
+        print("daily_summary is consistent")
+        return 0
+    finally:
+        container.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Headless booking API (no Tkinter dependency)."""
+from .booking_service import (
+    BookingService,
+    CreateBookingRequest,
+    BookingResponse,
+    CancelBookingResponse,
+    BookingListResponse,
+    AvailabilityResponse,
+)
+from .http_server import BookingHTTPServer
+
+__all__ = [
+    "BookingService",
+    "CreateBookingRequest",
+    "BookingResponse",
+    "CancelBookingResponse",
+    "BookingListResponse",
+    "AvailabilityResponse",
+    "BookingHTTPServer",
+]
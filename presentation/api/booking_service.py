@@ -0,0 +1,213 @@
+"""Headless booking service facade over the DI container."""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core.entities import Appointment
+from core.use_cases.appointments.create_appointment import INVALID_REQUEST
+
+
+@dataclass
+class CreateBookingRequest:
+    """Request to book an appointment."""
+
+    first_name: str
+    last_name: str
+    phone_number: str
+    date: str  # Format: YYYY-MM-DD
+    time: str  # Format: HH:MM
+    service_name: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CreateBookingRequest":
+        """Create request from dictionary.
+
+        Raises:
+            ValueError: If a required field is missing
+        """
+        missing = [
+            name for name in cls.__dataclass_fields__ if not str(data.get(name, "")).strip()
+        ]
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+        return cls(**{name: str(data[name]).strip() for name in cls.__dataclass_fields__})
+
+
+@dataclass
+class BookingResponse:
+    """Result of a booking request."""
+
+    success: bool
+    appointment: Optional[Appointment] = None
+    message: str = ""
+    # Failure kind from create_appointment: INVALID_REQUEST, SLOT_TAKEN or STORAGE_ERROR
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert response to dictionary."""
+        return {
+            "success": self.success,
+            "appointment": self.appointment.to_dict() if self.appointment else None,
+            "message": self.message,
+            "error": self.error,
+        }
+
+
+@dataclass
+class CancelBookingResponse:
+    """Result of a cancellation request."""
+
+    success: bool
+    appointment_id: int
+    message: str = ""
+
+    def to_dict(self) -> dict:
+        """Convert response to dictionary."""
+        return {
+            "success": self.success,
+            "appointment_id": self.appointment_id,
+            "message": self.message,
+        }
+
+
+@dataclass
+class BookingListResponse:
+    """List of appointments."""
+
+    appointments: List[Appointment] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert response to dictionary."""
+        return {
+            "count": len(self.appointments),
+            "appointments": [apt.to_dict() for apt in self.appointments],
+        }
+
+
+@dataclass
+class AvailabilityResponse:
+    """Free time slots for a date."""
+
+    date: str
+    available_slots: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert response to dictionary."""
+        return {"date": self.date, "available_slots": self.available_slots}
+
+
+class BookingService:
+    """Booking engine facade usable without Tkinter.
+
+    Kiosks, the web front end and the desktop dashboards all go through the
+    same use cases, so business rules stay in one place.
+    """
+
+    def __init__(self, container):
+        """Initialize booking service.
+
+        Args:
+            container: Dependency injection container
+        """
+        self.container = container
+
+    def create(self, request: CreateBookingRequest) -> BookingResponse:
+        """Book an appointment.
+
+        The price is taken from the service catalog, never from the caller.
+
+        Args:
+            request: Booking request
+
+        Returns:
+            BookingResponse with the created appointment
+        """
+        service = self.container.service_repository.get_by_name(request.service_name)
+        if service is None:
+            return BookingResponse(
+                success=False,
+                message=f"Unknown service '{request.service_name}'",
+                error=INVALID_REQUEST,
+            )
+
+        result = self.container.create_appointment.execute(
+            first_name=request.first_name,
+            last_name=request.last_name,
+            phone_number=request.phone_number,
+            date=request.date,
+            time=request.time,
+            service_name=service.name,
+            service_price=service.price,
+        )
+        return BookingResponse(
+            success=result.success,
+            appointment=result.appointment,
+            message=result.message,
+            error=result.error,
+        )
+
+    def cancel(self, appointment_id: int) -> CancelBookingResponse:
+        """Cancel an appointment.
+
+        Args:
+            appointment_id: ID of appointment to cancel
+
+        Returns:
+            CancelBookingResponse with cancellation status
+        """
+        result = self.container.cancel_appointment.execute(appointment_id)
+        return CancelBookingResponse(
+            success=result.success,
+            appointment_id=appointment_id,
+            message=result.message,
+        )
+
+    def list(
+        self,
+        date: Optional[str] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        phone_number: Optional[str] = None,
+    ) -> BookingListResponse:
+        """List appointments, optionally for one date or one customer.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            first_name: Customer's first name
+            last_name: Customer's last name
+            phone_number: Customer's phone number
+
+        Returns:
+            BookingListResponse with matching appointments
+        """
+        get_appointments = self.container.get_appointments
+        if first_name and last_name and phone_number:
+            appointments = get_appointments.get_by_customer(first_name, last_name, phone_number)
+            if date:
+                appointments = [apt for apt in appointments if apt.date == date]
+        elif date:
+            appointments = get_appointments.get_by_date(date)
+        else:
+            appointments = get_appointments.get_all()
+        return BookingListResponse(appointments=appointments)
+
+    def availability(self, date: str) -> AvailabilityResponse:
+        """Get free time slots for a date.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            AvailabilityResponse with free slots
+        """
+        return AvailabilityResponse(
+            date=date,
+            available_slots=self.container.get_available_slots.execute(date),
+        )
+
+    def services(self) -> List[dict]:
+        """Get the service catalog.
+
+        Returns:
+            List of service dictionaries
+        """
+        return [service.to_dict() for service in self.container.get_services.get_all()]
@@ -0,0 +1,205 @@
+"""Local HTTP front end for the booking service.
+
+Routes:
+    GET    /health
+    GET    /services
+    GET    /availability?date=YYYY-MM-DD
+    GET    /appointments[?date=...][&first_name=...&last_name=...&phone_number=...]
+    POST   /appointments            (JSON body, see CreateBookingRequest)
+    DELETE /appointments/<id>
+"""
+import json
+import threading
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from core.use_cases.appointments.create_appointment import (
+    INVALID_REQUEST,
+    SLOT_TAKEN,
+    STORAGE_ERROR,
+)
+from presentation.api.booking_service import BookingService, CreateBookingRequest
+
+LOCALHOST = "127.0.0.1"
+MAX_BODY_BYTES = 64 * 1024
+
+# HTTP status of a failed booking, by BookingResponse.error
+BOOKING_ERROR_STATUS = {
+    INVALID_REQUEST: HTTPStatus.UNPROCESSABLE_ENTITY,
+    SLOT_TAKEN: HTTPStatus.CONFLICT,
+    STORAGE_ERROR: HTTPStatus.SERVICE_UNAVAILABLE,
+}
+
+
+class BookingRequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests into BookingService calls."""
+
+    server: "BookingHTTPServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # keep-alive response stalls on delayed ACKs (~40 ms).
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Handle GET requests."""
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        booking_service = self.server.booking_service
+
+        if url.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif url.path == "/services":
+            self._send_json(HTTPStatus.OK, {"services": booking_service.services()})
+        elif url.path == "/availability":
+            if not query.get("date"):
+                self._send_error(HTTPStatus.BAD_REQUEST, "Query parameter 'date' is required")
+                return
+            try:
+                date.fromisoformat(query["date"])
+            except ValueError:
+                self._send_error(HTTPStatus.BAD_REQUEST, "Query parameter 'date' must be YYYY-MM-DD")
+                return
+            self._send_json(HTTPStatus.OK, booking_service.availability(query["date"]).to_dict())
+        elif url.path == "/appointments":
+            response = booking_service.list(
+                date=query.get("date"),
+                first_name=query.get("first_name"),
+                last_name=query.get("last_name"),
+                phone_number=query.get("phone_number"),
+            )
+            self._send_json(HTTPStatus.OK, response.to_dict())
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def do_POST(self) -> None:
+        """Handle POST requests."""
+        if urlparse(self.path).path != "/appointments":
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+
+        body, error = self._read_json()
+        if error:
+            self._send_error(HTTPStatus.BAD_REQUEST, error)
+            return
+
+        try:
+            request = CreateBookingRequest.from_dict(body)
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        response = self.server.booking_service.create(request)
+        if response.success:
+            status = HTTPStatus.CREATED
+        else:
+            status = BOOKING_ERROR_STATUS.get(response.error, HTTPStatus.INTERNAL_SERVER_ERROR)
+        self._send_json(status, response.to_dict())
+
+    def do_DELETE(self) -> None:
+        """Handle DELETE requests."""
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "appointments" or not parts[1].isdigit():
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+
+        response = self.server.booking_service.cancel(int(parts[1]))
+        status = HTTPStatus.OK if response.success else HTTPStatus.NOT_FOUND
+        self._send_json(status, response.to_dict())
+
+    def log_message(self, format: str, *args) -> None:
+        """Only log requests when the server is verbose."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _read_json(self) -> Tuple[Optional[dict], Optional[str]]:
+        """Read and decode the JSON request body.
+
+        Returns:
+            (body, None) on success, (None, error message) otherwise
+        """
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            return None, "Invalid Content-Length"
+        if length <= 0 or length > MAX_BODY_BYTES:
+            return None, "Request body is missing or too large"
+
+        try:
+            body = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None, "Request body must be valid JSON"
+        if not isinstance(body, dict):
+            return None, "Request body must be a JSON object"
+        return body, None
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        """Send a JSON response."""
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        """Send a JSON error response."""
+        self._send_json(status, {"success": False, "message": message})
+
+
+class BookingHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to the loopback interface.
+
+    One thread per connection; all threads share the container's booking
+    engine, whose SQLite connection serializes statements internally.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        booking_service: BookingService,
+        port: int = 8080,
+        host: str = LOCALHOST,
+        verbose: bool = False,
+    ):
+        """Initialize server.
+
+        Args:
+            booking_service: Booking service to expose
+            port: TCP port (0 picks a free port)
+            host: Interface to bind; must be a loopback address
+            verbose: Log every request to stderr
+
+        Raises:
+            ValueError: If host is not a loopback address
+        """
+        if host not in (LOCALHOST, "localhost"):
+            raise ValueError("The booking API may only be bound to localhost")
+        self.booking_service = booking_service
+        self.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+        super().__init__((host, port), BookingRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """Get base URL of the running server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_background(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="booking-http", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
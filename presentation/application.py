@@ -1,6 +1,8 @@
+import importlib
+import os
 import tkinter as tk
+from datetime import date
 from pathlib import Path
-from PIL import Image, ImageTk
 from typing import Optional
 
 from di_container import DIContainer
@@ -8,6 +10,18 @@ from config.settings import settings
 from config.constants import Messages
 from presentation.controllers.app_controller import AppController
 
+# Imported on a worker thread while the welcome screen is up, so opening the
+# first screen or dashboard does not stall on imports
+WARM_UP_MODULES = (
+    "presentation.components.main_screen",
+    "presentation.components.login_view",
+    "presentation.components.signup_view",
+    "presentation.dashboards.admin_dashboard",
+    "presentation.dashboards.customer_dashboard",
+    "presentation.dashboards.employee_dashboard",
+    "tkcalendar",
+)
+
 
 class BeautySalonApplication:
     def __init__(self, container: DIContainer):
@@ -43,12 +57,9 @@ class BeautySalonApplication:
     def _setup_background(self) -> None:
         """Setup background image or fallback color."""
         try:
-            if settings.BACKGROUND_IMAGE.exists():
-                bg_image = Image.open(settings.BACKGROUND_IMAGE)
-                bg_image = bg_image.resize(
-                    (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
-                )
-                self.bg_photo = ImageTk.PhotoImage(bg_image)
+            image_path = self._resized_background()
+            if image_path is not None:
+                self.bg_photo = tk.PhotoImage(file=str(image_path))
 
                 self.bg_label = tk.Label(self.root, image=self.bg_photo)
                 self.bg_label.image = self.bg_photo
@@ -59,12 +70,46 @@ class BeautySalonApplication:
             # Fallback to solid color if image fails to load
             self.root.configure(bg=settings.BACKGROUND_COLOR)
 
+    @staticmethod
+    def _resized_background() -> Optional[Path]:
+        """Get the background image resized to the window, cached on disk.
+
+        The cache file is keyed by the source's mtime and size and by the
+        window size, so it is rebuilt only when one of them changes. Tk loads
+        the cached PNG itself; PIL is imported only to (re)build the cache.
+
+        Returns:
+            Path to the resized PNG, or None if there is no background image
+        """
+        source = settings.BACKGROUND_IMAGE
+        if not source.exists():
+            return None
+
+        stat = source.stat()
+        size = (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
+        cached = settings.CACHE_DIR / (
+            f"{source.stem}_{size[0]}x{size[1]}_{stat.st_mtime_ns}_{stat.st_size}.png"
+        )
+        if cached.exists():
+            return cached
+
+        from PIL import Image
+
+        settings.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in settings.CACHE_DIR.glob(f"{source.stem}_*.png"):
+            stale.unlink()
+        tmp_path = cached.with_suffix(".tmp")
+        with Image.open(source) as image:
+            image.resize(size).save(tmp_path, format="PNG")
+        os.replace(tmp_path, cached)
+        return cached
+
     def _initialize_controller(self) -> None:
         """Initialize the application controller."""
         self.controller = AppController(self.root, self.container)
 
     def _show_welcome_screen(self) -> None:
-        """Display welcome message and transition to main screen."""
+        """Display welcome message while warming up, then show the main screen."""
         welcome_label = tk.Label(
             self.root,
             text=Messages.WELCOME_MESSAGE,
@@ -74,8 +119,36 @@ class BeautySalonApplication:
         )
         welcome_label.place(relx=0.5, rely=0.4, anchor="center")
 
-        # Show login/signup buttons after 2 seconds
-        self.root.after(2000, lambda: self._transition_to_main(welcome_label))
+        # Show login/signup buttons as soon as the warm-up has finished
+        self.controller.task_runner.submit(
+            "startup:warm_up",
+            self._warm_up,
+            on_success=lambda _: self._on_warmed_up(welcome_label),
+            on_error=lambda _: self._transition_to_main(welcome_label),
+        )
+
+    def _warm_up(self) -> None:
+        """Do startup work that is not needed for the first frame (runs on a worker).
+
+        Opens the database (running migrations if needed) and loads the
+        service catalog, so the first login is as fast as later ones.
+        """
+        for module in WARM_UP_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                continue  # reported when the screen needing it is opened
+        self.container.warm_up()
+
+    def _on_warmed_up(self, welcome_label: tk.Label) -> None:
+        """Show the main screen and prefetch this week's free slots.
+
+        Args:
+            welcome_label: Welcome label to remove
+        """
+        self._transition_to_main(welcome_label)
+        if self.controller:
+            self.controller.availability.prefetch_range(date.today(), days=7)
 
     def _transition_to_main(self, welcome_label: tk.Label) -> None:
         """Transition from welcome screen to main screen.
@@ -90,3 +163,5 @@ class BeautySalonApplication:
     def run(self) -> None:
         """Start the application main loop."""
         self.root.mainloop()
+        if self.controller:
+            self.controller.shutdown()
@@ -0,0 +1,195 @@
+"""Shared cache of available time slots for the booking calendars."""
+import calendar
+import time
+from datetime import date as Date, timedelta
+from tkinter import messagebox
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from presentation.background_task_runner import BackgroundTaskRunner, widget_exists
+
+Month = Tuple[int, int]  # (year, month)
+SlotsCallback = Callable[[List[str]], None]
+
+
+class AvailabilityCache:
+    """Serves calendar clicks from memory, loading whole months in the background.
+
+    A click on a date that is not cached is debounced, so clicking quickly
+    through several dates issues a single query. That query loads the whole
+    month in one round trip, so subsequent clicks in the same month are
+    answered immediately. The controller forwards change events to
+    ``on_appointment_changed``/``on_external_change``, which drop the affected
+    entries; entries also expire after ``max_age`` seconds as a safety net.
+    """
+
+    def __init__(
+        self,
+        container,
+        task_runner: BackgroundTaskRunner,
+        key: str,
+        debounce_ms: int = 150,
+        max_age: float = 60.0,
+    ):
+        """Initialize cache.
+
+        Args:
+            container: Dependency injection container
+            task_runner: Runner used for the month queries
+            key: Task key prefix unique to the owning view
+            debounce_ms: Delay before an uncached click triggers a query
+            max_age: Seconds a cached month stays valid
+        """
+        self.container = container
+        self.task_runner = task_runner
+        self.key = key
+        self.debounce_ms = debounce_ms
+        self.max_age = max_age
+
+        self._slots: Dict[str, List[str]] = {}
+        self._loaded_at: Dict[Month, float] = {}
+        self._in_flight: Set[Month] = set()
+        self._wanted: Optional[Tuple[str, SlotsCallback, object]] = None
+        self._debounce_id: Optional[str] = None
+
+    def request(self, date: str, callback: SlotsCallback, owner=None) -> None:
+        """Deliver the available slots for a date.
+
+        Only the most recent request is answered; earlier pending requests
+        are superseded.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            callback: Called on the Tk thread with the available slots
+            owner: Widget the slots are for; skipped if it has been destroyed
+        """
+        self._wanted = (date, callback, owner)
+        self._cancel_debounce()
+
+        month = _month_of(date)
+        if self._is_fresh(month):
+            self._deliver()
+        else:
+            self._debounce_id = self.task_runner.root.after(
+                self.debounce_ms, self._load_month, month
+            )
+
+    def prefetch_month(self, year: int, month: int) -> None:
+        """Load a month in the background unless it is already cached.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+        """
+        if not self._is_fresh((year, month)):
+            self._load_month((year, month))
+
+    def prefetch_range(self, start: Date, days: int = 7) -> None:
+        """Load every month touched by a range of days.
+
+        Args:
+            start: First day
+            days: Number of days
+        """
+        months = {(day.year, day.month) for day in (start + timedelta(n) for n in range(days))}
+        for year, month in sorted(months):
+            self.prefetch_month(year, month)
+
+    def on_appointment_changed(self, event) -> None:
+        """Drop the months of the dates an appointment change affects.
+
+        Args:
+            event: AppointmentChanged
+        """
+        for date in event.dates:
+            self.invalidate(date)
+
+    def on_external_change(self, event) -> None:
+        """Drop everything after another process wrote to the database.
+
+        Args:
+            event: ExternalDataChanged
+        """
+        self.invalidate()
+
+    def invalidate(self, date: Optional[str] = None) -> None:
+        """Drop cached slots after a booking or cancellation.
+
+        Args:
+            date: Date in YYYY-MM-DD format whose month to drop (all if None)
+        """
+        months = [_month_of(date)] if date else list(self._loaded_at) + list(self._in_flight)
+        for month in months:
+            self._loaded_at.pop(month, None)
+            if month in self._in_flight:
+                # The running query may have read the old state; ignore it
+                self._in_flight.discard(month)
+                self.task_runner.cancel(self._task_key(month))
+        if date is None:
+            self._slots.clear()
+
+        # Reload for a request that was waiting on a dropped query
+        if self._wanted and self._debounce_id is None:
+            wanted_month = _month_of(self._wanted[0])
+            if not self._is_fresh(wanted_month):
+                self._load_month(wanted_month)
+
+    def _load_month(self, month: Month) -> None:
+        """Query a whole month of availability on a worker thread."""
+        self._debounce_id = None
+        if month in self._in_flight:
+            return
+        self._in_flight.add(month)
+
+        year, month_number = month
+        last_day = calendar.monthrange(year, month_number)[1]
+        start = f"{year:04d}-{month_number:02d}-01"
+        end = f"{year:04d}-{month_number:02d}-{last_day:02d}"
+
+        self.task_runner.submit(
+            self._task_key(month),
+            lambda: self.container.get_available_slots.execute_range(start, end),
+            on_success=lambda slots: self._store(month, slots),
+            on_error=lambda e: self._load_failed(month, e),
+        )
+
+    def _store(self, month: Month, slots: Dict[str, List[str]]) -> None:
+        """Cache a loaded month and answer the pending request if it is in it."""
+        self._in_flight.discard(month)
+        self._slots.update(slots)
+        self._loaded_at[month] = time.monotonic()
+        if self._wanted and _month_of(self._wanted[0]) == month:
+            self._deliver()
+
+    def _load_failed(self, month: Month, error: Exception) -> None:
+        """Report a failed month query."""
+        self._in_flight.discard(month)
+        if self._wanted and _month_of(self._wanted[0]) == month:
+            self._wanted = None
+            messagebox.showerror("Error", f"Failed to load available times: {error}")
+
+    def _deliver(self) -> None:
+        """Answer the pending request from the cache."""
+        date, callback, owner = self._wanted
+        self._wanted = None
+        if owner is None or widget_exists(owner):
+            callback(list(self._slots.get(date, [])))
+
+    def _is_fresh(self, month: Month) -> bool:
+        """Check if a month is cached and not expired."""
+        loaded_at = self._loaded_at.get(month)
+        return loaded_at is not None and time.monotonic() - loaded_at < self.max_age
+
+    def _cancel_debounce(self) -> None:
+        """Cancel a pending debounced query."""
+        if self._debounce_id is not None:
+            self.task_runner.root.after_cancel(self._debounce_id)
+            self._debounce_id = None
+
+    def _task_key(self, month: Month) -> str:
+        """Get the task runner key for a month query."""
+        return f"{self.key}:{month[0]:04d}-{month[1]:02d}"
+
+
+def _month_of(date: str) -> Month:
+    """Get (year, month) of a YYYY-MM-DD date."""
+    return int(date[:4]), int(date[5:7])
@@ -0,0 +1,194 @@
+"""Background task runner - keeps database work off the Tk main thread."""
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+from typing import Any, Callable, Dict, Optional, Sequence
+
+# Poll intervals for the result queue: one frame while tasks are in flight,
+# slower while idle so call_soon() still gets picked up.
+BUSY_POLL_MS = 16
+IDLE_POLL_MS = 100
+
+
+class BackgroundTaskRunner:
+    """Runs blocking calls on worker threads and delivers results on the Tk thread.
+
+    Tk widgets may only be touched from the main thread, so workers never call
+    back directly: they put results on a queue which the main loop drains via
+    ``root.after``.
+
+    Every task is submitted under a key (e.g. "admin:appointments"). Submitting
+    again under the same key supersedes the earlier task, whose result is
+    dropped when it arrives, so a slow old query never overwrites a newer view.
+    """
+
+    def __init__(self, root: tk.Misc, max_workers: int = 4):
+        """Initialize runner and start polling.
+
+        Args:
+            root: Root Tkinter window
+            max_workers: Number of worker threads
+        """
+        self.root = root
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ui-worker"
+        )
+        self._results: "queue.Queue" = queue.Queue()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._after_id: Optional[str] = None
+        self._closed = False
+        self._schedule_poll(IDLE_POLL_MS)
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        owner: Optional[tk.Misc] = None,
+        busy: Sequence[tk.Widget] = (),
+    ) -> int:
+        """Run fn(*args) on a worker thread.
+
+        Args:
+            key: Request key; a newer submission under the same key wins
+            fn: Blocking function to run
+            *args: Arguments for fn
+            on_success: Called on the Tk thread with fn's return value
+            on_error: Called on the Tk thread with the raised exception
+                (defaults to an error dialog)
+            owner: Widget the result is for; dropped if it has been destroyed
+            busy: Buttons disabled until the result has been delivered
+
+        Returns:
+            Generation token of this submission
+        """
+        if self._closed:
+            raise RuntimeError("BackgroundTaskRunner is shut down")
+
+        with self._lock:
+            token = self._generations.get(key, 0) + 1
+            self._generations[key] = token
+            self._pending += 1
+
+        for widget in busy:
+            widget.config(state=tk.DISABLED)
+
+        def run() -> None:
+            try:
+                outcome = (True, fn(*args))
+            except Exception as e:
+                outcome = (False, e)
+            self._results.put((key, token, outcome, on_success, on_error, owner, busy))
+
+        self._executor.submit(run)
+        self._schedule_poll(BUSY_POLL_MS)
+        return token
+
+    def call_soon(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run callback(*args) on the Tk thread. Safe to call from any thread.
+
+        Args:
+            callback: Function to run on the Tk thread
+            *args: Arguments for callback
+        """
+        with self._lock:
+            self._pending += 1
+        self._results.put((None, 0, (True, None), lambda _: callback(*args), None, None, ()))
+
+    def cancel(self, key: str) -> None:
+        """Drop the result of the task currently running under key.
+
+        Args:
+            key: Request key
+        """
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def is_current(self, key: str, token: int) -> bool:
+        """Check if token is the latest submission under key.
+
+        Args:
+            key: Request key
+            token: Token returned by submit()
+
+        Returns:
+            True if no newer task was submitted under key
+        """
+        with self._lock:
+            return self._generations.get(key) == token
+
+    def shutdown(self) -> None:
+        """Stop polling and wait for running tasks to finish."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # root already destroyed
+            self._after_id = None
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _schedule_poll(self, delay_ms: int) -> None:
+        """(Re)schedule the queue poll, bringing it forward if needed."""
+        if self._closed:
+            return
+        if self._after_id is not None:
+            if delay_ms == IDLE_POLL_MS:
+                return
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(delay_ms, self._poll)
+
+    def _poll(self) -> None:
+        """Deliver finished results on the Tk thread."""
+        self._after_id = None
+        try:
+            self._deliver_results()
+        finally:
+            with self._lock:
+                busy = self._pending > 0
+            self._schedule_poll(BUSY_POLL_MS if busy else IDLE_POLL_MS)
+
+    def _deliver_results(self) -> None:
+        """Drain the result queue, skipping superseded and orphaned results."""
+        while True:
+            try:
+                key, token, outcome, on_success, on_error, owner, busy = (
+                    self._results.get_nowait()
+                )
+            except queue.Empty:
+                return
+            with self._lock:
+                self._pending -= 1
+            if key is not None and not self.is_current(key, token):
+                continue  # superseded; the newer task restores busy widgets
+            if owner is not None and not widget_exists(owner):
+                continue
+
+            for widget in busy:
+                if widget_exists(widget):
+                    widget.config(state=tk.NORMAL)
+
+            ok, value = outcome
+            if ok:
+                if on_success is not None:
+                    on_success(value)
+            elif on_error is not None:
+                on_error(value)
+            else:
+                messagebox.showerror("Error", f"Operation failed: {value}")
+
+
+def widget_exists(widget: tk.Misc) -> bool:
+    """Check if a widget is still alive (False once the root is gone)."""
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
@@ -0,0 +1,368 @@
+"""Virtualized appointment list component."""
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.entities import Appointment
+from infrastructure.events import AppointmentChanged
+
+# (heading, width in pixels, value formatter)
+Column = Tuple[str, int, Callable[[Appointment], str]]
+
+EMPTY_ROW = "__empty__"
+
+DATE_COLUMN: Column = ("Date", 90, lambda apt: apt.date)
+TIME_COLUMN: Column = ("Time", 60, lambda apt: apt.time)
+CUSTOMER_COLUMN: Column = ("Customer", 150, lambda apt: apt.full_name)
+PHONE_COLUMN: Column = ("Phone", 110, lambda apt: apt.phone_number)
+SERVICE_COLUMN: Column = ("Service", 170, lambda apt: apt.service_name)
+PRICE_COLUMN: Column = ("Price", 70, lambda apt: f"{apt.service_price}€")
+
+
+class AppointmentList(tk.Frame):
+    """Scrollable appointment table that only renders the visible rows.
+
+    The total is fetched with ``count_fn`` and rows are fetched a page at a
+    time with ``page_fn(offset, limit)``, both on the background task runner.
+    The Treeview never holds more than ``height`` items: scrolling moves a
+    window over the result set and refills those items from the page cache,
+    so memory and render time stay flat regardless of the number of rows.
+
+    Rows are keyed by appointment ID, so identical-looking rows never
+    collide and the selection survives scrolling. ``apply_change`` patches
+    the list from a repository change event instead of reloading it.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        task_runner,
+        key: str,
+        columns: Sequence[Column],
+        count_fn: Callable[[], int],
+        page_fn: Callable[[int, int], List[Appointment]],
+        height: int = 15,
+        page_size: int = 100,
+        max_cached_pages: int = 20,
+        empty_text: str = "No appointments found.",
+        matches: Optional[Callable[[Appointment], bool]] = None,
+    ):
+        """Initialize list.
+
+        Args:
+            parent: Parent widget
+            task_runner: Background task runner used for queries
+            key: Task key prefix unique to this list
+            columns: Column definitions
+            count_fn: Returns the total number of rows (runs on a worker)
+            page_fn: Returns rows [offset, offset + limit) (runs on a worker)
+            height: Number of visible rows
+            page_size: Rows fetched per query
+            max_cached_pages: Pages kept in memory
+            empty_text: Text shown when there are no rows
+            matches: Tells whether an appointment belongs in this list
+                (all appointments if None); used by apply_change
+        """
+        super().__init__(parent)
+        self.task_runner = task_runner
+        self.key = key
+        self.columns = list(columns)
+        self.count_fn = count_fn
+        self.page_fn = page_fn
+        self.height = height
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.empty_text = empty_text
+        self.matches = matches
+
+        self._total = 0
+        self._first = 0
+        self._pages: "OrderedDict[int, List[Appointment]]" = OrderedDict()
+        self._loading: Dict[int, int] = {}
+        self._generation = 0
+        self._counting = False
+        self._selected: Optional[Appointment] = None
+
+        self._create_widgets()
+        self.refresh()
+
+    def _create_widgets(self) -> None:
+        """Create tree and scrollbar."""
+        headings = [f"col{i}" for i in range(len(self.columns))]
+        self.tree = ttk.Treeview(
+            self, columns=headings, show="headings",
+            height=self.height, selectmode="browse"
+        )
+        for heading, (title, width, _) in zip(headings, self.columns):
+            self.tree.heading(heading, text=title)
+            self.tree.column(heading, width=width, anchor=tk.W)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self._first - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self._first + 3))
+        self.tree.bind("<Up>", self._on_key_up)
+        self.tree.bind("<Down>", self._on_key_down)
+        self.tree.bind("<Prior>", lambda e: self._scroll_and_break(-self.height))
+        self.tree.bind("<Next>", lambda e: self._scroll_and_break(self.height))
+
+    # Public API
+
+    def refresh(self) -> None:
+        """Reload the total and visible rows, e.g. after a cancellation."""
+        self._generation += 1
+        self._pages.clear()
+        self._loading.clear()
+        self._counting = True
+        generation = self._generation
+
+        self._show_message("Loading appointments...")
+        self.task_runner.submit(
+            f"{self.key}:count",
+            self.count_fn,
+            on_success=lambda total: self._on_count(generation, total),
+            owner=self,
+        )
+
+    def apply_change(self, event: AppointmentChanged) -> None:
+        """Patch the list after an appointment was created, updated or deleted.
+
+        An update that keeps the row in place rewrites that row only. Otherwise
+        the total is adjusted and only the cached pages at or after the
+        changed position are dropped and reloaded when they become visible.
+
+        Args:
+            event: Change published by the appointment repository
+        """
+        current = event.appointment if self._belongs(event.appointment) else None
+        previous = event.previous if self._belongs(event.previous) else None
+        if current is None and previous is None:
+            return
+        if self._counting:
+            self.refresh()  # the pending count may or may not include the change
+            return
+
+        moved = current is None or previous is None or _sort_key(current) != _sort_key(previous)
+        if not moved:
+            self._replace_row(current)
+            return
+
+        changed = [_sort_key(apt) for apt in (current, previous) if apt is not None]
+        first_changed = min(changed)
+        stale = [
+            page for page, rows in self._pages.items()
+            if not rows or _sort_key(rows[-1]) >= first_changed
+        ]
+        for page in stale:
+            del self._pages[page]
+        self._generation += 1  # pages in flight may predate the change
+        self._loading.clear()
+
+        if self._selected is not None and self._selected.appointment_id == event.appointment_id:
+            self._selected = current
+        self._total += (current is not None) - (previous is not None)
+        self._first = max(0, min(self._first, self._total - self.height))
+        if self._total == 0:
+            self._show_message(self.empty_text)
+            self._update_scrollbar()
+        else:
+            self._render()
+
+    def selected(self) -> Optional[Appointment]:
+        """Get the selected appointment.
+
+        Returns:
+            Selected appointment or None
+        """
+        return self._selected
+
+    def scroll_to(self, first: int) -> None:
+        """Scroll so that row ``first`` is at the top.
+
+        Args:
+            first: Index of the first visible row
+        """
+        first = max(0, min(first, self._total - self.height))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    # Loading
+
+    def _on_count(self, generation: int, total: int) -> None:
+        """Handle the total row count."""
+        if generation != self._generation:
+            return
+        self._counting = False
+        self._total = total
+        self._first = max(0, min(self._first, total - self.height))
+        if total == 0:
+            self._show_message(self.empty_text)
+            self._update_scrollbar()
+        else:
+            self._render()
+
+    def _belongs(self, appointment: Optional[Appointment]) -> bool:
+        """Check if an appointment is part of this list."""
+        return appointment is not None and (self.matches is None or self.matches(appointment))
+
+    def _replace_row(self, appointment: Appointment) -> None:
+        """Rewrite one row in the page cache and the tree."""
+        for rows in self._pages.values():
+            for index, cached in enumerate(rows):
+                if cached.appointment_id == appointment.appointment_id:
+                    rows[index] = appointment
+        if self._selected is not None and self._selected.appointment_id == appointment.appointment_id:
+            self._selected = appointment
+        iid = str(appointment.appointment_id)
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=[formatter(appointment) for _, _, formatter in self.columns])
+
+    def _ensure_page(self, page: int) -> bool:
+        """Check if a page is cached; start loading it if not."""
+        if page in self._pages:
+            self._pages.move_to_end(page)
+            return True
+        if page not in self._loading:
+            generation = self._generation
+            self._loading[page] = generation
+            self.task_runner.submit(
+                f"{self.key}:page:{page}",
+                self.page_fn,
+                page * self.page_size,
+                self.page_size,
+                on_success=lambda rows: self._on_page(generation, page, rows),
+                owner=self,
+            )
+        return False
+
+    def _on_page(self, generation: int, page: int, rows: List[Appointment]) -> None:
+        """Cache a loaded page and re-render if it is visible."""
+        if generation != self._generation:
+            return
+        self._loading.pop(page, None)
+        self._pages[page] = rows
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+        self._render()
+
+    # Rendering
+
+    def _render(self) -> None:
+        """Fill the tree with the rows in the visible window."""
+        last = min(self._first + self.height, self._total)
+        first_page = self._first // self.page_size
+        last_page = max(first_page, (last - 1) // self.page_size)
+
+        ready = all([self._ensure_page(page) for page in range(first_page, last_page + 1)])
+        if ready:
+            rows = []
+            for page in range(first_page, last_page + 1):
+                rows.extend(self._pages[page])
+            offset = self._first - first_page * self.page_size
+            self._fill(rows[offset:offset + (last - self._first)])
+
+        # Warm the next page so scrolling down does not stall
+        next_page = last_page + 1
+        if ready and next_page * self.page_size < self._total:
+            self._ensure_page(next_page)
+
+        self._update_scrollbar()
+
+    def _fill(self, appointments: List[Appointment]) -> None:
+        """Replace tree items with the given appointments."""
+        self.tree.delete(*self.tree.get_children())
+        for appointment in appointments:
+            self.tree.insert(
+                "", tk.END,
+                iid=str(appointment.appointment_id),
+                values=[formatter(appointment) for _, _, formatter in self.columns],
+            )
+        if self._selected is not None:
+            iid = str(self._selected.appointment_id)
+            if self.tree.exists(iid):
+                self.tree.selection_set(iid)
+
+    def _show_message(self, text: str) -> None:
+        """Show a single informational row."""
+        self.tree.delete(*self.tree.get_children())
+        self._selected = None
+        values = [text] + [""] * (len(self.columns) - 1)
+        self.tree.insert("", tk.END, iid=EMPTY_ROW, values=values)
+
+    def _update_scrollbar(self) -> None:
+        """Size the scrollbar thumb to the visible window."""
+        if self._total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.scrollbar.set(
+            self._first / self._total,
+            min(1.0, (self._first + self.height) / self._total),
+        )
+
+    # Events
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        """Handle scrollbar drags and arrow clicks."""
+        if action == tk.MOVETO:
+            self.scroll_to(int(float(amount) * self._total))
+        elif action == tk.SCROLL:
+            step = self.height if unit == tk.PAGES else 1
+            self.scroll_to(self._first + int(amount) * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        """Scroll three rows per wheel notch."""
+        self.scroll_to(self._first - 3 * (1 if event.delta > 0 else -1))
+        return "break"
+
+    def _on_select(self, event: tk.Event) -> None:
+        """Remember the selected appointment by ID."""
+        selection = self.tree.selection()
+        if not selection or selection[0] == EMPTY_ROW:
+            return
+        appointment_id = int(selection[0])
+        for rows in self._pages.values():
+            for appointment in rows:
+                if appointment.appointment_id == appointment_id:
+                    self._selected = appointment
+                    return
+
+    def _on_key_up(self, event: tk.Event) -> Optional[str]:
+        """Scroll up when moving past the first visible row."""
+        children = self.tree.get_children()
+        if children and self.tree.focus() == children[0] and self._first > 0:
+            self.scroll_to(self._first - 1)
+            self._select_item(self.tree.get_children()[0])
+            return "break"
+        return None
+
+    def _on_key_down(self, event: tk.Event) -> Optional[str]:
+        """Scroll down when moving past the last visible row."""
+        children = self.tree.get_children()
+        if children and self.tree.focus() == children[-1]:
+            if self._first + self.height < self._total:
+                self.scroll_to(self._first + 1)
+                self._select_item(self.tree.get_children()[-1])
+            return "break"
+        return None
+
+    def _scroll_and_break(self, rows: int) -> str:
+        """Scroll by a number of rows and stop default handling."""
+        self.scroll_to(self._first + rows)
+        return "break"
+
+    def _select_item(self, iid: str) -> None:
+        """Select and focus a tree item."""
+        if iid != EMPTY_ROW:
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+
+
+def _sort_key(appointment: Appointment) -> Tuple[str, str]:
+    """Get the position of an appointment in date/time order."""
+    return appointment.date, appointment.time
@@ -21,6 +21,11 @@ class LoginView(tk.Frame):
 
         self._create_widgets()
 
+    def on_show(self) -> None:
+        """Clear the form when the cached view is shown again."""
+        self.username_entry.delete(0, tk.END)
+        self.password_entry.delete(0, tk.END)
+
     def _create_widgets(self) -> None:
         """Create and layout widgets."""
         # Main frame
@@ -61,7 +66,7 @@ class LoginView(tk.Frame):
         buttons_frame.pack(pady=20)
 
         # Login button
-        login_btn = tk.Button(
+        self.login_btn = tk.Button(
             buttons_frame,
             text="Login",
             font=("Helvetica", 12),
@@ -69,7 +74,7 @@ class LoginView(tk.Frame):
             command=self._handle_login,
             cursor="hand2"
         )
-        login_btn.pack(side=tk.LEFT, padx=5)
+        self.login_btn.pack(side=tk.LEFT, padx=5)
 
         # Back button
         back_btn = tk.Button(
@@ -94,10 +99,21 @@ class LoginView(tk.Frame):
             messagebox.showerror("Error", Messages.MISSING_FIELDS)
             return
 
-        # Execute login use case
-        login_use_case = self.container.login_user
-        result = login_use_case.execute(username, password)
+        # Execute login use case off the Tk thread
+        self.controller.task_runner.submit(
+            "login",
+            lambda: self.container.login_user.execute(username, password),
+            on_success=self._on_login_result,
+            owner=self,
+            busy=[self.login_btn],
+        )
+
+    def _on_login_result(self, result) -> None:
+        """Handle login use case result.
 
+        Args:
+            result: LoginResult
+        """
         if result.success:
             messagebox.showinfo("Success", result.message)
             self.controller.on_login_success(
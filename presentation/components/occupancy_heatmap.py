@@ -0,0 +1,216 @@
+"""Weekday x hour occupancy heatmap component."""
+import tkinter as tk
+from datetime import date
+from typing import Callable, Dict, List, Tuple
+
+from core.entities import Appointment
+from core.use_cases.reports import OccupancyReport
+from infrastructure.events import AppointmentChanged
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+CELL_WIDTH = 52
+CELL_HEIGHT = 34
+LABEL_WIDTH = 48
+HEADER_HEIGHT = 24
+
+EMPTY_COLOR = (255, 245, 238)
+FULL_COLOR = (178, 34, 34)
+CLOSED_COLOR = "#d9d9d9"
+
+
+def rate_color(rate: float) -> str:
+    """Blend from EMPTY_COLOR (0%) to FULL_COLOR (100% booked)."""
+    rate = max(0.0, min(1.0, rate))
+    red, green, blue = (
+        round(empty + (full - empty) * rate) for empty, full in zip(EMPTY_COLOR, FULL_COLOR)
+    )
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+class OccupancyHeatmap(tk.Frame):
+    """Canvas grid of booked share per weekday (rows) and hour (columns).
+
+    The whole grid comes from one ``report_fn(start_date, end_date)`` call
+    on the background task runner and is drawn once; every cell keeps its
+    canvas items, so ``apply_change`` recolors just the cells a booking
+    event touches without querying again.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        task_runner,
+        key: str,
+        report_fn: Callable[[str, str], OccupancyReport],
+    ):
+        """Initialize heatmap.
+
+        Args:
+            parent: Parent widget
+            task_runner: Background task runner used for the query
+            key: Task key unique to this heatmap
+            report_fn: Returns the occupancy report of a date range
+                (runs on a worker)
+        """
+        super().__init__(parent)
+        self.task_runner = task_runner
+        self.key = key
+        self.report_fn = report_fn
+
+        self.start_date = ""
+        self.end_date = ""
+        self._cells: Dict[Tuple[int, str], List[int]] = {}  # [bookings, capacity]
+        self._items: Dict[Tuple[int, str], Tuple[int, int]] = {}  # (rectangle, text)
+        self._loading = False
+
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.summary = tk.Label(self, font=("Helvetica", 11))
+        self.summary.pack(pady=5)
+
+    # Public API
+
+    def load(self, start_date: str, end_date: str) -> None:
+        """Show the occupancy of a date range (YYYY-MM-DD, inclusive)."""
+        self.start_date = start_date
+        self.end_date = end_date
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Query and redraw the current date range."""
+        if not self.start_date:
+            return
+        self._loading = True
+        self.summary.config(text="Loading occupancy...")
+        self.task_runner.submit(
+            self.key,
+            self.report_fn,
+            self.start_date,
+            self.end_date,
+            on_success=self._on_report,
+            on_error=self._on_report_failed,
+            owner=self,
+        )
+
+    def apply_change(self, event: AppointmentChanged) -> None:
+        """Move a booking between cells after an appointment change.
+
+        Falls back to a full refresh while a query is in flight (its result
+        may predate the change) or when a booking lands in a slot the grid
+        does not show.
+        """
+        if not self.start_date:
+            return
+        if self._loading:
+            self.refresh()
+            return
+
+        changed = []
+        for appointment, delta in ((event.previous, -1), (event.appointment, 1)):
+            if appointment is None or not self._in_range(appointment):
+                continue
+            slot = (self._weekday(appointment), appointment.time)
+            cell = self._cells.get(slot)
+            if cell is None:
+                self.refresh()
+                return
+            cell[0] = max(0, cell[0] + delta)
+            changed.append(slot)
+
+        for slot in changed:
+            self._paint(slot)
+        if changed:
+            self._update_summary()
+
+    # Drawing
+
+    def _on_report(self, report: OccupancyReport) -> None:
+        """Redraw the grid from a freshly loaded report."""
+        self._loading = False
+        self._cells = {
+            (weekday, time): [bookings, capacity]
+            for weekday, time, bookings, capacity in report.rows
+        }
+        self._draw()
+        self._update_summary()
+
+    def _on_report_failed(self, error: Exception) -> None:
+        """Show a failed query and clear the grid.
+
+        With no cells left, the next booking event in range reloads instead
+        of patching counts from an earlier report.
+        """
+        self._loading = False
+        self._cells.clear()
+        self._items.clear()
+        self.canvas.delete("all")
+        self.summary.config(text=f"Failed to load occupancy: {error}")
+
+    def _draw(self) -> None:
+        """Create the canvas items of every cell."""
+        self.canvas.delete("all")
+        self._items.clear()
+        times = sorted({time for _, time in self._cells})
+        weekdays = range(len(WEEKDAY_NAMES))
+
+        self.canvas.config(
+            width=LABEL_WIDTH + CELL_WIDTH * max(1, len(times)),
+            height=HEADER_HEIGHT + CELL_HEIGHT * len(WEEKDAY_NAMES),
+        )
+        for column, time in enumerate(times):
+            x = LABEL_WIDTH + column * CELL_WIDTH + CELL_WIDTH / 2
+            self.canvas.create_text(x, HEADER_HEIGHT / 2, text=time, font=("Helvetica", 9))
+        for weekday in weekdays:
+            y = HEADER_HEIGHT + weekday * CELL_HEIGHT
+            self.canvas.create_text(
+                LABEL_WIDTH / 2, y + CELL_HEIGHT / 2,
+                text=WEEKDAY_NAMES[weekday], font=("Helvetica", 10, "bold"),
+            )
+            for column, time in enumerate(times):
+                x = LABEL_WIDTH + column * CELL_WIDTH
+                # Every slot gets a cell, so apply_change can fill closed ones
+                self._cells.setdefault((weekday, time), [0, 0])
+                rectangle = self.canvas.create_rectangle(
+                    x, y, x + CELL_WIDTH, y + CELL_HEIGHT, outline="white", width=2
+                )
+                text = self.canvas.create_text(
+                    x + CELL_WIDTH / 2, y + CELL_HEIGHT / 2, font=("Helvetica", 9)
+                )
+                self._items[weekday, time] = (rectangle, text)
+                self._paint((weekday, time))
+
+    def _paint(self, slot: Tuple[int, str]) -> None:
+        """Recolor one cell and its label."""
+        bookings, capacity = self._cells[slot]
+        rectangle, text = self._items[slot]
+        if capacity == 0:
+            self.canvas.itemconfig(rectangle, fill=CLOSED_COLOR)
+            self.canvas.itemconfig(text, text=str(bookings) if bookings else "", fill="black")
+            return
+        rate = bookings / capacity
+        self.canvas.itemconfig(rectangle, fill=rate_color(rate))
+        self.canvas.itemconfig(
+            text, text=f"{rate:.0%}", fill="white" if rate > 0.5 else "black"
+        )
+
+    def _update_summary(self) -> None:
+        """Show the overall occupancy of the range."""
+        bookings = sum(cell[0] for cell in self._cells.values())
+        capacity = sum(cell[1] for cell in self._cells.values())
+        rate = bookings / capacity if capacity else 0.0
+        self.summary.config(
+            text=f"{self.start_date} to {self.end_date}: "
+                 f"{bookings} of {capacity} slots booked ({rate:.1%})"
+        )
+
+    # Helpers
+
+    def _in_range(self, appointment: Appointment) -> bool:
+        """Check whether an appointment falls in the shown date range."""
+        return self.start_date <= appointment.date <= self.end_date
+
+    @staticmethod
+    def _weekday(appointment: Appointment) -> int:
+        """Weekday of an appointment, 0 = Monday."""
+        return date.fromisoformat(appointment.date).weekday()
@@ -21,6 +21,18 @@ class SignupView(tk.Frame):
 
         self._create_widgets()
 
+    def on_show(self) -> None:
+        """Clear the form when the cached view is shown again."""
+        for entry in (
+            self.first_name_entry,
+            self.last_name_entry,
+            self.phone_entry,
+            self.username_entry,
+            self.password_entry,
+            self.confirm_password_entry,
+        ):
+            entry.delete(0, tk.END)
+
     def _create_widgets(self) -> None:
         """Create and layout widgets."""
         # Main frame
@@ -93,7 +105,7 @@ class SignupView(tk.Frame):
         buttons_frame.pack(pady=15)
 
         # Register button
-        register_btn = tk.Button(
+        self.register_btn = tk.Button(
             buttons_frame,
             text="Register",
             font=("Helvetica", 12),
@@ -101,7 +113,7 @@ class SignupView(tk.Frame):
             command=self._handle_signup,
             cursor="hand2"
         )
-        register_btn.pack(side=tk.LEFT, padx=5)
+        self.register_btn.pack(side=tk.LEFT, padx=5)
 
         # Back button
         back_btn = tk.Button(
@@ -126,12 +138,23 @@ class SignupView(tk.Frame):
         password = self.password_entry.get().strip()
         confirm_password = self.confirm_password_entry.get().strip()
 
-        # Execute register use case
-        register_use_case = self.container.register_user
-        result = register_use_case.execute(
-            first_name, last_name, phone, username, password, confirm_password
+        # Execute register use case off the Tk thread
+        self.controller.task_runner.submit(
+            "signup",
+            lambda: self.container.register_user.execute(
+                first_name, last_name, phone, username, password, confirm_password
+            ),
+            on_success=self._on_signup_result,
+            owner=self,
+            busy=[self.register_btn],
         )
 
+    def _on_signup_result(self, result) -> None:
+        """Handle register use case result.
+
+        Args:
+            result: RegistrationResult
+        """
         if result.success:
             messagebox.showinfo("Success", result.message)
             self.controller.show_login()
@@ -0,0 +1,99 @@
+"""View stack - builds dashboard views once and switches between them."""
+import tkinter as tk
+from typing import Callable, Dict, Optional
+
+
+class ViewStack:
+    """Keeps the views of one dashboard alive and shows one at a time.
+
+    Views are built on first use and hidden with ``pack_forget`` when another
+    view is shown, so switching back is instant and does not re-query. A view
+    can register an ``on_show`` hook to reset form fields when it reappears.
+
+    Usage:
+        if self.views.show("cancel"):
+            return
+        view = self.views.create("cancel")
+        ...build widgets into view...
+    """
+
+    def __init__(self, parent: tk.Misc, bg: str):
+        """Initialize view stack.
+
+        Args:
+            parent: Widget the views are packed into
+            bg: Background color of the view frames
+        """
+        self.parent = parent
+        self.bg = bg
+        self._views: Dict[str, tk.Frame] = {}
+        self._on_show: Dict[str, Callable[[], None]] = {}
+        self._current: Optional[str] = None
+
+    def show(self, name: str) -> bool:
+        """Show a previously built view.
+
+        Args:
+            name: View name
+
+        Returns:
+            True if the view existed and is now shown, False if it must be built
+        """
+        view = self._views.get(name)
+        if view is None:
+            return False
+        self._hide_current()
+        view.pack(fill=tk.BOTH, expand=True)
+        self._current = name
+        hook = self._on_show.get(name)
+        if hook is not None:
+            hook()
+        return True
+
+    def create(self, name: str, on_show: Optional[Callable[[], None]] = None) -> tk.Frame:
+        """Create, register and show an empty view.
+
+        Args:
+            name: View name
+            on_show: Called every time the view is shown again
+
+        Returns:
+            Frame to build the view's widgets into
+        """
+        self.discard(name)
+        self._hide_current()
+        view = tk.Frame(self.parent, bg=self.bg)
+        view.pack(fill=tk.BOTH, expand=True)
+        self._views[name] = view
+        if on_show is not None:
+            self._on_show[name] = on_show
+        self._current = name
+        return view
+
+    def set_on_show(self, name: str, on_show: Callable[[], None]) -> None:
+        """Register the hook run when a view is shown again.
+
+        Args:
+            name: View name
+            on_show: Hook
+        """
+        self._on_show[name] = on_show
+
+    def discard(self, name: str) -> None:
+        """Destroy a view so the next visit rebuilds it.
+
+        Args:
+            name: View name
+        """
+        view = self._views.pop(name, None)
+        self._on_show.pop(name, None)
+        if view is not None:
+            view.destroy()
+        if self._current == name:
+            self._current = None
+
+    def _hide_current(self) -> None:
+        """Hide the visible view."""
+        if self._current is not None:
+            self._views[self._current].pack_forget()
+            self._current = None
@@ -1,16 +1,38 @@
 """Application controller - manages navigation and screen transitions."""
 import tkinter as tk
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from di_container import DIContainer
 from core.entities import User, Employee
 from config.constants import UserRole
+from config.settings import settings
+from infrastructure.events import (
+    AppointmentChanged,
+    EmployeeChanged,
+    ExternalDataChanged,
+    ServiceChanged,
+)
+from presentation.availability_cache import AvailabilityCache
+from presentation.background_task_runner import BackgroundTaskRunner
+
+DASHBOARD_SCREEN = "dashboard"
+
+# Event type -> screen method it is forwarded to
+SCREEN_EVENT_HANDLERS = {
+    AppointmentChanged: "on_appointment_changed",
+    EmployeeChanged: "on_employee_changed",
+    ServiceChanged: "on_service_changed",
+    ExternalDataChanged: "on_external_change",
+}
 
 
 class AppController:
     """Main application controller.
 
-    Manages screen navigation and state transitions.
+    Manages screen navigation and state transitions. Screens are built once
+    and hidden rather than destroyed when navigating away; the dashboard of a
+    session is dropped on logout. Repository change events are forwarded to
+    every screen defining the matching handler (see SCREEN_EVENT_HANDLERS).
     """
 
     def __init__(self, root: tk.Tk, container: DIContainer):
@@ -23,41 +45,96 @@ class AppController:
         self.root = root
         self.container = container
 
+        # Runs use cases off the Tk thread; shared by all screens
+        self.task_runner = BackgroundTaskRunner(root)
+
+        # Slot cache shared by the booking views; prefetched during startup
+        self.availability = AvailabilityCache(container, self.task_runner, "availability")
+
         # Current state
         self.current_frame: Optional[tk.Frame] = None
         self.current_user: Optional[User] = None
         self.current_employee: Optional[Employee] = None
         self.current_role: Optional[UserRole] = None
+        self._screens: Dict[str, tk.Frame] = {}
+
+        # Repositories publish on the writing thread; hop to the Tk thread
+        self._unsubscribers = [
+            container.event_bus.subscribe(
+                event_type,
+                lambda event, handler=handler: self.task_runner.call_soon(
+                    self._dispatch_event, handler, event
+                ),
+            )
+            for event_type, handler in SCREEN_EVENT_HANDLERS.items()
+        ]
+        if settings.USE_SQLITE and settings.DATA_VERSION_POLL_INTERVAL > 0:
+            # Opens the database, so keep it off the Tk thread
+            self.task_runner.submit(
+                "data_version_watcher", container.data_version_watcher.start
+            )
 
     def clear_frame(self) -> None:
-        """Clear the current frame."""
+        """Hide the current frame."""
         if self.current_frame:
-            self.current_frame.destroy()
+            self.current_frame.pack_forget()
             self.current_frame = None
 
+    def _show_screen(self, name: str, factory: Callable[[], tk.Frame]) -> None:
+        """Show a cached screen, building it on first use.
+
+        Screens defining ``on_show`` get it called when shown again.
+
+        Args:
+            name: Screen name
+            factory: Builds the screen
+        """
+        self.clear_frame()
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = factory()
+            self._screens[name] = screen
+        elif hasattr(screen, "on_show"):
+            screen.on_show()
+        self.current_frame = screen
+        screen.pack(fill=tk.BOTH, expand=True)
+
+    def _discard_screen(self, name: str) -> None:
+        """Destroy a cached screen.
+
+        Args:
+            name: Screen name
+        """
+        screen = self._screens.pop(name, None)
+        if screen is not None:
+            if screen is self.current_frame:
+                self.current_frame = None
+            screen.destroy()
+
+    def _dispatch_event(self, handler_name: str, event) -> None:
+        """Forward a change event to the slot cache, then to the cached screens."""
+        for screen in [self.availability, *self._screens.values()]:
+            handler = getattr(screen, handler_name, None)
+            if handler is not None:
+                handler(event)
+
     def show_main_screen(self) -> None:
         """Show main screen with login/signup buttons."""
         from presentation.components.main_screen import MainScreen
 
-        self.clear_frame()
-        self.current_frame = MainScreen(self.root, self)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen("main", lambda: MainScreen(self.root, self))
 
     def show_login(self) -> None:
         """Show login screen."""
         from presentation.components.login_view import LoginView
 
-        self.clear_frame()
-        self.current_frame = LoginView(self.root, self)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen("login", lambda: LoginView(self.root, self))
 
     def show_signup(self) -> None:
         """Show signup screen."""
         from presentation.components.signup_view import SignupView
 
-        self.clear_frame()
-        self.current_frame = SignupView(self.root, self)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen("signup", lambda: SignupView(self.root, self))
 
     def on_login_success(
         self, role: UserRole, user: Optional[User] = None, employee: Optional[Employee] = None
@@ -85,9 +162,7 @@ class AppController:
         """Show admin dashboard."""
         from presentation.dashboards.admin_dashboard import AdminDashboard
 
-        self.clear_frame()
-        self.current_frame = AdminDashboard(self.root, self)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen(DASHBOARD_SCREEN, lambda: AdminDashboard(self.root, self))
 
     def show_customer_dashboard(self) -> None:
         """Show customer dashboard."""
@@ -97,9 +172,9 @@ class AppController:
             self.show_main_screen()
             return
 
-        self.clear_frame()
-        self.current_frame = CustomerDashboard(self.root, self, self.current_user)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen(
+            DASHBOARD_SCREEN, lambda: CustomerDashboard(self.root, self, self.current_user)
+        )
 
     def show_employee_dashboard(self) -> None:
         """Show employee dashboard."""
@@ -109,13 +184,20 @@ class AppController:
             self.show_main_screen()
             return
 
-        self.clear_frame()
-        self.current_frame = EmployeeDashboard(self.root, self, self.current_employee)
-        self.current_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen(
+            DASHBOARD_SCREEN, lambda: EmployeeDashboard(self.root, self, self.current_employee)
+        )
+
+    def shutdown(self) -> None:
+        """Stop background work before the container is cleaned up."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self.task_runner.shutdown()
 
     def logout(self) -> None:
         """Logout and return to main screen."""
         self.current_user = None
         self.current_employee = None
         self.current_role = None
+        self._discard_screen(DASHBOARD_SCREEN)
         self.show_main_screen()
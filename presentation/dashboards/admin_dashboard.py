@@ -1,11 +1,31 @@
 """Admin dashboard - full control over salon operations."""
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
-from tkcalendar import Calendar
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-from config.settings import settings
 from config.constants import EmployeePosition
+from config.settings import settings
+from infrastructure.events import (
+    AppointmentChanged,
+    EmployeeChanged,
+    ExternalDataChanged,
+    ServiceChanged,
+)
+from presentation.components.appointment_list import (
+    AppointmentList,
+    DATE_COLUMN,
+    TIME_COLUMN,
+    CUSTOMER_COLUMN,
+    PHONE_COLUMN,
+    SERVICE_COLUMN,
+    PRICE_COLUMN,
+)
+from presentation.components.occupancy_heatmap import OccupancyHeatmap
+from presentation.components.view_stack import ViewStack
+
+if TYPE_CHECKING:
+    from tkcalendar import Calendar
 
 
 class AdminDashboard(tk.Frame):
@@ -21,17 +41,75 @@ class AdminDashboard(tk.Frame):
         super().__init__(parent, bg=settings.BACKGROUND_COLOR)
         self.controller = controller
         self.container = controller.container
+        self.tasks = controller.task_runner
+        self.availability = controller.availability
+
+        # Views are built on first visit and kept; change events patch them
+        self.views = ViewStack(self, settings.BACKGROUND_COLOR)
+        self._appointment_lists: List[AppointmentList] = []
+        self._heatmap: Optional[OccupancyHeatmap] = None
+        self._refresh_times: Optional[Callable[[Optional[List[str]]], None]] = None
+        self._reload_employees: Optional[Callable[[], None]] = None
+        self._reload_services: Optional[Callable[[], None]] = None
+
+        self._show_main_menu()
+
+    def on_appointment_changed(self, event: AppointmentChanged) -> None:
+        """Update the shown time slots and open lists after an appointment change.
+
+        The controller has already dropped the affected availability.
+
+        Args:
+            event: Change published by the appointment repository
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(event.dates)
+        for appointment_list in self._appointment_lists:
+            appointment_list.apply_change(event)
+        if self._heatmap is not None:
+            self._heatmap.apply_change(event)
+
+    def on_employee_changed(self, event: EmployeeChanged) -> None:
+        """Reload the employee list after an employee was added or removed.
+
+        Args:
+            event: Change published by the employee repository
+        """
+        if self._reload_employees is not None:
+            self._reload_employees()
+
+    def on_service_changed(self, event: ServiceChanged) -> None:
+        """Reload the service choices after the catalog changed.
 
-        self._create_main_menu()
+        Args:
+            event: Change published by the service repository
+        """
+        if self._reload_services is not None:
+            self._reload_services()
 
-    def _create_main_menu(self) -> None:
-        """Create main menu with action buttons."""
-        # Clear current content
-        for widget in self.winfo_children():
-            widget.destroy()
+    def on_external_change(self, event: ExternalDataChanged) -> None:
+        """Reload everything after another process wrote to the database.
+
+        Args:
+            event: Change detected by the data version watcher
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(None)
+        for appointment_list in self._appointment_lists:
+            appointment_list.refresh()
+        if self._heatmap is not None:
+            self._heatmap.refresh()
+        self.on_employee_changed(None)
+        self.on_service_changed(None)
+
+    def _show_main_menu(self) -> None:
+        """Show main menu with action buttons."""
+        if self.views.show("menu"):
+            return
+        view = self.views.create("menu")
 
         # Main frame
-        frame = tk.Frame(self, bg="light salmon", width=500, height=450)
+        frame = tk.Frame(view, bg="light salmon", width=500, height=500)
         frame.place(relx=0.5, rely=0.5, anchor="center")
 
         # Title
@@ -50,6 +128,7 @@ class AdminDashboard(tk.Frame):
             ("Schedule Appointment", self._show_schedule_appointment),
             ("Cancel Appointment", self._show_cancel_appointment),
             ("View All Appointments", self._show_appointments),
+            ("Occupancy Heatmap", self._show_occupancy),
             ("Logout", self.controller.logout),
         ]
 
@@ -66,10 +145,11 @@ class AdminDashboard(tk.Frame):
 
     def _show_add_employee(self) -> None:
         """Show add employee form."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("add_employee"):
+            return
+        view = self.views.create("add_employee")
 
-        frame = tk.Frame(self, bg="light salmon", width=500, height=500)
+        frame = tk.Frame(view, bg="light salmon", width=500, height=500)
         frame.place(relx=0.5, rely=0.5, anchor="center")
 
         tk.Label(
@@ -115,43 +195,61 @@ class AdminDashboard(tk.Frame):
         fields['password'] = tk.Entry(frame, font=("Helvetica", 11), width=30, show="*")
         fields['password'].pack(pady=3)
 
+        def clear_fields():
+            for name, field in fields.items():
+                if name == 'position':
+                    field.set("")
+                else:
+                    field.delete(0, tk.END)
+
+        self.views.set_on_show("add_employee", clear_fields)
+
         # Buttons
         btn_frame = tk.Frame(frame, bg="light salmon")
         btn_frame.pack(pady=15)
 
-        tk.Button(
+        add_btn = tk.Button(
             btn_frame, text="Add", font=("Helvetica", 12), width=10,
-            command=lambda: self._handle_add_employee(fields), cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+            command=lambda: self._handle_add_employee(fields, add_btn), cursor="hand2"
+        )
+        add_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
-    def _handle_add_employee(self, fields: dict) -> None:
+    def _handle_add_employee(self, fields: dict, button: tk.Button) -> None:
         """Handle add employee action."""
-        result = self.container.add_employee.execute(
-            first_name=fields['first_name'].get().strip(),
-            last_name=fields['last_name'].get().strip(),
-            position=fields['position'].get().strip(),
-            phone_number=fields['phone'].get().strip(),
-            username=fields['username'].get().strip(),
-            password=fields['password'].get().strip(),
+        values = {
+            'first_name': fields['first_name'].get().strip(),
+            'last_name': fields['last_name'].get().strip(),
+            'position': fields['position'].get().strip(),
+            'phone_number': fields['phone'].get().strip(),
+            'username': fields['username'].get().strip(),
+            'password': fields['password'].get().strip(),
+        }
+
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+                self._show_main_menu()
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "admin:add_employee",
+            lambda: self.container.add_employee.execute(**values),
+            on_success=on_result, owner=button, busy=[button],
         )
 
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._create_main_menu()
-        else:
-            messagebox.showerror("Error", result.message)
-
     def _show_remove_employee(self) -> None:
         """Show remove employee screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("remove_employee"):
+            return
+        view = self.views.create("remove_employee")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
@@ -162,29 +260,48 @@ class AdminDashboard(tk.Frame):
         listbox = tk.Listbox(frame, font=("Helvetica", 11), height=15, width=60)
         listbox.pack(pady=10, fill=tk.BOTH, expand=True)
 
-        employees = self.container.get_employees.get_all()
         employee_map = {}
 
-        for emp in employees:
-            display = f"{emp.full_name} - {emp.position} ({emp.username})"
-            listbox.insert(tk.END, display)
-            employee_map[display] = emp
+        def show_employees(employees):
+            listbox.delete(0, tk.END)
+            employee_map.clear()
+            for emp in employees:
+                display = f"{emp.full_name} - {emp.position} ({emp.username})"
+                listbox.insert(tk.END, display)
+                employee_map[display] = emp
+
+        def load_employees():
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, "Loading employees...")
+            self.tasks.submit(
+                "admin:employees",
+                lambda: self.container.get_employees.get_all(),
+                on_success=show_employees, owner=listbox,
+            )
+
+        # Kept current by employee change events
+        self._reload_employees = load_employees
+        load_employees()
 
         # Buttons
         btn_frame = tk.Frame(frame, bg="light salmon")
         btn_frame.pack(pady=10)
 
-        tk.Button(
+        remove_btn = tk.Button(
             btn_frame, text="Remove Selected", font=("Helvetica", 12), width=15,
-            command=lambda: self._handle_remove_employee(listbox, employee_map), cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+            command=lambda: self._handle_remove_employee(listbox, employee_map, remove_btn),
+            cursor="hand2"
+        )
+        remove_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
-    def _handle_remove_employee(self, listbox: tk.Listbox, employee_map: dict) -> None:
+    def _handle_remove_employee(
+        self, listbox: tk.Listbox, employee_map: dict, button: tk.Button
+    ) -> None:
         """Handle remove employee action."""
         selection = listbox.curselection()
         if not selection:
@@ -192,7 +309,9 @@ class AdminDashboard(tk.Frame):
             return
 
         display = listbox.get(selection[0])
-        employee = employee_map[display]
+        employee = employee_map.get(display)
+        if employee is None:
+            return
 
         confirm = messagebox.askyesno(
             "Confirm", f"Remove employee {employee.full_name}?"
@@ -200,27 +319,35 @@ class AdminDashboard(tk.Frame):
         if not confirm:
             return
 
-        result = self.container.remove_employee.execute(employee.employee_id)
-
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._show_remove_employee()
-        else:
-            messagebox.showerror("Error", result.message)
+        # The list is reloaded by the change event
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "admin:remove_employee",
+            lambda: self.container.remove_employee.execute(employee.employee_id),
+            on_success=on_result, owner=button, busy=[button],
+        )
 
     def _show_schedule_appointment(self) -> None:
         """Show schedule appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("schedule"):
+            return
+        view = self.views.create("schedule")
 
-        main_frame = tk.Frame(self, bg="light salmon")
+        main_frame = tk.Frame(view, bg="light salmon")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         tk.Label(
             main_frame, text="Schedule Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Calendar
+        # Calendar (tkcalendar is imported when a booking view is first opened)
+        from tkcalendar import Calendar
+
         tk.Label(main_frame, text="Select Date:", font=("Helvetica", 12), bg="light salmon").pack(pady=5)
 
         cal = Calendar(
@@ -241,15 +368,42 @@ class AdminDashboard(tk.Frame):
         )
         time_combo.pack(pady=5)
 
-        # Update available times when date changes
-        def update_times(event=None):
-            selected_date = cal.get_date()
-            available = self.container.get_available_slots.execute(selected_date)
+        # Update available times when date changes; rapid clicks are debounced
+        # and answered from the month cache once it has loaded
+        def show_times(available, keep=""):
+            time_combo.config(state="readonly")
             time_combo['values'] = available
-            if available:
+            if keep in available:
+                time_var.set(keep)
+            elif available:
                 time_combo.current(0)
+            else:
+                time_var.set("")
+
+        def update_times(event=None, keep=""):
+            selected_date = cal.get_date()
+            time_combo.config(state=tk.DISABLED)
+            time_var.set("Loading...")
+            self.availability.request(
+                selected_date, lambda available: show_times(available, keep), owner=time_combo
+            )
+
+        def refresh_times(dates):
+            # A booking elsewhere changed the shown date (None: any date);
+            # keep the choice if it is still free
+            if dates is not None and cal.get_date() not in dates:
+                return
+            if str(time_combo.cget("state")) != tk.DISABLED:
+                update_times(keep=time_var.get())
+
+        self._refresh_times = refresh_times
+
+        def prefetch_month(event=None):
+            month, year = cal.get_displayed_month()
+            self.availability.prefetch_month(year, month)
 
         cal.bind("<<CalendarSelected>>", update_times)
+        cal.bind("<<CalendarMonthChanged>>", prefetch_month)
         update_times()
 
         # Service selection
@@ -258,14 +412,31 @@ class AdminDashboard(tk.Frame):
         service_var = tk.StringVar()
         service_combo = ttk.Combobox(
             main_frame, textvariable=service_var, font=("Helvetica", 11),
-            width=30, state="readonly",
-            values=self.container.get_services.get_display_names()
+            width=30, state="readonly"
         )
         service_combo.pack(pady=5)
 
+        def load_services():
+            self.tasks.submit(
+                "admin:services",
+                lambda: self.container.get_services.get_display_names(),
+                on_success=lambda names: service_combo.config(values=names),
+                owner=service_combo,
+            )
+
+        self._reload_services = load_services
+        load_services()
+
         # Customer info button
         customer_data = {}
 
+        def reset_form():
+            customer_data.clear()
+            service_var.set("")
+            update_times()
+
+        self.views.set_on_show("schedule", reset_form)
+
         def get_customer_info():
             """Get customer information via popup."""
             popup = tk.Toplevel(self)
@@ -329,20 +500,26 @@ class AdminDashboard(tk.Frame):
         btn_frame = tk.Frame(main_frame, bg="light salmon")
         btn_frame.pack(pady=15)
 
-        tk.Button(
+        book_btn = tk.Button(
             btn_frame, text="Book", font=("Helvetica", 12), width=10,
             command=lambda: self._handle_schedule_appointment(
-                cal, time_var, service_var, customer_data
+                cal, time_var, service_var, customer_data, book_btn
             ), cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        book_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
     def _handle_schedule_appointment(
-        self, cal: Calendar, time_var: tk.StringVar, service_var: tk.StringVar, customer_data: dict
+        self,
+        cal: "Calendar",
+        time_var: tk.StringVar,
+        service_var: tk.StringVar,
+        customer_data: dict,
+        button: tk.Button,
     ) -> None:
         """Handle schedule appointment action."""
         if not customer_data:
@@ -358,124 +535,185 @@ class AdminDashboard(tk.Frame):
         service_name, price_str = service_display.split(" -> ")
         price = float(price_str.replace("€", ""))
 
-        result = self.container.create_appointment.execute(
-            first_name=customer_data.get('first_name', ''),
-            last_name=customer_data.get('last_name', ''),
-            phone_number=customer_data.get('phone', ''),
-            date=cal.get_date(),
-            time=time_var.get(),
-            service_name=service_name,
-            service_price=price,
+        values = {
+            'first_name': customer_data.get('first_name', ''),
+            'last_name': customer_data.get('last_name', ''),
+            'phone_number': customer_data.get('phone', ''),
+            'date': cal.get_date(),
+            'time': time_var.get(),
+            'service_name': service_name,
+            'service_price': price,
+        }
+
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+                self._show_main_menu()
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "admin:book",
+            lambda: self.container.create_appointment.execute(**values),
+            on_success=on_result, owner=button, busy=[button],
         )
 
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._create_main_menu()
-        else:
-            messagebox.showerror("Error", result.message)
-
     def _show_cancel_appointment(self) -> None:
         """Show cancel appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("cancel"):
+            return
+        view = self.views.create("cancel")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="Cancel Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Appointments list
-        listbox = tk.Listbox(frame, font=("Helvetica", 10), height=15, width=70)
-        listbox.pack(pady=10, fill=tk.BOTH, expand=True)
-
-        appointments = self.container.get_appointments.get_all()
-        appointment_map = {}
-
-        for apt in appointments:
-            display = f"{apt.date} {apt.time} - {apt.full_name} - {apt.service_name}"
-            listbox.insert(tk.END, display)
-            appointment_map[display] = apt
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "admin:cancel_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, CUSTOMER_COLUMN, SERVICE_COLUMN],
+            count_fn=lambda: self.container.get_appointments.get_count(),
+            page_fn=lambda offset, limit: self.container.get_appointments.get_page(offset, limit),
+            height=15,
+        )
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
         # Buttons
         btn_frame = tk.Frame(frame, bg="light salmon")
         btn_frame.pack(pady=10)
 
-        tk.Button(
+        cancel_btn = tk.Button(
             btn_frame, text="Cancel Selected", font=("Helvetica", 12), width=15,
-            command=lambda: self._handle_cancel_appointment(listbox, appointment_map), cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+            command=lambda: self._handle_cancel_appointment(appointment_list, cancel_btn),
+            cursor="hand2"
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
-    def _handle_cancel_appointment(self, listbox: tk.Listbox, appointment_map: dict) -> None:
+    def _handle_cancel_appointment(
+        self, appointment_list: AppointmentList, button: tk.Button
+    ) -> None:
         """Handle cancel appointment action."""
-        selection = listbox.curselection()
-        if not selection:
+        appointment = appointment_list.selected()
+        if appointment is None:
             messagebox.showwarning("Warning", "Please select an appointment to cancel")
             return
 
-        display = listbox.get(selection[0])
-        appointment = appointment_map[display]
-
         confirm = messagebox.askyesno(
             "Confirm", f"Cancel appointment for {appointment.full_name}?"
         )
         if not confirm:
             return
 
-        result = self.container.cancel_appointment.execute(appointment.appointment_id)
-
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._show_cancel_appointment()
-        else:
-            messagebox.showerror("Error", result.message)
+        # The list and availability are updated by the change event
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "admin:cancel",
+            lambda: self.container.cancel_appointment.execute(appointment.appointment_id),
+            on_success=on_result, owner=button, busy=[button],
+        )
 
     def _show_appointments(self) -> None:
         """Show all appointments."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("appointments"):
+            return
+        view = self.views.create("appointments")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="All Appointments", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Text widget with scrollbar
-        text_frame = tk.Frame(frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "admin:all_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, CUSTOMER_COLUMN, PHONE_COLUMN, SERVICE_COLUMN, PRICE_COLUMN],
+            count_fn=lambda: self.container.get_appointments.get_count(),
+            page_fn=lambda offset, limit: self.container.get_appointments.get_page(offset, limit),
+            height=18,
+        )
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
-        scrollbar = tk.Scrollbar(text_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Back button
+        tk.Button(
+            frame, text="Back", font=("Helvetica", 12), width=10,
+            command=self._show_main_menu, cursor="hand2"
+        ).pack(pady=10)
 
-        text_widget = tk.Text(
-            text_frame, font=("Courier", 10), height=20, width=80,
-            yscrollcommand=scrollbar.set
+    def _show_occupancy(self) -> None:
+        """Show booked share per weekday and hour for a date range."""
+        if self.views.show("occupancy"):
+            return
+        view = self.views.create("occupancy")
+
+        frame = tk.Frame(view, bg="light salmon")
+        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        tk.Label(
+            frame, text="Occupancy", font=("Helvetica", 18, "bold"), bg="light salmon"
+        ).pack(pady=15)
+
+        # Date range, four weeks either side of today by default
+        range_frame = tk.Frame(frame, bg="light salmon")
+        range_frame.pack(pady=5)
+
+        today = datetime.now().date()
+        dates = {}
+        for name, label, default in (
+            ("start", "From:", today - timedelta(days=28)),
+            ("end", "To:", today + timedelta(days=27)),
+        ):
+            tk.Label(
+                range_frame, text=label, font=("Helvetica", 11), bg="light salmon"
+            ).pack(side=tk.LEFT, padx=3)
+            dates[name] = tk.Entry(range_frame, font=("Helvetica", 11), width=12)
+            dates[name].insert(0, default.isoformat())
+            dates[name].pack(side=tk.LEFT, padx=3)
+
+        # One aggregate query per range; booking events patch single cells
+        heatmap = OccupancyHeatmap(
+            frame, self.tasks, "admin:occupancy",
+            report_fn=lambda start, end: self.container.get_occupancy_report.execute(start, end),
         )
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=text_widget.yview)
 
-        # Load appointments
-        appointments = self.container.get_appointments.get_all()
+        def show_range():
+            start = dates["start"].get().strip()
+            end = dates["end"].get().strip()
+            try:
+                if datetime.strptime(start, "%Y-%m-%d") > datetime.strptime(end, "%Y-%m-%d"):
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Enter a valid range as YYYY-MM-DD")
+                return
+            heatmap.load(start, end)
 
-        for apt in appointments:
-            text_widget.insert(
-                tk.END,
-                f"{apt.date} {apt.time} | {apt.full_name} | {apt.phone_number} | "
-                f"{apt.service_name} ({apt.service_price}€)\n"
-            )
+        tk.Button(
+            range_frame, text="Show", font=("Helvetica", 11), width=8,
+            command=show_range, cursor="hand2"
+        ).pack(side=tk.LEFT, padx=5)
 
-        text_widget.config(state=tk.DISABLED)
+        heatmap.pack(pady=10)
+        self._heatmap = heatmap
+        show_range()
 
         # Back button
         tk.Button(
             frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(pady=10)
@@ -1,11 +1,25 @@
 """Customer dashboard - self-service appointment management."""
 import tkinter as tk
 from tkinter import ttk, messagebox
+from concurrent.futures import Future
 from datetime import datetime
-from tkcalendar import Calendar
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from config.settings import settings
-from core.entities import User
+from core.entities import Appointment, User
+from infrastructure.events import AppointmentChanged, ExternalDataChanged, ServiceChanged
+from presentation.components.appointment_list import (
+    AppointmentList,
+    DATE_COLUMN,
+    TIME_COLUMN,
+    SERVICE_COLUMN,
+    PRICE_COLUMN,
+)
+from presentation.background_task_runner import widget_exists
+from presentation.components.view_stack import ViewStack
+
+if TYPE_CHECKING:
+    from tkcalendar import Calendar
 
 
 class CustomerDashboard(tk.Frame):
@@ -22,17 +36,68 @@ class CustomerDashboard(tk.Frame):
         super().__init__(parent, bg=settings.BACKGROUND_COLOR)
         self.controller = controller
         self.container = controller.container
+        self.tasks = controller.task_runner
+        self.availability = controller.availability
         self.user = user
         self.last_booked_appointment = None
 
-        self._create_main_menu()
+        # Views are built on first visit and kept; change events patch them
+        self.views = ViewStack(self, settings.BACKGROUND_COLOR)
+        self._appointment_lists: List[AppointmentList] = []
+        self._refresh_times: Optional[Callable[[Optional[List[str]]], None]] = None
+        self._reload_services: Optional[Callable[[], None]] = None
 
-    def _create_main_menu(self) -> None:
-        """Create main menu with action buttons."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        self._show_main_menu()
 
-        frame = tk.Frame(self, bg="light salmon", width=450, height=400)
+    def on_appointment_changed(self, event: AppointmentChanged) -> None:
+        """Update the shown time slots and open lists after an appointment change.
+
+        The controller has already dropped the affected availability.
+
+        Args:
+            event: Change published by the appointment repository
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(event.dates)
+        for appointment_list in self._appointment_lists:
+            appointment_list.apply_change(event)
+
+    def on_service_changed(self, event: ServiceChanged) -> None:
+        """Reload the service choices after the catalog changed.
+
+        Args:
+            event: Change published by the service repository
+        """
+        if self._reload_services is not None:
+            self._reload_services()
+
+    def on_external_change(self, event: ExternalDataChanged) -> None:
+        """Reload everything after another process wrote to the database.
+
+        Args:
+            event: Change detected by the data version watcher
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(None)
+        for appointment_list in self._appointment_lists:
+            appointment_list.refresh()
+        self.on_service_changed(None)
+
+    def _is_mine(self, appointment: Appointment) -> bool:
+        """Check if an appointment belongs to the logged in customer."""
+        return (
+            appointment.first_name == self.user.first_name
+            and appointment.last_name == self.user.last_name
+            and appointment.phone_number == self.user.phone_number
+        )
+
+    def _show_main_menu(self) -> None:
+        """Show main menu with action buttons."""
+        if self.views.show("menu"):
+            return
+        view = self.views.create("menu")
+
+        frame = tk.Frame(view, bg="light salmon", width=450, height=400)
         frame.place(relx=0.5, rely=0.5, anchor="center")
 
         # Welcome message
@@ -59,17 +124,20 @@ class CustomerDashboard(tk.Frame):
 
     def _show_book_appointment(self) -> None:
         """Show book appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("book"):
+            return
+        view = self.views.create("book")
 
-        main_frame = tk.Frame(self, bg="light salmon")
+        main_frame = tk.Frame(view, bg="light salmon")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         tk.Label(
             main_frame, text="Book Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Calendar
+        # Calendar (tkcalendar is imported when a booking view is first opened)
+        from tkcalendar import Calendar
+
         tk.Label(main_frame, text="Select Date:", font=("Helvetica", 12), bg="light salmon").pack(pady=5)
 
         cal = Calendar(
@@ -90,17 +158,44 @@ class CustomerDashboard(tk.Frame):
         )
         time_combo.pack(pady=5)
 
-        # Update available times when date changes
-        def update_times(event=None):
-            selected_date = cal.get_date()
-            available = self.container.get_available_slots.execute(selected_date)
+        # Update available times when date changes; rapid clicks are debounced
+        # and answered from the month cache once it has loaded
+        def show_times(available, keep=None):
+            time_combo.config(state="readonly")
             time_combo['values'] = available
-            if available:
+            if keep in available:
+                time_var.set(keep)
+            elif available:
                 time_combo.current(0)
             else:
-                messagebox.showinfo("Info", "No available slots for this date")
+                time_var.set("")
+                if keep is None:
+                    messagebox.showinfo("Info", "No available slots for this date")
+
+        def update_times(event=None, keep=None):
+            selected_date = cal.get_date()
+            time_combo.config(state=tk.DISABLED)
+            time_var.set("Loading...")
+            self.availability.request(
+                selected_date, lambda available: show_times(available, keep), owner=time_combo
+            )
+
+        def refresh_times(dates):
+            # A booking elsewhere changed the shown date (None: any date);
+            # keep the choice if it is still free
+            if dates is not None and cal.get_date() not in dates:
+                return
+            if str(time_combo.cget("state")) != tk.DISABLED:
+                update_times(keep=time_var.get())
+
+        self._refresh_times = refresh_times
+
+        def prefetch_month(event=None):
+            month, year = cal.get_displayed_month()
+            self.availability.prefetch_month(year, month)
 
         cal.bind("<<CalendarSelected>>", update_times)
+        cal.bind("<<CalendarMonthChanged>>", prefetch_month)
         update_times()
 
         # Service selection
@@ -109,28 +204,49 @@ class CustomerDashboard(tk.Frame):
         service_var = tk.StringVar()
         service_combo = ttk.Combobox(
             main_frame, textvariable=service_var, font=("Helvetica", 11),
-            width=30, state="readonly",
-            values=self.container.get_services.get_display_names()
+            width=30, state="readonly"
         )
         service_combo.pack(pady=5)
 
+        def load_services():
+            self.tasks.submit(
+                "customer:services",
+                lambda: self.container.get_services.get_display_names(),
+                on_success=lambda names: service_combo.config(values=names),
+                owner=service_combo,
+            )
+
+        self._reload_services = load_services
+        load_services()
+
+        def reset_form():
+            service_var.set("")
+            update_times()
+
+        self.views.set_on_show("book", reset_form)
+
         # Buttons
         btn_frame = tk.Frame(main_frame, bg="light salmon")
         btn_frame.pack(pady=15)
 
-        tk.Button(
+        book_btn = tk.Button(
             btn_frame, text="Book", font=("Helvetica", 12), width=10,
-            command=lambda: self._handle_book_appointment(cal, time_var, service_var),
+            command=lambda: self._handle_book_appointment(cal, time_var, service_var, book_btn),
             cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        book_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
     def _handle_book_appointment(
-        self, cal: Calendar, time_var: tk.StringVar, service_var: tk.StringVar
+        self,
+        cal: "Calendar",
+        time_var: tk.StringVar,
+        service_var: tk.StringVar,
+        button: tk.Button,
     ) -> None:
         """Handle book appointment action."""
         service_display = service_var.get()
@@ -139,7 +255,7 @@ class CustomerDashboard(tk.Frame):
             return
 
         time_slot = time_var.get()
-        if not time_slot:
+        if not time_slot or time_slot == "Loading...":
             messagebox.showerror("Error", "Please select a time slot")
             return
 
@@ -147,32 +263,39 @@ class CustomerDashboard(tk.Frame):
         service_name, price_str = service_display.split(" -> ")
         price = float(price_str.replace("€", ""))
 
-        result = self.container.create_appointment.execute(
-            first_name=self.user.first_name,
-            last_name=self.user.last_name,
-            phone_number=self.user.phone_number,
-            date=cal.get_date(),
-            time=time_slot,
-            service_name=service_name,
-            service_price=price,
-        )
+        values = {
+            'first_name': self.user.first_name,
+            'last_name': self.user.last_name,
+            'phone_number': self.user.phone_number,
+            'date': cal.get_date(),
+            'time': time_slot,
+            'service_name': service_name,
+            'service_price': price,
+        }
+
+        def on_result(result):
+            if result.success:
+                self.last_booked_appointment = result.appointment
+                self._show_confirmation()
+            else:
+                messagebox.showerror("Error", result.message)
 
-        if result.success:
-            self.last_booked_appointment = result.appointment
-            self._show_confirmation()
-        else:
-            messagebox.showerror("Error", result.message)
+        self.tasks.submit(
+            "customer:book",
+            lambda: self.container.create_appointment.execute(**values),
+            on_success=on_result, owner=button, busy=[button],
+        )
 
     def _show_confirmation(self) -> None:
         """Show booking confirmation with receipt option."""
         if not self.last_booked_appointment:
-            self._create_main_menu()
+            self._show_main_menu()
             return
 
-        for widget in self.winfo_children():
-            widget.destroy()
+        # Rebuilt for every booking since it shows that booking's details
+        view = self.views.create("confirmation")
 
-        frame = tk.Frame(self, bg="light salmon", width=450, height=400)
+        frame = tk.Frame(view, bg="light salmon", width=450, height=400)
         frame.place(relx=0.5, rely=0.5, anchor="center")
 
         tk.Label(
@@ -196,150 +319,154 @@ Price: {apt.service_price}€
         ).pack(pady=10)
 
         # Buttons
-        tk.Button(
+        receipt_btn = tk.Button(
             frame, text="Generate Receipt", font=("Helvetica", 12), width=15,
-            command=self._generate_receipt, cursor="hand2"
-        ).pack(pady=10)
+            command=lambda: self._generate_receipt(receipt_btn), cursor="hand2"
+        )
+        receipt_btn.pack(pady=10)
 
         tk.Button(
             frame, text="Back to Menu", font=("Helvetica", 12), width=15,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(pady=5)
 
-    def _generate_receipt(self) -> None:
-        """Generate receipt for last booked appointment."""
+    def _generate_receipt(self, button: tk.Button) -> None:
+        """Queue a receipt for the last booked appointment.
+
+        The background receipt writer does the rendering and disk I/O, so a
+        slow receipts location only delays the completion message.
+        """
         if not self.last_booked_appointment:
             return
 
-        try:
-            receipt_path = self.container.receipt_generator.generate(
-                self.last_booked_appointment
-            )
-            messagebox.showinfo(
-                "Receipt Generated",
-                f"Receipt saved to:\n{receipt_path}"
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate receipt: {str(e)}")
+        button.config(state=tk.DISABLED)
+        future = self.container.receipt_generator.generate_async(self.last_booked_appointment)
+        # Done callbacks run on the writer thread; report on the Tk thread
+        future.add_done_callback(
+            lambda done: self.tasks.call_soon(self._on_receipt_written, done, button)
+        )
+
+    def _on_receipt_written(self, future: Future, button: tk.Button) -> None:
+        """Report a finished receipt unless its confirmation view is gone."""
+        if not widget_exists(button):
+            return
+        button.config(state=tk.NORMAL)
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to generate receipt: {str(error)}")
+            return
+        messagebox.showinfo("Receipt Generated", f"Receipt saved to:\n{future.result()}")
 
     def _show_my_appointments(self) -> None:
         """Show user's appointments."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("my_appointments"):
+            return
+        view = self.views.create("my_appointments")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="My Appointments", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Text widget with scrollbar
-        text_frame = tk.Frame(frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-        scrollbar = tk.Scrollbar(text_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        text_widget = tk.Text(
-            text_frame, font=("Courier", 11), height=15, width=60,
-            yscrollcommand=scrollbar.set
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "customer:my_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, SERVICE_COLUMN, PRICE_COLUMN],
+            count_fn=self._count_my_appointments,
+            page_fn=self._load_my_appointments_page,
+            height=15,
+            matches=self._is_mine,
         )
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=text_widget.yview)
-
-        # Load user's appointments
-        appointments = self.container.get_appointments.get_by_customer(
-            self.user.first_name, self.user.last_name, self.user.phone_number
-        )
-
-        if appointments:
-            for apt in appointments:
-                text_widget.insert(
-                    tk.END,
-                    f"{apt.date} at {apt.time}\n"
-                    f"Service: {apt.service_name}\n"
-                    f"Price: {apt.service_price}€\n"
-                    f"{'-' * 40}\n"
-                )
-        else:
-            text_widget.insert(tk.END, "No appointments found.")
-
-        text_widget.config(state=tk.DISABLED)
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
         # Back button
         tk.Button(
             frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(pady=10)
 
     def _show_cancel_appointment(self) -> None:
         """Show cancel appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("cancel"):
+            return
+        view = self.views.create("cancel")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="Cancel Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Appointments list
-        listbox = tk.Listbox(frame, font=("Helvetica", 11), height=12, width=60)
-        listbox.pack(pady=10, fill=tk.BOTH, expand=True)
-
-        appointments = self.container.get_appointments.get_by_customer(
-            self.user.first_name, self.user.last_name, self.user.phone_number
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "customer:cancel_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, SERVICE_COLUMN, PRICE_COLUMN],
+            count_fn=self._count_my_appointments,
+            page_fn=self._load_my_appointments_page,
+            height=12,
+            empty_text="No appointments to cancel",
+            matches=self._is_mine,
         )
-        appointment_map = {}
-
-        if appointments:
-            for apt in appointments:
-                display = f"{apt.date} {apt.time} - {apt.service_name}"
-                listbox.insert(tk.END, display)
-                appointment_map[display] = apt
-        else:
-            listbox.insert(tk.END, "No appointments to cancel")
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
         # Buttons
         btn_frame = tk.Frame(frame, bg="light salmon")
         btn_frame.pack(pady=10)
 
-        tk.Button(
+        cancel_btn = tk.Button(
             btn_frame, text="Cancel Selected", font=("Helvetica", 12), width=15,
-            command=lambda: self._handle_cancel_appointment(listbox, appointment_map),
+            command=lambda: self._handle_cancel_appointment(appointment_list, cancel_btn),
             cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
-    def _handle_cancel_appointment(self, listbox: tk.Listbox, appointment_map: dict) -> None:
+    def _handle_cancel_appointment(
+        self, appointment_list: AppointmentList, button: tk.Button
+    ) -> None:
         """Handle cancel appointment action."""
-        selection = listbox.curselection()
-        if not selection:
+        appointment = appointment_list.selected()
+        if appointment is None:
             messagebox.showwarning("Warning", "Please select an appointment to cancel")
             return
 
-        display = listbox.get(selection[0])
-        if display == "No appointments to cancel":
-            return
-
-        appointment = appointment_map[display]
-
         confirm = messagebox.askyesno(
             "Confirm", f"Cancel appointment on {appointment.date} at {appointment.time}?"
         )
         if not confirm:
             return
 
-        result = self.container.cancel_appointment.execute(appointment.appointment_id)
+        # The list and availability are updated by the change event
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "customer:cancel",
+            lambda: self.container.cancel_appointment.execute(appointment.appointment_id),
+            on_success=on_result, owner=button, busy=[button],
+        )
 
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._show_cancel_appointment()
-        else:
-            messagebox.showerror("Error", result.message)
+    def _count_my_appointments(self) -> int:
+        """Count the logged in customer's appointments (runs on a worker thread)."""
+        return self.container.get_appointments.get_count_by_customer(
+            self.user.first_name, self.user.last_name, self.user.phone_number
+        )
+
+    def _load_my_appointments_page(self, offset: int, limit: int) -> list:
+        """Load a page of the customer's appointments (runs on a worker thread)."""
+        return self.container.get_appointments.get_page_by_customer(
+            self.user.first_name, self.user.last_name, self.user.phone_number,
+            offset, limit
+        )
@@ -2,10 +2,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from tkcalendar import Calendar
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from config.settings import settings
 from core.entities import Employee
+from infrastructure.events import AppointmentChanged, ExternalDataChanged, ServiceChanged
+from presentation.components.appointment_list import (
+    AppointmentList,
+    DATE_COLUMN,
+    TIME_COLUMN,
+    CUSTOMER_COLUMN,
+    PHONE_COLUMN,
+    SERVICE_COLUMN,
+    PRICE_COLUMN,
+)
+from presentation.components.view_stack import ViewStack
+
+if TYPE_CHECKING:
+    from tkcalendar import Calendar
 
 
 class EmployeeDashboard(tk.Frame):
@@ -22,16 +36,59 @@ class EmployeeDashboard(tk.Frame):
         super().__init__(parent, bg=settings.BACKGROUND_COLOR)
         self.controller = controller
         self.container = controller.container
+        self.tasks = controller.task_runner
+        self.availability = controller.availability
         self.employee = employee
 
-        self._create_main_menu()
+        # Views are built on first visit and kept; change events patch them
+        self.views = ViewStack(self, settings.BACKGROUND_COLOR)
+        self._appointment_lists: List[AppointmentList] = []
+        self._refresh_times: Optional[Callable[[Optional[List[str]]], None]] = None
+        self._reload_services: Optional[Callable[[], None]] = None
 
-    def _create_main_menu(self) -> None:
-        """Create main menu with action buttons."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        self._show_main_menu()
 
-        frame = tk.Frame(self, bg="light salmon", width=450, height=400)
+    def on_appointment_changed(self, event: AppointmentChanged) -> None:
+        """Update the shown time slots and open lists after an appointment change.
+
+        The controller has already dropped the affected availability.
+
+        Args:
+            event: Change published by the appointment repository
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(event.dates)
+        for appointment_list in self._appointment_lists:
+            appointment_list.apply_change(event)
+
+    def on_service_changed(self, event: ServiceChanged) -> None:
+        """Reload the service choices after the catalog changed.
+
+        Args:
+            event: Change published by the service repository
+        """
+        if self._reload_services is not None:
+            self._reload_services()
+
+    def on_external_change(self, event: ExternalDataChanged) -> None:
+        """Reload everything after another process wrote to the database.
+
+        Args:
+            event: Change detected by the data version watcher
+        """
+        if self._refresh_times is not None:
+            self._refresh_times(None)
+        for appointment_list in self._appointment_lists:
+            appointment_list.refresh()
+        self.on_service_changed(None)
+
+    def _show_main_menu(self) -> None:
+        """Show main menu with action buttons."""
+        if self.views.show("menu"):
+            return
+        view = self.views.create("menu")
+
+        frame = tk.Frame(view, bg="light salmon", width=450, height=400)
         frame.place(relx=0.5, rely=0.5, anchor="center")
 
         # Welcome message
@@ -65,17 +122,20 @@ class EmployeeDashboard(tk.Frame):
 
     def _show_schedule_appointment(self) -> None:
         """Show schedule appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("schedule"):
+            return
+        view = self.views.create("schedule")
 
-        main_frame = tk.Frame(self, bg="light salmon")
+        main_frame = tk.Frame(view, bg="light salmon")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         tk.Label(
             main_frame, text="Schedule Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Calendar
+        # Calendar (tkcalendar is imported when a booking view is first opened)
+        from tkcalendar import Calendar
+
         tk.Label(main_frame, text="Select Date:", font=("Helvetica", 12), bg="light salmon").pack(pady=5)
 
         cal = Calendar(
@@ -96,15 +156,42 @@ class EmployeeDashboard(tk.Frame):
         )
         time_combo.pack(pady=5)
 
-        # Update available times when date changes
-        def update_times(event=None):
-            selected_date = cal.get_date()
-            available = self.container.get_available_slots.execute(selected_date)
+        # Update available times when date changes; rapid clicks are debounced
+        # and answered from the month cache once it has loaded
+        def show_times(available, keep=""):
+            time_combo.config(state="readonly")
             time_combo['values'] = available
-            if available:
+            if keep in available:
+                time_var.set(keep)
+            elif available:
                 time_combo.current(0)
+            else:
+                time_var.set("")
+
+        def update_times(event=None, keep=""):
+            selected_date = cal.get_date()
+            time_combo.config(state=tk.DISABLED)
+            time_var.set("Loading...")
+            self.availability.request(
+                selected_date, lambda available: show_times(available, keep), owner=time_combo
+            )
+
+        def refresh_times(dates):
+            # A booking elsewhere changed the shown date (None: any date);
+            # keep the choice if it is still free
+            if dates is not None and cal.get_date() not in dates:
+                return
+            if str(time_combo.cget("state")) != tk.DISABLED:
+                update_times(keep=time_var.get())
+
+        self._refresh_times = refresh_times
+
+        def prefetch_month(event=None):
+            month, year = cal.get_displayed_month()
+            self.availability.prefetch_month(year, month)
 
         cal.bind("<<CalendarSelected>>", update_times)
+        cal.bind("<<CalendarMonthChanged>>", prefetch_month)
         update_times()
 
         # Service selection
@@ -113,14 +200,31 @@ class EmployeeDashboard(tk.Frame):
         service_var = tk.StringVar()
         service_combo = ttk.Combobox(
             main_frame, textvariable=service_var, font=("Helvetica", 11),
-            width=30, state="readonly",
-            values=self.container.get_services.get_display_names()
+            width=30, state="readonly"
         )
         service_combo.pack(pady=5)
 
+        def load_services():
+            self.tasks.submit(
+                "employee:services",
+                lambda: self.container.get_services.get_display_names(),
+                on_success=lambda names: service_combo.config(values=names),
+                owner=service_combo,
+            )
+
+        self._reload_services = load_services
+        load_services()
+
         # Customer info button
         customer_data = {}
 
+        def reset_form():
+            customer_data.clear()
+            service_var.set("")
+            update_times()
+
+        self.views.set_on_show("schedule", reset_form)
+
         def get_customer_info():
             """Get customer information via popup."""
             popup = tk.Toplevel(self)
@@ -184,20 +288,26 @@ class EmployeeDashboard(tk.Frame):
         btn_frame = tk.Frame(main_frame, bg="light salmon")
         btn_frame.pack(pady=15)
 
-        tk.Button(
+        book_btn = tk.Button(
             btn_frame, text="Book", font=("Helvetica", 12), width=10,
             command=lambda: self._handle_schedule_appointment(
-                cal, time_var, service_var, customer_data
+                cal, time_var, service_var, customer_data, book_btn
             ), cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        book_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
     def _handle_schedule_appointment(
-        self, cal: Calendar, time_var: tk.StringVar, service_var: tk.StringVar, customer_data: dict
+        self,
+        cal: "Calendar",
+        time_var: tk.StringVar,
+        service_var: tk.StringVar,
+        customer_data: dict,
+        button: tk.Button,
     ) -> None:
         """Handle schedule appointment action."""
         if not customer_data:
@@ -213,125 +323,123 @@ class EmployeeDashboard(tk.Frame):
         service_name, price_str = service_display.split(" -> ")
         price = float(price_str.replace("€", ""))
 
-        result = self.container.create_appointment.execute(
-            first_name=customer_data.get('first_name', ''),
-            last_name=customer_data.get('last_name', ''),
-            phone_number=customer_data.get('phone', ''),
-            date=cal.get_date(),
-            time=time_var.get(),
-            service_name=service_name,
-            service_price=price,
+        values = {
+            'first_name': customer_data.get('first_name', ''),
+            'last_name': customer_data.get('last_name', ''),
+            'phone_number': customer_data.get('phone', ''),
+            'date': cal.get_date(),
+            'time': time_var.get(),
+            'service_name': service_name,
+            'service_price': price,
+        }
+
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+                self._show_main_menu()
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "employee:book",
+            lambda: self.container.create_appointment.execute(**values),
+            on_success=on_result, owner=button, busy=[button],
         )
 
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._create_main_menu()
-        else:
-            messagebox.showerror("Error", result.message)
-
     def _show_cancel_appointment(self) -> None:
         """Show cancel appointment screen."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("cancel"):
+            return
+        view = self.views.create("cancel")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="Cancel Appointment", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Appointments list
-        listbox = tk.Listbox(frame, font=("Helvetica", 10), height=15, width=70)
-        listbox.pack(pady=10, fill=tk.BOTH, expand=True)
-
-        appointments = self.container.get_appointments.get_all()
-        appointment_map = {}
-
-        for apt in appointments:
-            display = f"{apt.date} {apt.time} - {apt.full_name} - {apt.service_name}"
-            listbox.insert(tk.END, display)
-            appointment_map[display] = apt
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "employee:cancel_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, CUSTOMER_COLUMN, SERVICE_COLUMN],
+            count_fn=lambda: self.container.get_appointments.get_count(),
+            page_fn=lambda offset, limit: self.container.get_appointments.get_page(offset, limit),
+            height=15,
+        )
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
         # Buttons
         btn_frame = tk.Frame(frame, bg="light salmon")
         btn_frame.pack(pady=10)
 
-        tk.Button(
+        cancel_btn = tk.Button(
             btn_frame, text="Cancel Selected", font=("Helvetica", 12), width=15,
-            command=lambda: self._handle_cancel_appointment(listbox, appointment_map),
+            command=lambda: self._handle_cancel_appointment(appointment_list, cancel_btn),
             cursor="hand2"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(side=tk.LEFT, padx=5)
 
-    def _handle_cancel_appointment(self, listbox: tk.Listbox, appointment_map: dict) -> None:
+    def _handle_cancel_appointment(
+        self, appointment_list: AppointmentList, button: tk.Button
+    ) -> None:
         """Handle cancel appointment action."""
-        selection = listbox.curselection()
-        if not selection:
+        appointment = appointment_list.selected()
+        if appointment is None:
             messagebox.showwarning("Warning", "Please select an appointment to cancel")
             return
 
-        display = listbox.get(selection[0])
-        appointment = appointment_map[display]
-
         confirm = messagebox.askyesno(
             "Confirm", f"Cancel appointment for {appointment.full_name}?"
         )
         if not confirm:
             return
 
-        result = self.container.cancel_appointment.execute(appointment.appointment_id)
-
-        if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._show_cancel_appointment()
-        else:
-            messagebox.showerror("Error", result.message)
+        # The list and availability are updated by the change event
+        def on_result(result):
+            if result.success:
+                messagebox.showinfo("Success", result.message)
+            else:
+                messagebox.showerror("Error", result.message)
+
+        self.tasks.submit(
+            "employee:cancel",
+            lambda: self.container.cancel_appointment.execute(appointment.appointment_id),
+            on_success=on_result, owner=button, busy=[button],
+        )
 
     def _show_all_appointments(self) -> None:
         """Show all appointments."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        if self.views.show("all_appointments"):
+            return
+        view = self.views.create("all_appointments")
 
-        frame = tk.Frame(self, bg="light salmon")
+        frame = tk.Frame(view, bg="light salmon")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         tk.Label(
             frame, text="All Appointments", font=("Helvetica", 18, "bold"), bg="light salmon"
         ).pack(pady=15)
 
-        # Text widget with scrollbar
-        text_frame = tk.Frame(frame)
-        text_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-        scrollbar = tk.Scrollbar(text_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        text_widget = tk.Text(
-            text_frame, font=("Courier", 10), height=20, width=80,
-            yscrollcommand=scrollbar.set
+        # Appointments list (only visible rows are loaded)
+        appointment_list = AppointmentList(
+            frame, self.tasks, "employee:all_list",
+            columns=[DATE_COLUMN, TIME_COLUMN, CUSTOMER_COLUMN, PHONE_COLUMN, SERVICE_COLUMN, PRICE_COLUMN],
+            count_fn=lambda: self.container.get_appointments.get_count(),
+            page_fn=lambda offset, limit: self.container.get_appointments.get_page(offset, limit),
+            height=18,
         )
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=text_widget.yview)
-
-        # Load appointments
-        appointments = self.container.get_appointments.get_all()
-
-        for apt in appointments:
-            text_widget.insert(
-                tk.END,
-                f"{apt.date} {apt.time} | {apt.full_name} | {apt.phone_number} | "
-                f"{apt.service_name} ({apt.service_price}€)\n"
-            )
-
-        text_widget.config(state=tk.DISABLED)
+        appointment_list.pack(pady=10, fill=tk.BOTH, expand=True)
+        self._appointment_lists.append(appointment_list)
 
         # Back button
         tk.Button(
             frame, text="Back", font=("Helvetica", 12), width=10,
-            command=self._create_main_menu, cursor="hand2"
+            command=self._show_main_menu, cursor="hand2"
         ).pack(pady=10)
@@ -0,0 +1,34 @@
+"""
+Beauty Salon Booking API - Headless Entry Point
+
+Serves the booking engine over HTTP on localhost for kiosks and the web front end.
+"""
+import argparse
+
+from di_container import DIContainer
+from presentation.api import BookingService, BookingHTTPServer
+
+
+def main():
+    """Main entry point - initializes DI container and serves the booking API."""
+    parser = argparse.ArgumentParser(description="Beauty Salon booking API")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    container = DIContainer()
+    server = BookingHTTPServer(BookingService(container), port=args.port, verbose=args.verbose)
+    print(f"Booking API listening on {server.url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down...")
+    finally:
+        server.stop()
+        container.cleanup()
+        print("Cleanup complete.")
+
+
+if __name__ == "__main__":
+    main()
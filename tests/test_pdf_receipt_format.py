@@ -0,0 +1,52 @@
+"""Tests for the PDF receipt format."""
+import re
+import unittest
+
+from infrastructure.file_handlers.pdf_receipt_format import PDF_EXTRA_GLYPHS, PdfReceiptFormat
+
+RECEIPT = {
+    "full_name": "Đurđica Ivić-Čačić (Ćosić)",
+    "phone_number": "0912345678",
+    "date": "2026-10-19",
+    "time": "10:00",
+    "service_name": "Manicure",
+    "service_price": "25.00",
+    "generated_at": "2026-10-19 09:00:00",
+}
+
+
+def decode_pdf_string(raw: bytes) -> str:
+    """Decode a PDF literal string with the receipt font's encoding."""
+    glyphs = {code: char for char, code, _ in PDF_EXTRA_GLYPHS}
+    raw = re.sub(rb"\\([0-7]{3})", lambda match: bytes([int(match.group(1), 8)]), raw)
+    raw = re.sub(rb"\\(.)", rb"\1", raw)
+    return "".join(
+        glyphs[byte] if byte in glyphs else bytes([byte]).decode("cp1252") for byte in raw
+    )
+
+
+class PdfReceiptFormatTest(unittest.TestCase):
+    """PdfReceiptFormat output."""
+
+    def render(self, values):
+        parts = []
+        PdfReceiptFormat().write(values, parts.append)
+        return b"".join(parts)
+
+    def test_croatian_name_survives(self):
+        pdf = self.render(RECEIPT)
+        name = re.search(rb"\(    Name: (.*?)\) Tj", pdf).group(1)
+        self.assertEqual(decode_pdf_string(name), RECEIPT["full_name"])
+
+    def test_font_encoding_maps_extra_glyphs(self):
+        pdf = self.render(RECEIPT)
+        for _, code, glyph in PDF_EXTRA_GLYPHS:
+            self.assertIn(b"%d /%s" % (code, glyph.encode()), pdf)
+
+    def test_uncovered_accents_are_transliterated(self):
+        pdf = self.render(dict(RECEIPT, full_name="Őrs Ŕ"))
+        self.assertIn(b"(    Name: Ors R) Tj", pdf)
+
+
+if __name__ == "__main__":
+    unittest.main()